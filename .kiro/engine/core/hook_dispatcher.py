@@ -85,7 +85,9 @@ class HookDispatcher:
     
     The hook dispatcher is responsible for determining which hooks should execute
     in response to an event, executing them in the appropriate order, and handling
-    any errors that occur during execution.
+    any errors that occur during execution. Hooks run in dependency waves: every
+    hook in a wave runs concurrently, up to ``max_concurrent_hooks`` at a time,
+    and each hook is bounded by its own ``timeout_seconds``.
     """
     
     def __init__(self, registry: HookRegistry, max_concurrent_hooks: int = 5):
@@ -113,8 +115,21 @@ class HookDispatcher:
         Returns:
             List of hook execution results
         """
-        # Get hooks that handle this event type
-        hooks = self.registry.get_hooks_for_event_type(event.type)
+        # Look up the cached execution plan for this event type; hooks in a
+        # dependency wave are independent of each other
+        try:
+            plan = self.registry.get_execution_plan(event.type)
+            hooks = plan.hooks
+            waves = plan.waves
+        except Exception as e:
+            self.logger.error(
+                f"Error determining hook execution order: {e}",
+                {"event_id": event.id, "event_type": event.type.value},
+                e
+            )
+            # Fall back to sequential priority-based ordering
+            hooks = self.registry.get_hooks_for_event_type(event.type)
+            waves = [[hook] for hook in sorted(hooks, key=lambda h: h.priority.value)]
         
         if not hooks:
             self.logger.debug(
@@ -131,55 +146,72 @@ class HookDispatcher:
             user_preferences={}  # This would be populated with actual user preferences
         )
         
-        # Determine execution order based on dependencies and priorities
+        # Execute each wave concurrently (bounded by the semaphore); a wave
+        # only starts once every hook of the previous wave has finished
+        results = []
+        for wave in waves:
+            wave_results = await asyncio.gather(
+                *(self._run_hook(hook, context, event) for hook in wave)
+            )
+            
+            # Merge in wave order so the context is independent of completion order
+            for hook, result in zip(wave, wave_results):
+                if result is None:
+                    continue
+                results.append(result)
+                
+                # Update context with execution record
+                context = context.with_execution_record({
+                    "hook_id": hook.id,
+                    "hook_name": hook.name,
+                    "success": result.success,
+                    "message": result.message,
+                    "execution_time_ms": result.execution_time_ms
+                })
+        
+        return results
+    
+    async def _run_hook(self, hook: AgentHook, context: HookContext, event: BaseEvent) -> Optional[HookResult]:
+        """
+        Check whether a hook should execute and, if so, execute it.
+        
+        Args:
+            hook: Hook to run
+            context: Execution context shared by the hook's wave
+            event: Event being dispatched
+            
+        Returns:
+            Hook execution result, or None if the hook was skipped
+        """
+        # Check if the hook should execute
+        should_execute = False
         try:
-            hook_ids = [hook.id for hook in hooks]
-            execution_order = self.registry.get_hook_execution_order(hook_ids)
-            ordered_hooks = [self.registry.get_hook(hook_id) for hook_id in execution_order if self.registry.get_hook(hook_id)]
+            async with self.semaphore:
+                should_execute = await asyncio.wait_for(
+                    hook.should_execute(context),
+                    timeout=hook.timeout_seconds
+                )
+        except asyncio.TimeoutError:
+            self.logger.error(
+                f"Hook {hook.name} ({hook.id}) timed out deciding whether to execute",
+                {"hook_id": hook.id, "hook_name": hook.name, "event_id": event.id}
+            )
         except Exception as e:
             self.logger.error(
-                f"Error determining hook execution order: {e}",
-                {"event_id": event.id, "event_type": event.type.value},
+                f"Error checking if hook should execute: {e}",
+                {"hook_id": hook.id, "hook_name": hook.name, "event_id": event.id},
                 e
             )
-            # Fall back to priority-based ordering
-            ordered_hooks = sorted(hooks, key=lambda h: h.priority.value)
         
-        # Execute hooks
-        results = []
-        for hook in ordered_hooks:
-            # Check if the hook should execute
-            should_execute = False
-            try:
-                should_execute = await hook.should_execute(context)
-            except Exception as e:
-                self.logger.error(
-                    f"Error checking if hook should execute: {e}",
-                    {"hook_id": hook.id, "hook_name": hook.name, "event_id": event.id},
-                    e
-                )
-            
-            if not should_execute:
-                self.logger.debug(
-                    f"Hook {hook.name} ({hook.id}) skipped execution",
-                    {"hook_id": hook.id, "hook_name": hook.name, "event_id": event.id}
-                )
-                continue
-            
-            # Execute the hook
-            result = await self._execute_hook(hook, context)
-            results.append(result)
-            
-            # Update context with execution record
-            context = context.with_execution_record({
-                "hook_id": hook.id,
-                "hook_name": hook.name,
-                "success": result.success,
-                "message": result.message,
-                "execution_time_ms": result.execution_time_ms
-            })
+        if not should_execute:
+            self.logger.debug(
+                f"Hook {hook.name} ({hook.id}) skipped execution",
+                {"hook_id": hook.id, "hook_name": hook.name, "event_id": event.id}
+            )
+            return None
         
-        return results
+        # Execute the hook
+        return await self._execute_hook(hook, context)
     
     async def _execute_hook(self, hook: AgentHook, context: HookContext) -> HookResult:
         """
@@ -5,6 +5,7 @@ This module implements a registry for managing hook definitions, including
 registration, deregistration, and lookup functionality.
 """
 
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Set, Tuple
 import uuid
 from datetime import datetime
@@ -14,12 +15,27 @@ from src.agent_hooks.events.models import EventType
 from src.agent_hooks.utils.logging import get_logger, ConfigurationError
 
 
+@dataclass(frozen=True)
+class HookExecutionPlan:
+    """
+    Precomputed execution plan for the hooks of one event type.
+    
+    Attributes:
+        hooks: Hooks in execution order
+        waves: Hooks grouped into dependency waves that can run concurrently
+    """
+    hooks: Tuple[AgentHook, ...]
+    waves: Tuple[Tuple[AgentHook, ...], ...]
+
+
 class HookRegistry:
     """
     Registry for managing hook definitions.
     
     The hook registry maintains a collection of registered hooks and provides
-    methods for registering, deregistering, and looking up hooks.
+    methods for registering, deregistering, and looking up hooks. Execution
+    plans are cached per event type and invalidated whenever hooks or
+    dependencies change.
     """
     
     def __init__(self):
@@ -30,6 +46,7 @@ class HookRegistry:
         self.hooks_by_priority: Dict[HookPriority, List[str]] = {priority: [] for priority in HookPriority}
         self.hook_dependencies: Dict[str, Set[str]] = {}
         self.dependent_hooks: Dict[str, Set[str]] = {}
+        self._execution_plans: Dict[EventType, HookExecutionPlan] = {}
     
     def register_hook(self, hook: AgentHook) -> str:
         """
@@ -59,6 +76,8 @@ class HookRegistry:
         if hook.id not in self.hooks_by_priority[hook.priority]:
             self.hooks_by_priority[hook.priority].append(hook.id)
         
+        self._invalidate_execution_plans()
+        
         self.logger.info(
             f"Hook registered: {hook.name} ({hook.id})",
             {"hook_id": hook.id, "hook_name": hook.name}
@@ -104,6 +123,8 @@ class HookRegistry:
         if hook_id in self.dependent_hooks:
             del self.dependent_hooks[hook_id]
         
+        self._invalidate_execution_plans()
+        
         self.logger.info(
             f"Hook unregistered: {hook.name} ({hook_id})",
             {"hook_id": hook_id, "hook_name": hook.name}
@@ -189,6 +210,8 @@ class HookRegistry:
             self.dependent_hooks[dependency_id] = set()
         self.dependent_hooks[dependency_id].add(hook_id)
         
+        self._invalidate_execution_plans()
+        
         self.logger.info(
             f"Hook dependency added: {hook_id} depends on {dependency_id}",
             {"hook_id": hook_id, "dependency_id": dependency_id}
@@ -219,6 +242,8 @@ class HookRegistry:
             if not self.dependent_hooks[dependency_id]:
                 del self.dependent_hooks[dependency_id]
         
+        self._invalidate_execution_plans()
+        
         self.logger.info(
             f"Hook dependency removed: {hook_id} no longer depends on {dependency_id}",
             {"hook_id": hook_id, "dependency_id": dependency_id}
@@ -295,8 +320,80 @@ class HookRegistry:
             if hook_id not in visited:
                 visit(hook_id)
         
-        # Reverse the result to get the correct execution order
-        return list(reversed(result))
+        # Each hook is appended after its dependencies, so this is already
+        # the execution order
+        return result
+    
+    def get_hook_execution_waves(self, hook_ids: List[str]) -> List[List[str]]:
+        """
+        Group hooks into waves that can be executed concurrently.
+        
+        A hook's wave is its dependency depth among the given hooks: hooks
+        without dependencies form the first wave, and every other hook goes
+        one wave after the deepest hook it depends on. Within a wave hooks
+        keep their relative position from ``get_hook_execution_order``.
+        
+        Args:
+            hook_ids: IDs of hooks to group
+            
+        Returns:
+            List of waves, each a list of hook IDs
+            
+        Raises:
+            ConfigurationError: If there is a dependency cycle
+        """
+        execution_order = self.get_hook_execution_order(hook_ids)
+        selected = set(execution_order)
+        depth: Dict[str, int] = {}
+        
+        # Depth of a hook = 1 + depth of its deepest dependency
+        def resolve(hook_id: str) -> int:
+            if hook_id not in depth:
+                dependencies = self.hook_dependencies.get(hook_id, set()) & selected
+                depth[hook_id] = 1 + max((resolve(dep) for dep in dependencies), default=-1)
+            return depth[hook_id]
+        
+        waves: List[List[str]] = []
+        for hook_id in execution_order:
+            level = resolve(hook_id)
+            while len(waves) <= level:
+                waves.append([])
+            waves[level].append(hook_id)
+        
+        return waves
+    
+    def get_execution_plan(self, event_type: EventType) -> HookExecutionPlan:
+        """
+        Get the execution plan for the hooks of an event type.
+        
+        The plan is built on first use and cached until a hook or
+        dependency is added or removed.
+        
+        Args:
+            event_type: Event type to get the plan for
+            
+        Returns:
+            Execution plan for the event type
+            
+        Raises:
+            ConfigurationError: If there is a dependency cycle
+        """
+        plan = self._execution_plans.get(event_type)
+        if plan is None:
+            hook_ids = [hook.id for hook in self.get_hooks_for_event_type(event_type)]
+            plan = HookExecutionPlan(
+                hooks=tuple(self.hooks[hook_id] for hook_id in self.get_hook_execution_order(hook_ids)),
+                waves=tuple(
+                    tuple(self.hooks[hook_id] for hook_id in wave)
+                    for wave in self.get_hook_execution_waves(hook_ids)
+                )
+            )
+            self._execution_plans[event_type] = plan
+        return plan
+    
+    def _invalidate_execution_plans(self) -> None:
+        """Drop every cached execution plan."""
+        self._execution_plans.clear()
     
     def _would_create_cycle(self, hook_id: str, dependency_id: str) -> bool:
         """
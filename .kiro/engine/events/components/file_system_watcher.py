@@ -7,10 +7,12 @@ and generates events when files are created, modified, deleted, or renamed.
 
 import asyncio
 import os
-import time
+import re
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Callable, Awaitable
+from stat import S_ISREG
+from typing import Dict, Any, List, Optional, Pattern, Set, Tuple, Callable, Awaitable
 import fnmatch
 
 from watchdog.observers import Observer
@@ -32,7 +34,8 @@ class FileSystemWatcherConfig:
         recursive: bool = True,
         debounce_seconds: float = 0.5,
         compute_hash: bool = True,
-        max_file_size_mb: int = 10
+        max_file_size_mb: int = 10,
+        hash_workers: int = 2
     ):
         """
         Initialize file system watcher configuration.
@@ -42,9 +45,10 @@ class FileSystemWatcherConfig:
             include_patterns: List of glob patterns to include
             exclude_patterns: List of glob patterns to exclude
             recursive: Whether to watch directories recursively
-            debounce_seconds: Debounce period for file events
+            debounce_seconds: Quiet period after which a path's changes are emitted
             compute_hash: Whether to compute file hashes
             max_file_size_mb: Maximum file size to compute hash for
+            hash_workers: Number of threads used to hash files
         """
         self.paths = [Path(p).resolve() for p in paths]
         self.include_patterns = include_patterns or ["*"]
@@ -53,10 +57,73 @@ class FileSystemWatcherConfig:
         self.debounce_seconds = debounce_seconds
         self.compute_hash = compute_hash
         self.max_file_size_mb = max_file_size_mb
+        self.hash_workers = hash_workers
+
+
+def compile_glob_patterns(patterns: List[str]) -> Optional[Pattern]:
+    """
+    Compile glob patterns into a single regular expression.
+    
+    Matching a file name against the result is equivalent to
+    ``any(fnmatch.fnmatch(name, pattern) for pattern in patterns)`` on a
+    name passed through ``os.path.normcase``.
+    
+    Args:
+        patterns: Glob patterns
+        
+    Returns:
+        Compiled alternation of the patterns, or None if there are none
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        f"(?:{fnmatch.translate(os.path.normcase(pattern))})" for pattern in patterns
+    ))
+
+
+def hash_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the MD5 hash of a file, reading it in chunks.
+    
+    Args:
+        path: File path
+        chunk_size: Number of bytes read at a time
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class _PendingChange:
+    """Changes to one path that have not settled yet."""
+    
+    __slots__ = ("operation", "old_path", "modified", "timer")
+    
+    def __init__(self, operation: str, old_path: Optional[Path] = None):
+        self.operation = operation  # create, modify, delete or move
+        self.old_path = old_path  # original path of a move
+        self.modified = False  # content changed after a move
+        self.timer: Optional[asyncio.TimerHandle] = None
 
 
 class FileSystemWatcherEventHandler(FileSystemEventHandler):
-    """Event handler for file system events."""
+    """
+    Event handler for file system events.
+    
+    Watchdog callbacks only hand the raw change to the event loop. There,
+    changes are coalesced per path and a path is emitted once no new change
+    arrived for ``debounce_seconds``: create+modify becomes create,
+    create+delete disappears, delete+create and a new file renamed over an
+    existing one (atomic saves) become modify, and chains of moves collapse
+    into a single rename. Hashing runs
+    in a thread pool and is skipped when a file's (mtime, size) is
+    unchanged since it was last hashed.
+    """
     
     def __init__(
         self,
@@ -74,8 +141,14 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
         self.logger = get_logger("events.file_system_watcher")
         self.config = config
         self.event_callback = event_callback
-        self.last_events: Dict[str, float] = {}  # path -> timestamp
         self.loop = asyncio.get_event_loop()
+        self.include_matcher = compile_glob_patterns(config.include_patterns)
+        self.exclude_matcher = compile_glob_patterns(config.exclude_patterns)
+        self.pending: Dict[Path, _PendingChange] = {}
+        self.fingerprints: Dict[Path, Tuple[int, int, Optional[str]]] = {}  # path -> (mtime_ns, size, hash)
+        self.hash_executor: Optional[ThreadPoolExecutor] = None
+        self.emit_tasks: Set[asyncio.Task] = set()
+        self.stats = {"raw_events": 0, "coalesced_events": 0, "emitted_events": 0, "hash_skips": 0}
     
     def on_created(self, event: FileSystemEvent) -> None:
         """
@@ -84,24 +157,8 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        if not self._should_process_event(event):
-            return
-        
-        path = Path(event.src_path).resolve()
-        
-        # Debounce events
-        now = time.time()
-        key = f"create:{path}"
-        if key in self.last_events and now - self.last_events[key] < self.config.debounce_seconds:
-            return
-        
-        self.last_events[key] = now
-        
-        # Create file event
-        file_event = self._create_file_event(path, "create")
-        
-        # Schedule event callback
-        self.loop.create_task(self._call_event_callback(file_event))
+        if self._should_process_event(event):
+            self.loop.call_soon_threadsafe(self._record_change, Path(event.src_path), "create")
     
     def on_modified(self, event: FileSystemEvent) -> None:
         """
@@ -110,24 +167,8 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        if not self._should_process_event(event):
-            return
-        
-        path = Path(event.src_path).resolve()
-        
-        # Debounce events
-        now = time.time()
-        key = f"modify:{path}"
-        if key in self.last_events and now - self.last_events[key] < self.config.debounce_seconds:
-            return
-        
-        self.last_events[key] = now
-        
-        # Create file event
-        file_event = self._create_file_event(path, "modify")
-        
-        # Schedule event callback
-        self.loop.create_task(self._call_event_callback(file_event))
+        if self._should_process_event(event):
+            self.loop.call_soon_threadsafe(self._record_change, Path(event.src_path), "modify")
     
     def on_deleted(self, event: FileSystemEvent) -> None:
         """
@@ -136,54 +177,33 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        if not self._should_process_event(event):
-            return
-        
-        path = Path(event.src_path).resolve()
-        
-        # Debounce events
-        now = time.time()
-        key = f"delete:{path}"
-        if key in self.last_events and now - self.last_events[key] < self.config.debounce_seconds:
-            return
-        
-        self.last_events[key] = now
-        
-        # Create file event
-        file_event = self._create_file_event(path, "delete")
-        
-        # Schedule event callback
-        self.loop.create_task(self._call_event_callback(file_event))
+        if self._should_process_event(event):
+            self.loop.call_soon_threadsafe(self._record_change, Path(event.src_path), "delete")
     
     def on_moved(self, event: FileSystemEvent) -> None:
         """
         Handle file move/rename event.
         
+        A move is processed if either of its paths is watched; editors save
+        by renaming an excluded temporary file over the watched one.
+        
         Args:
             event: File system event
         """
-        if not self._should_process_event(event):
-            return
-        
-        src_path = Path(event.src_path).resolve()
-        dest_path = Path(event.dest_path).resolve()
-        
-        # Debounce events
-        now = time.time()
-        key = f"move:{src_path}:{dest_path}"
-        if key in self.last_events and now - self.last_events[key] < self.config.debounce_seconds:
+        if event.is_directory:
             return
         
-        self.last_events[key] = now
-        
-        # Create file event
-        file_event = FileEvent.create_rename_event(
-            old_path=src_path,
-            new_path=dest_path
-        )
-        
-        # Schedule event callback
-        self.loop.create_task(self._call_event_callback(file_event))
+        src_watched = self._should_process_path(event.src_path)
+        dest_watched = self._should_process_path(event.dest_path)
+        if src_watched and dest_watched:
+            self.loop.call_soon_threadsafe(
+                self._record_move, Path(event.src_path), Path(event.dest_path)
+            )
+        elif dest_watched:
+            self.loop.call_soon_threadsafe(self._record_moved_in, Path(event.dest_path))
+        elif src_watched:
+            # Moved to a path that is not watched: gone as far as we can tell
+            self.loop.call_soon_threadsafe(self._record_change, Path(event.src_path), "delete")
     
     def _should_process_event(self, event: FileSystemEvent) -> bool:
         """
@@ -199,21 +219,236 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
         if event.is_directory:
             return False
         
-        path = Path(event.src_path).resolve()
+        return self._should_process_path(event.src_path)
+    
+    def _should_process_path(self, path: str) -> bool:
+        """
+        Check if a file path matches the include and exclude patterns.
+        
+        Args:
+            path: File path
+            
+        Returns:
+            True if the path is watched, False otherwise
+        """
+        name = os.path.normcase(os.path.basename(path))
         
         # Check include patterns
-        included = any(fnmatch.fnmatch(path.name, pattern) for pattern in self.config.include_patterns)
-        if not included:
+        if self.include_matcher is None or not self.include_matcher.match(name):
             return False
         
         # Check exclude patterns
-        excluded = any(fnmatch.fnmatch(path.name, pattern) for pattern in self.config.exclude_patterns)
-        if excluded:
+        if self.exclude_matcher is not None and self.exclude_matcher.match(name):
             return False
         
         return True
     
-    def _create_file_event(self, path: Path, operation: str) -> FileEvent:
+    def _record_change(self, path: Path, operation: str) -> None:
+        """
+        Merge a create, modify or delete into the pending changes of a path.
+        
+        Runs on the event loop thread.
+        
+        Args:
+            path: File path
+            operation: File operation (create, modify, delete)
+        """
+        self.stats["raw_events"] += 1
+        change = self.pending.get(path)
+        if change is None:
+            self._schedule(path, _PendingChange(operation))
+            return
+        
+        self.stats["coalesced_events"] += 1
+        previous = change.operation
+        if operation == "delete":
+            if previous == "create":
+                # Created and deleted within the window: nothing happened
+                self._discard(path)
+                return
+            if previous == "move":
+                # The file that is gone is the one at the original path
+                self._discard(path)
+                self._record_original_gone(change.old_path)
+                return
+            change.operation = "delete"
+        elif previous == "delete":
+            # Deleted and recreated (e.g. an atomic save): a modification
+            change.operation = "modify"
+        elif previous == "move":
+            change.modified = True
+        
+        self._schedule(path, change)
+    
+    def _record_moved_in(self, path: Path) -> None:
+        """
+        Merge a file moved in from a path that is not watched.
+        
+        Runs on the event loop thread.
+        
+        Args:
+            path: New file path
+        """
+        self._record_change(path, "modify" if path in self.fingerprints else "create")
+    
+    def _record_original_gone(self, path: Path) -> None:
+        """
+        Merge the loss of the file that was at ``path`` before it was moved away.
+        
+        Anything pending at ``path`` happened after that move, so the loss
+        comes first: a file created there since replaces the original.
+        
+        Args:
+            path: Original path of a moved file
+        """
+        change = self.pending.get(path)
+        if change is None:
+            self._schedule(path, _PendingChange("delete"))
+            return
+        
+        self.stats["coalesced_events"] += 1
+        if change.operation == "create":
+            change.operation = "modify"
+            self._schedule(path, change)
+    
+    def _record_move(self, src_path: Path, dest_path: Path) -> None:
+        """
+        Merge a move into the pending changes of its source and destination.
+        
+        Runs on the event loop thread.
+        
+        Args:
+            src_path: Original file path
+            dest_path: New file path
+        """
+        self.stats["raw_events"] += 1
+        source = self.pending.pop(src_path, None)
+        if source is not None and source.timer is not None:
+            source.timer.cancel()
+        
+        # Whether the move replaces a file already known at the destination
+        target = self.pending.get(dest_path)
+        if target is None:
+            replaces = dest_path in self.fingerprints
+        else:
+            replaces = target.operation in ("modify", "delete")
+            self._discard(dest_path)
+            if target.operation == "move":
+                # The file moved there earlier is overwritten
+                self._record_original_gone(target.old_path)
+        
+        # A temporary file saved over an existing one
+        saved_over = replaces and source is not None and source.operation == "create"
+        
+        if source is None:
+            change = _PendingChange("move", old_path=src_path)
+        else:
+            self.stats["coalesced_events"] += 1
+            if saved_over:
+                change = _PendingChange("modify")
+            elif source.operation == "create":
+                change = _PendingChange("create")
+            elif source.operation == "move" and source.old_path == dest_path:
+                # Moved back where it started
+                change = _PendingChange("modify") if source.modified else None
+            elif source.operation == "move":
+                change = _PendingChange("move", old_path=source.old_path)
+                change.modified = source.modified
+            else:
+                change = _PendingChange("move", old_path=src_path)
+                change.modified = source.operation == "modify"
+        
+        # A saved-over file is compared with the content it replaced
+        fingerprint = self.fingerprints.pop(src_path, None)
+        if fingerprint is not None and not saved_over:
+            self.fingerprints[dest_path] = fingerprint
+        
+        if change is not None:
+            self._schedule(dest_path, change)
+    
+    def _schedule(self, path: Path, change: _PendingChange) -> None:
+        """(Re)start the debounce timer of a path."""
+        if change.timer is not None:
+            change.timer.cancel()
+        self.pending[path] = change
+        change.timer = self.loop.call_later(self.config.debounce_seconds, self._settle, path)
+    
+    def _discard(self, path: Path) -> None:
+        """Drop the pending changes of a path."""
+        change = self.pending.pop(path, None)
+        if change is not None and change.timer is not None:
+            change.timer.cancel()
+    
+    def _settle(self, path: Path) -> None:
+        """Emit the coalesced changes of a path whose debounce window elapsed."""
+        change = self.pending.pop(path, None)
+        if change is None:
+            return
+        task = self.loop.create_task(self._emit(path, change))
+        self.emit_tasks.add(task)
+        task.add_done_callback(self.emit_tasks.discard)
+    
+    async def flush(self) -> None:
+        """Emit every pending change immediately and wait until all are delivered."""
+        # Let changes already handed over by the observer thread be recorded
+        await asyncio.sleep(0)
+        for path in list(self.pending):
+            change = self.pending[path]
+            if change.timer is not None:
+                change.timer.cancel()
+            self._settle(path)
+        if self.emit_tasks:
+            await asyncio.gather(*list(self.emit_tasks), return_exceptions=True)
+    
+    async def _emit(self, path: Path, change: _PendingChange) -> None:
+        """
+        Build and deliver the file events for a settled path.
+        
+        Args:
+            path: File path
+            change: Coalesced changes of the path
+        """
+        if change.operation == "move":
+            await self._call_event_callback(
+                FileEvent.create_rename_event(old_path=change.old_path, new_path=path)
+            )
+            if not change.modified:
+                return
+            operation = "modify"
+        else:
+            operation = change.operation
+        
+        file_event = await self._create_file_event(path, operation)
+        if file_event is not None:
+            await self._call_event_callback(file_event)
+    
+    def _fingerprint(self, path: Path) -> Optional[Tuple[int, int, Optional[str], bool]]:
+        """
+        Stat and, if needed, hash a file. Runs in the hash thread pool.
+        
+        Args:
+            path: File path
+            
+        Returns:
+            (mtime_ns, size, hash, unchanged) or None if the path is not a file
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        if not S_ISREG(stat.st_mode):
+            return None
+        
+        previous = self.fingerprints.get(path)
+        if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+            return previous + (True,)
+        
+        content_hash = None
+        if self.config.compute_hash and stat.st_size <= self.config.max_file_size_mb * 1024 * 1024:
+            content_hash = hash_file(path)
+        return (stat.st_mtime_ns, stat.st_size, content_hash, False)
+    
+    async def _create_file_event(self, path: Path, operation: str) -> Optional[FileEvent]:
         """
         Create a file event.
         
@@ -222,19 +457,30 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
             operation: File operation (create, modify, delete)
             
         Returns:
-            File event
+            File event, or None for a modification that left the file unchanged
         """
         content_hash = None
         size_bytes = None
         
-        if operation != "delete" and path.exists() and path.is_file():
+        if operation == "delete":
+            self.fingerprints.pop(path, None)
+        else:
             try:
-                size_bytes = path.stat().st_size
-                
-                # Compute hash if enabled and file is not too large
-                if self.config.compute_hash and size_bytes <= self.config.max_file_size_mb * 1024 * 1024:
-                    with open(path, "rb") as f:
-                        content_hash = hashlib.md5(f.read()).hexdigest()
+                if self.hash_executor is None:
+                    self.hash_executor = ThreadPoolExecutor(
+                        max_workers=self.config.hash_workers,
+                        thread_name_prefix="file-hash"
+                    )
+                fingerprint = await self.loop.run_in_executor(
+                    self.hash_executor, self._fingerprint, path
+                )
+                if fingerprint is not None:
+                    mtime_ns, size_bytes, content_hash, unchanged = fingerprint
+                    if unchanged:
+                        self.stats["hash_skips"] += 1
+                        if operation == "modify":
+                            return None
+                    self.fingerprints[path] = (mtime_ns, size_bytes, content_hash)
             except Exception as e:
                 self.logger.warning(
                     f"Error getting file info: {e}",
@@ -267,6 +513,7 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
         Args:
             event: File event
         """
+        self.stats["emitted_events"] += 1
         try:
             await self.event_callback(event)
         except Exception as e:
@@ -275,6 +522,21 @@ class FileSystemWatcherEventHandler(FileSystemEventHandler):
                 {"event_id": event.id, "event_type": event.type.value},
                 e
             )
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get event pipeline statistics.
+        
+        Returns:
+            Dictionary of statistics
+        """
+        return {**self.stats, "pending_paths": len(self.pending)}
+    
+    def close(self) -> None:
+        """Release the hashing thread pool (recreated on demand)."""
+        if self.hash_executor is not None:
+            self.hash_executor.shutdown(wait=False)
+            self.hash_executor = None
 
 
 class FileSystemWatcher:
@@ -342,9 +604,11 @@ class FileSystemWatcher:
         if not self.running:
             return
         
-        # Stop the observer
+        # Stop the observer, then deliver the changes still being debounced
         self.observer.stop()
         self.observer.join()
+        await self.event_handler.flush()
+        self.event_handler.close()
         self.running = False
         
         self.logger.info("File system watcher stopped")
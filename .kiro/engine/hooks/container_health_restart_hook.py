@@ -13,6 +13,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from ..core.models import AgentHook, HookContext, HookResult
 from ..events.models import EventType, SystemEvent
 from ..utils.logging import get_logger, ExecutionError
+from ..utils.container_runtime import ContainerRuntimeClient, get_container_runtime
 
 
 class ContainerHealthRestartHook(AgentHook):
@@ -37,6 +38,7 @@ class ContainerHealthRestartHook(AgentHook):
         self.excluded_containers = config.get("excluded_containers", [])
         self.health_check_timeout = config.get("health_check_timeout", 30)
         self.restart_timeout = config.get("restart_timeout", 60)
+        self.runtime_detection_ttl = config.get("runtime_detection_ttl", 300)
         
         # Internal state
         self.restart_attempts: Dict[str, int] = {}
@@ -283,107 +285,60 @@ class ContainerHealthRestartHook(AgentHook):
             "network": False
         }
     
-    async def _detect_container_runtime(self) -> str:
+    async def _detect_container_runtime(self) -> ContainerRuntimeClient:
         """
-        Detect the available container runtime.
+        Get the shared client for the available container runtime.
+        
+        Detection is cached across hooks for ``runtime_detection_ttl`` seconds.
         
         Returns:
-            Name of the container runtime ("podman" or "docker")
+            Client for the container runtime (podman or docker)
             
         Raises:
             ExecutionError: If no container runtime is available
         """
-        # Try podman first (preferred)
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "podman", "version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
-            
-            if process.returncode == 0:
-                self.logger.debug("Detected podman container runtime")
-                return "podman"
-        except (Exception, asyncio.TimeoutError):
-            pass
-        
-        # Try docker as fallback
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "docker", "version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=5)
-            
-            if process.returncode == 0:
-                self.logger.debug("Detected docker container runtime")
-                return "docker"
-        except (Exception, asyncio.TimeoutError):
-            pass
-        
-        raise ExecutionError("No container runtime (podman or docker) available")
+        return await get_container_runtime(self.runtime_detection_ttl)
     
-    async def _get_container_status(self, runtime: str, container_name: str) -> str:
+    async def _get_container_status(self, runtime: ContainerRuntimeClient, container_name: str) -> str:
         """
         Get the current status of a container.
         
         Args:
-            runtime: Container runtime to use ("podman" or "docker")
+            runtime: Container runtime client
             container_name: Name of the container
             
         Returns:
             Current status of the container
         """
         try:
-            process = await asyncio.create_subprocess_exec(
-                runtime, "inspect", "--format", "{{.State.Status}}", container_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
-            
-            if process.returncode == 0:
-                return stdout.decode().strip().lower()
-            else:
-                self.logger.warning(f"Failed to get container status: {stderr.decode().strip()}")
-                return "unknown"
+            container_info = await runtime.inspect(container_name, timeout=10)
+            return str(container_info.get("State", {}).get("Status", "unknown")).lower()
+        except ExecutionError as e:
+            self.logger.warning(f"Failed to get container status: {e}")
+            return "unknown"
         except (Exception, asyncio.TimeoutError) as e:
             self.logger.warning(f"Error getting container status: {e}")
             return "unknown"
     
-    async def _restart_container(self, runtime: str, container_name: str) -> Tuple[bool, str]:
+    async def _restart_container(self, runtime: ContainerRuntimeClient, container_name: str) -> Tuple[bool, str]:
         """
         Restart a container using the specified runtime.
         
         Args:
-            runtime: Container runtime to use ("podman" or "docker")
+            runtime: Container runtime client
             container_name: Name of the container to restart
             
         Returns:
             Tuple of (success, output)
         """
         try:
-            process = await asyncio.create_subprocess_exec(
-                runtime, "restart", container_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            success, output = await runtime.restart(container_name, timeout=self.restart_timeout)
             
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.restart_timeout
-            )
-            
-            if process.returncode == 0:
-                output = stdout.decode().strip()
+            if success:
                 self.logger.info(f"Container {container_name} restarted successfully")
-                return True, output
             else:
-                error_output = stderr.decode().strip()
-                self.logger.error(f"Failed to restart container {container_name}: {error_output}")
-                return False, error_output
+                self.logger.error(f"Failed to restart container {container_name}: {output}")
+            return success, output
         except asyncio.TimeoutError:
             error_msg = f"Container restart timed out after {self.restart_timeout} seconds"
             self.logger.error(error_msg)
@@ -393,49 +348,30 @@ class ContainerHealthRestartHook(AgentHook):
             self.logger.error(error_msg)
             return False, error_msg
     
-    async def _check_container_health(self, runtime: str, container_name: str) -> str:
+    async def _check_container_health(self, runtime: ContainerRuntimeClient, container_name: str) -> str:
         """
         Check the health status of a container.
         
         Args:
-            runtime: Container runtime to use ("podman" or "docker")
+            runtime: Container runtime client
             container_name: Name of the container to check
             
         Returns:
             Health status of the container
         """
         try:
-            # Get container info in JSON format
-            process = await asyncio.create_subprocess_exec(
-                runtime, "inspect", container_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=self.health_check_timeout
-            )
-            
-            if process.returncode != 0:
-                self.logger.warning(f"Failed to inspect container: {stderr.decode().strip()}")
-                return "unknown"
-            
-            # Parse JSON output
-            container_info = json.loads(stdout.decode())
-            
-            # Extract health status
-            if isinstance(container_info, list) and len(container_info) > 0:
-                container_info = container_info[0]
+            container_info = await runtime.inspect(container_name, timeout=self.health_check_timeout)
+            state = container_info.get("State") or {}
             
             # Check if container has health check
-            if "State" in container_info and "Health" in container_info["State"]:
-                health_status = container_info["State"]["Health"]["Status"].lower()
+            if state.get("Health"):
+                health_status = state["Health"]["Status"].lower()
                 self.logger.debug(f"Container {container_name} health status: {health_status}")
                 return health_status
             
             # If no health check, check if container is running
-            if "State" in container_info and "Status" in container_info["State"]:
-                status = container_info["State"]["Status"].lower()
+            if "Status" in state:
+                status = state["Status"].lower()
                 self.logger.debug(f"Container {container_name} status: {status}")
                 return status
             
@@ -443,6 +379,9 @@ class ContainerHealthRestartHook(AgentHook):
         except asyncio.TimeoutError:
             self.logger.warning(f"Health check timed out for container {container_name}")
             return "timeout"
+        except ExecutionError as e:
+            self.logger.warning(str(e))
+            return "unknown"
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to parse container inspect output: {e}")
             return "unknown"
@@ -6,14 +6,15 @@ remediation actions when patterns are detected.
 """
 
 import time
-import asyncio
 import re
-from typing import Dict, Any, List, Optional, Pattern, Set, Tuple
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Pattern, Set, Tuple
 from datetime import datetime, timedelta
 
 from ..core.models import AgentHook, HookContext, HookResult
 from ..events.models import EventType, BaseEvent
 from ..utils.logging import get_logger, ExecutionError
+from ..utils.container_runtime import ContainerRuntimeClient, get_container_runtime
 
 
 class LogPattern:
@@ -87,6 +88,57 @@ class LogPattern:
         self.match_count[container_name] = self.match_count.get(container_name, 0) + 1
 
 
+# Backreferences refer to group numbers/names that change inside an alternation
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class LogPatternScanner:
+    """
+    Matches log lines against many log patterns in a single pass.
+    
+    All patterns are combined into one case-insensitive alternation that
+    acts as a prefilter: a line that matches none of them (the vast
+    majority) costs one regex search. Only lines that hit the prefilter
+    are checked against the individual patterns, so the result is exactly
+    the set of patterns whose own regex matches the line.
+    """
+    
+    def __init__(self, patterns: List[LogPattern]):
+        """
+        Initialize the scanner.
+        
+        Args:
+            patterns: Log patterns to match
+        """
+        self.patterns = patterns
+        combinable = [p for p in patterns if not _BACKREFERENCE.search(p.pattern.pattern)]
+        # Patterns that cannot be combined are always checked individually
+        self.always_check = [p for p in patterns if p not in combinable]
+        self.prefilter: Optional[Pattern] = None
+        if combinable:
+            try:
+                self.prefilter = re.compile(
+                    "|".join(f"(?:{p.pattern.pattern})" for p in combinable),
+                    re.IGNORECASE
+                )
+            except re.error:
+                self.always_check = list(patterns)
+    
+    def scan(self, log_line: str) -> List[LogPattern]:
+        """
+        Find the patterns that match a log line.
+        
+        Args:
+            log_line: Log line to check
+            
+        Returns:
+            Matching patterns, in pattern order
+        """
+        if self.prefilter is not None and self.prefilter.search(log_line):
+            return [p for p in self.patterns if p.matches(log_line)]
+        return [p for p in self.always_check if p.matches(log_line)]
+
+
 class ContainerLogAnalysisHook(AgentHook):
     """
     Hook that analyzes container logs for error patterns.
@@ -107,10 +159,15 @@ class ContainerLogAnalysisHook(AgentHook):
         self.analysis_interval_seconds = config.get("analysis_interval_seconds", 60)  # 1 minute
         self.batch_analysis_size = config.get("batch_analysis_size", 50)
         self.enable_remediation = config.get("enable_remediation", True)
+        self.runtime_detection_ttl = config.get("runtime_detection_ttl", 300)
+        
+        self.scanner = LogPatternScanner(self.log_patterns)
         
         # Internal state
         self.last_analysis_time: Dict[str, float] = {}  # container_name -> timestamp
-        self.container_logs: Dict[str, List[Tuple[float, str]]] = {}  # container_name -> [(timestamp, log_line)]
+        self.container_logs: Dict[str, Deque[Tuple[float, str]]] = {}  # container_name -> ring buffer of (timestamp, log_line)
+        self.pending_matches: Dict[str, Deque[Tuple[LogPattern, str, float]]] = {}  # container_name -> matches not yet analyzed
+        self.unanalyzed_lines: Dict[str, int] = {}  # container_name -> lines received since the last analysis
         self.pattern_stats: Dict[str, Dict[str, int]] = {}  # pattern_name -> {container_name: count}
     
     def _load_log_patterns(self, patterns_config: List[Dict[str, Any]]) -> List[LogPattern]:
@@ -286,24 +343,25 @@ class ContainerLogAnalysisHook(AgentHook):
                     execution_time_ms=execution_time_ms
                 )
             
-            # Analyze logs for patterns
+            # Lines were scanned as they arrived; only act on matches found
+            # since the last analysis
+            lines_analyzed, new_matches = self._take_new_matches(container_name)
             matched_patterns = []
-            for timestamp, log_line in logs:
-                for pattern in self.log_patterns:
-                    if pattern.matches(log_line) and pattern.can_trigger(container_name):
-                        matched_patterns.append((pattern, log_line, timestamp))
-                        pattern.mark_triggered(container_name)
-                        
-                        # Update pattern statistics
-                        if pattern.name not in self.pattern_stats:
-                            self.pattern_stats[pattern.name] = {}
-                        self.pattern_stats[pattern.name][container_name] = self.pattern_stats[pattern.name].get(container_name, 0) + 1
+            for pattern, log_line, timestamp in new_matches:
+                if pattern.can_trigger(container_name):
+                    matched_patterns.append((pattern, log_line, timestamp))
+                    pattern.mark_triggered(container_name)
+                    
+                    # Update pattern statistics
+                    if pattern.name not in self.pattern_stats:
+                        self.pattern_stats[pattern.name] = {}
+                    self.pattern_stats[pattern.name][container_name] = self.pattern_stats[pattern.name].get(container_name, 0) + 1
             
             if not matched_patterns:
                 message = f"No error patterns detected in logs for container {container_name}"
                 self.logger.info(
                     message,
-                    {"container_name": container_name, "logs_analyzed": len(logs), "execution_id": context.execution_id}
+                    {"container_name": container_name, "logs_analyzed": lines_analyzed, "execution_id": context.execution_id}
                 )
                 
                 execution_time_ms = (time.time() - start_time) * 1000
@@ -314,7 +372,7 @@ class ContainerLogAnalysisHook(AgentHook):
                     suggestions=[],
                     metrics={
                         "execution_time_ms": execution_time_ms,
-                        "logs_analyzed": len(logs)
+                        "logs_analyzed": lines_analyzed
                     },
                     execution_time_ms=execution_time_ms
                 )
@@ -373,7 +431,7 @@ class ContainerLogAnalysisHook(AgentHook):
                 ],
                 metrics={
                     "execution_time_ms": execution_time_ms,
-                    "logs_analyzed": len(logs),
+                    "logs_analyzed": lines_analyzed,
                     "patterns_detected": len(matched_patterns),
                     "remediation_actions": len(remediation_results),
                     "pattern_details": [{"name": p.name, "severity": p.severity} for p, _, _ in matched_patterns]
@@ -414,7 +472,10 @@ class ContainerLogAnalysisHook(AgentHook):
     
     def _store_log_line(self, container_name: str, log_line: str) -> None:
         """
-        Store a log line for later analysis.
+        Store a log line and scan it for patterns.
+        
+        Each line is scanned exactly once, on arrival; matches are queued
+        until the next analysis of the container.
         
         Args:
             container_name: Name of the container
@@ -422,16 +483,38 @@ class ContainerLogAnalysisHook(AgentHook):
         """
         now = time.time()
         
-        # Initialize container logs if needed
-        if container_name not in self.container_logs:
-            self.container_logs[container_name] = []
+        # Initialize container state if needed
+        logs = self.container_logs.get(container_name)
+        if logs is None:
+            logs = self.container_logs[container_name] = deque(maxlen=self.max_log_lines)
+            self.pending_matches[container_name] = deque(maxlen=self.max_log_lines)
+            self.unanalyzed_lines[container_name] = 0
         
-        # Add log line with timestamp
-        self.container_logs[container_name].append((now, log_line))
+        # Add log line with timestamp; the ring buffer drops the oldest line
+        logs.append((now, log_line))
+        self.unanalyzed_lines[container_name] += 1
         
-        # Limit the number of stored log lines
-        if len(self.container_logs[container_name]) > self.max_log_lines:
-            self.container_logs[container_name] = self.container_logs[container_name][-self.max_log_lines:]
+        for pattern in self.scanner.scan(log_line):
+            self.pending_matches[container_name].append((pattern, log_line, now))
+    
+    def _take_new_matches(self, container_name: str) -> Tuple[int, List[Tuple[LogPattern, str, float]]]:
+        """
+        Advance the analysis cursor of a container.
+        
+        Args:
+            container_name: Name of the container
+            
+        Returns:
+            Tuple of (lines received since the last analysis, their pattern matches)
+        """
+        lines = self.unanalyzed_lines.get(container_name, 0)
+        self.unanalyzed_lines[container_name] = 0
+        pending = self.pending_matches.get(container_name)
+        if not pending:
+            return lines, []
+        matches = list(pending)
+        pending.clear()
+        return lines, matches
     
     def _should_analyze_container(self, container_name: str) -> bool:
         """
@@ -450,14 +533,13 @@ class ContainerLogAnalysisHook(AgentHook):
         if time_since_analysis >= self.analysis_interval_seconds:
             return True
         
-        # Check if we have enough log lines for batch analysis
-        logs = self.container_logs.get(container_name, [])
-        if len(logs) >= self.batch_analysis_size:
+        # Check if enough new log lines arrived for batch analysis
+        if self.unanalyzed_lines.get(container_name, 0) >= self.batch_analysis_size:
             return True
         
         return False
     
-    def _get_container_logs(self, container_name: str) -> List[Tuple[float, str]]:
+    def _get_container_logs(self, container_name: str) -> Deque[Tuple[float, str]]:
         """
         Get logs for a container.
         
@@ -465,9 +547,9 @@ class ContainerLogAnalysisHook(AgentHook):
             container_name: Name of the container
             
         Returns:
-            List of (timestamp, log_line) tuples
+            Ring buffer of (timestamp, log_line) tuples
         """
-        return self.container_logs.get(container_name, [])
+        return self.container_logs.get(container_name, deque())
     
     async def _take_remediation_action(self, container_name: str, action: str, args: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -521,17 +603,12 @@ class ContainerLogAnalysisHook(AgentHook):
                 # For now, we'll just log the intention
             
             # Restart the container
-            restart_process = await asyncio.create_subprocess_exec(
-                runtime, "restart", container_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            restart_stdout, restart_stderr = await restart_process.communicate()
+            restarted, output = await runtime.restart(container_name)
             
-            if restart_process.returncode == 0:
+            if restarted:
                 return True, f"Container {container_name} restarted successfully"
             else:
-                return False, f"Failed to restart container {container_name}: {restart_stderr.decode().strip()}"
+                return False, f"Failed to restart container {container_name}: {output}"
         
         except Exception as e:
             return False, f"Error restarting container: {e}"
@@ -572,23 +649,13 @@ class ContainerLogAnalysisHook(AgentHook):
             actions_taken = []
             
             # Prune unused containers
-            prune_process = await asyncio.create_subprocess_exec(
-                runtime, "container", "prune", "--force",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await prune_process.communicate()
-            if prune_process.returncode == 0:
+            pruned, _ = await runtime.prune("container")
+            if pruned:
                 actions_taken.append("Pruned unused containers")
             
             # Prune unused images
-            image_prune_process = await asyncio.create_subprocess_exec(
-                runtime, "image", "prune", "--force",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await image_prune_process.communicate()
-            if image_prune_process.returncode == 0:
+            pruned, _ = await runtime.prune("image")
+            if pruned:
                 actions_taken.append("Pruned unused images")
             
             return True, f"Disk space cleanup completed: {', '.join(actions_taken)}"
@@ -646,45 +713,19 @@ class ContainerLogAnalysisHook(AgentHook):
         )
         return True, "Performance analysis initiated"
     
-    async def _detect_container_runtime(self) -> str:
+    async def _detect_container_runtime(self) -> ContainerRuntimeClient:
         """
-        Detect the available container runtime.
+        Get the shared client for the available container runtime.
+        
+        Detection is cached across hooks for ``runtime_detection_ttl`` seconds.
         
         Returns:
-            Name of the container runtime ("podman" or "docker")
+            Client for the container runtime (podman or docker)
             
         Raises:
             ExecutionError: If no container runtime is available
         """
-        # Try podman first (preferred)
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "podman", "version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
-                return "podman"
-        except Exception:
-            pass
-        
-        # Try docker as fallback
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "docker", "version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
-                return "docker"
-        except Exception:
-            pass
-        
-        raise ExecutionError("No container runtime (podman or docker) available")
+        return await get_container_runtime(self.runtime_detection_ttl)
     
     def get_pattern_statistics(self) -> Dict[str, Any]:
         """
@@ -728,6 +769,8 @@ class ContainerLogAnalysisHook(AgentHook):
         """
         if container_name in self.container_logs:
             del self.container_logs[container_name]
+            self.pending_matches.pop(container_name, None)
+            self.unanalyzed_lines.pop(container_name, None)
             self.logger.info(f"Cleared logs for container {container_name}")
             return True
         return False
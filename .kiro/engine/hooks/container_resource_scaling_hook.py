@@ -6,14 +6,13 @@ based on usage patterns to prevent resource exhaustion.
 """
 
 import time
-import asyncio
-import json
 from typing import Dict, Any, List, Optional, Tuple
-import statistics
 
 from ..core.models import AgentHook, HookContext, HookResult
 from ..events.models import EventType, MetricEvent
 from ..utils.logging import get_logger, ExecutionError
+from ..utils.rolling_window import RollingWindowAggregator
+from ..utils.container_runtime import ContainerRuntimeClient, get_container_runtime
 
 
 class ContainerResourceScalingHook(AgentHook):
@@ -45,9 +44,11 @@ class ContainerResourceScalingHook(AgentHook):
         self.excluded_containers = config.get("excluded_containers", [])
         self.observation_window_seconds = config.get("observation_window_seconds", 600)  # 10 minutes
         self.min_data_points = config.get("min_data_points", 5)
+        self.metric_window_buckets = config.get("metric_window_buckets", 60)
+        self.runtime_detection_ttl = config.get("runtime_detection_ttl", 300)
         
         # Internal state
-        self.resource_metrics: Dict[str, Dict[str, List[Tuple[float, float]]]] = {}  # container -> metric -> [(timestamp, value)]
+        self.resource_metrics: Dict[str, Dict[str, RollingWindowAggregator]] = {}  # container -> metric -> rolling window
         self.last_scaling_time: Dict[str, float] = {}  # container -> timestamp
         self.scaling_history: Dict[str, List[Dict[str, Any]]] = {}  # container -> [scaling_events]
     
@@ -343,25 +344,20 @@ class ContainerResourceScalingHook(AgentHook):
             metric_name: Name of the metric
             value: Metric value
         """
-        now = time.time()
-        
-        # Initialize container metrics if needed
-        if container_name not in self.resource_metrics:
-            self.resource_metrics[container_name] = {}
-        
-        # Initialize metric list if needed
-        if metric_name not in self.resource_metrics[container_name]:
-            self.resource_metrics[container_name][metric_name] = []
-        
-        # Add metric value with timestamp
-        self.resource_metrics[container_name][metric_name].append((now, value))
+        container_metrics = self.resource_metrics.setdefault(container_name, {})
+        
+        # Initialize the metric's rolling window if needed
+        window = container_metrics.get(metric_name)
+        if window is None:
+            window = container_metrics[metric_name] = RollingWindowAggregator(
+                self.observation_window_seconds,
+                num_buckets=self.metric_window_buckets,
+                ewma_alpha=0.3,
+                histogram_range=(0.0, 100.0) if metric_name.endswith("_percent") else None
+            )
         
-        # Remove old metrics
-        cutoff_time = now - self.observation_window_seconds
-        self.resource_metrics[container_name][metric_name] = [
-            (ts, val) for ts, val in self.resource_metrics[container_name][metric_name]
-            if ts >= cutoff_time
-        ]
+        # Old samples expire as the window advances
+        window.add(value)
     
     def _has_sufficient_metrics(self, container_name: str) -> bool:
         """
@@ -377,11 +373,12 @@ class ContainerResourceScalingHook(AgentHook):
             return False
         
         # Check if we have CPU and memory metrics
-        cpu_metrics = self.resource_metrics[container_name].get("container.cpu.usage_percent", [])
-        memory_metrics = self.resource_metrics[container_name].get("container.memory.usage_percent", [])
+        cpu_metrics = self.resource_metrics[container_name].get("container.cpu.usage_percent")
+        memory_metrics = self.resource_metrics[container_name].get("container.memory.usage_percent")
         
         # We need at least min_data_points for each metric
-        return len(cpu_metrics) >= self.min_data_points or len(memory_metrics) >= self.min_data_points
+        return (cpu_metrics is not None and cpu_metrics.count() >= self.min_data_points) or \
+               (memory_metrics is not None and memory_metrics.count() >= self.min_data_points)
     
     def _get_average_metric(self, container_name: str, metric_name: str) -> Optional[float]:
         """
@@ -397,60 +394,32 @@ class ContainerResourceScalingHook(AgentHook):
         if container_name not in self.resource_metrics:
             return None
         
-        metrics = self.resource_metrics[container_name].get(metric_name, [])
-        if len(metrics) < self.min_data_points:
+        window = self.resource_metrics[container_name].get(metric_name)
+        if window is None or window.count() < self.min_data_points:
             return None
         
-        # Calculate average of metric values
-        values = [val for _, val in metrics]
-        return statistics.mean(values)
+        return window.mean()
     
-    async def _detect_container_runtime(self) -> str:
+    async def _detect_container_runtime(self) -> ContainerRuntimeClient:
         """
-        Detect the available container runtime.
+        Get the shared client for the available container runtime.
+        
+        Detection is cached across hooks for ``runtime_detection_ttl`` seconds.
         
         Returns:
-            Name of the container runtime ("podman" or "docker")
+            Client for the container runtime (podman or docker)
             
         Raises:
             ExecutionError: If no container runtime is available
         """
-        # Try podman first (preferred)
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "podman", "version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
-                return "podman"
-        except Exception:
-            pass
-        
-        # Try docker as fallback
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "docker", "version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
-                return "docker"
-        except Exception:
-            pass
-        
-        raise ExecutionError("No container runtime (podman or docker) available")
+        return await get_container_runtime(self.runtime_detection_ttl)
     
-    async def _get_container_resource_limits(self, runtime: str, container_name: str) -> Tuple[float, int]:
+    async def _get_container_resource_limits(self, runtime: ContainerRuntimeClient, container_name: str) -> Tuple[float, int]:
         """
         Get current resource limits for a container.
         
         Args:
-            runtime: Container runtime to use ("podman" or "docker")
+            runtime: Container runtime client
             container_name: Name of the container
             
         Returns:
@@ -460,42 +429,25 @@ class ContainerResourceScalingHook(AgentHook):
             ExecutionError: If the container information cannot be retrieved
         """
         try:
-            # Get container info in JSON format
-            process = await asyncio.create_subprocess_exec(
-                runtime, "inspect", container_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                raise ExecutionError(f"Failed to inspect container: {stderr.decode().strip()}")
-            
-            # Parse JSON output
-            container_info = json.loads(stdout.decode())
-            
-            # Extract resource limits
-            if isinstance(container_info, list) and len(container_info) > 0:
-                container_info = container_info[0]
+            container_info = await runtime.inspect(container_name)
+            host_config = container_info.get("HostConfig") or {}
             
             # Get CPU limit
             cpu_limit = 1.0  # Default to 1 core
-            if "HostConfig" in container_info and "NanoCpus" in container_info["HostConfig"]:
+            if host_config.get("NanoCpus", 0) > 0:
                 # NanoCpus is in billionths of a CPU
-                nano_cpus = container_info["HostConfig"]["NanoCpus"]
-                if nano_cpus > 0:
-                    cpu_limit = nano_cpus / 1_000_000_000
-            elif "HostConfig" in container_info and "CpuQuota" in container_info["HostConfig"] and "CpuPeriod" in container_info["HostConfig"]:
+                cpu_limit = host_config["NanoCpus"] / 1_000_000_000
+            elif "CpuQuota" in host_config and "CpuPeriod" in host_config:
                 # CpuQuota and CpuPeriod can be used to calculate CPU limit
-                cpu_quota = container_info["HostConfig"]["CpuQuota"]
-                cpu_period = container_info["HostConfig"]["CpuPeriod"]
+                cpu_quota = host_config["CpuQuota"]
+                cpu_period = host_config["CpuPeriod"]
                 if cpu_quota > 0 and cpu_period > 0:
                     cpu_limit = cpu_quota / cpu_period
             
             # Get memory limit
             memory_limit_mb = 1024  # Default to 1GB
-            if "HostConfig" in container_info and "Memory" in container_info["HostConfig"]:
-                memory_bytes = container_info["HostConfig"]["Memory"]
+            if "Memory" in host_config:
+                memory_bytes = host_config["Memory"]
                 if memory_bytes > 0:
                     memory_limit_mb = memory_bytes / (1024 * 1024)
             
@@ -506,12 +458,12 @@ class ContainerResourceScalingHook(AgentHook):
                 raise ExecutionError(f"Error getting container resource limits: {e}")
             raise
     
-    async def _update_container_resources(self, runtime: str, container_name: str, cpu_limit: float, memory_limit_mb: int) -> Tuple[bool, str]:
+    async def _update_container_resources(self, runtime: ContainerRuntimeClient, container_name: str, cpu_limit: float, memory_limit_mb: int) -> Tuple[bool, str]:
         """
         Update resource limits for a container.
         
         Args:
-            runtime: Container runtime to use ("podman" or "docker")
+            runtime: Container runtime client
             container_name: Name of the container
             cpu_limit: New CPU limit in cores
             memory_limit_mb: New memory limit in MB
@@ -522,19 +474,7 @@ class ContainerResourceScalingHook(AgentHook):
         try:
             # Convert limits to the format expected by the container runtime
             memory_bytes = memory_limit_mb * 1024 * 1024  # Convert to bytes
-            
-            # Update container resources using the update command
-            update_process = await asyncio.create_subprocess_exec(
-                runtime, "update", "--cpus", str(cpu_limit), "--memory", f"{memory_bytes}b", container_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            update_stdout, update_stderr = await update_process.communicate()
-            
-            if update_process.returncode == 0:
-                return True, "Container resources updated successfully"
-            else:
-                return False, f"Failed to update container resources: {update_stderr.decode().strip()}"
+            return await runtime.update_resources(container_name, cpu_limit, memory_bytes)
         
         except Exception as e:
             return False, str(e)
@@ -584,13 +524,19 @@ class ContainerResourceScalingHook(AgentHook):
         current_metrics = {}
         
         if container_name in self.resource_metrics:
-            for metric_name, values in self.resource_metrics[container_name].items():
-                if values:
+            for metric_name, window in self.resource_metrics[container_name].items():
+                stats = window.snapshot()
+                if stats["count"]:
                     current_metrics[metric_name] = {
-                        "current_value": values[-1][1],
-                        "average_value": statistics.mean([v for _, v in values]),
-                        "data_points": len(values)
+                        "current_value": stats["last"],
+                        "average_value": stats["mean"],
+                        "data_points": stats["count"],
+                        "min_value": stats["min"],
+                        "max_value": stats["max"],
+                        "ewma_value": stats["ewma"]
                     }
+                    if "p95" in stats:
+                        current_metrics[metric_name]["p95_value"] = stats["p95"]
         
         return {
             "container_name": container_name,
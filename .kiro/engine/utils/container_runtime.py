@@ -0,0 +1,538 @@
+"""
+Shared container runtime access for the Agent Hooks Enhancement system.
+
+This module detects the available container runtime (podman preferred,
+docker as fallback) once and caches the result for a configurable time.
+Runtime operations go through a ``ContainerRuntimeClient`` that speaks
+the runtime's REST API over its Unix socket with a small pool of
+keep-alive connections, and falls back to the CLI when no socket is
+reachable.
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from .logging import get_logger, ExecutionError
+
+
+DEFAULT_DETECTION_TTL_SECONDS = 300
+CLI_DETECTION_TIMEOUT_SECONDS = 5
+
+
+class ContainerRuntimeError(ExecutionError):
+    """Error raised when the container runtime rejects or fails a request."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.status_code = status_code
+
+
+class _UnixHTTPConnectionPool:
+    """
+    Minimal HTTP/1.1 client over a Unix socket with keep-alive pooling.
+
+    At most ``max_connections`` requests are in flight; idle connections
+    are reused until the server closes them.
+    """
+
+    def __init__(self, socket_path: str, max_connections: int = 4):
+        self.socket_path = socket_path
+        self.max_connections = max_connections
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.connections_opened = 0
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Any] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Send a request and read the full response.
+
+        Args:
+            method: HTTP method
+            path: Request path including the query string
+            body: JSON-serializable request body
+            timeout: Timeout in seconds for the whole exchange
+
+        Returns:
+            Tuple of (status code, response body)
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_connections)
+        payload = json.dumps(body).encode() if body is not None else b""
+
+        async with self._slots:
+            # A pooled connection may have been closed by the server; retry
+            # once on a fresh connection in that case
+            for attempt in range(2):
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._open()
+                try:
+                    status, data, keep_alive = await asyncio.wait_for(
+                        self._exchange(reader, writer, method, path, payload),
+                        timeout=timeout
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    writer.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise ConnectionError(f"Connection to {self.socket_path} failed: {e}") from e
+                except BaseException:
+                    writer.close()
+                    raise
+
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, data
+        raise ConnectionError(f"Connection to {self.socket_path} failed")
+
+    async def _open(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        self.connections_opened += 1
+        return await asyncio.open_unix_connection(self.socket_path)
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        method: str,
+        path: str,
+        payload: bytes
+    ) -> Tuple[int, bytes, bool]:
+        """Write one request and parse its response."""
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            "Host: localhost\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode() + payload)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        status = int(status_line.split()[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(chunks)
+        elif "content-length" in headers:
+            data = await reader.readexactly(int(headers["content-length"]))
+        elif status in (204, 304) or method == "HEAD":
+            data = b""
+        else:
+            data = await reader.read()
+            keep_alive = False
+
+        return status, data, keep_alive
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while self._idle:
+            _, writer = self._idle.pop()
+            try:
+                writer.close()
+            except RuntimeError:
+                pass  # Its event loop has already been closed
+
+
+class ContainerRuntimeClient:
+    """
+    Client for container operations used by the container hooks.
+
+    With a ``socket_path`` every operation is a request on the runtime's
+    Docker-compatible REST API (served by both podman and docker), using
+    pooled keep-alive connections. Without one, or if the socket stops
+    answering, operations fall back to the ``podman``/``docker`` CLI.
+    """
+
+    def __init__(self, runtime: str, socket_path: Optional[str] = None, max_connections: int = 4):
+        """
+        Initialize the runtime client.
+
+        Args:
+            runtime: Container runtime name ("podman" or "docker")
+            socket_path: Path of the runtime's API socket (None = CLI only)
+            max_connections: Maximum number of pooled API connections
+        """
+        self.logger = get_logger("utils.container_runtime")
+        self.runtime = runtime
+        self.socket_path = socket_path
+        self._pool = _UnixHTTPConnectionPool(socket_path, max_connections) if socket_path else None
+        self.stats = {"api_requests": 0, "cli_calls": 0, "api_fallbacks": 0}
+
+    def __str__(self) -> str:
+        return self.runtime
+
+    @property
+    def uses_api(self) -> bool:
+        """Whether operations currently go through the REST API."""
+        return self._pool is not None
+
+    async def _api(
+        self,
+        method: str,
+        path: str,
+        body: Optional[Any] = None,
+        timeout: Optional[float] = None
+    ) -> Optional[Tuple[int, Any]]:
+        """
+        Call the REST API, or return None if it is unavailable.
+
+        Returns:
+            Tuple of (status code, decoded JSON body or text), or None
+        """
+        if self._pool is None:
+            return None
+        try:
+            self.stats["api_requests"] += 1
+            status, data = await self._pool.request(method, path, body, timeout)
+        except (ConnectionError, OSError) as e:
+            self.logger.warning(
+                f"Container runtime API unavailable, falling back to CLI: {e}",
+                {"runtime": self.runtime, "socket_path": self.socket_path}
+            )
+            self.stats["api_fallbacks"] += 1
+            self._pool.close()
+            self._pool = None
+            return None
+
+        text = data.decode(errors="replace")
+        try:
+            return status, json.loads(text) if text else None
+        except json.JSONDecodeError:
+            return status, text
+
+    async def _cli(self, *args: str, timeout: Optional[float] = None) -> Tuple[int, str, str]:
+        """
+        Run a runtime CLI command.
+
+        Returns:
+            Tuple of (return code, stdout, stderr)
+        """
+        self.stats["cli_calls"] += 1
+        process = await asyncio.create_subprocess_exec(
+            self.runtime, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+        return process.returncode, stdout.decode().strip(), stderr.decode().strip()
+
+    @staticmethod
+    def _error_message(result: Any) -> str:
+        if isinstance(result, dict):
+            return result.get("message") or result.get("cause") or json.dumps(result)
+        return str(result or "")
+
+    async def inspect(self, container_name: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get the inspect document of a container.
+
+        Args:
+            container_name: Name or ID of the container
+            timeout: Timeout in seconds
+
+        Returns:
+            Container inspect document
+
+        Raises:
+            ContainerRuntimeError: If the container cannot be inspected
+        """
+        response = await self._api("GET", f"/containers/{quote(container_name, safe='')}/json", timeout=timeout)
+        if response is not None:
+            status, result = response
+            if status == 200 and isinstance(result, dict):
+                return result
+            raise ContainerRuntimeError(
+                f"Failed to inspect container: {self._error_message(result)}", status_code=status
+            )
+
+        returncode, stdout, stderr = await self._cli("inspect", container_name, timeout=timeout)
+        if returncode != 0:
+            raise ContainerRuntimeError(f"Failed to inspect container: {stderr}")
+        info = json.loads(stdout)
+        if isinstance(info, list):
+            if not info:
+                raise ContainerRuntimeError(f"Failed to inspect container: {container_name} not found")
+            info = info[0]
+        return info
+
+    async def restart(self, container_name: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """
+        Restart a container.
+
+        Args:
+            container_name: Name or ID of the container
+            timeout: Timeout in seconds for the whole restart
+
+        Returns:
+            Tuple of (success, output)
+        """
+        response = await self._api("POST", f"/containers/{quote(container_name, safe='')}/restart", timeout=timeout)
+        if response is not None:
+            status, result = response
+            if status in (200, 204):
+                return True, container_name
+            return False, self._error_message(result)
+
+        returncode, stdout, stderr = await self._cli("restart", container_name, timeout=timeout)
+        return (True, stdout) if returncode == 0 else (False, stderr)
+
+    async def update_resources(
+        self,
+        container_name: str,
+        cpu_limit: float,
+        memory_bytes: int,
+        timeout: Optional[float] = None
+    ) -> Tuple[bool, str]:
+        """
+        Update the CPU and memory limits of a container.
+
+        Args:
+            container_name: Name or ID of the container
+            cpu_limit: CPU limit in cores
+            memory_bytes: Memory limit in bytes
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (success, output)
+        """
+        name = quote(container_name, safe='')
+        if self.runtime == "podman":
+            # Podman exposes updates on its native API with an OCI resources body
+            path = f"/v4.0.0/libpod/containers/{name}/update"
+            body = {
+                "cpu": {"quota": int(cpu_limit * 100_000), "period": 100_000},
+                "memory": {"limit": memory_bytes}
+            }
+        else:
+            path = f"/containers/{name}/update"
+            body = {"NanoCpus": int(cpu_limit * 1_000_000_000), "Memory": memory_bytes}
+
+        response = await self._api("POST", path, body=body, timeout=timeout)
+        if response is not None:
+            status, result = response
+            if status in (200, 201, 204):
+                return True, "Container resources updated successfully"
+            return False, f"Failed to update container resources: {self._error_message(result)}"
+
+        returncode, _, stderr = await self._cli(
+            "update", "--cpus", str(cpu_limit), "--memory", f"{memory_bytes}b", container_name,
+            timeout=timeout
+        )
+        if returncode == 0:
+            return True, "Container resources updated successfully"
+        return False, f"Failed to update container resources: {stderr}"
+
+    async def prune(self, kind: str, timeout: Optional[float] = None) -> Tuple[bool, str]:
+        """
+        Remove unused containers or images.
+
+        Args:
+            kind: "container" or "image"
+            timeout: Timeout in seconds
+
+        Returns:
+            Tuple of (success, output)
+        """
+        if kind not in ("container", "image"):
+            raise ValueError(f"Unknown prune kind: {kind}")
+
+        response = await self._api("POST", f"/{kind}s/prune", timeout=timeout)
+        if response is not None:
+            status, result = response
+            return status == 200, self._error_message(result) if status != 200 else f"Pruned unused {kind}s"
+
+        returncode, stdout, stderr = await self._cli(kind, "prune", "--force", timeout=timeout)
+        return (True, stdout) if returncode == 0 else (False, stderr)
+
+    async def ping(self, timeout: float = CLI_DETECTION_TIMEOUT_SECONDS) -> bool:
+        """
+        Check whether the runtime answers.
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            True if the runtime is reachable
+        """
+        try:
+            response = await self._api("GET", "/version", timeout=timeout)
+            if response is not None:
+                return response[0] == 200
+            returncode, _, _ = await self._cli("version", timeout=timeout)
+            return returncode == 0
+        except (OSError, asyncio.TimeoutError):
+            return False
+
+    def close(self) -> None:
+        """Close pooled API connections."""
+        if self._pool is not None:
+            self._pool.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get client statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {
+            "runtime": self.runtime,
+            "socket_path": self.socket_path,
+            "uses_api": self.uses_api,
+            "connections_opened": self._pool.connections_opened if self._pool else 0,
+            **self.stats
+        }
+
+
+def default_socket_candidates() -> List[Tuple[str, str]]:
+    """
+    List the API sockets to probe, in order of preference.
+
+    Returns:
+        List of (runtime, socket_path) tuples
+    """
+    candidates: List[Tuple[str, str]] = []
+    for runtime, variable in (("podman", "CONTAINER_HOST"), ("docker", "DOCKER_HOST")):
+        host = os.environ.get(variable, "")
+        if host.startswith("unix://"):
+            candidates.append((runtime, host[len("unix://"):]))
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir and hasattr(os, "getuid"):
+        runtime_dir = f"/run/user/{os.getuid()}"
+    if runtime_dir:
+        candidates.append(("podman", os.path.join(runtime_dir, "podman", "podman.sock")))
+    candidates.append(("podman", "/run/podman/podman.sock"))
+    candidates.append(("docker", "/var/run/docker.sock"))
+    return candidates
+
+
+async def detect_container_runtime(
+    socket_candidates: Optional[List[Tuple[str, str]]] = None
+) -> ContainerRuntimeClient:
+    """
+    Detect the available container runtime.
+
+    API sockets are probed first; if none answers, the ``podman`` and
+    ``docker`` CLIs are tried in that order.
+
+    Args:
+        socket_candidates: (runtime, socket_path) tuples to probe (None = defaults)
+
+    Returns:
+        Client for the detected runtime
+
+    Raises:
+        ExecutionError: If no container runtime is available
+    """
+    logger = get_logger("utils.container_runtime")
+
+    for runtime, socket_path in socket_candidates if socket_candidates is not None else default_socket_candidates():
+        if not os.path.exists(socket_path):
+            continue
+        client = ContainerRuntimeClient(runtime, socket_path)
+        if await client.ping():
+            logger.debug(f"Detected {runtime} API socket at {socket_path}")
+            return client
+        client.close()
+
+    for runtime in ("podman", "docker"):
+        client = ContainerRuntimeClient(runtime)
+        try:
+            if await client.ping():
+                logger.debug(f"Detected {runtime} container runtime CLI")
+                return client
+        except Exception:
+            pass
+
+    raise ExecutionError("No container runtime (podman or docker) available")
+
+
+_shared_client: Optional[ContainerRuntimeClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_client_expires_at = 0.0
+_detection_lock: Optional[asyncio.Lock] = None
+
+
+async def get_container_runtime(
+    ttl_seconds: float = DEFAULT_DETECTION_TTL_SECONDS,
+    socket_candidates: Optional[List[Tuple[str, str]]] = None
+) -> ContainerRuntimeClient:
+    """
+    Get the shared runtime client, detecting the runtime if needed.
+
+    The detection result is cached for ``ttl_seconds`` so hooks do not
+    probe the runtime on every execution. The client (and its pooled
+    connections) belongs to the running event loop.
+
+    Args:
+        ttl_seconds: How long a detection result stays valid
+        socket_candidates: (runtime, socket_path) tuples to probe (None = defaults)
+
+    Returns:
+        Shared container runtime client
+
+    Raises:
+        ExecutionError: If no container runtime is available
+    """
+    global _shared_client, _shared_client_loop, _shared_client_expires_at, _detection_lock
+
+    loop = asyncio.get_running_loop()
+    if _shared_client_loop is not loop:
+        reset_container_runtime()
+        _shared_client_loop = loop
+        _detection_lock = asyncio.Lock()
+
+    async with _detection_lock:
+        if _shared_client is None or time.monotonic() >= _shared_client_expires_at:
+            client = await detect_container_runtime(socket_candidates)
+            if _shared_client is not None:
+                _shared_client.close()
+            _shared_client = client
+            _shared_client_expires_at = time.monotonic() + ttl_seconds
+        return _shared_client
+
+
+def reset_container_runtime() -> None:
+    """Forget the cached runtime so the next call detects it again."""
+    global _shared_client, _shared_client_loop, _shared_client_expires_at
+    if _shared_client is not None:
+        _shared_client.close()
+    _shared_client = None
+    _shared_client_loop = None
+    _shared_client_expires_at = 0.0
@@ -0,0 +1,194 @@
+"""
+Fake container runtime API server for the Agent Hooks Enhancement system.
+
+This module serves the subset of the podman/docker REST API used by
+``ContainerRuntimeClient`` on a Unix socket, backed by in-memory container
+state, so the container hooks can be exercised without a real runtime.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+
+class FakeContainerRuntimeServer:
+    """
+    In-memory container runtime speaking HTTP/1.1 over a Unix socket.
+
+    Usage:
+        async with FakeContainerRuntimeServer() as server:
+            server.add_container("web", status="running")
+            client = ContainerRuntimeClient("podman", server.socket_path)
+    """
+
+    def __init__(self, socket_path: Optional[str] = None):
+        """
+        Initialize the fake server.
+
+        Args:
+            socket_path: Path of the socket to listen on (None = temporary path)
+        """
+        self._tmpdir = None
+        if socket_path is None:
+            self._tmpdir = tempfile.TemporaryDirectory()
+            socket_path = os.path.join(self._tmpdir.name, "runtime.sock")
+        self.socket_path = socket_path
+        self.containers: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, str, Any]] = []
+        self.connections = 0
+        self._writers: List[asyncio.StreamWriter] = []
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def add_container(
+        self,
+        name: str,
+        status: str = "running",
+        health: Optional[str] = None,
+        nano_cpus: int = 0,
+        memory: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Add a container to the fake runtime.
+
+        Args:
+            name: Container name
+            status: Container state ("running", "exited", ...)
+            health: Health check status (None = no health check)
+            nano_cpus: CPU limit in billionths of a CPU
+            memory: Memory limit in bytes
+
+        Returns:
+            Inspect document of the container
+        """
+        state: Dict[str, Any] = {"Status": status, "Running": status == "running"}
+        if health is not None:
+            state["Health"] = {"Status": health}
+        info = {
+            "Id": f"{len(self.containers):064x}",
+            "Name": name,
+            "State": state,
+            "HostConfig": {"NanoCpus": nano_cpus, "Memory": memory, "CpuQuota": 0, "CpuPeriod": 0},
+            "RestartCount": 0,
+        }
+        self.containers[name] = info
+        return info
+
+    async def start(self) -> None:
+        """Start listening on the socket."""
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+
+    async def stop(self) -> None:
+        """Stop the server and remove the socket."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            while self._writers:
+                await asyncio.sleep(0)  # Let connection handlers see EOF and exit
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        if self._tmpdir is not None:
+            self._tmpdir.cleanup()
+            self._tmpdir = None
+
+    async def __aenter__(self) -> "FakeContainerRuntimeServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.append(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                raw = await reader.readexactly(length) if length else b""
+                body = json.loads(raw) if raw else None
+
+                path = urlsplit(target).path
+                self.requests.append((method, path, body))
+                status, payload = self._dispatch(method, path, body)
+
+                data = json.dumps(payload).encode() if payload is not None else b""
+                head = f"HTTP/1.1 {status} {'OK' if status < 400 else 'Error'}\r\n"
+                if status == 204:
+                    head += "\r\n"
+                else:
+                    head += f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+                writer.write(head.encode() + data)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.remove(writer)
+            writer.close()
+
+    def _dispatch(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        """Route a request to the in-memory runtime."""
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if parts and parts[0].startswith("v") and parts[0][1:2].isdigit():
+            parts = parts[1:]  # Drop the API version prefix
+        if parts and parts[0] == "libpod":
+            parts = parts[1:]
+
+        if method == "GET" and parts == ["version"]:
+            return 200, {"Version": "fake", "ApiVersion": "1.41"}
+        if method == "POST" and len(parts) == 2 and parts[1] == "prune" and parts[0] in ("containers", "images"):
+            if parts[0] == "containers":
+                removed = [name for name, info in self.containers.items() if info["State"]["Status"] == "exited"]
+                for name in removed:
+                    del self.containers[name]
+                return 200, {"ContainersDeleted": removed, "SpaceReclaimed": 0}
+            return 200, {"ImagesDeleted": [], "SpaceReclaimed": 0}
+
+        if len(parts) != 3 or parts[0] != "containers":
+            return 404, {"message": f"page not found: {path}"}
+        info = self.containers.get(parts[1])
+        if info is None:
+            return 404, {"message": f"no such container: {parts[1]}"}
+
+        action = parts[2]
+        if method == "GET" and action == "json":
+            return 200, info
+        if method == "POST" and action == "restart":
+            info["State"]["Status"] = "running"
+            info["State"]["Running"] = True
+            if "Health" in info["State"]:
+                info["State"]["Health"]["Status"] = "healthy"
+            info["RestartCount"] += 1
+            return 204, None
+        if method == "POST" and action == "update":
+            host_config = info["HostConfig"]
+            body = body or {}
+            if "NanoCpus" in body:
+                host_config["NanoCpus"] = body["NanoCpus"]
+            if "Memory" in body:
+                host_config["Memory"] = body["Memory"]
+            if "cpu" in body:
+                host_config["NanoCpus"] = 0
+                host_config["CpuQuota"] = body["cpu"].get("quota", 0)
+                host_config["CpuPeriod"] = body["cpu"].get("period", 0)
+            if "memory" in body:
+                host_config["Memory"] = body["memory"].get("limit", 0)
+            return 200, {"Warnings": []}
+        return 404, {"message": f"page not found: {path}"}
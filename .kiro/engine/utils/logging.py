@@ -16,6 +16,37 @@ class ExecutionError(Exception):
         self.context = kwargs
 
 
+class TimeoutError(ExecutionError):
+    """Exception raised when hook execution times out."""
+
+
+class ConfigurationError(Exception):
+    """Exception raised for invalid hook registry configuration."""
+
+
+class _ContextFilter(logging.Filter):
+    """
+    Accept the ``logger.info(message, context, error)`` calling convention.
+    
+    The context dictionary is stored on the record as ``context`` and an
+    error, if given, becomes the record's exception info, so neither is
+    used for %-formatting the message.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        args = record.args
+        if isinstance(args, dict):
+            record.context = args
+            record.args = ()
+        elif isinstance(args, tuple) and args and isinstance(args[0], dict):
+            record.context = args[0]
+            error = args[1] if len(args) > 1 else None
+            if isinstance(error, BaseException) and not record.exc_info:
+                record.exc_info = (type(error), error, error.__traceback__)
+            record.args = ()
+        return True
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for the given name.
@@ -36,6 +67,7 @@ def get_logger(name: str) -> logging.Logger:
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        logger.addFilter(_ContextFilter())
         logger.setLevel(logging.INFO)
     
     return logger
\ No newline at end of file
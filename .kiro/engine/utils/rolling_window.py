@@ -0,0 +1,263 @@
+"""
+Rolling time-window aggregation for the Agent Hooks Enhancement system.
+
+This module implements a time-bucketed ring buffer that keeps running
+statistics over a sliding time window, so recording a sample and reading
+the window's statistics cost the same no matter how many samples the
+window holds.
+"""
+
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class _Bucket:
+    """Statistics of the samples that fell into one time slice."""
+
+    __slots__ = ("epoch", "count", "total", "minimum", "maximum", "histogram")
+
+    def __init__(self, histogram_bins: int):
+        self.epoch = -1
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.histogram = [0] * histogram_bins if histogram_bins else None
+
+    def reset(self, epoch: int) -> None:
+        self.epoch = epoch
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        if self.histogram is not None:
+            for i in range(len(self.histogram)):
+                self.histogram[i] = 0
+
+
+class RollingWindowAggregator:
+    """
+    Running statistics over the last ``window_seconds`` of samples.
+
+    The window is split into ``num_buckets`` time slices held in a ring
+    buffer. Each slice keeps count, sum, min and max (and, if a histogram
+    range is configured, per-bin counts); window-wide count, sum and
+    histogram are maintained incrementally as slices enter and expire.
+    Memory is bounded by the number of buckets, and expiry happens at
+    bucket granularity.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        num_buckets: int = 60,
+        ewma_alpha: Optional[float] = None,
+        histogram_range: Optional[Tuple[float, float]] = None,
+        histogram_bins: int = 100,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            window_seconds: Length of the sliding window in seconds
+            num_buckets: Number of time slices the window is split into
+            ewma_alpha: Smoothing factor for the exponentially weighted moving average (None = disabled)
+            histogram_range: (low, high) value range for percentile estimates (None = disabled)
+            histogram_bins: Number of histogram bins used for percentile estimates
+            clock: Source of the current time in seconds
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        if num_buckets <= 0:
+            raise ValueError("num_buckets must be positive")
+        if ewma_alpha is not None and not 0 < ewma_alpha <= 1:
+            raise ValueError("ewma_alpha must be in (0, 1]")
+        if histogram_range is not None and histogram_range[1] <= histogram_range[0]:
+            raise ValueError("histogram_range must be (low, high) with low < high")
+
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / num_buckets
+        self.ewma_alpha = ewma_alpha
+        self.histogram_range = histogram_range
+        self._clock = clock
+        bins = histogram_bins if histogram_range is not None else 0
+        self._buckets: List[_Bucket] = [_Bucket(bins) for _ in range(num_buckets)]
+        self._histogram = [0] * bins if bins else None
+        self._count = 0
+        self._total = 0.0
+        self._epoch: Optional[int] = None
+        self._last: Optional[float] = None
+        self._last_timestamp: Optional[float] = None
+        self._ewma: Optional[float] = None
+
+    def _epoch_of(self, timestamp: float) -> int:
+        return int(timestamp // self.bucket_seconds)
+
+    def _advance(self, now: float) -> None:
+        """Expire the buckets that have left the window."""
+        epoch = self._epoch_of(now)
+        if self._epoch is not None and epoch <= self._epoch:
+            return
+
+        num_buckets = len(self._buckets)
+        first = epoch - num_buckets + 1  # Oldest epoch still in the window
+        if self._epoch is None or epoch - self._epoch >= num_buckets:
+            # Everything expired
+            for index, bucket in enumerate(self._buckets):
+                bucket.reset(first + (index - first) % num_buckets)
+            self._count = 0
+            self._total = 0.0
+            if self._histogram is not None:
+                self._histogram = [0] * len(self._histogram)
+        else:
+            for expired in range(self._epoch + 1, epoch + 1):
+                bucket = self._buckets[expired % num_buckets]
+                self._count -= bucket.count
+                self._total -= bucket.total
+                if self._histogram is not None and bucket.count:
+                    for i, n in enumerate(bucket.histogram):
+                        self._histogram[i] -= n
+                bucket.reset(expired)
+            if not self._count:
+                self._total = 0.0  # Drop accumulated rounding error
+        self._epoch = epoch
+
+    def _bin_of(self, value: float) -> int:
+        low, high = self.histogram_range
+        bins = len(self._histogram)
+        index = int((value - low) / (high - low) * bins)
+        return min(max(index, 0), bins - 1)
+
+    def add(self, value: float, timestamp: Optional[float] = None) -> None:
+        """
+        Record a sample.
+
+        Args:
+            value: Sample value
+            timestamp: Sample time in seconds (defaults to now); samples older
+                than the window are ignored
+        """
+        if timestamp is None:
+            timestamp = self._clock()
+        self._advance(timestamp)
+
+        epoch = self._epoch_of(timestamp)
+        bucket = self._buckets[epoch % len(self._buckets)]
+        if bucket.epoch != epoch:
+            return  # Too old for the window
+
+        bucket.count += 1
+        bucket.total += value
+        bucket.minimum = min(bucket.minimum, value)
+        bucket.maximum = max(bucket.maximum, value)
+        self._count += 1
+        self._total += value
+        if self._histogram is not None:
+            index = self._bin_of(value)
+            bucket.histogram[index] += 1
+            self._histogram[index] += 1
+
+        if self._last_timestamp is None or timestamp >= self._last_timestamp:
+            self._last = value
+            self._last_timestamp = timestamp
+        if self.ewma_alpha is not None:
+            self._ewma = value if self._ewma is None else (
+                self.ewma_alpha * value + (1 - self.ewma_alpha) * self._ewma
+            )
+
+    def count(self, now: Optional[float] = None) -> int:
+        """Number of samples in the window."""
+        self._advance(self._clock() if now is None else now)
+        return self._count
+
+    def sum(self, now: Optional[float] = None) -> float:
+        """Sum of the samples in the window."""
+        self._advance(self._clock() if now is None else now)
+        return self._total
+
+    def mean(self, now: Optional[float] = None) -> Optional[float]:
+        """Mean of the samples in the window, or None if it is empty."""
+        self._advance(self._clock() if now is None else now)
+        return self._total / self._count if self._count else None
+
+    def min(self, now: Optional[float] = None) -> Optional[float]:
+        """Smallest sample in the window, or None if it is empty."""
+        self._advance(self._clock() if now is None else now)
+        if not self._count:
+            return None
+        return min(bucket.minimum for bucket in self._buckets if bucket.count)
+
+    def max(self, now: Optional[float] = None) -> Optional[float]:
+        """Largest sample in the window, or None if it is empty."""
+        self._advance(self._clock() if now is None else now)
+        if not self._count:
+            return None
+        return max(bucket.maximum for bucket in self._buckets if bucket.count)
+
+    @property
+    def last(self) -> Optional[float]:
+        """Most recent sample, or None if none was recorded."""
+        return self._last
+
+    @property
+    def ewma(self) -> Optional[float]:
+        """Exponentially weighted moving average over all samples, if enabled."""
+        return self._ewma
+
+    def percentile(self, q: float, now: Optional[float] = None) -> Optional[float]:
+        """
+        Estimate a percentile of the samples in the window from the histogram.
+
+        Args:
+            q: Percentile between 0 and 100
+            now: Current time in seconds (defaults to now)
+
+        Returns:
+            Estimated value (midpoint of the bin holding the percentile), or
+            None if the window is empty
+
+        Raises:
+            ValueError: If no histogram range was configured
+        """
+        if self._histogram is None:
+            raise ValueError("percentiles require a histogram_range")
+        self._advance(self._clock() if now is None else now)
+        if not self._count:
+            return None
+
+        rank = max(1, math.ceil(q / 100 * self._count))
+        seen = 0
+        low, high = self.histogram_range
+        width = (high - low) / len(self._histogram)
+        for index, n in enumerate(self._histogram):
+            seen += n
+            if seen >= rank:
+                return low + (index + 0.5) * width
+        return high
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get all window statistics at once.
+
+        Args:
+            now: Current time in seconds (defaults to now)
+
+        Returns:
+            Dictionary of statistics
+        """
+        now = self._clock() if now is None else now
+        stats = {
+            "count": self.count(now),
+            "mean": self.mean(now),
+            "min": self.min(now),
+            "max": self.max(now),
+            "last": self._last,
+        }
+        if self.ewma_alpha is not None:
+            stats["ewma"] = self._ewma
+        if self._histogram is not None:
+            stats["p50"] = self.percentile(50, now)
+            stats["p95"] = self.percentile(95, now)
+        return stats
@@ -6,13 +6,14 @@ Downloads the complete 2025 model ecosystem from Hugging Face
 
 import json
 import os
+import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import click
-from huggingface_hub import hf_hub_download, login, snapshot_download
+from huggingface_hub import login
 from huggingface_hub.utils import HfHubHTTPError
 from rich.console import Console
 from rich.progress import (
@@ -24,6 +25,15 @@ from rich.progress import (
 )
 from rich.table import Table
 
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.model_downloader import (
+    ModelDownloadEngine,
+    huggingface_headers,
+    huggingface_manifest,
+)
+
 console = Console()
 
 # 2025 Advanced Model Ecosystem for Hugging Face
@@ -83,12 +93,28 @@ HF_MODEL_STACK = {
 
 
 class ModelDownloader:
-    def __init__(self, output_dir: str = "/models", max_workers: int = 3):
+    def __init__(
+        self,
+        output_dir: str = "/models",
+        max_workers: int = 3,
+        max_files: int = 8,
+        max_bytes_per_second: Optional[float] = None,
+        hf_token: Optional[str] = None,
+    ):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.max_workers = max_workers
+        self.hf_token = hf_token
         self.results = []
 
+        # Shared engine: global file concurrency, dedup store, inventory
+        self.engine = ModelDownloadEngine(
+            str(self.output_dir / ".store"),
+            max_concurrent_files=max_files,
+            max_bytes_per_second=max_bytes_per_second,
+            headers=huggingface_headers(hf_token),
+        )
+
     def download_model(self, model_name: str, category: str) -> Dict:
         """Download a single model from Hugging Face"""
         try:
@@ -105,12 +131,11 @@ class ModelDownloader:
             # Download model
             local_dir = category_dir / model_name.replace("/", "_")
 
-            snapshot_download(
-                repo_id=model_name,
-                local_dir=str(local_dir),
-                local_dir_use_symlinks=False,
-                resume_download=True,
-            )
+            manifest = huggingface_manifest(model_name, token=self.hf_token)
+            result = self.engine.download_repo(manifest, str(local_dir))
+            if not result.success:
+                failed = ", ".join(f.path for f in result.failed_files)
+                raise RuntimeError(f"Failed files: {failed}")
 
             console.print(f"✅ Successfully downloaded: {model_name}", style="green")
             return {
@@ -118,6 +143,11 @@ class ModelDownloader:
                 "category": category,
                 "status": "Success",
                 "local_path": str(local_dir),
+                "files": len(result.files),
+                "deduplicated": len(
+                    [f for f in result.files if f.status == "deduplicated"]
+                ),
+                "bytes_downloaded": result.bytes_transferred,
                 "timestamp": time.time(),
             }
 
@@ -242,11 +272,20 @@ class ModelDownloader:
 @click.command()
 @click.option("--output-dir", default="/models", help="Output directory for models")
 @click.option("--max-workers", default=3, help="Maximum concurrent downloads")
+@click.option("--max-files", default=8, help="Maximum concurrent file transfers")
+@click.option("--max-mbps", type=float, default=None, help="Bandwidth limit in MB/s")
 @click.option(
     "--sequential", is_flag=True, help="Use sequential downloads instead of parallel"
 )
 @click.option("--hf-token", help="Hugging Face token for private models")
-def main(output_dir: str, max_workers: int, sequential: bool, hf_token: Optional[str]):
+def main(
+    output_dir: str,
+    max_workers: int,
+    max_files: int,
+    max_mbps: Optional[float],
+    sequential: bool,
+    hf_token: Optional[str],
+):
     """Phoenix Hydra 2025 Hugging Face Model Downloader"""
 
     console.print("🚀 Phoenix Hydra 2025 HF Model Stack Downloader", style="cyan bold")
@@ -261,7 +300,13 @@ def main(output_dir: str, max_workers: int, sequential: bool, hf_token: Optional
             console.print(f"⚠️  Failed to login to Hugging Face: {e}", style="yellow")
 
     # Initialize downloader
-    downloader = ModelDownloader(output_dir=output_dir, max_workers=max_workers)
+    downloader = ModelDownloader(
+        output_dir=output_dir,
+        max_workers=max_workers,
+        max_files=max_files,
+        max_bytes_per_second=max_mbps * 1024 * 1024 if max_mbps else None,
+        hf_token=hf_token,
+    )
 
     # Download models
     try:
@@ -6,6 +6,7 @@ Manages and tracks all downloaded models from Ollama and Hugging Face
 
 import json
 import os
+import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -16,6 +17,11 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.model_inventory_scanner import IncrementalTreeScanner
+
 console = Console()
 
 
@@ -25,12 +31,21 @@ class ModelInventoryManager:
         ollama_models_path: str = "/ollama-models",
         hf_cache_path: str = "/hf-cache",
         output_path: str = "/models",
+        scan_workers: int = 8,
+        full_scan: bool = False,
     ):
         self.ollama_models_path = Path(ollama_models_path)
         self.hf_cache_path = Path(hf_cache_path)
         self.output_path = Path(output_path)
         self.output_path.mkdir(parents=True, exist_ok=True)
 
+        # Per-directory stats cache; only changed directories are listed again
+        self.full_scan = full_scan
+        self.scanner = IncrementalTreeScanner(
+            str(self.output_path / ".inventory_scan_cache.json"),
+            max_workers=scan_workers,
+        )
+
         self.inventory = {
             "timestamp": time.time(),
             "ollama_models": [],
@@ -95,7 +110,8 @@ class ModelInventoryManager:
         """Scan Hugging Face models directory"""
         console.print("🔍 Scanning Hugging Face models...", style="yellow")
 
-        hf_models = []
+        # Inventory entries without their sizes, keyed by model directory
+        candidates: Dict[Path, Dict] = {}
 
         # Scan HF cache directory
         if self.hf_cache_path.exists():
@@ -106,25 +122,10 @@ class ModelInventoryManager:
                         model_name = model_dir.name.replace("models--", "").replace(
                             "--", "/"
                         )
-
-                        # Calculate total size
-                        total_size = 0
-                        file_count = 0
-                        for file_path in model_dir.rglob("*"):
-                            if file_path.is_file():
-                                total_size += file_path.stat().st_size
-                                file_count += 1
-
-                        hf_models.append(
-                            {
-                                "name": model_name,
-                                "size": total_size,
-                                "file_count": file_count,
-                                "path": str(model_dir),
-                                "modified": model_dir.stat().st_mtime,
-                                "source": "huggingface_hub",
-                            }
-                        )
+                        candidates[model_dir] = {
+                            "name": model_name,
+                            "source": "huggingface_hub",
+                        }
 
         # Also scan direct downloads
         hf_direct_path = self.output_path / "huggingface"
@@ -133,25 +134,40 @@ class ModelInventoryManager:
                 if category_dir.is_dir():
                     for model_dir in category_dir.iterdir():
                         if model_dir.is_dir():
-                            total_size = 0
-                            file_count = 0
-                            for file_path in model_dir.rglob("*"):
-                                if file_path.is_file():
-                                    total_size += file_path.stat().st_size
-                                    file_count += 1
-
-                            hf_models.append(
-                                {
-                                    "name": model_dir.name.replace("_", "/"),
-                                    "category": category_dir.name,
-                                    "size": total_size,
-                                    "file_count": file_count,
-                                    "path": str(model_dir),
-                                    "modified": model_dir.stat().st_mtime,
-                                    "source": "direct_download",
-                                }
-                            )
+                            candidates[model_dir] = {
+                                "name": model_dir.name.replace("_", "/"),
+                                "category": category_dir.name,
+                                "source": "direct_download",
+                            }
+
+        # Calculate total sizes, reusing cached stats of unchanged directories
+        totals = self.scanner.scan(
+            (str(model_dir) for model_dir in candidates), full=self.full_scan
+        )
 
+        hf_models = []
+        for model_dir, model in candidates.items():
+            stats = totals.get(os.path.abspath(model_dir))
+            if stats is None:
+                continue  # Removed while scanning
+            source = model.pop("source")
+            model.update(
+                {
+                    "size": stats.size,
+                    "file_count": stats.file_count,
+                    "path": str(model_dir),
+                    "modified": stats.modified,
+                    "source": source,
+                }
+            )
+            hf_models.append(model)
+
+        console.print(
+            f"♻️  Reused cached stats for {self.scanner.directories_reused} of "
+            f"{self.scanner.directories_reused + self.scanner.directories_scanned} "
+            "directories",
+            style="dim",
+        )
         console.print(f"✅ Found {len(hf_models)} Hugging Face models", style="green")
         return hf_models
 
@@ -326,7 +342,10 @@ def main():
     console.print("=" * 50, style="cyan")
 
     # Initialize manager
-    manager = ModelInventoryManager()
+    manager = ModelInventoryManager(
+        full_scan=os.environ.get("PHX_INVENTORY_FULL_SCAN", "").lower()
+        in ("1", "true", "yes")
+    )
 
     try:
         # Generate inventory
@@ -7,7 +7,8 @@ definida en `MODEL_STACK` y, opcionalmente, los modelos locales de Ollama
 indicados en `OLLAMA_MODELS`.
 
 • 100% compatible con contenedores Podman / Docker.
-• Reanuda descargas interrumpidas (snapshot-download).
+• Reanuda descargas interrumpidas y verifica SHA-256 (motor compartido
+  `model_downloader`, con deduplicación por contenido e inventario único).
 • Reporte JSON + tabla resumen en consola Rich.
 • Pull automático de modelos Ollama vía CLI (`ollama pull`).
 """
@@ -25,7 +26,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 import click
-from huggingface_hub import login, snapshot_download
+from huggingface_hub import login
 from huggingface_hub.utils import HfHubHTTPError
 from rich.console import Console
 from rich.progress import (
@@ -37,6 +38,22 @@ from rich.progress import (
 )
 from rich.table import Table
 
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+try:
+    from src.core.model_downloader import (
+        ModelDownloadEngine,
+        huggingface_headers,
+        huggingface_manifest,
+    )
+except ImportError:
+    # Dentro del contenedor el motor se copia junto a este script
+    from model_downloader import (
+        ModelDownloadEngine,
+        huggingface_headers,
+        huggingface_manifest,
+    )
+
 ###############################################################################
 # 1- Configuración                                                             #
 ###############################################################################
@@ -130,6 +147,7 @@ OLLAMA_MODELS = [
 ]
 
 PARALLEL_WORKERS = int(os.environ.get("PHX_HYDRA_WORKERS", 4))
+MAX_FILE_TRANSFERS = int(os.environ.get("PHX_HYDRA_MAX_FILES", 8))
 DEFAULT_OUT_DIR = Path(os.environ.get("PHX_HYDRA_MODELDIR", "/models")).expanduser()
 
 
@@ -137,11 +155,26 @@ DEFAULT_OUT_DIR = Path(os.environ.get("PHX_HYDRA_MODELDIR", "/models")).expandus
 # 2- Descargador Hugging Face                                                  #
 ###############################################################################
 class HFDownloader:
-    def __init__(self, out_dir: Path):
+    def __init__(
+        self,
+        out_dir: Path,
+        max_files: int = MAX_FILE_TRANSFERS,
+        max_bytes_per_second: Optional[float] = None,
+        hf_token: Optional[str] = None,
+    ):
         self.out_dir = out_dir
         self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.hf_token = hf_token
         self.results: list[Dict] = []
 
+        # Motor compartido: límite global de ficheros, store deduplicado e inventario
+        self.engine = ModelDownloadEngine(
+            str(self.out_dir / ".store"),
+            max_concurrent_files=max_files,
+            max_bytes_per_second=max_bytes_per_second,
+            headers=huggingface_headers(hf_token),
+        )
+
     def _dl_single(self, repo_id: str, tag: str) -> Dict:
         console.print(f"⬇️  Descargando {tag}: {repo_id}", style="yellow")
 
@@ -153,21 +186,22 @@ class HFDownloader:
                 / repo_id.replace("/", "_")
             )
 
-            # Create directory structure
-            local_dir.mkdir(parents=True, exist_ok=True)
-
-            snapshot_download(
-                repo_id=repo_id,
-                local_dir=str(local_dir),
-                local_dir_use_symlinks=False,
-                resume_download=True,
+            manifest = huggingface_manifest(
+                repo_id,
+                token=self.hf_token,
                 ignore_patterns=["*.bin"]
                 if "large" in repo_id.lower()
                 else None,  # Skip large bins for some models
             )
+            download = self.engine.download_repo(manifest, str(local_dir))
 
-            console.print(f"✅ Completado: {repo_id}", style="green")
-            status, err = "Success", ""
+            if download.success:
+                console.print(f"✅ Completado: {repo_id}", style="green")
+                status, err = "Success", ""
+            else:
+                failed = ", ".join(f.path for f in download.failed_files)
+                console.print(f"❌ Error {repo_id}: {failed}", style="red")
+                status, err = "Error", f"Ficheros fallidos: {failed}"
 
         except HfHubHTTPError as e:
             console.print(f"❌ HTTP Error {repo_id}: {e}", style="red")
@@ -182,6 +216,9 @@ class HFDownloader:
             "status": status,
             "error": err,
             "path": str(local_dir) if "local_dir" in locals() else "",
+            "bytes_downloaded": download.bytes_transferred
+            if "download" in locals()
+            else 0,
             "timestamp": time.time(),
         }
         self.results.append(result)
@@ -412,6 +449,15 @@ def _generate_ollama_report(results: list[Dict]):
     "--workers", default=PARALLEL_WORKERS, show_default=True, help="Hilos paralelos"
 )
 @click.option("--serial", is_flag=True, help="Descarga secuencial")
+@click.option(
+    "--max-files",
+    default=MAX_FILE_TRANSFERS,
+    show_default=True,
+    help="Transferencias de ficheros simultáneas (límite global)",
+)
+@click.option(
+    "--max-mbps", type=float, default=None, help="Límite de ancho de banda (MB/s)"
+)
 @click.option("--hf-token", envvar="HF_TOKEN", help="Token HF para modelos privados")
 @click.option("--skip-ollama", is_flag=True, help="No ejecutar pulls de Ollama")
 @click.option("--skip-hf", is_flag=True, help="No descargar modelos de Hugging Face")
@@ -425,6 +471,8 @@ def cli(
     out: str,
     workers: int,
     serial: bool,
+    max_files: int,
+    max_mbps: Optional[float],
     hf_token: Optional[str],
     skip_ollama: bool,
     skip_hf: bool,
@@ -443,6 +491,7 @@ def cli(
 
     config_table.add_row("Directorio salida", str(out_dir))
     config_table.add_row("Workers paralelos", str(workers))
+    config_table.add_row("Ficheros simultáneos", str(max_files))
     config_table.add_row("Modo", "Secuencial" if serial else "Paralelo")
     config_table.add_row("Ollama host", ollama_host)
     config_table.add_row("Modo test", "Sí" if test_mode else "No")
@@ -469,7 +518,12 @@ def cli(
     # HF download
     if not skip_hf:
         console.print("\n🤗 Iniciando descarga Hugging Face...", style="bold blue")
-        hf = HFDownloader(out_dir)
+        hf = HFDownloader(
+            out_dir,
+            max_files=max_files,
+            max_bytes_per_second=max_mbps * 1024 * 1024 if max_mbps else None,
+            hf_token=hf_token,
+        )
         hf.download(parallel=not serial, workers=workers)
         hf_report = hf.report()
     else:
@@ -65,6 +65,7 @@ Write-Host "`n📋 Preparing Phoenix Hugger execution..." -ForegroundColor Cyan
 Write-Host "📁 Copying phoenix_hugger.py to container..." -ForegroundColor Yellow
 try {
     podman cp "scripts/phoenix_hugger.py" "${OllamaContainer}:/tmp/phoenix_hugger.py"
+    podman cp "src/core/model_downloader.py" "${OllamaContainer}:/tmp/model_downloader.py"
     if ($LASTEXITCODE -ne 0) {
         throw "Failed to copy script"
     }
@@ -195,7 +196,7 @@ try {
 # Cleanup
 Write-Host "`n🧹 Cleaning up temporary files..." -ForegroundColor Cyan
 try {
-    podman exec $OllamaContainer rm -f /tmp/phoenix_hugger.py
+    podman exec $OllamaContainer rm -f /tmp/phoenix_hugger.py /tmp/model_downloader.py
     Write-Host "✅ Cleanup completed" -ForegroundColor Green
 } catch {
     Write-Host "⚠️  Cleanup warning: $_" -ForegroundColor Yellow
@@ -44,6 +44,7 @@ try {
 Write-Host "`n📁 Copying phoenix_hugger.py..." -ForegroundColor Yellow
 try {
     podman cp "scripts/phoenix_hugger.py" "${Container}:/tmp/phoenix_hugger.py"
+    podman cp "src/core/model_downloader.py" "${Container}:/tmp/model_downloader.py"
     Write-Host "✅ Script copied" -ForegroundColor Green
 } catch {
     Write-Error "❌ Failed to copy script: $_"
@@ -156,6 +157,6 @@ try {
 
 # Cleanup
 Write-Host "`n🧹 Cleaning up..." -ForegroundColor Cyan
-podman exec $Container rm -f /tmp/phoenix_hugger.py /tmp/phoenix_test.py
+podman exec $Container rm -f /tmp/phoenix_hugger.py /tmp/model_downloader.py /tmp/phoenix_test.py
 
 Write-Host "`n🎉 Phoenix Hugger simple test completed!" -ForegroundColor Bold -ForegroundColor Green
\ No newline at end of file
@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
-from src.event_routing import Event, EventPattern, EventRouter, Subscription
+from src.event_routing import Event, EventPattern, EventRouter
 
 from .animation_controller import AnimationController
 from .gamification_system import GamificationSystem
@@ -82,32 +82,27 @@ class ChatbotAgent:
     
     def _setup_event_subscriptions(self):
         """Setup event subscriptions for system integration"""
-        # Subscribe to container events
-        container_pattern = EventPattern("container.*")
-        container_subscription = Subscription(
-            pattern=container_pattern,
+        # Subscribe to container events; the handlers are coroutines and are
+        # awaited on the loop by EventRouter.publish_async
+        self.event_router.subscribe(
+            pattern=EventPattern("container.*"),
             handler=self._handle_container_event,
             priority=5
         )
-        self.event_router.subscribe(container_subscription)
         
         # Subscribe to deployment events
-        deploy_pattern = EventPattern("deployment.*")
-        deploy_subscription = Subscription(
-            pattern=deploy_pattern,
+        self.event_router.subscribe(
+            pattern=EventPattern("deployment.*"),
             handler=self._handle_deployment_event,
             priority=5
         )
-        self.event_router.subscribe(deploy_subscription)
         
         # Subscribe to error events
-        error_pattern = EventPattern("error.*")
-        error_subscription = Subscription(
-            pattern=error_pattern,
+        self.event_router.subscribe(
+            pattern=EventPattern("error.*"),
             handler=self._handle_error_event,
             priority=10
         )
-        self.event_router.subscribe(error_subscription)
     
     async def start_chat_session(self, user_id: str) -> UserSession:
         """Start a new chat session for a user"""
@@ -139,7 +134,7 @@ class ChatbotAgent:
                 "timestamp": session.start_time.isoformat()
             }
         )
-        await self.event_router.publish(session_event)
+        await self.event_router.publish_async(session_event)
         
         return session
     
@@ -197,7 +192,7 @@ class ChatbotAgent:
                 "response_type": response_data.get("type", "general")
             }
         )
-        await self.event_router.publish(chat_event)
+        await self.event_router.publish_async(chat_event)
         
         return bot_msg
     
@@ -246,7 +241,7 @@ class ChatbotAgent:
             source="chatbot_agent",
             payload={"requested_by": session.user_id}
         )
-        await self.event_router.publish(status_event)
+        await self.event_router.publish_async(status_event)
         
         # Mock status for now - in real implementation, wait for response event
         status_msg = """🚀 **Phoenix Hydra System Status**
@@ -297,7 +292,7 @@ class ChatbotAgent:
                     "deployment_type": "manual"
                 }
             )
-            await self.event_router.publish(deploy_event)
+            await self.event_router.publish_async(deploy_event)
             
             return {
                 "message": "🚀 **Deployment Started!**\n\n"
@@ -560,4 +555,4 @@ Progress: 2/5 deployments""".format(
                     "idle_minutes": max_idle_minutes
                 }
             )
-            await self.event_router.publish(session_event)
\ No newline at end of file
+            await self.event_router.publish_async(session_event)
\ No newline at end of file
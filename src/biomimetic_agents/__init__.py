@@ -49,6 +49,7 @@ from .rubik_genome import (
     Archetype,
     GeneExpression,
     GeneticBase,
+    GenomeMatrix,
     GenomePool,
     MoodState,
     RUBIKGenome,
@@ -59,6 +60,7 @@ __all__ = [
     # Genetic System
     "RUBIKGenome",
     "GenomePool",
+    "GenomeMatrix",
     "GeneExpression",
     "GeneticBase",
     "Archetype",
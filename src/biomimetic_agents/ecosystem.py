@@ -9,10 +9,12 @@ import asyncio
 import json
 import logging
 import time
+import uuid
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 from ..local_processing import LocalAIPipeline, ProcessingMode, ProcessingRequest
 from .agent_system import AgentStatus, BiomimeticAgent
@@ -33,6 +35,9 @@ class EcosystemConfig:
     learning_enabled: bool = True
     auto_scaling: bool = True
     model_preferences: Dict[str, str] = None
+    max_tasks_per_agent: int = 2  # Concurrent tasks one agent may hold
+    task_workers: Optional[int] = None  # None = max_population * max_tasks_per_agent
+    max_queued_tasks: int = 1000  # process_task waits while the queue is full
 
     def __post_init__(self):
         if self.model_preferences is None:
@@ -49,6 +54,66 @@ class EcosystemConfig:
             }
 
 
+class FairTaskQueue:
+    """
+    Bounded task queue that round-robins across task types.
+
+    Tasks are queued per ``task_type`` and ``get`` takes one task from each
+    type in turn, so a burst of one type cannot starve the others. ``put``
+    waits while ``maxsize`` tasks are queued.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self._queues: "OrderedDict[str, Deque[Any]]" = OrderedDict()
+        self._size = 0
+        self._unfinished = 0
+        self._changed = asyncio.Condition()
+
+    def qsize(self) -> int:
+        """Number of queued tasks."""
+        return self._size
+
+    def full(self) -> bool:
+        """Whether ``put`` would wait."""
+        return 0 < self.maxsize <= self._size
+
+    def sizes_by_type(self) -> Dict[str, int]:
+        """Number of queued tasks per task type."""
+        return {task_type: len(queue) for task_type, queue in self._queues.items()}
+
+    async def put(self, item: Any, task_type: str = "general"):
+        """Queue an item, waiting while the queue is full."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: not self.full())
+            self._queues.setdefault(task_type, deque()).append(item)
+            self._size += 1
+            self._unfinished += 1
+            self._changed.notify_all()
+
+    async def get(self) -> Any:
+        """Take the next item, rotating across task types."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._size > 0)
+            task_type, queue = next(iter(self._queues.items()))
+            item = queue.popleft()
+            if queue:
+                self._queues.move_to_end(task_type)
+            else:
+                del self._queues[task_type]
+            self._size -= 1
+            self._changed.notify_all()
+            return item
+
+    def task_done(self):
+        """Mark a previously taken item as processed."""
+        self._unfinished -= 1
+
+    def unfinished(self) -> int:
+        """Number of queued or in-progress items."""
+        return self._unfinished
+
+
 class RUBIKEcosystem:
     """
     Complete RUBIK Biomimetic Agent Ecosystem.
@@ -76,9 +141,12 @@ class RUBIKEcosystem:
         )
 
         # Task management
-        self.task_queue: asyncio.Queue = asyncio.Queue()
+        self.task_queue = FairTaskQueue(maxsize=self.config.max_queued_tasks)
         self.active_tasks: Dict[str, Dict[str, Any]] = {}
         self.completed_tasks: List[Dict[str, Any]] = []
+        self._task_workers: List[asyncio.Task] = []
+        self._agent_task_counts: Dict[str, int] = {}  # agent_id -> tasks assigned
+        self._agent_capacity = asyncio.Condition()
 
         # Performance tracking
         self.ecosystem_metrics = {
@@ -139,8 +207,8 @@ class RUBIKEcosystem:
         # Start core components
         await self.thanatos_controller.start()
 
-        # Start task processing
-        asyncio.create_task(self._task_processing_loop())
+        # Start task workers
+        self._start_task_workers()
 
         # Start metrics update loop
         asyncio.create_task(self._metrics_update_loop())
@@ -162,50 +230,78 @@ class RUBIKEcosystem:
         while self.active_tasks:
             await asyncio.sleep(0.1)
 
+        # Workers notice the stop flag within their polling interval
+        async with self._agent_capacity:
+            self._agent_capacity.notify_all()
+        await asyncio.gather(*self._task_workers, return_exceptions=True)
+        self._task_workers = []
+
         logger.info("RUBIK Ecosystem stopped")
 
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a task using the biomimetic agent ecosystem.
 
+        Waits while the task queue is full, so callers submitting faster
+        than the agents can work are slowed down instead of growing the
+        queue without bound. The task's ``timeout`` covers both the wait
+        for queue space and the wait for the result.
+
         Args:
             task: Task specification
 
         Returns:
             Task result with ecosystem metadata
         """
-        task_id = task.get("id", f"task_{int(time.time())}")
+        task_id = task.get("id", f"task_{uuid.uuid4().hex[:12]}")
         task["id"] = task_id
 
-        # Add to queue
-        await self.task_queue.put(task)
-
-        # Wait for completion
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
         timeout = task.get("timeout", 60.0)
+        deadline = None if timeout is None else loop.time() + timeout
+        result_future = loop.create_future()
 
-        while task_id not in [t["task_id"] for t in self.completed_tasks]:
-            if time.time() - start_time > timeout:
-                return {"success": False, "error": "Task timeout", "task_id": task_id}
-
-            await asyncio.sleep(0.1)
+        try:
+            # Add to queue
+            await asyncio.wait_for(
+                self.task_queue.put(
+                    (task, result_future), task.get("task_type", "general")
+                ),
+                timeout,
+            )
 
-        # Find and return completed task result
-        for completed_task in self.completed_tasks:
-            if completed_task["task_id"] == task_id:
-                return completed_task["result"]
+            # Wait for completion; the task keeps running if we time out
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            return await asyncio.wait_for(asyncio.shield(result_future), remaining)
+        except asyncio.TimeoutError:
+            return {"success": False, "error": "Task timeout", "task_id": task_id}
 
-        return {"success": False, "error": "Task result not found", "task_id": task_id}
+    def _start_task_workers(self):
+        """Start the pool of concurrent task workers."""
+        num_workers = self.config.task_workers or (
+            self.config.max_population * self.config.max_tasks_per_agent
+        )
+        self._task_workers = [
+            asyncio.create_task(self._task_worker_loop(worker_index))
+            for worker_index in range(max(1, num_workers))
+        ]
+        logger.info(f"Started {len(self._task_workers)} task workers")
 
-    async def _task_processing_loop(self):
-        """Main task processing loop."""
-        logger.info("Starting task processing loop")
+    async def _task_worker_loop(self, worker_index: int):
+        """Task worker: takes queued tasks and processes them one at a time."""
+        logger.debug(f"Starting task worker {worker_index}")
 
         while self.running:
             try:
                 # Get next task
-                task = await asyncio.wait_for(self.task_queue.get(), timeout=1.0)
+                task, result_future = await asyncio.wait_for(
+                    self.task_queue.get(), timeout=1.0
+                )
+            except asyncio.TimeoutError:
+                # No tasks in queue, continue
+                continue
 
+            try:
                 # Process task
                 result = await self._process_single_task(task)
 
@@ -223,24 +319,81 @@ class RUBIKEcosystem:
                 if len(self.completed_tasks) > 1000:
                     self.completed_tasks = self.completed_tasks[-1000:]
 
+                if not result_future.done():
+                    result_future.set_result(result)
+
+            except Exception as e:
+                logger.error(f"Error in task worker {worker_index}: {e}")
+                if not result_future.done():
+                    result_future.set_result(
+                        {"success": False, "error": str(e), "task_id": task["id"]}
+                    )
+            finally:
                 # Mark task as done
                 self.task_queue.task_done()
 
-            except asyncio.TimeoutError:
-                # No tasks in queue, continue
-                continue
-            except Exception as e:
-                logger.error(f"Error in task processing loop: {e}")
-                await asyncio.sleep(1.0)
+    def _agent_has_capacity(self, agent: BiomimeticAgent) -> bool:
+        """Whether an agent can take another task."""
+        load = max(
+            len(agent.active_tasks), self._agent_task_counts.get(agent.agent_id, 0)
+        )
+        return load < self.config.max_tasks_per_agent
+
+    async def _acquire_agent_for_task(
+        self, task: Dict[str, Any]
+    ) -> Optional[BiomimeticAgent]:
+        """
+        Select an agent for a task and reserve one of its task slots.
+
+        Waits while every active agent is at its concurrency limit.
+
+        Returns:
+            Reserved agent, or None if there are no active agents
+        """
+        while self.running:
+            selected_agent = await self._select_agent_for_task(task)
+            if selected_agent is not None and self._agent_has_capacity(selected_agent):
+                agent_id = selected_agent.agent_id
+                self._agent_task_counts[agent_id] = (
+                    self._agent_task_counts.get(agent_id, 0) + 1
+                )
+                return selected_agent
+
+            if not any(
+                agent.status == AgentStatus.ACTIVE
+                for agent in self.thanatos_controller.active_agents.values()
+            ):
+                return None
+
+            # Every agent is busy; wait for a slot (or a newly born agent)
+            async with self._agent_capacity:
+                try:
+                    await asyncio.wait_for(self._agent_capacity.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+
+        return None
+
+    async def _release_agent(self, agent: BiomimeticAgent):
+        """Release a task slot reserved by ``_acquire_agent_for_task``."""
+        remaining = self._agent_task_counts.get(agent.agent_id, 1) - 1
+        if remaining > 0:
+            self._agent_task_counts[agent.agent_id] = remaining
+        else:
+            self._agent_task_counts.pop(agent.agent_id, None)
+
+        async with self._agent_capacity:
+            self._agent_capacity.notify()
 
     async def _process_single_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process a single task using the best available agent."""
         task_id = task["id"]
         start_time = time.time()
+        selected_agent = None
 
         try:
-            # Select best agent for task
-            selected_agent = await self._select_agent_for_task(task)
+            # Select best agent with a free task slot
+            selected_agent = await self._acquire_agent_for_task(task)
 
             if not selected_agent:
                 return {
@@ -318,6 +471,10 @@ class RUBIKEcosystem:
                 "processing_time": time.time() - start_time,
             }
 
+        finally:
+            if selected_agent is not None:
+                await self._release_agent(selected_agent)
+
     async def _select_agent_for_task(
         self, task: Dict[str, Any]
     ) -> Optional[BiomimeticAgent]:
@@ -326,7 +483,7 @@ class RUBIKEcosystem:
         available_agents = [
             agent
             for agent in self.thanatos_controller.active_agents.values()
-            if agent.status == AgentStatus.ACTIVE
+            if agent.status == AgentStatus.ACTIVE and self._agent_has_capacity(agent)
         ]
 
         if not available_agents:
@@ -533,11 +690,14 @@ class RUBIKEcosystem:
             "task_metrics": self.ecosystem_metrics.copy(),
             "active_tasks": len(self.active_tasks),
             "queue_size": self.task_queue.qsize(),
+            "queued_by_type": self.task_queue.sizes_by_type(),
+            "task_workers": len(self._task_workers),
             "config": {
                 "max_population": self.config.max_population,
                 "min_population": self.config.min_population,
                 "learning_enabled": self.config.learning_enabled,
                 "auto_scaling": self.config.auto_scaling,
+                "max_tasks_per_agent": self.config.max_tasks_per_agent,
             },
         }
 
@@ -586,6 +746,9 @@ class RUBIKEcosystem:
                 "learning_enabled": self.config.learning_enabled,
                 "auto_scaling": self.config.auto_scaling,
                 "model_preferences": self.config.model_preferences,
+                "max_tasks_per_agent": self.config.max_tasks_per_agent,
+                "task_workers": self.config.task_workers,
+                "max_queued_tasks": self.config.max_queued_tasks,
             },
             "metrics": self.ecosystem_metrics,
             "completed_tasks_count": len(self.completed_tasks),
@@ -626,6 +789,10 @@ class RUBIKEcosystem:
             self.config.learning_enabled = config_data.get("learning_enabled", True)
             self.config.auto_scaling = config_data.get("auto_scaling", True)
             self.config.model_preferences = config_data.get("model_preferences", {})
+            self.config.max_tasks_per_agent = config_data.get("max_tasks_per_agent", 2)
+            self.config.task_workers = config_data.get("task_workers")
+            self.config.max_queued_tasks = config_data.get("max_queued_tasks", 1000)
+            self.task_queue.maxsize = self.config.max_queued_tasks
 
             # Restore metrics
             self.ecosystem_metrics.update(ecosystem_data.get("metrics", {}))
@@ -5,13 +5,12 @@ This module implements the revolutionary 20-base logarithmic matrix genome syste
 for self-evolving AI agents, integrating with the 2025 advanced model ecosystem.
 """
 
-import hashlib
 import json
 import logging
 import math
+import os
 import random
 from dataclasses import asdict, dataclass
-from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -103,97 +102,562 @@ class GeneExpression:
         )
 
 
+NUM_BASES = len(GeneticBase)
+
+# Interaction strengths between gene pairs, applied in both directions
+_SYNERGISTIC_PAIRS = {
+    (GeneticBase.REASONING, GeneticBase.FOCUS): 1.5,
+    (GeneticBase.CREATIVITY, GeneticBase.CURIOSITY): 1.4,
+    (GeneticBase.MEMORY, GeneticBase.LEARNING): 1.3,
+    (GeneticBase.PERSISTENCE, GeneticBase.CONFIDENCE): 1.2,
+    (GeneticBase.EMPATHY, GeneticBase.COOPERATION): 1.4,
+    (GeneticBase.CAUTION, GeneticBase.ANXIETY): 1.1,
+    (GeneticBase.EFFICIENCY, GeneticBase.PRECISION): 1.3,
+    (GeneticBase.ADAPTABILITY, GeneticBase.LEARNING): 1.2,
+}
+
+_ANTAGONISTIC_PAIRS = {
+    (GeneticBase.AGGRESSION, GeneticBase.CAUTION): 0.7,
+    (GeneticBase.SPEED, GeneticBase.PRECISION): 0.8,
+    (GeneticBase.CONFIDENCE, GeneticBase.ANXIETY): 0.6,
+    (GeneticBase.FOCUS, GeneticBase.CURIOSITY): 0.9,
+}
+
+# Archetype scores are weighted sums of effective gene expressions
+_ARCHETYPES = list(Archetype)
+_ARCHETYPE_WEIGHTS = np.zeros((len(_ARCHETYPES), NUM_BASES))
+for _archetype, _weights in {
+    Archetype.EXPLORER: {
+        GeneticBase.CURIOSITY: 1.5,
+        GeneticBase.ADAPTABILITY: 1.2,
+        GeneticBase.LEARNING: 1.1,
+    },
+    Archetype.GUARDIAN: {
+        GeneticBase.CAUTION: 1.5,
+        GeneticBase.ROBUSTNESS: 1.3,
+        GeneticBase.PERSISTENCE: 1.1,
+    },
+    Archetype.CREATOR: {
+        GeneticBase.CREATIVITY: 1.5,
+        GeneticBase.REASONING: 1.2,
+        GeneticBase.PRECISION: 1.1,
+    },
+    Archetype.DESTROYER: {
+        GeneticBase.AGGRESSION: 1.4,
+        GeneticBase.EFFICIENCY: 1.3,
+        GeneticBase.FOCUS: 1.2,
+    },
+}.items():
+    for _base, _weight in _weights.items():
+        _ARCHETYPE_WEIGHTS[_ARCHETYPES.index(_archetype), _base.value] = _weight
+
+# Fitness weights of performance metrics, and the archetype-specific bonus metric
+_FITNESS_WEIGHTS = {
+    "task_success_rate": 0.3,
+    "energy_efficiency": 0.2,
+    "adaptation_speed": 0.2,
+    "collaboration_score": 0.15,
+}
+_ERROR_RATE_WEIGHT = 0.15
+_ARCHETYPE_BONUS_METRICS = {
+    Archetype.EXPLORER: "discovery_rate",
+    Archetype.GUARDIAN: "security_score",
+    Archetype.CREATOR: "innovation_score",
+    Archetype.DESTROYER: "optimization_score",
+}
+_ARCHETYPE_BONUS_WEIGHT = 0.1
+
+_rng = np.random.default_rng()
+
+
+def build_interaction_matrix(
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Build a gene interaction matrix.
+
+    Known synergistic and antagonistic pairs get fixed strengths; every
+    other pair gets a neutral strength with slight randomness.
+    """
+    rng = rng or _rng
+    matrix = rng.uniform(0.95, 1.05, (NUM_BASES, NUM_BASES))
+    for pairs in (_ANTAGONISTIC_PAIRS, _SYNERGISTIC_PAIRS):
+        for (base_i, base_j), strength in pairs.items():
+            matrix[base_i.value, base_j.value] = strength
+            matrix[base_j.value, base_i.value] = strength
+    np.fill_diagonal(matrix, 1.0)  # Self-interaction
+    return matrix
+
+
+def _generate_genome_ids(count: int) -> List[str]:
+    """Generate unique 16-character genome identifiers."""
+    data = os.urandom(8 * count).hex()
+    return [data[i : i + 16] for i in range(0, 16 * count, 16)]
+
+
+class GenomeMatrix:
+    """
+    Struct-of-arrays storage for a population of genomes.
+
+    Row ``i`` holds genome ``i`` and column ``j`` holds ``GeneticBase(j)``.
+    All genomes share one interaction matrix, so effective expressions,
+    archetypes, fitness, selection, crossover and mutation are computed
+    for the whole population with a few array operations.
+    """
+
+    def __init__(
+        self,
+        raw_values: np.ndarray,
+        mutation_rates: np.ndarray,
+        dominance: np.ndarray,
+        interaction_matrix: np.ndarray,
+        fitness: Optional[np.ndarray] = None,
+        generations: Optional[np.ndarray] = None,
+        genome_ids: Optional[List[str]] = None,
+        parent_genomes: Optional[List[List[str]]] = None,
+    ):
+        self.raw_values = np.asarray(raw_values, dtype=float).reshape(-1, NUM_BASES)
+        size = len(self.raw_values)
+        # Logarithmic scaling: small changes have exponential effects
+        self.expression_levels = np.log10(1 + 9 * self.raw_values)
+        self.mutation_rates = np.asarray(mutation_rates, dtype=float).reshape(
+            size, NUM_BASES
+        )
+        self.dominance = np.asarray(dominance, dtype=float).reshape(size, NUM_BASES)
+        self.fitness = (
+            np.zeros(size) if fitness is None else np.array(fitness, dtype=float)
+        )
+        self.generations = (
+            np.zeros(size, dtype=int)
+            if generations is None
+            else np.array(generations, dtype=int)
+        )
+        self.genome_ids = (
+            _generate_genome_ids(size) if genome_ids is None else list(genome_ids)
+        )
+        self.parent_genomes = (
+            [[] for _ in range(size)]
+            if parent_genomes is None
+            else list(parent_genomes)
+        )
+        self.interaction_matrix = interaction_matrix
+
+    def __len__(self) -> int:
+        return len(self.raw_values)
+
+    @property
+    def interaction_matrix(self) -> np.ndarray:
+        """Gene interaction matrix shared by every genome in the population."""
+        return self._interaction_matrix
+
+    @interaction_matrix.setter
+    def interaction_matrix(self, matrix: np.ndarray):
+        self._interaction_matrix = np.asarray(matrix, dtype=float)
+        self._effective_expressions: Optional[np.ndarray] = None
+        self._archetype_indices: Optional[np.ndarray] = None
+
+    @classmethod
+    def random(
+        cls,
+        size: int,
+        rng: Optional[np.random.Generator] = None,
+        interaction_matrix: Optional[np.ndarray] = None,
+    ) -> "GenomeMatrix":
+        """Create a population of random genomes."""
+        rng = rng or _rng
+        shape = (size, NUM_BASES)
+        return cls(
+            raw_values=rng.random(shape),
+            mutation_rates=rng.uniform(0.01, 0.05, shape),
+            dominance=rng.uniform(0.5, 1.5, shape),
+            interaction_matrix=(
+                build_interaction_matrix(rng)
+                if interaction_matrix is None
+                else interaction_matrix
+            ),
+        )
+
+    @classmethod
+    def from_genes(
+        cls, genes: List[GeneExpression], interaction_matrix: np.ndarray
+    ) -> "GenomeMatrix":
+        """Create a single-genome population from one gene per base."""
+        by_base = {gene.base: gene for gene in genes}
+        missing = [base.name for base in GeneticBase if base not in by_base]
+        if missing:
+            raise ValueError(f"Genome is missing genes: {', '.join(missing)}")
+
+        ordered = [by_base[base] for base in GeneticBase]
+        return cls(
+            raw_values=[gene.raw_value for gene in ordered],
+            mutation_rates=[gene.mutation_rate for gene in ordered],
+            dominance=[gene.dominance for gene in ordered],
+            interaction_matrix=interaction_matrix,
+        )
+
+    @classmethod
+    def from_genomes(cls, genomes: List["RUBIKGenome"]) -> "GenomeMatrix":
+        """
+        Gather genomes into one population.
+
+        The population uses the interaction matrix of the first genome.
+        """
+        if not genomes:
+            return cls.random(0)
+        rows = [(genome._matrix, genome._row) for genome in genomes]
+        return cls(
+            raw_values=[matrix.raw_values[row] for matrix, row in rows],
+            mutation_rates=[matrix.mutation_rates[row] for matrix, row in rows],
+            dominance=[matrix.dominance[row] for matrix, row in rows],
+            interaction_matrix=genomes[0].interaction_matrix,
+            fitness=[matrix.fitness[row] for matrix, row in rows],
+            generations=[matrix.generations[row] for matrix, row in rows],
+            genome_ids=[matrix.genome_ids[row] for matrix, row in rows],
+            parent_genomes=[matrix.parent_genomes[row] for matrix, row in rows],
+        )
+
+    @classmethod
+    def concatenate(cls, matrices: List["GenomeMatrix"]) -> "GenomeMatrix":
+        """Stack populations; the result uses the first one's interaction matrix."""
+        return cls(
+            raw_values=np.concatenate([m.raw_values for m in matrices]),
+            mutation_rates=np.concatenate([m.mutation_rates for m in matrices]),
+            dominance=np.concatenate([m.dominance for m in matrices]),
+            interaction_matrix=matrices[0].interaction_matrix,
+            fitness=np.concatenate([m.fitness for m in matrices]),
+            generations=np.concatenate([m.generations for m in matrices]),
+            genome_ids=[gid for m in matrices for gid in m.genome_ids],
+            parent_genomes=[p for m in matrices for p in m.parent_genomes],
+        )
+
+    def take(self, rows) -> "GenomeMatrix":
+        """Copy the given rows into a new population."""
+        rows = np.asarray(rows, dtype=int)
+        return GenomeMatrix(
+            raw_values=self.raw_values[rows],
+            mutation_rates=self.mutation_rates[rows],
+            dominance=self.dominance[rows],
+            interaction_matrix=self.interaction_matrix,
+            fitness=self.fitness[rows],
+            generations=self.generations[rows],
+            genome_ids=[self.genome_ids[row] for row in rows.tolist()],
+            parent_genomes=[self.parent_genomes[row] for row in rows.tolist()],
+        )
+
+    def effective_expressions(self) -> np.ndarray:
+        """
+        Calculate effective gene expressions considering interactions.
+
+        Each gene's expression is raised by the logarithm of the summed
+        influence of every other gene, so small genetic changes can have
+        exponential effects on behavior. Results are clipped to 0-2
+        (allowing for super-expression).
+
+        Returns:
+            Array of shape (population, NUM_BASES)
+        """
+        if self._effective_expressions is None:
+            weighted = self.expression_levels * self.dominance * 0.1
+            # Influence of every gene on every other, without self-interaction
+            interaction_effect = (
+                weighted @ self.interaction_matrix.T
+                - weighted * np.diag(self.interaction_matrix)
+            )
+            self._effective_expressions = np.clip(
+                self.expression_levels + np.log10(1 + np.abs(interaction_effect)),
+                0.0,
+                2.0,
+            )
+        return self._effective_expressions
+
+    def archetype_indices(self) -> np.ndarray:
+        """Index into ``list(Archetype)`` of each genome's primary archetype."""
+        if self._archetype_indices is None:
+            scores = self.effective_expressions() @ _ARCHETYPE_WEIGHTS.T
+            self._archetype_indices = np.argmax(scores, axis=1)
+        return self._archetype_indices
+
+    def archetype_counts(self) -> Dict[str, int]:
+        """Count genomes per archetype."""
+        counts = np.bincount(self.archetype_indices(), minlength=len(_ARCHETYPES))
+        return {
+            archetype.value: int(count) for archetype, count in zip(_ARCHETYPES, counts)
+        }
+
+    def compute_fitness(
+        self, performance_metrics: Dict[str, Any], rows: Optional[Any] = None
+    ) -> np.ndarray:
+        """
+        Calculate and store fitness from performance metrics.
+
+        Args:
+            performance_metrics: Metric name to a scalar or to one value per row
+            rows: Rows to evaluate (None = all)
+
+        Returns:
+            Fitness of the evaluated rows
+        """
+        rows = np.arange(len(self)) if rows is None else np.asarray(rows, dtype=int)
+
+        def metric(name: str, default: float) -> np.ndarray:
+            return np.asarray(performance_metrics.get(name, default), dtype=float)
+
+        fitness = np.zeros(len(rows))
+        for name, weight in _FITNESS_WEIGHTS.items():
+            fitness = fitness + metric(name, 0.0) * weight
+        fitness = fitness + (1.0 - metric("error_rate", 1.0)) * _ERROR_RATE_WEIGHT
+
+        # Apply archetype-specific bonuses
+        bonus_metrics = np.stack(
+            [
+                np.broadcast_to(
+                    metric(_ARCHETYPE_BONUS_METRICS[archetype], 0.0), rows.shape
+                )
+                for archetype in _ARCHETYPES
+            ],
+            axis=1,
+        )
+        archetypes = self.archetype_indices()[rows]
+        fitness = fitness + (
+            bonus_metrics[np.arange(len(rows)), archetypes] * _ARCHETYPE_BONUS_WEIGHT
+        )
+
+        self.fitness[rows] = fitness
+        return fitness
+
+    def tournament_select(
+        self,
+        count: int,
+        tournament_size: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """
+        Select rows by tournament selection.
+
+        Each winner is the fittest of ``tournament_size`` distinct random
+        entrants. Instead of drawing the tournaments, the winner's fitness
+        rank is drawn directly from the distribution of the best rank in a
+        random subset: P(best rank >= r) = C(n - r, t) / C(n, t).
+
+        Args:
+            count: Number of rows to select
+            tournament_size: Number of entrants per tournament
+            rng: Random number generator
+
+        Returns:
+            Array of selected row indices
+        """
+        rng = rng or _rng
+        size = len(self)
+        entrants = min(max(tournament_size, 1), size)
+
+        order = np.argsort(-self.fitness, kind="stable")
+        ranks = np.arange(size)
+        # survival[r] = P(best rank > r), from the ratio of consecutive terms
+        survival = np.cumprod(
+            np.clip((size - ranks - entrants) / (size - ranks), 0.0, None)
+        )
+        cdf = 1.0 - survival
+        winners = np.searchsorted(cdf, rng.random(count), side="right")
+        return order[np.minimum(winners, size - 1)]
+
+    def crossover(
+        self,
+        parents1: np.ndarray,
+        parents2: np.ndarray,
+        rng: Optional[np.random.Generator] = None,
+    ) -> "GenomeMatrix":
+        """
+        Create offspring of row pairs through genetic crossover.
+
+        Each gene is inherited from the fitter parent with probability
+        0.6 (0.5 on equal fitness), and blended from both parents with
+        probability 0.3.
+
+        Args:
+            parents1: Row indices of the first parents
+            parents2: Row indices of the second parents
+            rng: Random number generator
+
+        Returns:
+            Population of offspring, one per pair
+        """
+        rng = rng or _rng
+        parents1 = np.asarray(parents1, dtype=int)
+        parents2 = np.asarray(parents2, dtype=int)
+        shape = (len(parents1), NUM_BASES)
+
+        fitness1 = self.fitness[parents1]
+        fitness2 = self.fitness[parents2]
+        selection_probability = np.where(
+            fitness1 > fitness2, 0.6, np.where(fitness2 > fitness1, 0.4, 0.5)
+        )[:, None]
+        from_parent1 = rng.random(shape) < selection_probability
+        blended = rng.random(shape) < 0.3
+
+        def inherit(values: np.ndarray) -> np.ndarray:
+            values1 = values[parents1]
+            values2 = values[parents2]
+            return np.where(
+                blended,
+                (values1 + values2) / 2,
+                np.where(from_parent1, values1, values2),
+            )
+
+        return GenomeMatrix(
+            raw_values=inherit(self.raw_values),
+            mutation_rates=inherit(self.mutation_rates),
+            dominance=inherit(self.dominance),
+            interaction_matrix=self.interaction_matrix,
+            generations=np.maximum(
+                self.generations[parents1], self.generations[parents2]
+            )
+            + 1,
+            parent_genomes=[
+                [self.genome_ids[a], self.genome_ids[b]]
+                for a, b in zip(parents1.tolist(), parents2.tolist())
+            ],
+        )
+
+    def mutate(
+        self,
+        rows: Optional[np.ndarray] = None,
+        mutation_strength: float = 0.1,
+        rng: Optional[np.random.Generator] = None,
+    ) -> "GenomeMatrix":
+        """
+        Create a copy of the population with the given rows mutated.
+
+        Each gene of a mutated row changes with probability equal to its
+        own mutation rate.
+
+        Args:
+            rows: Boolean mask of rows to mutate (None = all)
+            mutation_strength: Scale of the raw value perturbation
+            rng: Random number generator
+
+        Returns:
+            Mutated population (identifiers are kept)
+        """
+        rng = rng or _rng
+        shape = self.raw_values.shape
+        mutating = rng.random(shape) < self.mutation_rates
+        if rows is not None:
+            mutating &= np.asarray(rows, dtype=bool)[:, None]
+
+        mutated_raw = np.clip(
+            self.raw_values
+            + rng.standard_normal(shape) * mutation_strength * self.mutation_rates,
+            0.0,
+            1.0,
+        )
+        return GenomeMatrix(
+            raw_values=np.where(mutating, mutated_raw, self.raw_values),
+            mutation_rates=np.where(
+                mutating,
+                self.mutation_rates * rng.uniform(0.95, 1.05, shape),
+                self.mutation_rates,
+            ),
+            dominance=np.where(
+                mutating,
+                self.dominance * rng.uniform(0.98, 1.02, shape),
+                self.dominance,
+            ),
+            interaction_matrix=self.interaction_matrix,
+            fitness=self.fitness,
+            generations=self.generations,
+            genome_ids=self.genome_ids,
+            parent_genomes=self.parent_genomes,
+        )
+
+    def genome(self, row: int) -> "RUBIKGenome":
+        """Get a genome view of one row."""
+        return RUBIKGenome(matrix=self, row=row)
+
+
 class RUBIKGenome:
     """
     20-base logarithmic matrix genome for biomimetic agents.
 
     This class implements the core genetic architecture that defines
-    agent behavior, capabilities, and evolutionary potential.
+    agent behavior, capabilities, and evolutionary potential. A genome is
+    a view of one row of a ``GenomeMatrix``; a genome created on its own
+    owns a single-row matrix.
     """
 
-    def __init__(self, genes: Optional[List[GeneExpression]] = None):
-        self.genes: Dict[GeneticBase, GeneExpression] = {}
-        self.interaction_matrix = np.zeros((20, 20))  # Gene interaction matrix
-        self.genome_id = self._generate_genome_id()
-        self.generation = 0
-        self.fitness_score = 0.0
-        self.parent_genomes: List[str] = []
-
-        if genes:
-            for gene in genes:
-                self.genes[gene.base] = gene
-        else:
-            self._initialize_random_genome()
+    def __init__(
+        self,
+        genes: Optional[List[GeneExpression]] = None,
+        *,
+        matrix: Optional[GenomeMatrix] = None,
+        row: int = 0,
+    ):
+        if matrix is None:
+            if genes:
+                matrix = GenomeMatrix.from_genes(genes, build_interaction_matrix())
+            else:
+                matrix = GenomeMatrix.random(1)
+            row = 0
+
+        self._matrix = matrix
+        self._row = row
+
+    @property
+    def genome_id(self) -> str:
+        return self._matrix.genome_ids[self._row]
+
+    @genome_id.setter
+    def genome_id(self, value: str):
+        self._matrix.genome_ids[self._row] = value
 
-        self._calculate_interaction_matrix()
+    @property
+    def generation(self) -> int:
+        return int(self._matrix.generations[self._row])
 
-    def _generate_genome_id(self) -> str:
-        """Generate unique genome identifier."""
-        timestamp = str(datetime.now().timestamp())
-        random_data = str(random.random())
-        return hashlib.sha256((timestamp + random_data).encode()).hexdigest()[:16]
+    @generation.setter
+    def generation(self, value: int):
+        self._matrix.generations[self._row] = value
 
-    def _initialize_random_genome(self):
-        """Initialize genome with random gene expressions."""
-        for base in GeneticBase:
-            self.genes[base] = GeneExpression(
+    @property
+    def fitness_score(self) -> float:
+        return float(self._matrix.fitness[self._row])
+
+    @fitness_score.setter
+    def fitness_score(self, value: float):
+        self._matrix.fitness[self._row] = value
+
+    @property
+    def parent_genomes(self) -> List[str]:
+        return self._matrix.parent_genomes[self._row]
+
+    @parent_genomes.setter
+    def parent_genomes(self, value: List[str]):
+        self._matrix.parent_genomes[self._row] = list(value)
+
+    @property
+    def interaction_matrix(self) -> np.ndarray:
+        """Gene interaction matrix (shared with the rest of the population)."""
+        return self._matrix.interaction_matrix
+
+    @interaction_matrix.setter
+    def interaction_matrix(self, matrix: np.ndarray):
+        self._matrix.interaction_matrix = matrix
+
+    @property
+    def genes(self) -> Dict[GeneticBase, GeneExpression]:
+        """Snapshot of the genome's gene expressions."""
+        matrix, row = self._matrix, self._row
+        return {
+            base: GeneExpression(
                 base=base,
-                raw_value=random.random(),
+                raw_value=float(matrix.raw_values[row, base.value]),
                 expression_level=0.0,  # Calculated in __post_init__
-                mutation_rate=random.uniform(0.01, 0.05),
-                dominance=random.uniform(0.5, 1.5),
+                mutation_rate=float(matrix.mutation_rates[row, base.value]),
+                dominance=float(matrix.dominance[row, base.value]),
             )
-
-    def _calculate_interaction_matrix(self):
-        """Calculate gene interaction matrix using logarithmic relationships."""
-        for i, base_i in enumerate(GeneticBase):
-            for j, base_j in enumerate(GeneticBase):
-                if i == j:
-                    self.interaction_matrix[i][j] = 1.0  # Self-interaction
-                else:
-                    # Calculate interaction strength based on gene categories
-                    interaction = self._calculate_gene_interaction(base_i, base_j)
-                    self.interaction_matrix[i][j] = interaction
-
-    def _calculate_gene_interaction(
-        self, base_i: GeneticBase, base_j: GeneticBase
-    ) -> float:
-        """Calculate interaction strength between two genetic bases."""
-        # Define interaction rules based on biological and psychological principles
-        synergistic_pairs = {
-            (GeneticBase.REASONING, GeneticBase.FOCUS): 1.5,
-            (GeneticBase.CREATIVITY, GeneticBase.CURIOSITY): 1.4,
-            (GeneticBase.MEMORY, GeneticBase.LEARNING): 1.3,
-            (GeneticBase.PERSISTENCE, GeneticBase.CONFIDENCE): 1.2,
-            (GeneticBase.EMPATHY, GeneticBase.COOPERATION): 1.4,
-            (GeneticBase.CAUTION, GeneticBase.ANXIETY): 1.1,
-            (GeneticBase.EFFICIENCY, GeneticBase.PRECISION): 1.3,
-            (GeneticBase.ADAPTABILITY, GeneticBase.LEARNING): 1.2,
-        }
-
-        antagonistic_pairs = {
-            (GeneticBase.AGGRESSION, GeneticBase.CAUTION): 0.7,
-            (GeneticBase.SPEED, GeneticBase.PRECISION): 0.8,
-            (GeneticBase.CONFIDENCE, GeneticBase.ANXIETY): 0.6,
-            (GeneticBase.FOCUS, GeneticBase.CURIOSITY): 0.9,
+            for base in GeneticBase
         }
 
-        # Check for defined interactions
-        pair = (base_i, base_j)
-        reverse_pair = (base_j, base_i)
-
-        if pair in synergistic_pairs:
-            return synergistic_pairs[pair]
-        elif reverse_pair in synergistic_pairs:
-            return synergistic_pairs[reverse_pair]
-        elif pair in antagonistic_pairs:
-            return antagonistic_pairs[pair]
-        elif reverse_pair in antagonistic_pairs:
-            return antagonistic_pairs[reverse_pair]
-        else:
-            # Default neutral interaction with slight randomness
-            return random.uniform(0.95, 1.05)
-
     def get_effective_expression(self, base: GeneticBase) -> float:
         """
         Calculate effective gene expression considering interactions.
@@ -201,57 +665,11 @@ class RUBIKGenome:
         This is where the logarithmic matrix magic happens - small genetic
         changes can have exponential effects on behavior.
         """
-        if base not in self.genes:
-            return 0.0
-
-        base_expression = self.genes[base].expression_level
-        base_index = base.value
-
-        # Calculate interaction effects
-        interaction_effect = 0.0
-        for other_base, other_gene in self.genes.items():
-            if other_base != base:
-                other_index = other_base.value
-                interaction_strength = self.interaction_matrix[base_index][other_index]
-                interaction_effect += (
-                    other_gene.expression_level
-                    * interaction_strength
-                    * other_gene.dominance
-                    * 0.1
-                )
-
-        # Apply logarithmic scaling to interaction effects
-        total_expression = base_expression + math.log10(1 + abs(interaction_effect))
-
-        # Normalize to 0-2 range (allowing for super-expression)
-        return np.clip(total_expression, 0.0, 2.0)
+        return float(self._matrix.effective_expressions()[self._row, base.value])
 
     def determine_archetype(self) -> Archetype:
         """Determine primary archetype based on gene expressions."""
-        archetype_scores = {
-            Archetype.EXPLORER: (
-                self.get_effective_expression(GeneticBase.CURIOSITY) * 1.5
-                + self.get_effective_expression(GeneticBase.ADAPTABILITY) * 1.2
-                + self.get_effective_expression(GeneticBase.LEARNING) * 1.1
-            ),
-            Archetype.GUARDIAN: (
-                self.get_effective_expression(GeneticBase.CAUTION) * 1.5
-                + self.get_effective_expression(GeneticBase.ROBUSTNESS) * 1.3
-                + self.get_effective_expression(GeneticBase.PERSISTENCE) * 1.1
-            ),
-            Archetype.CREATOR: (
-                self.get_effective_expression(GeneticBase.CREATIVITY) * 1.5
-                + self.get_effective_expression(GeneticBase.REASONING) * 1.2
-                + self.get_effective_expression(GeneticBase.PRECISION) * 1.1
-            ),
-            Archetype.DESTROYER: (
-                self.get_effective_expression(GeneticBase.AGGRESSION) * 1.4
-                + self.get_effective_expression(GeneticBase.EFFICIENCY) * 1.3
-                + self.get_effective_expression(GeneticBase.FOCUS) * 1.2
-            ),
-        }
-
-        return max(archetype_scores.items(), key=lambda x: x[1])[0]
+        return _ARCHETYPES[self._matrix.archetype_indices()[self._row]]
 
     def calculate_mood_state(
         self, environmental_factors: Dict[str, float]
@@ -310,77 +728,22 @@ class RUBIKGenome:
         Implements sophisticated crossover that preserves beneficial
         gene combinations while introducing variation.
         """
-        offspring_genes = []
-
-        for base in GeneticBase:
-            parent1_gene = self.genes[base]
-            parent2_gene = other_genome.genes[base]
-
-            # Weighted selection based on fitness
-            if self.fitness_score > other_genome.fitness_score:
-                selection_probability = 0.6  # Favor fitter parent
-            elif other_genome.fitness_score > self.fitness_score:
-                selection_probability = 0.4
-            else:
-                selection_probability = 0.5  # Equal fitness
-
-            if random.random() < selection_probability:
-                selected_gene = parent1_gene
-            else:
-                selected_gene = parent2_gene
-
-            # Create new gene with potential crossover
-            if random.random() < 0.3:  # 30% chance of crossover
-                # Blend genes
-                blended_value = (parent1_gene.raw_value + parent2_gene.raw_value) / 2
-                blended_mutation_rate = (
-                    parent1_gene.mutation_rate + parent2_gene.mutation_rate
-                ) / 2
-                blended_dominance = (
-                    parent1_gene.dominance + parent2_gene.dominance
-                ) / 2
-
-                offspring_gene = GeneExpression(
-                    base=base,
-                    raw_value=blended_value,
-                    expression_level=0.0,
-                    mutation_rate=blended_mutation_rate,
-                    dominance=blended_dominance,
-                )
-            else:
-                # Direct inheritance
-                offspring_gene = GeneExpression(
-                    base=selected_gene.base,
-                    raw_value=selected_gene.raw_value,
-                    expression_level=0.0,
-                    mutation_rate=selected_gene.mutation_rate,
-                    dominance=selected_gene.dominance,
-                )
-
-            offspring_genes.append(offspring_gene)
-
-        # Create offspring genome
-        offspring = RUBIKGenome(offspring_genes)
-        offspring.generation = max(self.generation, other_genome.generation) + 1
-        offspring.parent_genomes = [self.genome_id, other_genome.genome_id]
-
-        return offspring
+        parents = GenomeMatrix.concatenate(
+            [
+                self._matrix.take([self._row]),
+                other_genome._matrix.take([other_genome._row]),
+            ]
+        )
+        return parents.crossover([0], [1]).genome(0)
 
     def mutate(self, mutation_strength: float = 0.1) -> "RUBIKGenome":
         """Create a mutated version of this genome."""
-        mutated_genes = []
-
-        for base, gene in self.genes.items():
-            if random.random() < gene.mutation_rate:
-                mutated_genes.append(gene.mutate(mutation_strength))
-            else:
-                mutated_genes.append(gene)
-
-        mutated_genome = RUBIKGenome(mutated_genes)
-        mutated_genome.generation = self.generation
-        mutated_genome.parent_genomes = [self.genome_id]
-
-        return mutated_genome
+        mutated = self._matrix.take([self._row]).mutate(
+            mutation_strength=mutation_strength
+        )
+        mutated.genome_ids = _generate_genome_ids(1)
+        mutated.parent_genomes = [[self.genome_id]]
+        return mutated.genome(0)
 
     def get_model_preferences(self) -> Dict[str, float]:
         """
@@ -500,14 +863,17 @@ class GenomePool:
     Manages a population of RUBIK genomes for evolutionary processes.
 
     This class handles the population-level genetics including selection,
-    breeding, and evolutionary pressure management.
+    breeding, and evolutionary pressure management. The population is held
+    in a ``GenomeMatrix`` so each generation is computed with batched array
+    operations; ``genomes`` exposes it as ``RUBIKGenome`` views.
     """
 
-    def __init__(self, initial_population_size: int = 100):
-        self.genomes: Dict[str, RUBIKGenome] = {}
+    def __init__(self, initial_population_size: int = 100, seed: Optional[int] = None):
         self.population_size = initial_population_size
         self.generation_count = 0
         self.fitness_history: List[Dict[str, float]] = []
+        self._rng = np.random.default_rng(seed)
+        self._genomes: Optional[Dict[str, RUBIKGenome]] = None
 
         # Initialize random population
         self._initialize_population()
@@ -516,11 +882,31 @@ class GenomePool:
         """Initialize population with diverse random genomes."""
         logger.info(f"Initializing genome pool with {self.population_size} genomes")
 
-        for i in range(self.population_size):
-            genome = RUBIKGenome()
-            self.genomes[genome.genome_id] = genome
+        self._set_population(GenomeMatrix.random(self.population_size, self._rng))
+
+        logger.info(f"Created {len(self.population)} initial genomes")
 
-        logger.info(f"Created {len(self.genomes)} initial genomes")
+    def _set_population(self, population: GenomeMatrix):
+        """Replace the population and drop views of the previous one."""
+        self.population = population
+        self._rows = {
+            genome_id: row for row, genome_id in enumerate(population.genome_ids)
+        }
+        self._genomes = None
+
+    @property
+    def genomes(self) -> Dict[str, RUBIKGenome]:
+        """Genomes of the population by identifier, in row order."""
+        if self._genomes is None:
+            self._genomes = {
+                genome_id: RUBIKGenome(matrix=self.population, row=row)
+                for genome_id, row in self._rows.items()
+            }
+        return self._genomes
+
+    @genomes.setter
+    def genomes(self, genomes: Dict[str, RUBIKGenome]):
+        self._set_population(GenomeMatrix.from_genomes(list(genomes.values())))
 
     def evaluate_fitness(
         self, genome_id: str, performance_metrics: Dict[str, float]
@@ -535,51 +921,58 @@ class GenomePool:
         Returns:
             Updated fitness score
         """
-        if genome_id not in self.genomes:
+        if genome_id not in self._rows:
             logger.warning(f"Genome {genome_id} not found in pool")
             return 0.0
 
-        genome = self.genomes[genome_id]
-
-        # Calculate fitness based on multiple factors
-        task_success_rate = performance_metrics.get("task_success_rate", 0.0)
-        energy_efficiency = performance_metrics.get("energy_efficiency", 0.0)
-        adaptation_speed = performance_metrics.get("adaptation_speed", 0.0)
-        error_rate = performance_metrics.get("error_rate", 1.0)
-        collaboration_score = performance_metrics.get("collaboration_score", 0.0)
-
-        # Weighted fitness calculation
-        fitness = (
-            task_success_rate * 0.3
-            + energy_efficiency * 0.2
-            + adaptation_speed * 0.2
-            + (1.0 - error_rate) * 0.15
-            + collaboration_score * 0.15
+        fitness = float(
+            self.population.compute_fitness(
+                performance_metrics, rows=[self._rows[genome_id]]
+            )[0]
         )
 
-        # Apply archetype-specific bonuses
-        archetype = genome.determine_archetype()
-        if archetype == Archetype.EXPLORER:
-            fitness += performance_metrics.get("discovery_rate", 0.0) * 0.1
-        elif archetype == Archetype.GUARDIAN:
-            fitness += performance_metrics.get("security_score", 0.0) * 0.1
-        elif archetype == Archetype.CREATOR:
-            fitness += performance_metrics.get("innovation_score", 0.0) * 0.1
-        elif archetype == Archetype.DESTROYER:
-            fitness += performance_metrics.get("optimization_score", 0.0) * 0.1
-
-        # Update genome fitness
-        genome.fitness_score = fitness
-
         logger.debug(f"Updated fitness for {genome_id[:8]}: {fitness:.3f}")
         return fitness
 
+    def evaluate_fitness_batch(
+        self, genome_ids: List[str], performance_metrics: Dict[str, Any]
+    ) -> np.ndarray:
+        """
+        Evaluate and update the fitness of many genomes at once.
+
+        Args:
+            genome_ids: Genome identifiers
+            performance_metrics: Metric name to a scalar or to one value per genome
+
+        Returns:
+            Updated fitness scores (0.0 for genomes not in the pool)
+        """
+        rows = np.array([self._rows.get(genome_id, -1) for genome_id in genome_ids])
+        found = rows >= 0
+        if not found.all():
+            logger.warning(f"{int((~found).sum())} genomes not found in pool")
+
+        metrics = {
+            name: np.broadcast_to(np.asarray(values, dtype=float), rows.shape)[found]
+            for name, values in performance_metrics.items()
+        }
+        fitness = np.zeros(len(rows))
+        fitness[found] = self.population.compute_fitness(metrics, rows=rows[found])
+        return fitness
+
+    def _tournament_size(self) -> int:
+        return max(3, int(len(self.population) * 0.1))
+
     def select_parents(
         self, selection_pressure: float = 0.7
     ) -> Tuple[RUBIKGenome, RUBIKGenome]:
         """
         Select two parent genomes for breeding using tournament selection.
 
+        The fittest entrant of each tournament always wins: the acceptance
+        probability of the first-ranked entrant, (1 - selection_pressure) ** 0,
+        is 1.
+
         Args:
             selection_pressure: Higher values favor fitter individuals
 
@@ -587,30 +980,17 @@ class GenomePool:
             Tuple of two parent genomes
         """
         genomes_list = list(self.genomes.values())
-
-        # Tournament selection
-        tournament_size = max(3, int(len(genomes_list) * 0.1))
-
-        def tournament_select():
-            tournament = random.sample(genomes_list, tournament_size)
-            tournament.sort(key=lambda g: g.fitness_score, reverse=True)
-
-            # Probabilistic selection favoring fitter individuals
-            for i, genome in enumerate(tournament):
-                selection_prob = (1 - selection_pressure) ** i
-                if random.random() < selection_prob:
-                    return genome
-
-            return tournament[-1]  # Fallback to least fit
-
-        parent1 = tournament_select()
-        parent2 = tournament_select()
+        parent1, parent2 = self.population.tournament_select(
+            2, self._tournament_size(), self._rng
+        )
 
         # Ensure different parents
-        while parent2.genome_id == parent1.genome_id and len(genomes_list) > 1:
-            parent2 = tournament_select()
+        while parent2 == parent1 and len(genomes_list) > 1:
+            parent2 = self.population.tournament_select(
+                1, self._tournament_size(), self._rng
+            )[0]
 
-        return parent1, parent2
+        return genomes_list[parent1], genomes_list[parent2]
 
     def breed_offspring(
         self, parent1: RUBIKGenome, parent2: RUBIKGenome, mutation_rate: float = 0.1
@@ -639,43 +1019,50 @@ class GenomePool:
         """
         logger.info(f"Evolving generation {self.generation_count}")
 
-        # Sort genomes by fitness
-        sorted_genomes = sorted(
-            self.genomes.values(), key=lambda g: g.fitness_score, reverse=True
-        )
+        population = self.population
+        fitness_scores = population.fitness
 
         # Calculate statistics
-        fitness_scores = [g.fitness_score for g in sorted_genomes]
         stats = {
             "generation": self.generation_count,
-            "population_size": len(sorted_genomes),
-            "max_fitness": max(fitness_scores) if fitness_scores else 0.0,
-            "avg_fitness": sum(fitness_scores) / len(fitness_scores)
-            if fitness_scores
-            else 0.0,
-            "min_fitness": min(fitness_scores) if fitness_scores else 0.0,
+            "population_size": len(population),
+            "max_fitness": float(fitness_scores.max()) if len(population) else 0.0,
+            "avg_fitness": float(fitness_scores.mean()) if len(population) else 0.0,
+            "min_fitness": float(fitness_scores.min()) if len(population) else 0.0,
             "archetype_distribution": self._calculate_archetype_distribution(),
         }
 
         # Select survivors
-        num_survivors = int(len(sorted_genomes) * survival_rate)
-        survivors = sorted_genomes[:num_survivors]
+        num_survivors = int(len(population) * survival_rate)
+        survivors = np.argsort(-fitness_scores, kind="stable")[:num_survivors]
 
-        # Create new population
-        new_genomes = {}
+        # Breed offspring to fill population
+        num_offspring = max(self.population_size - num_survivors, 0)
+        tournament_size = self._tournament_size()
+        parents1 = population.tournament_select(
+            num_offspring, tournament_size, self._rng
+        )
+        parents2 = population.tournament_select(
+            num_offspring, tournament_size, self._rng
+        )
 
-        # Add survivors
-        for genome in survivors:
-            new_genomes[genome.genome_id] = genome
+        # Ensure different parents
+        same = parents1 == parents2
+        while same.any() and len(population) > 1:
+            parents2[same] = population.tournament_select(
+                int(same.sum()), tournament_size, self._rng
+            )
+            same = parents1 == parents2
 
-        # Breed offspring to fill population
-        while len(new_genomes) < self.population_size:
-            parent1, parent2 = self.select_parents()
-            offspring = self.breed_offspring(parent1, parent2, mutation_rate)
-            new_genomes[offspring.genome_id] = offspring
+        offspring = population.crossover(parents1, parents2, self._rng)
+        offspring = offspring.mutate(
+            rows=self._rng.random(num_offspring) < mutation_rate, rng=self._rng
+        )
 
         # Update population
-        self.genomes = new_genomes
+        self._set_population(
+            GenomeMatrix.concatenate([population.take(survivors), offspring])
+        )
         self.generation_count += 1
         self.fitness_history.append(stats)
 
@@ -689,35 +1076,26 @@ class GenomePool:
 
     def _calculate_archetype_distribution(self) -> Dict[str, int]:
         """Calculate distribution of archetypes in population."""
-        distribution = {archetype.value: 0 for archetype in Archetype}
-
-        for genome in self.genomes.values():
-            archetype = genome.determine_archetype()
-            distribution[archetype.value] += 1
-
-        return distribution
+        return self.population.archetype_counts()
 
     def get_best_genomes(self, count: int = 10) -> List[RUBIKGenome]:
         """Get the top performing genomes."""
-        sorted_genomes = sorted(
-            self.genomes.values(), key=lambda g: g.fitness_score, reverse=True
-        )
-        return sorted_genomes[:count]
+        genomes_list = list(self.genomes.values())
+        order = np.argsort(-self.population.fitness, kind="stable")[:count]
+        return [genomes_list[row] for row in order]
 
     def get_diverse_genomes(self, count: int = 4) -> List[RUBIKGenome]:
         """Get a diverse set of genomes representing different archetypes."""
-        archetype_genomes = {}
-
-        for genome in self.genomes.values():
-            archetype = genome.determine_archetype()
-            if (
-                archetype not in archetype_genomes
-                or genome.fitness_score > archetype_genomes[archetype].fitness_score
-            ):
-                archetype_genomes[archetype] = genome
+        genomes_list = list(self.genomes.values())
+        archetypes = self.population.archetype_indices()
+        fitness = self.population.fitness
 
-        # Return up to count genomes, prioritizing diversity
-        diverse_genomes = list(archetype_genomes.values())
+        # Fittest genome of each archetype, in order of first appearance
+        present, first_rows = np.unique(archetypes, return_index=True)
+        diverse_genomes = []
+        for archetype in present[np.argsort(first_rows)]:
+            candidates = np.where(archetypes == archetype, fitness, -np.inf)
+            diverse_genomes.append(genomes_list[int(np.argmax(candidates))])
 
         if len(diverse_genomes) < count:
             # Fill remaining slots with high-fitness genomes
@@ -756,10 +1134,11 @@ class GenomePool:
         self.population_size = data["population_size"]
         self.fitness_history = data["fitness_history"]
 
-        self.genomes = {}
-        for genome_id, genome_data in data["genomes"].items():
-            genome = RUBIKGenome.from_dict(genome_data)
-            self.genomes[genome_id] = genome
+        # Genomes saved from one pool share its interaction matrix
+        self.genomes = {
+            genome_id: RUBIKGenome.from_dict(genome_data)
+            for genome_id, genome_data in data["genomes"].items()
+        }
 
         logger.info(
             f"Loaded population from {filepath}: "
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Phoenix Hydra Model Download Engine
+Parallel, resumable, SHA-256 verified model downloads into a shared
+content-addressed store, shared by the model manager and download scripts
+"""
+
+import fnmatch
+import hashlib
+import http.client
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+HF_ENDPOINT = os.environ.get("HF_ENDPOINT", "https://huggingface.co")
+
+
+class DownloadError(Exception):
+    """Raised when a file cannot be downloaded"""
+
+
+class ChecksumMismatchError(DownloadError):
+    """Raised when downloaded content does not match its manifest SHA-256"""
+
+
+@dataclass
+class FileEntry:
+    """One file of a model repository"""
+    path: str                      # Path relative to the repository root
+    url: str                       # http(s)://, file:// or local path
+    size: Optional[int] = None
+    sha256: Optional[str] = None   # Expected digest; computed if unknown
+
+
+@dataclass
+class RepoManifest:
+    """Files making up a model repository"""
+    repo_id: str
+    files: List[FileEntry]
+    revision: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RepoManifest":
+        return cls(
+            repo_id=data["repo_id"],
+            files=[FileEntry(**entry) for entry in data["files"]],
+            revision=data.get("revision"),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RepoManifest":
+        """Load a manifest from a JSON file"""
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class FileResult:
+    """Outcome of fetching one file"""
+    path: str
+    status: str                    # downloaded, resumed, deduplicated, present, failed
+    sha256: Optional[str] = None
+    size: int = 0
+    bytes_transferred: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class RepoDownloadResult:
+    """Outcome of fetching a repository"""
+    repo_id: str
+    dest_dir: str
+    files: List[FileResult] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return all(f.status != "failed" for f in self.files)
+
+    @property
+    def failed_files(self) -> List[FileResult]:
+        return [f for f in self.files if f.status == "failed"]
+
+    @property
+    def bytes_transferred(self) -> int:
+        return sum(f.bytes_transferred for f in self.files)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["success"] = self.success
+        return data
+
+
+def _matches(path: str, patterns: Optional[Sequence[str]]) -> bool:
+    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns or ())
+
+
+def _select(paths: Iterable[str], allow_patterns: Optional[Sequence[str]],
+            ignore_patterns: Optional[Sequence[str]]) -> List[str]:
+    return [
+        path for path in paths
+        if (not allow_patterns or _matches(path, allow_patterns))
+        and not _matches(path, ignore_patterns)
+    ]
+
+
+def sha256_file(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def local_manifest(repo_id: str, root: str,
+                   allow_patterns: Optional[Sequence[str]] = None,
+                   ignore_patterns: Optional[Sequence[str]] = None) -> RepoManifest:
+    """Manifest for a repository mirrored in a local directory"""
+    root_path = Path(root)
+    paths = sorted(
+        p.relative_to(root_path).as_posix() for p in root_path.rglob("*") if p.is_file()
+    )
+    files = []
+    for rel in _select(paths, allow_patterns, ignore_patterns):
+        path = root_path / rel
+        files.append(FileEntry(
+            path=rel,
+            url=path.resolve().as_uri(),
+            size=path.stat().st_size,
+            sha256=sha256_file(path),
+        ))
+    return RepoManifest(repo_id=repo_id, files=files)
+
+
+def huggingface_manifest(repo_id: str, revision: str = "main", token: Optional[str] = None,
+                         allow_patterns: Optional[Sequence[str]] = None,
+                         ignore_patterns: Optional[Sequence[str]] = None) -> RepoManifest:
+    """
+    Manifest for a Hugging Face model repository.
+
+    LFS files carry their SHA-256 in the Hub metadata; small git files do
+    not, so their digest is computed and recorded on download.
+    """
+    from huggingface_hub import HfApi, hf_hub_url
+
+    info = HfApi(endpoint=HF_ENDPOINT, token=token).model_info(
+        repo_id, revision=revision, files_metadata=True
+    )
+    siblings = {s.rfilename: s for s in info.siblings or []}
+    files = []
+    for path in _select(sorted(siblings), allow_patterns, ignore_patterns):
+        sibling = siblings[path]
+        lfs = sibling.lfs
+        files.append(FileEntry(
+            path=path,
+            url=hf_hub_url(repo_id, path, revision=info.sha or revision, endpoint=HF_ENDPOINT),
+            size=lfs.size if lfs else sibling.size,
+            sha256=lfs.sha256 if lfs else None,
+        ))
+    return RepoManifest(repo_id=repo_id, files=files, revision=info.sha or revision)
+
+
+def huggingface_headers(token: Optional[str] = None) -> Dict[str, str]:
+    """
+    Request headers for downloading (possibly gated) Hugging Face files.
+
+    Without an explicit token or ``HF_TOKEN``, the token saved by
+    ``huggingface-cli login`` is used, as huggingface_hub itself does.
+    """
+    token = token or os.environ.get("HF_TOKEN") or _saved_huggingface_token()
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def _saved_huggingface_token() -> Optional[str]:
+    try:
+        from huggingface_hub import get_token
+    except ImportError:
+        return None
+    return get_token()
+
+
+class BandwidthLimiter:
+    """Token bucket shared by all transfers of an engine"""
+
+    def __init__(self, bytes_per_second: float):
+        self.rate = float(bytes_per_second)
+        self._allowance = self.rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int) -> None:
+        """Block until ``amount`` bytes may be transferred"""
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(self.rate, self._allowance + (now - self._last) * self.rate)
+            self._last = now
+            self._allowance -= amount
+            wait = -self._allowance / self.rate if self._allowance < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ModelDownloadEngine:
+    """
+    Downloads model repositories file by file into a content-addressed store.
+
+    Every file is stored once under ``<store>/blobs/sha256/<digest>`` and
+    hard-linked into each repository directory that contains it, so files
+    shared between repositories are downloaded and stored only once.
+    Partial downloads are kept under ``<store>/partial`` and resumed with
+    HTTP range requests. All repositories are recorded in a single
+    ``<store>/inventory.json``.
+    """
+
+    def __init__(self, store_dir: str, max_concurrent_files: int = 8,
+                 max_bytes_per_second: Optional[float] = None,
+                 headers: Optional[Dict[str, str]] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, retries: int = 2,
+                 timeout: float = 60.0):
+        self.store_dir = Path(store_dir)
+        self.blobs_dir = self.store_dir / "blobs" / "sha256"
+        self.partial_dir = self.store_dir / "partial"
+        self.inventory_path = self.store_dir / "inventory.json"
+
+        self.max_concurrent_files = max_concurrent_files
+        self.headers = headers or {}
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.timeout = timeout
+        self.limiter = BandwidthLimiter(max_bytes_per_second) if max_bytes_per_second else None
+
+        # Global limit on concurrent transfers, shared by every caller
+        self._transfer_slots = threading.BoundedSemaphore(max_concurrent_files)
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        self._inventory_lock = threading.Lock()
+
+    # Public API
+
+    def download_repo(self, manifest: RepoManifest, dest_dir: str,
+                      on_file: Optional[Callable[[FileResult], None]] = None) -> RepoDownloadResult:
+        """Download one repository into ``dest_dir``"""
+        return self.download_repos([(manifest, dest_dir)], on_file=on_file)[0]
+
+    def download_repos(self, jobs: Sequence[Tuple[RepoManifest, str]],
+                       on_file: Optional[Callable[[FileResult], None]] = None) -> List[RepoDownloadResult]:
+        """Download several repositories, all files sharing one worker pool"""
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+
+        results = [RepoDownloadResult(m.repo_id, str(Path(d))) for m, d in jobs]
+        tasks = [
+            (index, entry, Path(dest_dir) / entry.path)
+            for index, (manifest, dest_dir) in enumerate(jobs)
+            for entry in manifest.files
+        ]
+
+        def run(task):
+            index, entry, dest = task
+            result = self.fetch_file(entry, dest)
+            if on_file is not None:
+                on_file(result)
+            return index, result
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_files) as pool:
+            for index, result in pool.map(run, tasks):
+                results[index].files.append(result)
+
+        for (manifest, _), result in zip(jobs, results):
+            self._record_repo(manifest, result)
+        return results
+
+    def fetch_file(self, entry: FileEntry, dest: Path) -> FileResult:
+        """Fetch one file into the store and link it to ``dest``"""
+        key = entry.sha256 or hashlib.sha256(entry.url.encode()).hexdigest()
+        try:
+            with self._key_lock(key):
+                return self._fetch_locked(entry, Path(dest), key)
+        except Exception as e:
+            logger.error(f"Failed to download {entry.path}: {e}")
+            return FileResult(path=entry.path, status="failed", sha256=entry.sha256, error=str(e))
+
+    def blob_path(self, sha256: str) -> Path:
+        """Store location of a blob"""
+        return self.blobs_dir / sha256[:2] / sha256
+
+    def load_inventory(self) -> Dict[str, Any]:
+        """Inventory of every repository downloaded through this store"""
+        if not self.inventory_path.exists():
+            return {"repos": {}, "blobs": {}}
+        with open(self.inventory_path, "r") as f:
+            return json.load(f)
+
+    # Internals
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._key_locks_guard:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _fetch_locked(self, entry: FileEntry, dest: Path, key: str) -> FileResult:
+        if entry.sha256:
+            blob = self.blob_path(entry.sha256)
+            if blob.exists():
+                status = "present" if dest.exists() and os.path.samefile(blob, dest) else "deduplicated"
+                self._link(blob, dest)
+                return FileResult(entry.path, status, entry.sha256, blob.stat().st_size)
+            if dest.exists() and sha256_file(dest) == entry.sha256:
+                # Adopt a file downloaded before the store existed
+                self._store_blob(dest, entry.sha256, move=False)
+                self._link(self.blob_path(entry.sha256), dest)
+                return FileResult(entry.path, "present", entry.sha256, dest.stat().st_size)
+
+        last_error: Optional[Exception] = None
+        for _ in range(self.retries + 1):
+            try:
+                with self._transfer_slots:
+                    part, digest, transferred, resumed = self._transfer(entry, key)
+                break
+            except urllib.error.HTTPError as e:
+                if 400 <= e.code < 500 and e.code not in (408, 429):
+                    raise  # Missing or forbidden: retrying will not help
+                last_error = e
+            except (DownloadError, urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                # Checksum mismatches discard the partial file and start over;
+                # dropped connections keep it and resume
+                last_error = e
+        else:
+            raise DownloadError(str(last_error))
+
+        blob = self.blob_path(digest)
+        status = "resumed" if resumed else "downloaded"
+        if blob.exists():
+            part.unlink()  # Same content already stored under another URL
+            status = "deduplicated"
+        else:
+            self._store_blob(part, digest, move=True)
+        self._link(blob, dest)
+        return FileResult(entry.path, status, digest, blob.stat().st_size, transferred)
+
+    def _open(self, url: str, offset: int):
+        """Open a source at ``offset``; returns (stream, honoured_offset)"""
+        if "://" not in url or url.startswith("file://"):
+            path = urllib.request.url2pathname(url[len("file://"):]) if url.startswith("file://") else url
+            stream = open(path, "rb")
+            stream.seek(offset)
+            return stream, offset
+
+        headers = dict(self.headers)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                return None, offset  # Partial file is already complete
+            raise
+        return response, offset if response.status == 206 else 0
+
+    def _transfer(self, entry: FileEntry, key: str) -> Tuple[Path, str, int, bool]:
+        """Download (or resume) into the partial area and verify"""
+        part = self.partial_dir / f"{key}.part"
+        offset = part.stat().st_size if part.exists() else 0
+        if entry.size is not None and offset > entry.size:
+            part.unlink()
+            offset = 0
+
+        digest = hashlib.sha256()
+        transferred = 0
+        stream = None
+        if entry.size is None or offset < entry.size:
+            stream, offset = self._open(entry.url, offset)
+
+        # Hash what is already on disk before appending to it
+        if offset:
+            with open(part, "rb") as f:
+                for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                    digest.update(chunk)
+
+        if stream is not None:
+            with stream, open(part, "r+b" if offset else "wb") as out:
+                out.seek(offset)
+                out.truncate()
+                for chunk in iter(lambda: stream.read(self.chunk_size), b""):
+                    if self.limiter is not None:
+                        self.limiter.consume(len(chunk))
+                    out.write(chunk)
+                    digest.update(chunk)
+                    transferred += len(chunk)
+
+        size = part.stat().st_size
+        result = digest.hexdigest()
+        if entry.size is not None and size != entry.size:
+            if size > entry.size:
+                part.unlink()
+                raise ChecksumMismatchError(f"{entry.path}: expected {entry.size} bytes, got {size}")
+            raise DownloadError(f"{entry.path}: incomplete ({size}/{entry.size} bytes)")
+        if entry.sha256 and result != entry.sha256:
+            part.unlink()
+            raise ChecksumMismatchError(f"{entry.path}: SHA-256 {result} does not match {entry.sha256}")
+        return part, result, transferred, bool(offset)
+
+    def _store_blob(self, source: Path, sha256: str, move: bool) -> None:
+        blob = self.blob_path(sha256)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if move:
+            os.replace(source, blob)
+        else:
+            try:
+                os.link(source, blob)
+            except OSError:
+                shutil.copy2(source, blob)
+        blob.chmod(0o444)  # Shared by hard links: never modify in place
+
+    @staticmethod
+    def _link(blob: Path, dest: Path) -> None:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists():
+            if os.path.samefile(blob, dest):
+                return
+            dest.unlink()
+        try:
+            os.link(blob, dest)
+        except OSError:
+            shutil.copy2(blob, dest)  # Store on another filesystem
+
+    def _record_repo(self, manifest: RepoManifest, result: RepoDownloadResult) -> None:
+        """Merge a repository into the inventory manifest"""
+        with self._inventory_lock:
+            inventory = self.load_inventory()
+            inventory["repos"][manifest.repo_id] = {
+                "dest_dir": result.dest_dir,
+                "revision": manifest.revision,
+                "complete": result.success,
+                "updated_at": time.time(),
+                "files": {
+                    f.path: {"sha256": f.sha256, "size": f.size}
+                    for f in result.files if f.status != "failed"
+                },
+            }
+
+            blobs: Dict[str, Dict[str, Any]] = {}
+            for repo_id, repo in inventory["repos"].items():
+                for path, info in repo["files"].items():
+                    blob = blobs.setdefault(info["sha256"], {"size": info["size"], "refs": []})
+                    blob["refs"].append(f"{repo_id}/{path}")
+            inventory["blobs"] = blobs
+
+            tmp = self.inventory_path.with_suffix(".json.tmp")
+            with open(tmp, "w") as f:
+                json.dump(inventory, f, indent=2, sort_keys=True)
+            os.replace(tmp, self.inventory_path)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Phoenix Hydra Model Inventory Scanner
+Incremental size and file-count scans of model directory trees, reusing
+cached per-directory stats for directories whose mtime has not changed
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Directories modified this close to the scan may change again within the
+# same mtime tick, so their cached stats are not trusted on the next run
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class TreeStats:
+    """Totals for a scanned directory tree"""
+    path: str
+    size: int
+    file_count: int
+    directory_count: int
+    modified: float                # mtime of the tree's root directory
+
+
+class IncrementalTreeScanner:
+    """
+    Scans directory trees for total file size and count.
+
+    Each directory's own files (size, count), subdirectory names and mtime
+    are cached in a JSON file. On later scans a directory whose mtime is
+    unchanged reuses its cached entry instead of being listed again; only
+    its subdirectories are stat'ed, since their changes do not touch the
+    parent's mtime. Files rewritten in place without a rename are not
+    noticed until their directory changes or a full scan is requested;
+    model downloads and the Hugging Face cache always write by rename.
+    """
+
+    def __init__(self, cache_path: str, max_workers: int = 8):
+        self.cache_path = Path(cache_path)
+        self.max_workers = max_workers
+
+        # Counters for the last scan
+        self.directories_scanned = 0
+        self.directories_reused = 0
+
+    def load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Cached directory entries keyed by absolute path"""
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("directories", {})
+
+    def _save_cache(self, directories: Dict[str, Dict[str, Any]]) -> None:
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"version": CACHE_VERSION, "directories": directories}, f)
+        os.replace(tmp, self.cache_path)
+
+    @staticmethod
+    def _scan_directory(path: str, cached: Optional[Dict[str, Any]],
+                        started_ns: int) -> Optional[Dict[str, Any]]:
+        """Cache entry for one directory, listing it only if it changed"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None  # Removed since its parent was listed
+
+        if cached and cached["stable"] and cached["mtime_ns"] == st.st_mtime_ns:
+            return cached
+
+        size = file_count = 0
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            size += entry.stat().st_size
+                            file_count += 1
+                    except OSError:
+                        continue  # Dangling symlink or vanished file
+        except OSError as e:
+            logger.warning(f"Cannot list {path}: {e}")
+
+        return {
+            "mtime_ns": st.st_mtime_ns,
+            "stable": started_ns - st.st_mtime_ns > RACY_WINDOW_NS,
+            "size": size,
+            "file_count": file_count,
+            "subdirs": sorted(subdirs),
+        }
+
+    @staticmethod
+    def _totals(root: str, directories: Dict[str, Dict[str, Any]]) -> TreeStats:
+        size = file_count = directory_count = 0
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            entry = directories.get(path)
+            if entry is None:
+                continue  # Removed after its parent was listed
+            size += entry["size"]
+            file_count += entry["file_count"]
+            directory_count += 1
+            stack.extend(os.path.join(path, name) for name in entry["subdirs"])
+        return TreeStats(
+            path=root,
+            size=size,
+            file_count=file_count,
+            directory_count=directory_count,
+            modified=directories[root]["mtime_ns"] / 1e9,
+        )
+
+    def scan(self, roots: Iterable[str], full: bool = False) -> Dict[str, TreeStats]:
+        """
+        Scan directory trees, returning their totals keyed by root path.
+
+        Directories of a tree are processed level by level on a thread
+        pool. Roots that do not exist are left out of the result. With
+        ``full`` every directory is listed regardless of the cache.
+        """
+        roots = [os.path.abspath(root) for root in roots]
+        previous = {} if full else self.load_cache()
+        directories: Dict[str, Dict[str, Any]] = {}
+        started_ns = time.time_ns()
+        self.directories_scanned = self.directories_reused = 0
+
+        frontier: List[str] = list(dict.fromkeys(roots))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while frontier:
+                entries = pool.map(
+                    lambda path: self._scan_directory(
+                        path, previous.get(path), started_ns
+                    ),
+                    frontier,
+                )
+                next_frontier = []
+                for path, entry in zip(frontier, entries):
+                    if entry is None:
+                        continue
+                    if entry is previous.get(path):
+                        self.directories_reused += 1
+                    else:
+                        self.directories_scanned += 1
+                    directories[path] = entry
+                    next_frontier.extend(
+                        os.path.join(path, name) for name in entry["subdirs"]
+                    )
+                frontier = next_frontier
+
+        # Keep cached entries of trees outside this scan
+        prefixes = tuple(root + os.sep for root in roots)
+        for path, entry in previous.items():
+            if path in directories or path in roots or path.startswith(prefixes):
+                continue
+            directories[path] = entry
+        self._save_cache(directories)
+
+        logger.info(
+            f"Scanned {self.directories_scanned} directories, "
+            f"reused {self.directories_reused} from cache"
+        )
+        return {
+            root: self._totals(root, directories)
+            for root in roots
+            if root in directories
+        }
@@ -5,6 +5,7 @@ Comprehensive local model management system for Phoenix Hydra ecosystem
 """
 
 import asyncio
+import gc
 import hashlib
 import json
 import logging
@@ -13,12 +14,19 @@ from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
 import torch
 import yaml
 
+from .model_downloader import DownloadError, ModelDownloadEngine, huggingface_headers
+from .model_residency import (
+    ModelResidencyManager,
+    ResidencyBudgetError,
+    estimate_footprint_mb,
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -86,12 +94,23 @@ class PhoenixModelManager:
     Manages local AI models with energy-efficient SSM architecture
     """
     
-    def __init__(self, models_dir: str = "models", config_path: str = "config/models.yaml"):
+    def __init__(self, models_dir: str = "models", config_path: str = "config/models.yaml",
+                 memory_budget_mb: Optional[int] = None):
         self.models_dir = Path(models_dir)
         self.config_path = Path(config_path)
         self.models: Dict[str, ModelInstance] = {}
         self.active_models: Dict[ModelType, str] = {}
         
+        # Memory budget for loaded models (active models are pinned)
+        self.residency = ModelResidencyManager(memory_budget_mb)
+        self.unload_listeners: List[Callable[[str], None]] = []
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Shared download engine (content-addressed store under models_dir)
+        self.downloader = ModelDownloadEngine(
+            str(self.models_dir / ".store"), headers=huggingface_headers()
+        )
+        
         # Create directories
         self.models_dir.mkdir(parents=True, exist_ok=True)
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -376,25 +395,20 @@ class PhoenixModelManager:
             # Download via Hugging Face if Ollama failed
             if config.huggingface_name:
                 try:
-                    from transformers import AutoModel, AutoTokenizer
+                    from .model_downloader import huggingface_manifest
                     
                     model_path = self.models_dir / model_name
-                    model_path.mkdir(parents=True, exist_ok=True)
                     
-                    # Download model and tokenizer
-                    model = AutoModel.from_pretrained(
-                        config.huggingface_name,
-                        cache_dir=str(model_path),
-                        torch_dtype=torch.float16 if config.energy_efficient else torch.float32
+                    # Fetch files in parallel, verified and deduplicated in the shared store
+                    manifest = await asyncio.to_thread(
+                        huggingface_manifest, config.huggingface_name
                     )
-                    tokenizer = AutoTokenizer.from_pretrained(
-                        config.huggingface_name,
-                        cache_dir=str(model_path)
+                    result = await asyncio.to_thread(
+                        self.downloader.download_repo, manifest, str(model_path)
                     )
-                    
-                    # Save locally
-                    model.save_pretrained(str(model_path))
-                    tokenizer.save_pretrained(str(model_path))
+                    if not result.success:
+                        failed = ", ".join(f.path for f in result.failed_files)
+                        raise DownloadError(f"Failed files: {failed}")
                     
                     config.local_path = str(model_path)
                     instance.status = ModelStatus.DOWNLOADED
@@ -403,7 +417,7 @@ class PhoenixModelManager:
                     return True
                     
                 except ImportError:
-                    logger.error("transformers library not installed for Hugging Face downloads")
+                    logger.error("huggingface_hub library not installed for Hugging Face downloads")
                 except Exception as e:
                     logger.error(f"Hugging Face download failed: {e}")
             
@@ -429,11 +443,15 @@ class PhoenixModelManager:
             logger.error(f"Model {model_name} not downloaded")
             return False
         
+        # Make room within the memory budget before loading
+        config = instance.config
+        if not self._make_room(model_name, estimate_footprint_mb(config)):
+            return False
+        
         try:
             instance.status = ModelStatus.LOADING
             logger.info(f"Loading model: {model_name}")
             
-            config = instance.config
             
             # Load based on model type
             if config.type == ModelType.SSM:
@@ -490,6 +508,17 @@ class PhoenixModelManager:
             
             instance.status = ModelStatus.LOADED
             instance.loaded_at = datetime.now()
+            instance.error_message = None
+            
+            # Track the measured footprint; evict more if the estimate was low
+            instance.memory_usage_mb = estimate_footprint_mb(config, instance.model_object)
+            self.residency.admit(model_name, instance.memory_usage_mb)
+            if not self._make_room(model_name, instance.memory_usage_mb):
+                logger.warning(
+                    f"Model {model_name} exceeds the memory budget "
+                    f"({self.residency.resident_mb}/{self.residency.budget_mb} MB)"
+                )
+            
             logger.info(f"Successfully loaded model: {model_name}")
             self._save_config()
             return True
@@ -500,6 +529,64 @@ class PhoenixModelManager:
             logger.error(f"Error loading {model_name}: {e}")
             return False
     
+    def _make_room(self, model_name: str, footprint_mb: int) -> bool:
+        """Evict idle, unpinned models until ``footprint_mb`` fits in the budget"""
+        try:
+            victims = self.residency.plan_eviction(
+                model_name, footprint_mb, pinned=self.active_models.values()
+            )
+        except ResidencyBudgetError as e:
+            logger.error(str(e))
+            self.models[model_name].error_message = str(e)
+            return False
+        
+        for victim in victims:
+            self.unload_model(victim, evicted=True)
+        return True
+    
+    def unload_model(self, model_name: str, evicted: bool = False) -> bool:
+        """Release a loaded model's memory; it stays downloaded"""
+        instance = self.models.get(model_name)
+        if instance is None or instance.status != ModelStatus.LOADED:
+            return False
+        
+        for listener in self.unload_listeners:
+            try:
+                listener(model_name)
+            except Exception as e:
+                logger.error(f"Unload listener failed for {model_name}: {e}")
+        
+        instance.status = ModelStatus.DOWNLOADED
+        instance.model_object = None
+        instance.loaded_at = None
+        instance.memory_usage_mb = 0
+        self.residency.release(model_name, evicted=evicted)
+        
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        
+        logger.info(f"Unloaded model: {model_name}")
+        return True
+    
+    async def ensure_loaded(self, model_name: str) -> bool:
+        """Load a model on first use; returns whether it is loaded"""
+        instance = self.models.get(model_name)
+        if instance is None:
+            return False
+        
+        if instance.status == ModelStatus.LOADED:
+            self.residency.record_request(model_name, hit=True)
+            return True
+        
+        lock = self._load_locks.setdefault(model_name, asyncio.Lock())
+        async with lock:
+            if instance.status == ModelStatus.LOADED:
+                self.residency.record_request(model_name, hit=True)
+                return True
+            self.residency.record_request(model_name, hit=False)
+            return await self.load_model(model_name)
+    
     def get_active_model(self, model_type: ModelType) -> Optional[str]:
         """Get the currently active model for a given type"""
         return self.active_models.get(model_type)
@@ -608,6 +695,7 @@ class PhoenixModelManager:
             "overall_healthy": True,
             "models": {},
             "system_resources": self.get_system_requirements(),
+            "residency": self.residency.get_metrics(pinned=self.active_models.values()),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Phoenix Hydra Model Residency
+Tracks which models are resident in memory against a RAM budget and picks
+least-recently-used idle models to evict when a new load would not fit
+"""
+
+import logging
+import math
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import psutil
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Share of system RAM models may use when no budget is configured
+DEFAULT_BUDGET_FRACTION = 0.75
+
+# Environment variable overriding the budget, in MB
+BUDGET_ENV_VAR = "PHOENIX_MODEL_MEMORY_BUDGET_MB"
+
+# Files counted when sizing a model from its on-disk weights
+WEIGHT_FILE_SUFFIXES = {".safetensors", ".bin", ".pt", ".pth", ".ckpt", ".gguf", ".onnx"}
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+class ResidencyBudgetError(MemoryError):
+    """Raised when a model cannot fit in the memory budget"""
+
+
+@dataclass
+class ResidentModel:
+    """A model currently held in memory"""
+    model_name: str
+    footprint_mb: int
+    loaded_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.monotonic)
+    in_use: int = 0
+    uses: int = 0
+
+
+def default_memory_budget_mb() -> int:
+    """Budget from the environment, else a fixed share of system RAM"""
+    configured = os.environ.get(BUDGET_ENV_VAR)
+    if configured:
+        return int(configured)
+    total_mb = psutil.virtual_memory().total // _BYTES_PER_MB
+    return int(total_mb * DEFAULT_BUDGET_FRACTION)
+
+
+def _module_bytes(model_object: Any) -> int:
+    """Bytes held by the parameters and buffers of torch modules in a model object"""
+    if isinstance(model_object, dict):
+        return sum(_module_bytes(value) for value in model_object.values())
+
+    module = model_object
+    if not hasattr(module, "parameters") and hasattr(module, "model"):
+        module = module.model  # Wrappers such as ultralytics YOLO
+    if not hasattr(module, "parameters") or not callable(module.parameters):
+        return 0
+
+    try:
+        total = sum(p.numel() * p.element_size() for p in module.parameters())
+        if hasattr(module, "buffers"):
+            total += sum(b.numel() * b.element_size() for b in module.buffers())
+        return total
+    except Exception:
+        return 0
+
+
+def _disk_bytes(path: Path) -> int:
+    """Size of a model's weight files (whole directory if none are recognised)"""
+    if path.is_file():
+        return path.stat().st_size
+
+    files = [f for f in path.rglob("*") if f.is_file()]
+    weights = [f for f in files if f.suffix in WEIGHT_FILE_SUFFIXES]
+    return sum(f.stat().st_size for f in (weights or files))
+
+
+def estimate_footprint_mb(config: Any, model_object: Any = None) -> int:
+    """
+    Estimate a model's resident memory in MB.
+
+    Uses, in order: the parameters of a loaded model object, the size of
+    its weights on disk, and the configured ``memory_requirement_mb``.
+    """
+    if model_object is not None:
+        size = _module_bytes(model_object)
+        if size:
+            return max(1, math.ceil(size / _BYTES_PER_MB))
+
+    local_path = getattr(config, "local_path", None)
+    if local_path and Path(local_path).exists():
+        size = _disk_bytes(Path(local_path))
+        if size:
+            return max(1, math.ceil(size / _BYTES_PER_MB))
+
+    return config.memory_requirement_mb
+
+
+class ModelResidencyManager:
+    """
+    Memory budget bookkeeping for loaded models.
+
+    The manager does not load or unload anything itself: callers ask it
+    which models to evict with ``plan_eviction`` and report loads and
+    unloads with ``admit`` and ``release``.
+    """
+
+    def __init__(self, budget_mb: Optional[int] = None):
+        self.budget_mb = budget_mb if budget_mb is not None else default_memory_budget_mb()
+        self.resident: Dict[str, ResidentModel] = {}
+
+        # Metrics
+        self.loads = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_mb = 0
+        self.rejected_loads = 0
+
+    @property
+    def resident_mb(self) -> int:
+        """Memory held by resident models"""
+        return sum(model.footprint_mb for model in self.resident.values())
+
+    @property
+    def available_mb(self) -> int:
+        """Budget not used by resident models"""
+        return self.budget_mb - self.resident_mb
+
+    def is_resident(self, model_name: str) -> bool:
+        """Whether a model is held in memory"""
+        return model_name in self.resident
+
+    def plan_eviction(self, model_name: str, footprint_mb: int,
+                      pinned: Iterable[str] = ()) -> List[str]:
+        """
+        Models to evict, least recently used first, so that ``model_name`` fits.
+
+        Pinned and in-use models are never chosen.
+
+        Raises:
+            ResidencyBudgetError: If the model cannot fit even after evicting
+                every evictable model
+        """
+        pinned = set(pinned) | {model_name}
+        needed = footprint_mb - self.available_mb
+        if model_name in self.resident:
+            needed -= self.resident[model_name].footprint_mb
+        if needed <= 0:
+            return []
+
+        candidates = sorted(
+            (model for model in self.resident.values()
+             if model.model_name not in pinned and model.in_use == 0),
+            key=lambda model: model.last_used
+        )
+
+        victims = []
+        for model in candidates:
+            if needed <= 0:
+                break
+            victims.append(model.model_name)
+            needed -= model.footprint_mb
+
+        if needed > 0:
+            self.rejected_loads += 1
+            raise ResidencyBudgetError(
+                f"Model {model_name} needs {footprint_mb} MB, "
+                f"{needed} MB more than the {self.budget_mb} MB budget can free"
+            )
+        return victims
+
+    def admit(self, model_name: str, footprint_mb: int) -> ResidentModel:
+        """Record that a model has been loaded"""
+        model = ResidentModel(model_name=model_name, footprint_mb=footprint_mb)
+        self.resident[model_name] = model
+        self.loads += 1
+        logger.info(
+            f"Model {model_name} resident ({footprint_mb} MB, "
+            f"{self.resident_mb}/{self.budget_mb} MB used)"
+        )
+        return model
+
+    def release(self, model_name: str, evicted: bool = False) -> None:
+        """Record that a model has been unloaded"""
+        model = self.resident.pop(model_name, None)
+        if model is not None and evicted:
+            self.evictions += 1
+            self.evicted_mb += model.footprint_mb
+            logger.info(f"Evicted model {model_name} ({model.footprint_mb} MB)")
+
+    def record_request(self, model_name: str, hit: bool) -> None:
+        """Count a request that found its model resident (hit) or had to load it"""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @contextmanager
+    def in_use(self, model_name: str) -> Iterator[None]:
+        """Mark a model busy (not evictable) and most recently used"""
+        model = self.resident.get(model_name)
+        if model is None:
+            yield
+            return
+
+        model.in_use += 1
+        model.uses += 1
+        model.last_used = time.monotonic()
+        try:
+            yield
+        finally:
+            model.in_use -= 1
+            model.last_used = time.monotonic()
+
+    def get_metrics(self, pinned: Iterable[str] = ()) -> Dict[str, Any]:
+        """Residency and eviction metrics"""
+        pinned = set(pinned)
+        now = time.monotonic()
+        return {
+            "budget_mb": self.budget_mb,
+            "resident_mb": self.resident_mb,
+            "available_mb": self.available_mb,
+            "loads": self.loads,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "evicted_mb": self.evicted_mb,
+            "rejected_loads": self.rejected_loads,
+            "resident_models": {
+                name: {
+                    "footprint_mb": model.footprint_mb,
+                    "pinned": name in pinned,
+                    "in_use": model.in_use,
+                    "uses": model.uses,
+                    "idle_seconds": round(now - model.last_used, 3),
+                }
+                for name, model in self.resident.items()
+            },
+        }
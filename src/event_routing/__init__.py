@@ -5,6 +5,16 @@ This module provides a comprehensive event routing system with pattern matching,
 subscription management, and delivery modes for the Phoenix Hydra ecosystem.
 """
 
+from .delivery import (
+    # Delivery engines
+    AsyncDeliveryEngine,
+    AsyncioDeliveryEngine,
+    DeliveryStats,
+    OverflowPolicy,
+    QueuedDelivery,
+    QueuedDeliveryConsumer,
+)
+from .correlation_graph import CorrelationGraph
 from .event_correlator import (
     CorrelationChain,
     # Event correlator
@@ -21,6 +31,7 @@ from .event_routing import (
     EventQueue,
     # Main router
     EventRouter,
+    IndexedPatternMatcher,
     InMemoryEventQueue,
     # Pattern matching
     PatternMatcher,
@@ -33,6 +44,11 @@ from .event_store import (
     InMemoryEventStore,
     RetentionPolicy,
 )
+from .pattern_compiler import CompiledPattern, compile_type_matcher
+from .retention import RetentionEngine
+from .search_index import EventSearchIndex, SearchQuery
+from .segment_store import SegmentedEventStore
+from .sqlite_store import SQLiteEventStore
 
 __all__ = [
     # Core data models
@@ -46,6 +62,9 @@ __all__ = [
     'DefaultPatternMatcher',
     'WildcardPatternMatcher',
     'CachedPatternMatcher',
+    'IndexedPatternMatcher',
+    'CompiledPattern',
+    'compile_type_matcher',
     
     # Event queue
     'EventQueue',
@@ -54,12 +73,26 @@ __all__ = [
     # Main router
     'EventRouter',
     
+    # Delivery engines
+    'AsyncDeliveryEngine',
+    'AsyncioDeliveryEngine',
+    'DeliveryStats',
+    'OverflowPolicy',
+    'QueuedDelivery',
+    'QueuedDeliveryConsumer',
+    
     # Event store
     'EventStoreBase',
     'InMemoryEventStore',
+    'SegmentedEventStore',
+    'SQLiteEventStore',
     'RetentionPolicy',
+    'RetentionEngine',
+    'EventSearchIndex',
+    'SearchQuery',
     
     # Event correlator
     'EventCorrelator',
     'CorrelationChain',
+    'CorrelationGraph',
 ]
\ No newline at end of file
@@ -0,0 +1,335 @@
+"""
+Correlation graph for Phoenix Hydra Event Routing System.
+
+Keeps causation adjacency (parent -> children) and per-correlation
+time-ordered event lists up to date on insert, so chain, timeline and
+causation queries cost O(chain) or O(depth) instead of a store scan. The
+traversal helpers are shared with the event store, which answers the
+same queries from its own secondary indexes.
+"""
+
+import bisect
+import heapq
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from .event_routing import Event
+
+
+def _timestamp(event: Event):
+    return event.timestamp
+
+
+def walk_ancestors(event: Event, lookup: Callable[[str], Optional[Event]]) -> List[Event]:
+    """
+    Follow causation links from an event up to its root cause.
+
+    Args:
+        event: The event to start from
+        lookup: Returns a stored event by ID, or None
+
+    Returns:
+        Events in causation order (root cause first, ``event`` last)
+    """
+    chain = [event]
+    visited = {event.id}
+    parent_id = event.causation_id
+    while parent_id and parent_id not in visited:
+        parent = lookup(parent_id)
+        if parent is None:
+            break
+        chain.append(parent)
+        visited.add(parent_id)
+        parent_id = parent.causation_id
+    chain.reverse()
+    return chain
+
+
+def walk_descendants(event_id: str,
+                     children: Callable[[str], Iterable[Event]],
+                     max_depth: Optional[int] = None) -> List[Event]:
+    """
+    Collect every event caused, directly or transitively, by an event.
+
+    Args:
+        event_id: ID of the event to start from
+        children: Returns the events directly caused by an event ID
+        max_depth: Maximum number of causation hops (None = unlimited)
+
+    Returns:
+        Descendant events in breadth-first order
+    """
+    descendants = []
+    visited = {event_id}
+    frontier = deque([(event_id, 0)])
+    while frontier:
+        parent_id, depth = frontier.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for child in children(parent_id):
+            if child.id not in visited:
+                visited.add(child.id)
+                descendants.append(child)
+                frontier.append((child.id, depth + 1))
+    return descendants
+
+
+def merge_timeline(chain: Sequence[Event],
+                   lookup: Callable[[str], Optional[Event]],
+                   children: Callable[[str], Iterable[Event]]) -> List[Event]:
+    """
+    Extend a time-ordered correlation chain with its direct causation neighbours.
+
+    Adds the events that caused a chain member and the events a chain member
+    caused, then merges them into the chain. Costs O(chain + neighbours).
+
+    Args:
+        chain: Events of one correlation chain, in chronological order
+        lookup: Returns a stored event by ID, or None
+        children: Returns the events directly caused by an event ID
+
+    Returns:
+        The timeline in chronological order
+    """
+    chain_ids = {event.id for event in chain}
+    extra: Dict[str, Event] = {}
+    for event in chain:
+        if event.causation_id and event.causation_id not in chain_ids:
+            parent = lookup(event.causation_id)
+            if parent is not None:
+                extra[parent.id] = parent
+        for child in children(event.id):
+            if child.id not in chain_ids:
+                extra[child.id] = child
+
+    if not extra:
+        return list(chain)
+    neighbours = sorted(extra.values(), key=_timestamp)
+    return list(heapq.merge(chain, neighbours, key=_timestamp))
+
+
+class CorrelationGraph:
+    """
+    Causation adjacency and per-chain ordered event lists.
+
+    Chains are kept in least-recently-used order. With ``max_chains`` set,
+    adding an event to a new chain beyond the limit evicts the least
+    recently used chain and its events, bounding memory use.
+    """
+
+    def __init__(self,
+                 max_chains: Optional[int] = None,
+                 on_evict: Optional[Callable[[str, List[Event]], None]] = None):
+        """
+        Initialize the correlation graph.
+
+        Args:
+            max_chains: Maximum number of chains kept (None = unbounded)
+            on_evict: Called with (correlation_id, events) when a chain is evicted
+        """
+        if max_chains is not None and max_chains <= 0:
+            raise ValueError("max_chains must be positive")
+
+        self.max_chains = max_chains
+        self._on_evict = on_evict
+        self._events: Dict[str, Event] = {}
+        self._filed_under: Dict[str, Optional[str]] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._chains: "OrderedDict[str, List[Event]]" = OrderedDict()
+        self._evicted_chains = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def get(self, event_id: str) -> Optional[Event]:
+        """Get a stored event by ID."""
+        return self._events.get(event_id)
+
+    def add(self, event: Event) -> None:
+        """
+        Add an event, or re-file it if it was added before.
+
+        Args:
+            event: The event to add
+        """
+        if event.id in self._events:
+            self.remove(event.id)
+
+        self._events[event.id] = event
+        self._filed_under[event.id] = event.correlation_id
+        if event.causation_id:
+            self._children.setdefault(event.causation_id, []).append(event.id)
+
+        correlation_id = event.correlation_id
+        if correlation_id is None:
+            return
+
+        chain = self._chains.get(correlation_id)
+        if chain is None:
+            chain = self._chains[correlation_id] = []
+            self._evict_if_needed()
+        else:
+            self._chains.move_to_end(correlation_id)
+
+        if not chain or event.timestamp >= chain[-1].timestamp:
+            chain.append(event)
+        else:
+            bisect.insort_right(chain, event, key=_timestamp)
+
+    def remove(self, event_id: str) -> Optional[Event]:
+        """
+        Remove an event.
+
+        Args:
+            event_id: ID of the event
+
+        Returns:
+            The removed event, or None if it was not stored
+        """
+        event = self._events.pop(event_id, None)
+        if event is None:
+            return None
+
+        correlation_id = self._filed_under.pop(event_id)
+        if event.causation_id:
+            siblings = self._children.get(event.causation_id)
+            if siblings is not None:
+                siblings.remove(event_id)
+                if not siblings:
+                    del self._children[event.causation_id]
+
+        chain = self._chains.get(correlation_id) if correlation_id is not None else None
+        if chain is not None:
+            index = bisect.bisect_left(chain, event.timestamp, key=_timestamp)
+            while chain[index] is not event:
+                index += 1
+            del chain[index]
+            if not chain:
+                del self._chains[correlation_id]
+        return event
+
+    def remove_chain(self, correlation_id: str) -> List[Event]:
+        """
+        Remove a chain and all of its events.
+
+        Args:
+            correlation_id: The chain to remove
+
+        Returns:
+            The removed events
+        """
+        events = list(self._chains.get(correlation_id, ()))
+        for event in events:
+            self.remove(event.id)
+        return events
+
+    def clear(self) -> None:
+        """Remove every event and chain."""
+        self._events.clear()
+        self._filed_under.clear()
+        self._children.clear()
+        self._chains.clear()
+
+    def _evict_if_needed(self) -> None:
+        """Evict least recently used chains beyond ``max_chains``."""
+        if self.max_chains is None:
+            return
+        while len(self._chains) > self.max_chains:
+            correlation_id = next(iter(self._chains))
+            events = self.remove_chain(correlation_id)
+            self._evicted_chains += 1
+            if self._on_evict is not None:
+                self._on_evict(correlation_id, events)
+
+    def has_chain(self, correlation_id: str) -> bool:
+        """Check whether a chain has any events."""
+        return correlation_id in self._chains
+
+    def get_chain(self, correlation_id: str) -> List[Event]:
+        """
+        Get the events of a chain in chronological order.
+
+        Args:
+            correlation_id: The chain to read
+
+        Returns:
+            The chain's events (empty if unknown)
+        """
+        chain = self._chains.get(correlation_id)
+        if chain is None:
+            return []
+        self._chains.move_to_end(correlation_id)
+        return list(chain)
+
+    def get_children(self, event_id: str) -> List[Event]:
+        """
+        Get the events directly caused by an event.
+
+        Args:
+            event_id: ID of the parent event
+
+        Returns:
+            Child events in insertion order
+        """
+        return [self._events[child_id] for child_id in self._children.get(event_id, ())]
+
+    def get_ancestors(self, event_id: str) -> List[Event]:
+        """
+        Get the causation chain of an event in O(depth).
+
+        Args:
+            event_id: ID of the event
+
+        Returns:
+            Events from the root cause to the event (empty if unknown)
+        """
+        event = self._events.get(event_id)
+        if event is None:
+            return []
+        return walk_ancestors(event, self._events.get)
+
+    def get_descendants(self, event_id: str, max_depth: Optional[int] = None) -> List[Event]:
+        """
+        Get every event caused, directly or transitively, by an event.
+
+        Args:
+            event_id: ID of the event
+            max_depth: Maximum number of causation hops (None = unlimited)
+
+        Returns:
+            Descendant events in breadth-first order
+        """
+        return walk_descendants(event_id, self.get_children, max_depth)
+
+    def get_timeline(self, correlation_id: str, include_causation: bool = True) -> List[Event]:
+        """
+        Get a chain plus its direct causation neighbours in O(chain).
+
+        Args:
+            correlation_id: The chain to read
+            include_causation: Whether to include causes and effects outside the chain
+
+        Returns:
+            Events in chronological order
+        """
+        chain = self.get_chain(correlation_id)
+        if not include_causation:
+            return chain
+        return merge_timeline(chain, self._events.get, self.get_children)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get graph statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {
+            "events": len(self._events),
+            "chains": len(self._chains),
+            "parents_with_children": len(self._children),
+            "evicted_chains": self._evicted_chains,
+        }
@@ -0,0 +1,821 @@
+"""
+Delivery engines for the Phoenix Hydra Event Routing System.
+
+This module provides the machinery the EventRouter uses to hand events to
+subscribers outside the publisher's call stack: thread-safe delivery
+statistics, the worker-pool engine behind ``DeliveryMode.ASYNC``, the
+asyncio engine behind ``EventRouter.publish_async`` and the queue consumer
+behind ``DeliveryMode.QUEUED``.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+
+class OverflowPolicy(Enum):
+    """
+    What to do when a subscriber's mailbox is full.
+
+    Policies:
+        BLOCK: The publisher waits until the mailbox has room (or until the
+               engine's block timeout elapses, after which the event is rejected).
+
+        DROP_OLDEST: The oldest pending event in the mailbox is discarded to
+                     make room for the new one.
+
+        REJECT: The new event is not accepted and the submit call returns False.
+    """
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+
+    @classmethod
+    def from_string(cls, policy_str: str) -> 'OverflowPolicy':
+        """
+        Convert a string to an OverflowPolicy.
+
+        Args:
+            policy_str: String representation of the policy
+
+        Returns:
+            The corresponding OverflowPolicy
+
+        Raises:
+            ValueError: If the string does not match any OverflowPolicy
+        """
+        try:
+            return cls(policy_str.lower())
+        except ValueError:
+            valid_policies = ", ".join([policy.value for policy in cls])
+            raise ValueError(f"Invalid overflow policy: {policy_str}. Valid policies are: {valid_policies}")
+
+
+class DeliveryStats:
+    """
+    Thread-safe named counters.
+
+    Supports ``stats["name"]`` reads so it can stand in for the plain
+    dictionary the router used to keep.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        """
+        Initialize the counters.
+
+        Args:
+            names: Counter names to pre-register at zero
+        """
+        self._counters: Dict[str, int] = {name: 0 for name in names}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """
+        Add to a counter, creating it if needed.
+
+        Args:
+            name: Counter name
+            amount: Amount to add
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def __getitem__(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Get a consistent copy of all counters.
+
+        Returns:
+            Dictionary of counter values
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        """Reset every counter to zero."""
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
+
+
+class _Mailbox:
+    """
+    FIFO of pending events for one subscription.
+
+    At most one worker drains a mailbox at a time, which is what keeps each
+    subscriber's events in publish order.
+    """
+
+    __slots__ = ("subscription", "events", "scheduled", "lock", "not_full")
+
+    def __init__(self, subscription: Any):
+        self.subscription = subscription
+        self.events: Deque[Any] = deque()
+        self.scheduled = False
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+
+
+class AsyncDeliveryEngine:
+    """
+    Worker-pool delivery engine with per-subscription mailboxes.
+
+    Each subscription gets a bounded FIFO mailbox. Submitting an event
+    appends to the mailbox and, if the mailbox is idle, schedules one drain
+    task on a fixed-size thread pool. The drain task delivers up to
+    ``drain_batch_size`` events and then yields the worker so busy
+    subscribers can't starve quiet ones.
+
+    The number of threads never exceeds ``max_workers`` and the number of
+    queued drain tasks never exceeds the number of subscriptions, however
+    many events are published.
+
+    Note:
+        With ``OverflowPolicy.BLOCK``, a handler that publishes to its own
+        full mailbox from a worker thread will wait for itself; use a block
+        timeout or a non-blocking policy for such subscribers.
+    """
+
+    def __init__(self,
+                 deliver: Callable[[Any, Any], None],
+                 max_workers: int = 10,
+                 mailbox_capacity: int = 1000,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 block_timeout: Optional[float] = None,
+                 drain_batch_size: int = 32):
+        """
+        Initialize the delivery engine.
+
+        Args:
+            deliver: Callable invoked as ``deliver(subscription, event)`` on a
+                worker thread; it is responsible for its own error handling
+            max_workers: Number of worker threads
+            mailbox_capacity: Maximum pending events per subscription
+            overflow_policy: What to do when a mailbox is full
+            block_timeout: Maximum seconds to wait under BLOCK (None = forever)
+            drain_batch_size: Events delivered per drain task before yielding
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if mailbox_capacity < 1:
+            raise ValueError("mailbox_capacity must be at least 1")
+
+        self._deliver = deliver
+        self.max_workers = max_workers
+        self.mailbox_capacity = mailbox_capacity
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.drain_batch_size = max(1, drain_batch_size)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="event-delivery"
+        )
+        self._mailboxes: Dict[str, _Mailbox] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._idle = threading.Condition(threading.Lock())
+        self._shutdown = False
+
+        self.stats = DeliveryStats([
+            "submitted",
+            "processed",
+            "dropped",
+            "rejected",
+        ])
+
+    def _get_mailbox(self, subscription: Any) -> _Mailbox:
+        """Get or create the mailbox for a subscription."""
+        with self._lock:
+            mailbox = self._mailboxes.get(subscription.id)
+            if mailbox is None:
+                mailbox = _Mailbox(subscription)
+                self._mailboxes[subscription.id] = mailbox
+            return mailbox
+
+    def _add_pending(self, amount: int) -> None:
+        with self._idle:
+            self._pending += amount
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def submit(self, subscription: Any, event: Any) -> bool:
+        """
+        Queue an event for delivery to a subscription.
+
+        Args:
+            subscription: The subscription to deliver to
+            event: The event to deliver
+
+        Returns:
+            True if the event was accepted, False if it was rejected
+        """
+        if self._shutdown:
+            self.stats.increment("rejected")
+            return False
+
+        mailbox = self._get_mailbox(subscription)
+        schedule = False
+
+        with mailbox.lock:
+            if len(mailbox.events) >= self.mailbox_capacity:
+                if self.overflow_policy == OverflowPolicy.REJECT:
+                    self.stats.increment("rejected")
+                    return False
+
+                if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                    mailbox.events.popleft()
+                    self.stats.increment("dropped")
+                    self._add_pending(-1)
+                else:
+                    has_room = mailbox.not_full.wait_for(
+                        lambda: len(mailbox.events) < self.mailbox_capacity or self._shutdown,
+                        timeout=self.block_timeout
+                    )
+                    if not has_room or self._shutdown:
+                        self.stats.increment("rejected")
+                        return False
+
+            mailbox.events.append(event)
+            self._add_pending(1)
+            if not mailbox.scheduled:
+                mailbox.scheduled = True
+                schedule = True
+
+        self.stats.increment("submitted")
+        if schedule:
+            self._executor.submit(self._drain, mailbox)
+        return True
+
+    def _drain(self, mailbox: _Mailbox) -> None:
+        """Deliver a batch of events from a mailbox on a worker thread."""
+        for _ in range(self.drain_batch_size):
+            with mailbox.lock:
+                if not mailbox.events:
+                    mailbox.scheduled = False
+                    return
+                event = mailbox.events.popleft()
+                mailbox.not_full.notify()
+
+            try:
+                self._deliver(mailbox.subscription, event)
+            except Exception:
+                pass  # The deliver callable owns error reporting
+            finally:
+                self.stats.increment("processed")
+                self._add_pending(-1)
+
+        with mailbox.lock:
+            if not mailbox.events:
+                mailbox.scheduled = False
+                return
+
+        # More work left: requeue behind other mailboxes for fairness
+        try:
+            self._executor.submit(self._drain, mailbox)
+        except RuntimeError:
+            # Executor already shut down; deliver the rest inline
+            self._drain_remaining(mailbox)
+
+    def _drain_remaining(self, mailbox: _Mailbox) -> None:
+        while True:
+            with mailbox.lock:
+                if not mailbox.events:
+                    mailbox.scheduled = False
+                    return
+                event = mailbox.events.popleft()
+                mailbox.not_full.notify()
+            try:
+                self._deliver(mailbox.subscription, event)
+            except Exception:
+                pass
+            finally:
+                self.stats.increment("processed")
+                self._add_pending(-1)
+
+    def remove_mailbox(self, subscription_id: str) -> None:
+        """
+        Forget a subscription's mailbox.
+
+        Events already queued are still delivered; new submits for the same
+        subscription create a fresh mailbox.
+
+        Args:
+            subscription_id: ID of the subscription
+        """
+        with self._lock:
+            self._mailboxes.pop(subscription_id, None)
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every accepted event has been delivered or dropped.
+
+        Args:
+            timeout: Maximum seconds to wait (None = forever)
+
+        Returns:
+            True if the engine became idle, False on timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting events and release the worker threads.
+
+        Args:
+            wait: Whether to deliver pending events before returning
+        """
+        self._shutdown = True
+        with self._lock:
+            mailboxes = list(self._mailboxes.values())
+        for mailbox in mailboxes:
+            with mailbox.lock:
+                mailbox.not_full.notify_all()
+
+        if wait:
+            self.wait_until_idle()
+        self._executor.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with engine statistics
+        """
+        with self._lock:
+            mailbox_count = len(self._mailboxes)
+            largest = max((len(m.events) for m in self._mailboxes.values()), default=0)
+        with self._idle:
+            pending = self._pending
+
+        return {
+            "workers": self.max_workers,
+            "mailboxes": mailbox_count,
+            "largest_mailbox": largest,
+            "pending": pending,
+            "overflow_policy": self.overflow_policy.value,
+            **self.stats.snapshot()
+        }
+
+
+class AsyncioDeliveryEngine:
+    """
+    Asyncio-native delivery engine.
+
+    Coroutine handlers are awaited directly on the running event loop; plain
+    callables are pushed to a thread pool so CPU-bound handlers don't block
+    the loop. Deliveries for one event fan out concurrently with
+    ``asyncio.gather``, bounded by a per-loop semaphore, and each handler can
+    be given a timeout.
+
+    Note:
+        A timed-out sync handler is reported as failed, but its worker thread
+        keeps running until the handler returns.
+    """
+
+    def __init__(self,
+                 on_success: Callable[[Any, Any], None],
+                 on_failure: Callable[[Any, Any, Exception], None],
+                 max_concurrency: int = 100,
+                 handler_timeout: Optional[float] = None,
+                 executor_workers: int = 10):
+        """
+        Initialize the asyncio delivery engine.
+
+        Args:
+            on_success: Called as ``on_success(subscription, event)`` after a
+                handler completes
+            on_failure: Called as ``on_failure(subscription, event, error)`` when
+                a handler raises or times out
+            max_concurrency: Maximum handlers in flight per event loop
+            handler_timeout: Default per-handler timeout in seconds (None = no limit)
+            executor_workers: Threads used for sync handlers
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._on_success = on_success
+        self._on_failure = on_failure
+        self.max_concurrency = max_concurrency
+        self.handler_timeout = handler_timeout
+        self.executor_workers = executor_workers
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # asyncio primitives are bound to one loop, so keep one semaphore per loop
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+            weakref.WeakKeyDictionary()
+
+        self.stats = DeliveryStats([
+            "coroutine_deliveries",
+            "threaded_deliveries",
+            "timeouts",
+        ])
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.executor_workers,
+                    thread_name_prefix="event-asyncio-sync"
+                )
+            return self._executor
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _deliver_one(self,
+                           subscription: Any,
+                           event: Any,
+                           semaphore: asyncio.Semaphore,
+                           timeout: Optional[float]) -> bool:
+        async with semaphore:
+            try:
+                if subscription.is_coroutine_handler():
+                    self.stats.increment("coroutine_deliveries")
+                    work = subscription.process_event_async(event)
+                else:
+                    self.stats.increment("threaded_deliveries")
+                    loop = asyncio.get_running_loop()
+                    work = loop.run_in_executor(self._get_executor(),
+                                                subscription.process_event, event)
+
+                if timeout is not None:
+                    await asyncio.wait_for(work, timeout)
+                else:
+                    await work
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError as e:
+                self.stats.increment("timeouts")
+                self._on_failure(subscription, event, e)
+                return False
+            except Exception as e:
+                self._on_failure(subscription, event, e)
+                return False
+
+        self._on_success(subscription, event)
+        return True
+
+    async def deliver(self,
+                      event: Any,
+                      subscriptions: List[Any],
+                      timeout: Optional[float] = None) -> List[bool]:
+        """
+        Deliver an event to subscriptions concurrently.
+
+        Args:
+            event: The event to deliver
+            subscriptions: Subscriptions to deliver to
+            timeout: Per-handler timeout overriding the engine default
+
+        Returns:
+            Per-subscription success flags, in the order given
+        """
+        if not subscriptions:
+            return []
+
+        if timeout is None:
+            timeout = self.handler_timeout
+        semaphore = self._get_semaphore(asyncio.get_running_loop())
+
+        return list(await asyncio.gather(*(
+            self._deliver_one(subscription, event, semaphore, timeout)
+            for subscription in subscriptions
+        )))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Release the thread pool used for sync handlers.
+
+        Args:
+            wait: Whether to wait for running sync handlers
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with engine statistics
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "handler_timeout": self.handler_timeout,
+            **self.stats.snapshot()
+        }
+
+
+@dataclass
+class QueuedDelivery:
+    """
+    Envelope for one event waiting in the queue for one subscription.
+
+    The event itself is shared by every envelope created for the same
+    publish; only this small record is allocated per subscriber.
+
+    Attributes:
+        event: The published event (shared, not copied)
+        subscription_id: ID of the subscription to deliver to
+        attempts: Number of failed delivery attempts so far
+        delivery_id: Unique identifier for this delivery
+        enqueued_at: When the delivery was first queued (time.time())
+    """
+    event: Any
+    subscription_id: str
+    attempts: int = 0
+    delivery_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    enqueued_at: float = field(default_factory=time.time)
+
+
+class QueuedDeliveryConsumer:
+    """
+    Drains an event queue into subscriptions.
+
+    Drainer threads take batches of ``QueuedDelivery`` envelopes from the
+    queue, group them by subscription and hand each group to the
+    subscription in one ``process_batch`` call (which uses the batch handler
+    if the subscription opted in). Successful envelopes are acked; failed
+    ones are nacked for redelivery until ``max_attempts`` is reached, after
+    which they are moved to ``dead_letters``. Envelopes for a paused
+    subscription are parked unacked until ``requeue_parked`` puts them back.
+
+    Note:
+        Per-subscription ordering is only guaranteed with a single drainer;
+        with several drainers, batches for the same subscription may be
+        processed concurrently.
+    """
+
+    def __init__(self,
+                 queue: Any,
+                 resolve_subscription: Callable[[str], Optional[Any]],
+                 on_success: Callable[[Any, Any], None],
+                 on_failure: Callable[[Any, Any, Exception], None],
+                 batch_size: int = 100,
+                 max_attempts: int = 3,
+                 poll_interval: float = 0.05,
+                 dead_letter_limit: int = 1000):
+        """
+        Initialize the consumer.
+
+        Args:
+            queue: EventQueue holding QueuedDelivery envelopes
+            resolve_subscription: Returns the live subscription for an ID, or
+                None if it is gone
+            on_success: Called as ``on_success(subscription, event)`` per event
+            on_failure: Called as ``on_failure(subscription, event, error)`` per event
+            batch_size: Maximum envelopes taken from the queue at once
+            max_attempts: Delivery attempts before an envelope is dead-lettered
+            poll_interval: Seconds a drainer waits when the queue is empty
+            dead_letter_limit: Maximum dead letters kept for inspection
+        """
+        self.queue = queue
+        self._resolve_subscription = resolve_subscription
+        self._on_success = on_success
+        self._on_failure = on_failure
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        self.poll_interval = poll_interval
+
+        self.dead_letters: Deque[QueuedDelivery] = deque(maxlen=dead_letter_limit)
+        self._parked: Dict[str, List[QueuedDelivery]] = {}
+        self._parked_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        self.stats = DeliveryStats([
+            "batches",
+            "delivered",
+            "redelivered",
+            "dead_lettered",
+            "orphaned",
+            "parked",
+        ])
+
+    def process_batch(self, timeout: Optional[float] = None) -> int:
+        """
+        Take one batch from the queue and deliver it.
+
+        Args:
+            timeout: Seconds to wait for events if the queue is empty
+
+        Returns:
+            Number of envelopes taken from the queue
+        """
+        items = self.queue.dequeue_for_ack(self.batch_size, timeout)
+        if not items:
+            return 0
+
+        self.stats.increment("batches")
+
+        # Group by subscription, keeping queue order within each group
+        groups: Dict[str, List[QueuedDelivery]] = {}
+        for item in items:
+            groups.setdefault(item.subscription_id, []).append(item)
+
+        retries: Set[int] = set()
+        for subscription_id, deliveries in groups.items():
+            subscription = self._resolve_subscription(subscription_id)
+            if subscription is None:
+                for delivery in deliveries:
+                    self.queue.ack(delivery)
+                self.stats.increment("orphaned", len(deliveries))
+                continue
+
+            if not subscription.active:
+                self._park(subscription, deliveries)
+                continue
+
+            for delivery in self._deliver_group(subscription, deliveries):
+                retries.add(id(delivery))
+
+        # Nack in queue order so redelivery keeps the original order
+        if retries:
+            self.queue.nack_batch([item for item in items if id(item) in retries])
+
+        return len(items)
+
+    def _deliver_group(self, subscription: Any,
+                       deliveries: List[QueuedDelivery]) -> List[QueuedDelivery]:
+        """Deliver one subscription's envelopes, returning those to retry."""
+        if subscription.get_batch_handler() is None:
+            # No batch handler: ack/retry each event on its own
+            retries = []
+            for delivery in deliveries:
+                try:
+                    subscription.process_event(delivery.event)
+                except Exception as e:
+                    self._on_failure(subscription, delivery.event, e)
+                    if self._should_retry(delivery):
+                        retries.append(delivery)
+                    continue
+                self.queue.ack(delivery)
+                self.stats.increment("delivered")
+                self._on_success(subscription, delivery.event)
+            return retries
+
+        try:
+            subscription.process_batch([delivery.event for delivery in deliveries])
+        except Exception as e:
+            # The batch is all-or-nothing
+            retries = []
+            for delivery in deliveries:
+                self._on_failure(subscription, delivery.event, e)
+                if self._should_retry(delivery):
+                    retries.append(delivery)
+            return retries
+
+        for delivery in deliveries:
+            self.queue.ack(delivery)
+            self._on_success(subscription, delivery.event)
+        self.stats.increment("delivered", len(deliveries))
+        return []
+
+    def _should_retry(self, delivery: QueuedDelivery) -> bool:
+        """Count a failed attempt, dead-lettering the envelope once exhausted."""
+        delivery.attempts += 1
+        if delivery.attempts >= self.max_attempts:
+            self.queue.ack(delivery)
+            self.dead_letters.append(delivery)
+            self.stats.increment("dead_lettered")
+            return False
+        self.stats.increment("redelivered")
+        return True
+
+    def _park(self, subscription: Any, deliveries: List[QueuedDelivery]) -> None:
+        """Hold a paused subscription's envelopes, unacked, until it resumes."""
+        with self._parked_lock:
+            self._parked.setdefault(subscription.id, []).extend(deliveries)
+            self.stats.increment("parked", len(deliveries))
+            # The subscription may have resumed before the envelopes were parked
+            resumed = subscription.active
+        if resumed:
+            self.requeue_parked(subscription.id)
+
+    def requeue_parked(self, subscription_id: str) -> int:
+        """
+        Put a subscription's parked envelopes back at the head of the queue.
+
+        Called when a paused subscription resumes or is removed.
+
+        Args:
+            subscription_id: ID of the subscription
+
+        Returns:
+            Number of envelopes requeued
+        """
+        with self._parked_lock:
+            deliveries = self._parked.pop(subscription_id, [])
+            if deliveries:
+                self.queue.nack_batch(deliveries)
+        return len(deliveries)
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        """
+        Deliver queued events on the calling thread until the queue is empty.
+
+        Args:
+            max_batches: Stop after this many batches (None = until empty)
+
+        Returns:
+            Number of envelopes processed
+        """
+        processed = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            count = self.process_batch()
+            if count == 0:
+                break
+            processed += count
+            batches += 1
+        return processed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.process_batch(timeout=self.poll_interval)
+            except Exception:
+                # Keep the drainer alive; failures are reported per event
+                time.sleep(self.poll_interval)
+
+    def start(self, workers: int = 1) -> None:
+        """
+        Start background drainer threads.
+
+        Args:
+            workers: Number of drainer threads
+        """
+        with self._lock:
+            if self._threads:
+                return
+            self._stop.clear()
+            for index in range(max(1, workers)):
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"event-queue-drainer-{index}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the drainer threads.
+
+        Args:
+            timeout: Maximum seconds to wait for each thread
+        """
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._stop.set()
+        for thread in threads:
+            thread.join(timeout)
+
+    def is_running(self) -> bool:
+        """
+        Check if drainer threads are running.
+
+        Returns:
+            True if the consumer has been started and not stopped
+        """
+        with self._lock:
+            return bool(self._threads)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get consumer statistics.
+
+        Returns:
+            Dictionary with consumer statistics
+        """
+        with self._parked_lock:
+            parked = sum(len(deliveries) for deliveries in self._parked.values())
+        return {
+            "running": self.is_running(),
+            "batch_size": self.batch_size,
+            "max_attempts": self.max_attempts,
+            "dead_letters": len(self.dead_letters),
+            "parked_deliveries": parked,
+            **self.stats.snapshot()
+        }
@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Set
 
+from .correlation_graph import CorrelationGraph
 from .event_routing import Event
 
 
@@ -32,6 +33,11 @@ class CorrelationChain:
     created_at: datetime = field(default_factory=datetime.now)
     last_updated: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, any] = field(default_factory=dict)
+    _members: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Index the initial event IDs for constant-time membership checks."""
+        self._members = set(self.events)
     
     def add_event(self, event_id: str) -> None:
         """
@@ -40,7 +46,8 @@ class CorrelationChain:
         Args:
             event_id: ID of the event to add
         """
-        if event_id not in self.events:
+        if event_id not in self._members:
+            self._members.add(event_id)
             self.events.append(event_id)
             self.last_updated = datetime.now()
     
@@ -63,7 +70,7 @@ class CorrelationChain:
         Returns:
             True if the event is in the chain, False otherwise
         """
-        return event_id in self.events
+        return event_id in self._members
 
 
 class EventCorrelator:
@@ -72,13 +79,51 @@ class EventCorrelator:
     
     This component tracks relationships between events and provides
     functionality to correlate events and retrieve correlation chains.
+    Events are held in a CorrelationGraph, which keeps every chain in
+    chronological order and indexes causation in both directions.
     """
     
-    def __init__(self):
-        """Initialize the event correlator."""
+    def __init__(self, max_chains: Optional[int] = None):
+        """
+        Initialize the event correlator.
+        
+        Args:
+            max_chains: Maximum number of chains kept in memory; the least
+                recently used chain is forgotten beyond it (None = unbounded)
+        """
         self._correlation_chains: Dict[str, CorrelationChain] = {}
         self._event_to_correlation: Dict[str, str] = {}
-        self._stored_events: Dict[str, Event] = {}
+        self._graph = CorrelationGraph(max_chains, on_evict=self._forget_chain)
+    
+    def _forget_chain(self, correlation_id: str, events: List[Event]) -> None:
+        """Drop bookkeeping for a chain evicted from the graph."""
+        chain = self._correlation_chains.pop(correlation_id, None)
+        if chain is not None:
+            for event_id in chain.events:
+                self._event_to_correlation.pop(event_id, None)
+    
+    def _get_chain(self, correlation_id: str, root_event_id: str) -> CorrelationChain:
+        """
+        Get a correlation chain, starting it afresh if it is not tracked.
+        
+        A chain is no longer tracked once it has been evicted, so events
+        correlated with an evicted parent start a new chain under the
+        parent's correlation ID.
+        
+        Args:
+            correlation_id: The chain to get
+            root_event_id: Root event ID if the chain has to be started
+            
+        Returns:
+            The correlation chain
+        """
+        chain = self._correlation_chains.get(correlation_id)
+        if chain is None:
+            chain = self._correlation_chains[correlation_id] = CorrelationChain(
+                correlation_id=correlation_id,
+                root_event_id=root_event_id
+            )
+        return chain
     
     def correlate(self, event: Event, parent_event: Optional[Event] = None) -> Event:
         """
@@ -124,7 +169,7 @@ class EventCorrelator:
                     )
                     self._correlation_chains[correlation_id].add_event(parent_event.id)
                     self._event_to_correlation[parent_event.id] = correlation_id
-                    self._stored_events[parent_event.id] = parent_event
+                    self._graph.add(parent_event)
             
             # Set correlation and causation for the new event
             event.correlation_id = correlation_id
@@ -142,12 +187,12 @@ class EventCorrelator:
             )
         
         # Add event to the correlation chain
-        chain = self._correlation_chains[correlation_id]
+        chain = self._get_chain(correlation_id, event.id)
         chain.add_event(event.id)
         
         # Update mappings
         self._event_to_correlation[event.id] = correlation_id
-        self._stored_events[event.id] = event
+        self._graph.add(event)
         
         return event
     
@@ -167,17 +212,8 @@ class EventCorrelator:
         if correlation_id not in self._correlation_chains:
             raise ValueError(f"Correlation ID {correlation_id} not found")
         
-        chain = self._correlation_chains[correlation_id]
-        events = []
-        
-        for event_id in chain.events:
-            if event_id in self._stored_events:
-                events.append(self._stored_events[event_id])
-        
-        # Sort events by timestamp to ensure chronological order
-        events.sort(key=lambda e: e.timestamp)
-        
-        return events
+        # The graph keeps each chain in chronological order on insert
+        return self._graph.get_chain(correlation_id)
     
     def get_correlation_id_for_event(self, event_id: str) -> Optional[str]:
         """
@@ -204,9 +240,8 @@ class EventCorrelator:
         correlation_id = self.get_correlation_id_for_event(event_id)
         if not correlation_id:
             # Return just the event itself if no correlation exists
-            if event_id in self._stored_events:
-                return [self._stored_events[event_id]]
-            return []
+            event = self._graph.get(event_id)
+            return [event] if event is not None else []
         
         return self.get_correlation_chain(correlation_id)
     
@@ -220,26 +255,32 @@ class EventCorrelator:
         Returns:
             List of events in causation order (root cause first)
         """
-        if event_id not in self._stored_events:
-            return []
-        
-        causation_chain = []
-        current_event = self._stored_events[event_id]
-        visited = set()  # Prevent infinite loops
+        return self._graph.get_ancestors(event_id)
+    
+    def get_caused_events(self, event_id: str) -> List[Event]:
+        """
+        Get the events directly caused by an event.
         
-        while current_event and current_event.id not in visited:
-            causation_chain.append(current_event)
-            visited.add(current_event.id)
+        Args:
+            event_id: The event ID to look up
             
-            # Find the parent event (causation)
-            if current_event.causation_id and current_event.causation_id in self._stored_events:
-                current_event = self._stored_events[current_event.causation_id]
-            else:
-                break
+        Returns:
+            List of events whose causation_id is the given event
+        """
+        return self._graph.get_children(event_id)
+    
+    def get_descendant_events(self, event_id: str, max_depth: Optional[int] = None) -> List[Event]:
+        """
+        Get every event caused, directly or transitively, by an event.
         
-        # Reverse to get root cause first
-        causation_chain.reverse()
-        return causation_chain
+        Args:
+            event_id: The event ID to start from
+            max_depth: Maximum number of causation hops (None = unlimited)
+            
+        Returns:
+            List of descendant events in breadth-first order
+        """
+        return self._graph.get_descendants(event_id, max_depth)
     
     def associate_events(self, event_ids: List[str], correlation_id: Optional[str] = None) -> str:
         """
@@ -257,31 +298,28 @@ class EventCorrelator:
         """
         # Validate all event IDs exist
         for event_id in event_ids:
-            if event_id not in self._stored_events:
+            if event_id not in self._graph:
                 raise ValueError(f"Event ID {event_id} not found")
         
         # Use provided correlation ID or generate new one
         if not correlation_id:
             correlation_id = self._generate_correlation_id()
         
-        # Create or get correlation chain
-        if correlation_id not in self._correlation_chains:
-            # Use first event as root
-            root_event_id = event_ids[0] if event_ids else str(uuid.uuid4())
-            self._correlation_chains[correlation_id] = CorrelationChain(
-                correlation_id=correlation_id,
-                root_event_id=root_event_id
-            )
-        
-        chain = self._correlation_chains[correlation_id]
+        # Create or get correlation chain, using the first event as root
+        root_event_id = event_ids[0] if event_ids else str(uuid.uuid4())
+        chain = self._get_chain(correlation_id, root_event_id)
         
         # Associate all events with this correlation
         for event_id in event_ids:
-            event = self._stored_events[event_id]
+            event = self._graph.get(event_id)
+            if event is None:
+                continue  # Evicted along with its previous chain
             event.correlation_id = correlation_id
             
             chain.add_event(event_id)
             self._event_to_correlation[event_id] = correlation_id
+            # Re-file the event under its new chain
+            self._graph.add(event)
         
         return correlation_id
     
@@ -293,7 +331,7 @@ class EventCorrelator:
             Dictionary with correlation statistics
         """
         total_chains = len(self._correlation_chains)
-        total_events = len(self._stored_events)
+        total_events = len(self._graph)
         
         if total_chains == 0:
             return {
@@ -335,17 +373,15 @@ class EventCorrelator:
         
         # Remove expired correlations
         for correlation_id in expired_correlations:
-            chain = self._correlation_chains[correlation_id]
+            chain = self._correlation_chains.pop(correlation_id, None)
+            if chain is None:
+                continue
             
             # Remove event mappings
             for event_id in chain.events:
                 if event_id in self._event_to_correlation:
                     del self._event_to_correlation[event_id]
-                if event_id in self._stored_events:
-                    del self._stored_events[event_id]
-            
-            # Remove correlation chain
-            del self._correlation_chains[correlation_id]
+                self._graph.remove(event_id)
         
         return len(expired_correlations)
     
@@ -371,4 +407,4 @@ class EventCorrelator:
         """Clear all correlation data (useful for testing)."""
         self._correlation_chains.clear()
         self._event_to_correlation.clear()
-        self._stored_events.clear()
\ No newline at end of file
+        self._graph.clear()
\ No newline at end of file
@@ -7,15 +7,30 @@ to subscribers based on event types and patterns.
 """
 
 import asyncio
+import bisect
+import copy
+import heapq
+import inspect
 import re
 import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Pattern, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Pattern, Set, Tuple, Union
+
+from .delivery import (
+    AsyncDeliveryEngine,
+    AsyncioDeliveryEngine,
+    DeliveryStats,
+    OverflowPolicy,
+    QueuedDelivery,
+    QueuedDeliveryConsumer,
+)
+from .pattern_compiler import CompiledPattern
 
 
 class DeliveryMode(Enum):
@@ -213,6 +228,8 @@ class EventPattern:
     """
     event_type: str
     attributes: Dict[str, Any] = field(default_factory=dict)
+    _compiled: Optional[CompiledPattern] = field(
+        default=None, init=False, repr=False, compare=False)
     
     def __str__(self) -> str:
         """String representation of the pattern"""
@@ -228,6 +245,25 @@ class EventPattern:
         return (self.event_type == other.event_type and 
                 self.attributes == other.attributes)
     
+    def compile(self) -> CompiledPattern:
+        """
+        Get the compiled form of the pattern.
+        
+        The pattern is compiled on first use from a copy of its attributes,
+        and recompiled when ``event_type`` or ``attributes`` no longer equal
+        what it was compiled from, including after in-place edits. A new
+        compiled pattern also gets fresh entries in a CachedPatternMatcher.
+        
+        Returns:
+            The compiled pattern
+        """
+        compiled = self._compiled
+        if (compiled is None or compiled.event_type != self.event_type
+                or compiled.attributes != self.attributes):
+            compiled = self._compiled = CompiledPattern(
+                self.event_type, copy.deepcopy(self.attributes))
+        return compiled
+    
     def matches_event_type(self, event_type: str) -> bool:
         """
         Check if the pattern matches an event type.
@@ -238,13 +274,16 @@ class EventPattern:
         Returns:
             True if the pattern matches the event type, False otherwise
         """
-        matcher = WildcardPatternMatcher()
-        return matcher.matches_event_type(event_type, self.event_type)
+        return self.compile().matches_type(event_type)
     
     def matches_attributes(self, event_attributes: Dict[str, Any]) -> bool:
         """
         Check if the pattern matches event attributes.
         
+        Supports dot notation for nested attributes (e.g. ``"user.id"``) and
+        the operators ``$eq``, ``$ne``, ``$gt``, ``$gte``, ``$lt``, ``$lte``,
+        ``$in``, ``$nin`` and ``$exists``.
+        
         Args:
             event_attributes: The event attributes to match against
             
@@ -253,64 +292,7 @@ class EventPattern:
         """
         if not self.attributes:
             return True
-        
-        for key, pattern_value in self.attributes.items():
-            # Handle nested attributes using dot notation (e.g., "user.id")
-            if "." in key:
-                parts = key.split(".")
-                current = event_attributes
-                for part in parts[:-1]:
-                    if part not in current or not isinstance(current[part], dict):
-                        return False
-                    current = current[part]
-                
-                last_part = parts[-1]
-                if last_part not in current:
-                    return False
-                
-                actual_value = current[last_part]
-            else:
-                if key not in event_attributes:
-                    return False
-                actual_value = event_attributes[key]
-            
-            # Handle different types of pattern values
-            if isinstance(pattern_value, dict) and any(k.startswith("$") for k in pattern_value.keys()):
-                # Operator-based comparison
-                for op, op_value in pattern_value.items():
-                    if op == "$eq":
-                        if actual_value != op_value:
-                            return False
-                    elif op == "$ne":
-                        if actual_value == op_value:
-                            return False
-                    elif op == "$gt":
-                        if not (isinstance(actual_value, (int, float)) and actual_value > op_value):
-                            return False
-                    elif op == "$gte":
-                        if not (isinstance(actual_value, (int, float)) and actual_value >= op_value):
-                            return False
-                    elif op == "$lt":
-                        if not (isinstance(actual_value, (int, float)) and actual_value < op_value):
-                            return False
-                    elif op == "$lte":
-                        if not (isinstance(actual_value, (int, float)) and actual_value <= op_value):
-                            return False
-                    elif op == "$in":
-                        if actual_value not in op_value:
-                            return False
-                    elif op == "$nin":
-                        if actual_value in op_value:
-                            return False
-                    elif op == "$exists":
-                        # This is handled by the key check above
-                        pass
-            else:
-                # Direct value comparison
-                if actual_value != pattern_value:
-                    return False
-        
-        return True
+        return self.compile().matches_attributes(event_attributes)
     
     def matches(self, event: 'Event') -> bool:
         """
@@ -322,15 +304,7 @@ class EventPattern:
         Returns:
             True if the pattern matches the event, False otherwise
         """
-        # Check event type match
-        if not self.matches_event_type(event.type):
-            return False
-        
-        # Check payload attributes match
-        if not self.matches_attributes(event.payload):
-            return False
-        
-        return True
+        return self.compile().matches(event)
 
 
 @dataclass
@@ -346,6 +320,8 @@ class Subscription:
         max_events: Maximum number of events to process before expiring
         expiration: Time in seconds after which the subscription expires
         priority: Priority of the subscription (higher values = higher priority)
+        batch_handler: Optional function that receives a list of events at once
+                       when events are consumed from the queue (QUEUED mode)
     """
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     pattern: EventPattern = field(default_factory=lambda: EventPattern("*"))
@@ -354,6 +330,7 @@ class Subscription:
     max_events: Optional[int] = None
     expiration: Optional[float] = None
     priority: int = 0
+    batch_handler: Optional[Callable[[List['Event']], None]] = None
     
     # Runtime state (not part of initialization)
     events_processed: int = field(default=0, init=False)
@@ -364,6 +341,8 @@ class Subscription:
         """Validate the subscription after creation"""
         if self.handler is None:
             raise ValueError("Subscription handler cannot be None")
+        # Compile up front so matching never pays the compilation cost
+        self.pattern.compile()
     
     def activate(self) -> None:
         """Activate the subscription"""
@@ -419,6 +398,68 @@ class Subscription:
         self.events_processed += 1
         self.last_event_time = datetime.now().timestamp()
     
+    def get_batch_handler(self) -> Optional[Callable[[List['Event']], None]]:
+        """
+        Get the batch handler, if the subscription opted in to batching.
+        
+        A subscription opts in either with an explicit ``batch_handler`` or
+        with a handler object that has a ``handle_batch(events)`` method.
+        
+        Returns:
+            The batch handler, or None if events must be handled one by one
+        """
+        if self.batch_handler is not None:
+            return self.batch_handler
+        return getattr(self.handler, "handle_batch", None)
+    
+    def process_batch(self, events: List['Event']) -> None:
+        """
+        Process several events through this subscription in one call.
+        
+        Falls back to per-event processing when no batch handler is set.
+        
+        Args:
+            events: The events to process, in delivery order
+        """
+        if not self.active or not events:
+            return
+        
+        batch_handler = self.get_batch_handler()
+        if batch_handler is None:
+            for event in events:
+                self.process_event(event)
+            return
+        
+        batch_handler(events)
+        self.events_processed += len(events)
+        self.last_event_time = datetime.now().timestamp()
+    
+    def is_coroutine_handler(self) -> bool:
+        """
+        Check if the handler is a coroutine function.
+        
+        Returns:
+            True if the handler must be awaited, False otherwise
+        """
+        return inspect.iscoroutinefunction(self.handler)
+    
+    async def process_event_async(self, event: 'Event') -> None:
+        """
+        Process an event through this subscription, awaiting async handlers.
+        
+        Args:
+            event: The event to process
+        """
+        if not self.active:
+            return
+        
+        if self.handler:
+            result = self.handler(event)
+            if inspect.isawaitable(result):
+                await result
+        self.events_processed += 1
+        self.last_event_time = datetime.now().timestamp()
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the subscription to a dictionary representation.
@@ -475,6 +516,29 @@ class PatternMatcher(ABC):
         """
         pass
 
+    def add_subscription(self, subscription: Subscription) -> None:
+        """
+        Notify the matcher that a subscription became routable.
+
+        Called by the router on subscribe and resume. Matchers that keep
+        no per-subscription state can ignore it.
+
+        Args:
+            subscription: The subscription that was added or resumed
+        """
+        pass
+
+    def remove_subscription(self, subscription: Subscription) -> None:
+        """
+        Notify the matcher that a subscription is no longer routable.
+
+        Called by the router on unsubscribe, pause and expiry cleanup.
+
+        Args:
+            subscription: The subscription that was removed or paused
+        """
+        pass
+
 
 class DefaultPatternMatcher(PatternMatcher):
     """
@@ -526,8 +590,11 @@ class CachedPatternMatcher(PatternMatcher):
     """
     Pattern matcher with caching for improved performance.
     
-    This implementation caches pattern matching results to avoid
-    repeated computation for the same event-pattern combinations.
+    Results are kept in a least-recently-used cache keyed on the event
+    type, the compiled pattern and the values of only those payload fields
+    the pattern references, so unrelated payload content never affects the
+    key. Lookups, insertions and evictions are O(1), and the cache is safe
+    to use from several publisher threads.
     """
     
     def __init__(self, cache_size: int = 1000):
@@ -538,37 +605,58 @@ class CachedPatternMatcher(PatternMatcher):
             cache_size: Maximum number of cache entries to maintain
         """
         self.cache_size = cache_size
-        self._cache: Dict[str, bool] = {}
-        self._cache_order: List[str] = []
+        self._cache: "OrderedDict[Tuple[Any, ...], Tuple[CompiledPattern, bool]]" = OrderedDict()
+        self._keys_by_pattern: Dict[int, Set[Tuple[Any, ...]]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
     
-    def _get_cache_key(self, event: Event, pattern: EventPattern) -> str:
+    def _get_cache_key(self, event: Event, compiled: CompiledPattern) -> Optional[Tuple[Any, ...]]:
         """
         Generate a cache key for an event-pattern combination.
         
         Args:
             event: The event
-            pattern: The pattern
+            compiled: The compiled pattern
             
         Returns:
-            A string cache key
+            A hashable cache key, or None if a referenced value is unhashable
         """
-        return f"{event.type}:{event.source}:{hash(str(pattern))}:{hash(str(event.payload))}"
+        key = (event.type, id(compiled), compiled.referenced_values(event.payload))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
     
-    def _update_cache(self, key: str, result: bool) -> None:
+    def _update_cache(self, key: Tuple[Any, ...], compiled: CompiledPattern, result: bool) -> None:
         """
         Update the cache with a new result.
         
+        Must be called with the lock held.
+        
         Args:
             key: The cache key
+            compiled: The compiled pattern the result belongs to
             result: The matching result
         """
-        # Remove oldest entries if cache is full
-        if len(self._cache) >= self.cache_size:
-            oldest_key = self._cache_order.pop(0)
-            del self._cache[oldest_key]
+        self._cache[key] = (compiled, result)
+        self._keys_by_pattern.setdefault(key[1], set()).add(key)
         
-        self._cache[key] = result
-        self._cache_order.append(key)
+        # Evict least recently used entries if the cache is full
+        while len(self._cache) > self.cache_size:
+            oldest_key, _ = self._cache.popitem(last=False)
+            self._forget_key(oldest_key)
+            self._evictions += 1
+    
+    def _forget_key(self, key: Tuple[Any, ...]) -> None:
+        """Drop a key from the per-pattern key sets (lock held)."""
+        keys = self._keys_by_pattern.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_pattern[key[1]]
     
     def matches(self, event: Event, pattern: EventPattern) -> bool:
         """
@@ -581,15 +669,29 @@ class CachedPatternMatcher(PatternMatcher):
         Returns:
             True if the event matches the pattern, False otherwise
         """
-        cache_key = self._get_cache_key(event, pattern)
+        compiled = pattern.compile()
+        if self.cache_size <= 0:
+            return compiled.matches(event)
+        
+        cache_key = self._get_cache_key(event, compiled)
+        if cache_key is None:
+            with self._lock:
+                self._misses += 1
+            return compiled.matches(event)
         
-        # Check cache first
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        # Check cache first; the stored pattern guards against reused ids
+        with self._lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None and entry[0] is compiled:
+                self._cache.move_to_end(cache_key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
         
         # Compute result and cache it
-        result = pattern.matches(event)
-        self._update_cache(cache_key, result)
+        result = compiled.matches(event)
+        with self._lock:
+            self._update_cache(cache_key, compiled, result)
         
         return result
     
@@ -620,10 +722,23 @@ class CachedPatternMatcher(PatternMatcher):
         
         return matching_subscriptions
     
+    def remove_subscription(self, subscription: Subscription) -> None:
+        """
+        Drop the cached results of a removed subscription's pattern.
+        
+        Args:
+            subscription: The subscription that was removed or paused
+        """
+        compiled = subscription.pattern.compile()
+        with self._lock:
+            for key in self._keys_by_pattern.pop(id(compiled), ()):
+                self._cache.pop(key, None)
+    
     def clear_cache(self) -> None:
         """Clear the pattern matching cache."""
-        self._cache.clear()
-        self._cache_order.clear()
+        with self._lock:
+            self._cache.clear()
+            self._keys_by_pattern.clear()
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -632,11 +747,17 @@ class CachedPatternMatcher(PatternMatcher):
         Returns:
             Dictionary with cache statistics
         """
-        return {
-            "cache_size": len(self._cache),
-            "max_cache_size": self.cache_size,
-            "cache_utilization": len(self._cache) / self.cache_size if self.cache_size > 0 else 0
-        }
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "cache_size": len(self._cache),
+                "max_cache_size": self.cache_size,
+                "cache_utilization": len(self._cache) / self.cache_size if self.cache_size > 0 else 0,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
 
 
 class WildcardPatternMatcher(PatternMatcher):
@@ -748,8 +869,320 @@ class WildcardPatternMatcher(PatternMatcher):
         """Clear the regex pattern cache."""
         self._regex_cache.clear()
 
-c
-lass EventQueue(ABC):
+
+def _subscription_sort_key(subscription: Subscription):
+    """Delivery order: priority (highest first), then creation time (oldest first)."""
+    return (-subscription.priority, subscription.created_at)
+
+
+class _SubscriptionBucket:
+    """
+    List of subscriptions kept sorted in delivery order.
+
+    Inserts and removals use binary search, so reading a bucket never
+    needs a sort.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items: List[Subscription] = []
+
+    def add(self, subscription: Subscription) -> None:
+        bisect.insort_right(self.items, subscription, key=_subscription_sort_key)
+
+    def remove(self, subscription: Subscription) -> bool:
+        key = _subscription_sort_key(subscription)
+        index = bisect.bisect_left(self.items, key, key=_subscription_sort_key)
+        while index < len(self.items) and _subscription_sort_key(self.items[index]) == key:
+            if self.items[index] is subscription:
+                del self.items[index]
+                return True
+            index += 1
+        return False
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+class _SubscriptionTrieNode:
+    """
+    Node of the event type segment trie.
+
+    Attributes:
+        children: Literal segment -> child node
+        star: Child for a ``*`` segment (exactly one segment)
+        globstar: Child for a ``**`` segment (one or more segments)
+        bucket: Subscriptions whose pattern ends at this node
+    """
+
+    __slots__ = ("children", "star", "globstar", "bucket")
+
+    def __init__(self):
+        self.children: Dict[str, '_SubscriptionTrieNode'] = {}
+        self.star: Optional['_SubscriptionTrieNode'] = None
+        self.globstar: Optional['_SubscriptionTrieNode'] = None
+        self.bucket = _SubscriptionBucket()
+
+    def is_empty(self) -> bool:
+        return (not self.children and self.star is None
+                and self.globstar is None and not self.bucket)
+
+
+class IndexedPatternMatcher(PatternMatcher):
+    """
+    Pattern matcher backed by an incrementally maintained subscription index.
+
+    Subscriptions are indexed when the router calls ``add_subscription``:
+
+    - exact event types go into a hash map,
+    - wildcard types made of whole ``*``/``**`` segments go into a segment trie,
+    - everything else (``regex:``, ``!`` negation, partial-segment wildcards
+      such as ``user.log*``) goes into a small fallback list checked with
+      each pattern's compiled type predicate.
+
+    Every bucket is kept sorted by ``(-priority, created_at)``, so publishing
+    merges the few buckets that apply to the event type instead of scanning
+    and sorting every subscription. The ``subscriptions`` argument of
+    ``find_matching_subscriptions`` is ignored; the index is the source of
+    truth.
+    """
+
+    def __init__(self):
+        """Initialize an empty subscription index."""
+        self._exact: Dict[str, _SubscriptionBucket] = {}
+        self._trie = _SubscriptionTrieNode()
+        self._match_all = _SubscriptionBucket()
+        self._fallback = _SubscriptionBucket()
+        self._indexed: Dict[str, Subscription] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _classify(pattern_str: str) -> str:
+        """
+        Decide which index structure a type pattern belongs to.
+
+        Args:
+            pattern_str: The event type pattern
+
+        Returns:
+            One of "all", "exact", "trie" or "fallback"
+        """
+        if pattern_str == "*":
+            return "all"
+        if pattern_str.startswith("regex:") or pattern_str.startswith("!"):
+            return "fallback"
+        if "*" not in pattern_str:
+            return "exact"
+        for segment in pattern_str.split("."):
+            if "*" in segment and segment not in ("*", "**"):
+                return "fallback"
+        return "trie"
+
+    def add_subscription(self, subscription: Subscription) -> None:
+        """
+        Index a subscription. Adding an already indexed subscription is a no-op.
+
+        Args:
+            subscription: The subscription to index
+        """
+        with self._lock:
+            if subscription.id in self._indexed:
+                return
+            self._indexed[subscription.id] = subscription
+
+            pattern_str = subscription.pattern.event_type
+            kind = self._classify(pattern_str)
+            if kind == "all":
+                self._match_all.add(subscription)
+            elif kind == "exact":
+                self._exact.setdefault(pattern_str, _SubscriptionBucket()).add(subscription)
+            elif kind == "fallback":
+                self._fallback.add(subscription)
+            else:
+                node = self._trie
+                for segment in pattern_str.split("."):
+                    if segment == "*":
+                        if node.star is None:
+                            node.star = _SubscriptionTrieNode()
+                        node = node.star
+                    elif segment == "**":
+                        if node.globstar is None:
+                            node.globstar = _SubscriptionTrieNode()
+                        node = node.globstar
+                    else:
+                        node = node.children.setdefault(segment, _SubscriptionTrieNode())
+                node.bucket.add(subscription)
+
+    def remove_subscription(self, subscription: Subscription) -> None:
+        """
+        Drop a subscription from the index. Unknown subscriptions are ignored.
+
+        Args:
+            subscription: The subscription to drop
+        """
+        with self._lock:
+            indexed = self._indexed.pop(subscription.id, None)
+            if indexed is None:
+                return
+
+            pattern_str = indexed.pattern.event_type
+            kind = self._classify(pattern_str)
+            if kind == "all":
+                self._match_all.remove(indexed)
+            elif kind == "exact":
+                bucket = self._exact.get(pattern_str)
+                if bucket is not None:
+                    bucket.remove(indexed)
+                    if not bucket:
+                        del self._exact[pattern_str]
+            elif kind == "fallback":
+                self._fallback.remove(indexed)
+            else:
+                self._remove_from_trie(indexed, pattern_str.split("."))
+
+    def _remove_from_trie(self, subscription: Subscription, segments: List[str]) -> None:
+        """Remove a subscription from the trie and prune emptied nodes."""
+        path = []
+        node = self._trie
+        for segment in segments:
+            if segment == "*":
+                child = node.star
+            elif segment == "**":
+                child = node.globstar
+            else:
+                child = node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, segment))
+            node = child
+
+        node.bucket.remove(subscription)
+
+        # Prune empty nodes bottom-up so the trie doesn't grow without bound
+        for parent, segment in reversed(path):
+            if not node.is_empty():
+                break
+            if segment == "*":
+                parent.star = None
+            elif segment == "**":
+                parent.globstar = None
+            else:
+                del parent.children[segment]
+            node = parent
+
+    def _collect_trie_buckets(self, segments: List[str]) -> List[_SubscriptionBucket]:
+        """
+        Find the buckets of every trie pattern that matches an event type.
+
+        Args:
+            segments: The event type split on "."
+
+        Returns:
+            Non-empty buckets of the matching trie nodes
+        """
+        count = len(segments)
+        visited = set()
+        matched: Dict[int, _SubscriptionTrieNode] = {}
+        stack = [(self._trie, 0)]
+
+        while stack:
+            node, index = stack.pop()
+            state = (id(node), index)
+            if state in visited:
+                continue
+            visited.add(state)
+
+            if index == count:
+                if node.bucket:
+                    matched[id(node)] = node
+                continue
+
+            child = node.children.get(segments[index])
+            if child is not None:
+                stack.append((child, index + 1))
+            if node.star is not None:
+                stack.append((node.star, index + 1))
+            if node.globstar is not None:
+                # "**" consumes one or more segments
+                for end in range(index + 1, count + 1):
+                    stack.append((node.globstar, end))
+
+        return [node.bucket for node in matched.values()]
+
+    def matches(self, event: Event, pattern: EventPattern) -> bool:
+        """
+        Check if an event matches a pattern.
+
+        Args:
+            event: The event to match
+            pattern: The pattern to match against
+
+        Returns:
+            True if the event matches the pattern, False otherwise
+        """
+        return pattern.matches(event)
+
+    def find_matching_subscriptions(self, event: Event, subscriptions: List[Subscription]) -> List[Subscription]:
+        """
+        Find all indexed subscriptions that match an event.
+
+        Args:
+            event: The event to match
+            subscriptions: Ignored; matching uses the index
+
+        Returns:
+            List of matching subscriptions sorted by priority (highest first)
+        """
+        with self._lock:
+            buckets = []
+            exact = self._exact.get(event.type)
+            if exact:
+                buckets.append(exact.items)
+            if self._match_all:
+                buckets.append(self._match_all.items)
+            if self._trie.children or self._trie.star or self._trie.globstar:
+                buckets.extend(bucket.items for bucket in
+                               self._collect_trie_buckets(event.type.split(".")))
+
+            fallback = [
+                subscription for subscription in self._fallback.items
+                if subscription.pattern.compile().matches_type(event.type)
+            ]
+            if fallback:
+                buckets.append(fallback)
+
+            if not buckets:
+                return []
+            if len(buckets) == 1:
+                candidates = buckets[0]
+            else:
+                candidates = heapq.merge(*buckets, key=_subscription_sort_key)
+
+            return [
+                subscription for subscription in candidates
+                if subscription.active
+                and not subscription.is_expired()
+                and subscription.pattern.compile().matches_attributes(event.payload)
+            ]
+
+    def get_index_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the subscription index.
+
+        Returns:
+            Dictionary with index statistics
+        """
+        with self._lock:
+            return {
+                "indexed_subscriptions": len(self._indexed),
+                "exact_event_types": len(self._exact),
+                "match_all_subscriptions": len(self._match_all),
+                "fallback_subscriptions": len(self._fallback),
+            }
+
+
+class EventQueue(ABC):
     """
     Abstract base class for event queue implementations.
     
@@ -796,21 +1229,119 @@ lass EventQueue(ABC):
             The number of events in the queue
         """
         pass
+    
+    def dequeue_batch(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to ``max_items`` events.
+        
+        Queues that can block efficiently should override this; the default
+        polls ``dequeue`` and sleeps once if the queue is empty.
+        
+        Args:
+            max_items: Maximum number of events to return
+            timeout: Seconds to wait if the queue is empty (None = don't wait)
+            
+        Returns:
+            List of dequeued events, possibly empty
+        """
+        items = []
+        while len(items) < max_items:
+            item = self.dequeue()
+            if item is None:
+                break
+            items.append(item)
+        
+        if not items and timeout:
+            time.sleep(timeout)
+        return items
+    
+    def dequeue_for_ack(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove up to ``max_items`` events that the caller will ack or nack.
+        
+        Only consumers that ack or nack every item they take should use
+        this; queues that track unacknowledged items hold on to them until
+        then. The default tracks nothing and behaves like ``dequeue_batch``.
+        
+        Args:
+            max_items: Maximum number of events to return
+            timeout: Seconds to wait if the queue is empty (None = don't wait)
+            
+        Returns:
+            List of dequeued events, possibly empty
+        """
+        return self.dequeue_batch(max_items, timeout)
+    
+    def ack(self, item: Any) -> None:
+        """
+        Confirm that a dequeued event was processed.
+        
+        Args:
+            item: The item returned by dequeue_for_ack
+        """
+        pass
+    
+    def nack(self, item: Any) -> None:
+        """
+        Return a dequeued event to the queue for redelivery.
+        
+        Args:
+            item: The item returned by dequeue_for_ack
+        """
+        self.enqueue(item)
+    
+    def nack_batch(self, items: List[Any]) -> None:
+        """
+        Return several dequeued events for redelivery, keeping their order.
+        
+        Args:
+            items: Items returned by dequeue_for_ack, in queue order
+        """
+        for item in items:
+            self.nack(item)
 
 
 class InMemoryEventQueue(EventQueue):
     """
     In-memory implementation of the EventQueue interface.
     
-    This implementation uses a simple list to store events in memory.
+    Events are kept in a deque, so enqueue and dequeue are O(1). Items
+    taken with ``dequeue_for_ack`` stay "in flight" until they are acked;
+    a nack puts them back at the head of the queue so they are redelivered
+    before newer events. ``dequeue`` and ``dequeue_batch`` hand items over
+    without tracking them.
     """
     
     def __init__(self):
         """Initialize the in-memory event queue."""
-        self._queue: List[Event] = []
+        self._queue: Deque[Any] = deque()
+        self._in_flight: Dict[Any, List[Any]] = {}
         self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
     
-    def enqueue(self, event: Event) -> None:
+    @staticmethod
+    def _ack_key(item: Any) -> Any:
+        """In-flight key: the delivery ID of envelopes, else the item's identity."""
+        return getattr(item, "delivery_id", None) or id(item)
+    
+    def _release(self, item: Any) -> None:
+        """Stop tracking one in-flight copy of an item (lock held)."""
+        key = self._ack_key(item)
+        entries = self._in_flight.get(key)
+        if entries:
+            entries.pop()
+            if not entries:
+                del self._in_flight[key]
+    
+    def _take(self, max_items: int, timeout: Optional[float]) -> List[Any]:
+        """Pop up to ``max_items`` items, waiting if empty (lock held)."""
+        if not self._queue and timeout:
+            self._not_empty.wait(timeout)
+        
+        count = min(max_items, len(self._queue))
+        return [self._queue.popleft() for _ in range(count)]
+    
+    def enqueue(self, event: Any) -> None:
         """
         Add an event to the queue.
         
@@ -819,8 +1350,9 @@ class InMemoryEventQueue(EventQueue):
         """
         with self._lock:
             self._queue.append(event)
+            self._not_empty.notify()
     
-    def dequeue(self) -> Optional[Event]:
+    def dequeue(self) -> Optional[Any]:
         """
         Remove and return the next event from the queue.
         
@@ -828,9 +1360,74 @@ class InMemoryEventQueue(EventQueue):
             The next event in the queue, or None if the queue is empty
         """
         with self._lock:
-            if not self.is_empty():
-                return self._queue.pop(0)
-            return None
+            if not self._queue:
+                return None
+            return self._queue.popleft()
+    
+    def dequeue_batch(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove and return up to ``max_items`` events.
+        
+        Args:
+            max_items: Maximum number of events to return
+            timeout: Seconds to wait if the queue is empty (None = don't wait)
+            
+        Returns:
+            List of dequeued events, possibly empty
+        """
+        with self._lock:
+            return self._take(max_items, timeout)
+    
+    def dequeue_for_ack(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Remove up to ``max_items`` events and track them until acked.
+        
+        Args:
+            max_items: Maximum number of events to return
+            timeout: Seconds to wait if the queue is empty (None = don't wait)
+            
+        Returns:
+            List of dequeued events, possibly empty
+        """
+        with self._lock:
+            items = self._take(max_items, timeout)
+            for item in items:
+                self._in_flight.setdefault(self._ack_key(item), []).append(item)
+            return items
+    
+    def ack(self, item: Any) -> None:
+        """
+        Confirm that a dequeued event was processed.
+        
+        Args:
+            item: The item returned by dequeue_for_ack
+        """
+        with self._lock:
+            self._release(item)
+    
+    def nack(self, item: Any) -> None:
+        """
+        Put a dequeued event back at the head of the queue.
+        
+        Args:
+            item: The item returned by dequeue_for_ack
+        """
+        self.nack_batch([item])
+    
+    def nack_batch(self, items: List[Any]) -> None:
+        """
+        Put dequeued events back at the head of the queue in their order.
+        
+        Args:
+            items: Items returned by dequeue_for_ack, in queue order
+        """
+        if not items:
+            return
+        with self._lock:
+            for item in items:
+                self._release(item)
+            self._queue.extendleft(reversed(items))
+            self._not_empty.notify(len(items))
     
     def is_empty(self) -> bool:
         """
@@ -851,6 +1448,16 @@ class InMemoryEventQueue(EventQueue):
         """
         with self._lock:
             return len(self._queue)
+    
+    def in_flight_count(self) -> int:
+        """
+        Get the number of dequeued events that have not been acked yet.
+        
+        Returns:
+            The number of in-flight events
+        """
+        with self._lock:
+            return sum(len(entries) for entries in self._in_flight.values())
 
 
 class EventRouter:
@@ -865,7 +1472,14 @@ class EventRouter:
                  pattern_matcher: Optional[PatternMatcher] = None, 
                  event_queue: Optional[EventQueue] = None,
                  enable_delivery_confirmation: bool = False,
-                 max_concurrent_deliveries: int = 10):
+                 max_concurrent_deliveries: int = 10,
+                 async_mailbox_capacity: int = 1000,
+                 async_overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 async_block_timeout: Optional[float] = None,
+                 asyncio_max_concurrency: int = 100,
+                 asyncio_handler_timeout: Optional[float] = None,
+                 queue_batch_size: int = 100,
+                 queue_max_attempts: int = 3):
         """
         Initialize the event router.
         
@@ -873,27 +1487,62 @@ class EventRouter:
             pattern_matcher: The pattern matcher to use for matching events
             event_queue: The event queue to use for queued delivery
             enable_delivery_confirmation: Whether to track delivery confirmations
-            max_concurrent_deliveries: Maximum concurrent async deliveries
+            max_concurrent_deliveries: Number of worker threads for async delivery
+            async_mailbox_capacity: Maximum pending async events per subscription
+            async_overflow_policy: What to do when a subscription's mailbox is full
+            async_block_timeout: Maximum seconds a publisher waits under BLOCK
+            asyncio_max_concurrency: Maximum handlers in flight per loop for publish_async
+            asyncio_handler_timeout: Default per-handler timeout for publish_async
+            queue_batch_size: Maximum queued deliveries drained per batch
+            queue_max_attempts: Attempts before a queued delivery is dead-lettered
         """
         self.subscriptions: List[Subscription] = []
-        self.pattern_matcher = pattern_matcher or DefaultPatternMatcher()
+        self._subscriptions_by_id: Dict[str, Subscription] = {}
+        self.pattern_matcher = pattern_matcher or IndexedPatternMatcher()
         self.event_queue = event_queue or InMemoryEventQueue()
         self.enable_delivery_confirmation = enable_delivery_confirmation
         self.max_concurrent_deliveries = max_concurrent_deliveries
         self._lock = threading.RLock()
         
         # Delivery tracking
-        self._delivery_stats = {
-            "events_published": 0,
-            "successful_deliveries": 0,
-            "failed_deliveries": 0,
-            "async_deliveries": 0,
-            "sync_deliveries": 0,
-            "queued_deliveries": 0
-        }
+        self._delivery_stats = DeliveryStats([
+            "events_published",
+            "successful_deliveries",
+            "failed_deliveries",
+            "async_deliveries",
+            "sync_deliveries",
+            "queued_deliveries",
+            "asyncio_deliveries",
+            "rejected_deliveries"
+        ])
+        
+        # Fixed worker pool with per-subscription mailboxes for async delivery
+        self._async_engine = AsyncDeliveryEngine(
+            deliver=self._deliver_to_subscription,
+            max_workers=max_concurrent_deliveries,
+            mailbox_capacity=async_mailbox_capacity,
+            overflow_policy=async_overflow_policy,
+            block_timeout=async_block_timeout
+        )
         
-        # Semaphore for controlling concurrent deliveries
-        self._delivery_semaphore = threading.Semaphore(max_concurrent_deliveries)
+        # Loop-native engine for publish_async
+        self._asyncio_engine = AsyncioDeliveryEngine(
+            on_success=self._record_delivery_success,
+            on_failure=self._record_delivery_failure,
+            max_concurrency=asyncio_max_concurrency,
+            handler_timeout=asyncio_handler_timeout,
+            executor_workers=max_concurrent_deliveries
+        )
+        
+        # Consumer side of QUEUED delivery
+        self._queue_consumer = QueuedDeliveryConsumer(
+            queue=self.event_queue,
+            resolve_subscription=self.get_subscription_by_id,
+            on_success=self._record_delivery_success,
+            on_failure=self._record_delivery_failure,
+            batch_size=queue_batch_size,
+            max_attempts=queue_max_attempts
+        )
         
         # Error handlers
         self._error_handlers: List[Callable[[Event, Subscription, Exception], None]] = []
@@ -904,7 +1553,8 @@ class EventRouter:
                   delivery_mode: DeliveryMode = DeliveryMode.SYNC,
                   priority: int = 0,
                   max_events: Optional[int] = None,
-                  expiration: Optional[float] = None) -> Subscription:
+                  expiration: Optional[float] = None,
+                  batch_handler: Optional[Callable[[List[Event]], None]] = None) -> Subscription:
         """
         Create a new subscription.
         
@@ -915,6 +1565,7 @@ class EventRouter:
             priority: The priority of the subscription
             max_events: Maximum number of events to process before expiring
             expiration: Time in seconds after which the subscription expires
+            batch_handler: Optional handler that receives queued events in batches
             
         Returns:
             The new subscription
@@ -924,11 +1575,14 @@ class EventRouter:
             handler=handler,
             priority=priority,
             max_events=max_events,
-            expiration=expiration
+            expiration=expiration,
+            batch_handler=batch_handler
         )
         
         with self._lock:
             self.subscriptions.append(subscription)
+            self._subscriptions_by_id[subscription.id] = subscription
+            self.pattern_matcher.add_subscription(subscription)
         
         return subscription
     
@@ -945,9 +1599,14 @@ class EventRouter:
         with self._lock:
             try:
                 self.subscriptions.remove(subscription)
-                return True
             except ValueError:
                 return False
+            self._subscriptions_by_id.pop(subscription.id, None)
+            self.pattern_matcher.remove_subscription(subscription)
+            self._async_engine.remove_mailbox(subscription.id)
+        # Parked deliveries go back to the queue to be dropped as orphans
+        self._queue_consumer.requeue_parked(subscription.id)
+        return True
     
     def unsubscribe_by_id(self, subscription_id: str) -> bool:
         """
@@ -960,11 +1619,10 @@ class EventRouter:
             True if the subscription was removed, False if it wasn't found
         """
         with self._lock:
-            for subscription in self.subscriptions:
-                if subscription.id == subscription_id:
-                    self.subscriptions.remove(subscription)
-                    return True
-            return False
+            subscription = self._subscriptions_by_id.get(subscription_id)
+            if subscription is None:
+                return False
+            return self.unsubscribe(subscription)
     
     def publish(self, event: Event, delivery_mode: DeliveryMode = DeliveryMode.SYNC) -> None:
         """
@@ -974,7 +1632,7 @@ class EventRouter:
             event: The event to publish
             delivery_mode: How to deliver the event to subscribers
         """
-        self._delivery_stats["events_published"] += 1
+        self._delivery_stats.increment("events_published")
         
         # Find matching subscriptions
         with self._lock:
@@ -993,6 +1651,87 @@ class EventRouter:
         elif delivery_mode == DeliveryMode.QUEUED:
             self._deliver_queued(event, matching_subscriptions)
     
+    def _deliver_to_subscription(self, subscription: Subscription, event: Event) -> bool:
+        """
+        Deliver an event to a single subscription and record the outcome.
+        
+        Args:
+            subscription: The subscription to deliver to
+            event: The event to deliver
+            
+        Returns:
+            True if the handler succeeded, False otherwise
+        """
+        try:
+            subscription.process_event(event)
+        except Exception as e:
+            self._record_delivery_failure(subscription, event, e)
+            return False
+        
+        self._record_delivery_success(subscription, event)
+        return True
+    
+    def _record_delivery_success(self, subscription: Subscription, event: Event) -> None:
+        """
+        Record a successful delivery.
+        
+        Args:
+            subscription: The subscription that processed the event
+            event: The delivered event
+        """
+        self._delivery_stats.increment("successful_deliveries")
+        
+        if self.enable_delivery_confirmation:
+            self._publish_delivery_confirmation(event, subscription, True)
+    
+    def _record_delivery_failure(self, subscription: Subscription, event: Event, error: Exception) -> None:
+        """
+        Record a failed delivery and notify error handlers.
+        
+        Args:
+            subscription: The subscription whose handler failed
+            event: The event that failed to deliver
+            error: The exception raised by the handler
+        """
+        self._delivery_stats.increment("failed_deliveries")
+        
+        # Call error handlers
+        for error_handler in self._error_handlers:
+            try:
+                error_handler(event, subscription, error)
+            except Exception:
+                pass  # Don't let error handlers break the delivery
+        
+        if self.enable_delivery_confirmation:
+            self._publish_delivery_confirmation(event, subscription, False, str(error))
+    
+    async def publish_async(self, event: Event, timeout: Optional[float] = None) -> None:
+        """
+        Publish an event from asyncio code.
+        
+        Coroutine handlers are awaited on the running loop and sync handlers
+        run in a thread pool. All matching handlers run concurrently, bounded
+        by ``asyncio_max_concurrency``, and the call returns once each has
+        finished, failed or timed out.
+        
+        Args:
+            event: The event to publish
+            timeout: Per-handler timeout in seconds (defaults to the router's
+                asyncio_handler_timeout)
+        """
+        self._delivery_stats.increment("events_published")
+        
+        with self._lock:
+            matching_subscriptions = self.pattern_matcher.find_matching_subscriptions(
+                event, self.subscriptions
+            )
+        
+        if not matching_subscriptions:
+            return
+        
+        self._delivery_stats.increment("asyncio_deliveries")
+        await self._asyncio_engine.deliver(event, matching_subscriptions, timeout)
+    
     def _deliver_sync(self, event: Event, subscriptions: List[Subscription]) -> None:
         """
         Deliver an event synchronously to all subscriptions.
@@ -1001,76 +1740,30 @@ class EventRouter:
             event: The event to deliver
             subscriptions: List of subscriptions to deliver to
         """
-        self._delivery_stats["sync_deliveries"] += 1
+        self._delivery_stats.increment("sync_deliveries")
         
+        # In sync mode, we continue with other subscriptions after a failure
+        # but could be configured to fail fast
         for subscription in subscriptions:
-            try:
-                subscription.process_event(event)
-                self._delivery_stats["successful_deliveries"] += 1
-                
-                if self.enable_delivery_confirmation:
-                    self._publish_delivery_confirmation(event, subscription, True)
-                    
-            except Exception as e:
-                self._delivery_stats["failed_deliveries"] += 1
-                
-                # Call error handlers
-                for error_handler in self._error_handlers:
-                    try:
-                        error_handler(event, subscription, e)
-                    except Exception:
-                        pass  # Don't let error handlers break the delivery
-                
-                if self.enable_delivery_confirmation:
-                    self._publish_delivery_confirmation(event, subscription, False, str(e))
-                
-                # In sync mode, we continue with other subscriptions
-                # but could be configured to fail fast
+            self._deliver_to_subscription(subscription, event)
     
     def _deliver_async(self, event: Event, subscriptions: List[Subscription]) -> None:
         """
         Deliver an event asynchronously to all subscriptions.
         
+        The event is appended to each subscription's mailbox and delivered by
+        the router's fixed worker pool, preserving per-subscription order.
+        Mailbox overflow is handled by the configured OverflowPolicy.
+        
         Args:
             event: The event to deliver
             subscriptions: List of subscriptions to deliver to
         """
-        self._delivery_stats["async_deliveries"] += 1
+        self._delivery_stats.increment("async_deliveries")
         
-        def deliver_to_subscription(subscription: Subscription, event: Event):
-            with self._delivery_semaphore:  # Control concurrent deliveries
-                try:
-                    subscription.process_event(event)
-                    self._delivery_stats["successful_deliveries"] += 1
-                    
-                    if self.enable_delivery_confirmation:
-                        self._publish_delivery_confirmation(event, subscription, True)
-                        
-                except Exception as e:
-                    self._delivery_stats["failed_deliveries"] += 1
-                    
-                    # Call error handlers
-                    for error_handler in self._error_handlers:
-                        try:
-                            error_handler(event, subscription, e)
-                        except Exception:
-                            pass
-                    
-                    if self.enable_delivery_confirmation:
-                        self._publish_delivery_confirmation(event, subscription, False, str(e))
-        
-        # Create threads for each subscription
-        threads = []
         for subscription in subscriptions:
-            thread = threading.Thread(
-                target=deliver_to_subscription,
-                args=(subscription, event)
-            )
-            thread.daemon = True
-            thread.start()
-            threads.append(thread)
-        
-        # Don't wait for threads in async mode
+            if not self._async_engine.submit(subscription, event):
+                self._delivery_stats.increment("rejected_deliveries")
     
     def _deliver_queued(self, event: Event, subscriptions: List[Subscription]) -> None:
         """
@@ -1080,36 +1773,53 @@ class EventRouter:
             event: The event to deliver
             subscriptions: List of subscriptions to deliver to
         """
-        self._delivery_stats["queued_deliveries"] += 1
+        self._delivery_stats.increment("queued_deliveries")
         
-        # For queued delivery, we add the event to the queue
-        # The actual processing would be handled by queue consumers
+        # Envelopes share the event; queue consumers deliver them in batches
         for subscription in subscriptions:
             try:
-                # Create a copy of the event for each subscription
-                queued_event = Event(
-                    id=str(uuid.uuid4()),
-                    type=event.type,
-                    source=event.source,
-                    timestamp=event.timestamp,
-                    correlation_id=event.correlation_id,
-                    causation_id=event.causation_id,
-                    payload=event.payload.copy(),
-                    metadata={**event.metadata, "subscription_id": subscription.id},
-                    is_replay=event.is_replay
-                )
-                self.event_queue.enqueue(queued_event)
-                self._delivery_stats["successful_deliveries"] += 1
-                
+                self.event_queue.enqueue(QueuedDelivery(event, subscription.id))
             except Exception as e:
-                self._delivery_stats["failed_deliveries"] += 1
-                
-                # Call error handlers
-                for error_handler in self._error_handlers:
-                    try:
-                        error_handler(event, subscription, e)
-                    except Exception:
-                        pass
+                self._record_delivery_failure(subscription, event, e)
+    
+    def start_queue_consumers(self, workers: int = 1) -> None:
+        """
+        Start background threads that drain the event queue into subscriptions.
+        
+        Args:
+            workers: Number of drainer threads (use 1 to keep per-subscription order)
+        """
+        self._queue_consumer.start(workers)
+    
+    def stop_queue_consumers(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the queue drainer threads.
+        
+        Args:
+            timeout: Maximum seconds to wait for each thread
+        """
+        self._queue_consumer.stop(timeout)
+    
+    def process_queued_events(self, max_batches: Optional[int] = None) -> int:
+        """
+        Drain the event queue on the calling thread.
+        
+        Args:
+            max_batches: Stop after this many batches (None = until empty)
+            
+        Returns:
+            Number of queued deliveries processed
+        """
+        return self._queue_consumer.drain(max_batches)
+    
+    def get_dead_letters(self) -> List[QueuedDelivery]:
+        """
+        Get queued deliveries that exhausted their delivery attempts.
+        
+        Returns:
+            List of dead-lettered deliveries, oldest first
+        """
+        return list(self._queue_consumer.dead_letters)
     
     def get_subscriptions(self) -> List[Subscription]:
         """
@@ -1139,9 +1849,17 @@ class EventRouter:
             Number of subscriptions removed
         """
         with self._lock:
-            initial_count = len(self.subscriptions)
+            expired = [sub for sub in self.subscriptions if sub.is_expired()]
+            if not expired:
+                return 0
+            
+            for subscription in expired:
+                self._subscriptions_by_id.pop(subscription.id, None)
+                self.pattern_matcher.remove_subscription(subscription)
+                self._async_engine.remove_mailbox(subscription.id)
+            
             self.subscriptions = [sub for sub in self.subscriptions if not sub.is_expired()]
-            return initial_count - len(self.subscriptions)
+            return len(expired)
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -1160,7 +1878,10 @@ class EventRouter:
                 "expired_subscriptions": len(expired_subs),
                 "queue_size": self.event_queue.size(),
                 "pattern_matcher_type": type(self.pattern_matcher).__name__,
-                **self._delivery_stats
+                "async_engine": self._async_engine.get_stats(),
+                "asyncio_engine": self._asyncio_engine.get_stats(),
+                "queue_consumer": self._queue_consumer.get_stats(),
+                **self._delivery_stats.snapshot()
             }
     
     def _publish_delivery_confirmation(self, 
@@ -1269,10 +1990,7 @@ class EventRouter:
             The subscription if found, None otherwise
         """
         with self._lock:
-            for subscription in self.subscriptions:
-                if subscription.id == subscription_id:
-                    return subscription
-            return None
+            return self._subscriptions_by_id.get(subscription_id)
     
     def pause_subscription(self, subscription_id: str) -> bool:
         """
@@ -1288,6 +2006,7 @@ class EventRouter:
             subscription = self.get_subscription_by_id(subscription_id)
             if subscription:
                 subscription.deactivate()
+                self.pattern_matcher.remove_subscription(subscription)
                 return True
             return False
     
@@ -1303,7 +2022,33 @@ class EventRouter:
         """
         with self._lock:
             subscription = self.get_subscription_by_id(subscription_id)
-            if subscription:
-                subscription.activate()
-                return True
-            return False
\ No newline at end of file
+            if not subscription:
+                return False
+            subscription.activate()
+            self.pattern_matcher.add_subscription(subscription)
+        # Deliveries queued while it was paused are delivered again
+        self._queue_consumer.requeue_parked(subscription_id)
+        return True
+
+    def wait_for_async_deliveries(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all accepted async deliveries have been processed.
+        
+        Args:
+            timeout: Maximum seconds to wait (None = forever)
+            
+        Returns:
+            True if all async deliveries completed, False on timeout
+        """
+        return self._async_engine.wait_until_idle(timeout)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the router's delivery workers.
+        
+        Args:
+            wait: Whether to finish pending async deliveries first
+        """
+        self._async_engine.shutdown(wait=wait)
+        self._asyncio_engine.shutdown(wait=wait)
+        self._queue_consumer.stop()
@@ -5,14 +5,19 @@ This module provides event persistence and retrieval capabilities,
 supporting chronological ordering, filtering, and retention policies.
 """
 
+import bisect
+import heapq
+import itertools
 import threading
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from .correlation_graph import merge_timeline, walk_ancestors, walk_descendants
 from .event_routing import Event
+from .search_index import EventSearchIndex, SearchQuery
 
 
 @dataclass
@@ -58,6 +63,78 @@ class RetentionPolicy:
                 return True
         
         return False
+    
+    @classmethod
+    def create_age_based_policy(cls, max_age_hours: float) -> 'RetentionPolicy':
+        """
+        Create an age-based retention policy.
+        
+        Args:
+            max_age_hours: Maximum age in hours
+            
+        Returns:
+            RetentionPolicy configured for age-based retention
+        """
+        return cls(max_age_seconds=max_age_hours * 3600)
+    
+    @classmethod
+    def create_count_based_policy(cls, max_count: int) -> 'RetentionPolicy':
+        """
+        Create a count-based retention policy.
+        
+        Args:
+            max_count: Maximum number of events to retain
+            
+        Returns:
+            RetentionPolicy configured for count-based retention
+        """
+        return cls(max_count=max_count)
+    
+    @classmethod
+    def create_combined_policy(cls, 
+                              max_age_hours: float, 
+                              max_count: int,
+                              preserve_correlations: bool = True) -> 'RetentionPolicy':
+        """
+        Create a combined age and count-based retention policy.
+        
+        Args:
+            max_age_hours: Maximum age in hours
+            max_count: Maximum number of events to retain
+            preserve_correlations: Whether to preserve correlation chains
+            
+        Returns:
+            RetentionPolicy configured for combined retention
+        """
+        return cls(
+            max_age_seconds=max_age_hours * 3600,
+            max_count=max_count,
+            preserve_correlations=preserve_correlations
+        )
+    
+    def add_event_type_policy(self, event_type: str, policy: 'RetentionPolicy') -> None:
+        """
+        Add a specific retention policy for an event type.
+        
+        Args:
+            event_type: The event type to apply the policy to
+            policy: The retention policy for this event type
+        """
+        self.event_type_policies[event_type] = policy
+    
+    def get_effective_policy(self, event: Event) -> 'RetentionPolicy':
+        """
+        Get the effective retention policy for a specific event.
+        
+        Args:
+            event: The event to get the policy for
+            
+        Returns:
+            The effective retention policy
+        """
+        if event.type in self.event_type_policies:
+            return self.event_type_policies[event.type]
+        return self
 
 
 class EventStoreBase(ABC):
@@ -148,22 +225,316 @@ class EventStoreBase(ABC):
             Number of events removed
         """
         pass
+    
+    def _event_matches_criteria(self, event: Event, criteria: Dict[str, Any]) -> bool:
+        """
+        Check if an event matches the given criteria.
+        
+        Args:
+            event: The event to check
+            criteria: The criteria to match against
+            
+        Returns:
+            True if the event matches all criteria, False otherwise
+        """
+        for key, value in criteria.items():
+            if key == "type":
+                if event.type != value:
+                    return False
+            elif key == "source":
+                if event.source != value:
+                    return False
+            elif key == "correlation_id":
+                if event.correlation_id != value:
+                    return False
+            elif key == "causation_id":
+                if event.causation_id != value:
+                    return False
+            elif key == "is_replay":
+                if event.is_replay != value:
+                    return False
+            elif key.startswith("payload."):
+                # Handle nested payload filtering
+                payload_key = key[8:]  # Remove "payload." prefix
+                if not self._check_nested_value(event.payload, payload_key, value):
+                    return False
+            elif key.startswith("metadata."):
+                # Handle nested metadata filtering
+                metadata_key = key[9:]  # Remove "metadata." prefix
+                if not self._check_nested_value(event.metadata, metadata_key, value):
+                    return False
+            else:
+                # Direct attribute check
+                if not hasattr(event, key) or getattr(event, key) != value:
+                    return False
+        
+        return True
+    
+    def _check_nested_value(self, data: Dict[str, Any], key_path: str, expected_value: Any) -> bool:
+        """
+        Check a nested value using dot notation.
+        
+        Args:
+            data: The data dictionary to check
+            key_path: The key path (e.g., "user.id")
+            expected_value: The expected value
+            
+        Returns:
+            True if the nested value matches, False otherwise
+        """
+        keys = key_path.split(".")
+        current = data
+        
+        for key in keys[:-1]:
+            if not isinstance(current, dict) or key not in current:
+                return False
+            current = current[key]
+        
+        final_key = keys[-1]
+        if not isinstance(current, dict) or final_key not in current:
+            return False
+        
+        return current[final_key] == expected_value
+
+
+class _TimeOrderedEvents:
+    """
+    Events kept in timestamp order with a parallel list of timestamps.
+    
+    Appends of in-order events are O(1); late events are placed with a
+    binary search. Time ranges are resolved with binary search as well, so
+    a range query only touches the events inside the range.
+    """
+    
+    __slots__ = ("events", "timestamps")
+    
+    def __init__(self, events: Optional[Iterable[Event]] = None):
+        """
+        Initialize the ordered list.
+        
+        Args:
+            events: Optional events to load (sorted if needed)
+        """
+        self.events: List[Event] = []
+        self.timestamps: List[datetime] = []
+        if events:
+            ordered = sorted(events, key=lambda e: e.timestamp)
+            self.events = ordered
+            self.timestamps = [event.timestamp for event in ordered]
+    
+    def add(self, event: Event) -> None:
+        """
+        Insert an event, keeping insertion order among equal timestamps.
+        
+        Args:
+            event: The event to insert
+        """
+        timestamp = event.timestamp
+        if not self.timestamps or timestamp >= self.timestamps[-1]:
+            # Fast path: events normally arrive in order
+            self.events.append(event)
+            self.timestamps.append(timestamp)
+        else:
+            index = bisect.bisect_right(self.timestamps, timestamp)
+            self.events.insert(index, event)
+            self.timestamps.insert(index, timestamp)
+    
+    def remove(self, event: Event) -> bool:
+        """
+        Remove a specific event instance.
+        
+        Args:
+            event: The event to remove
+            
+        Returns:
+            True if the event was found and removed, False otherwise
+        """
+        index = bisect.bisect_left(self.timestamps, event.timestamp)
+        while index < len(self.events) and self.timestamps[index] == event.timestamp:
+            if self.events[index] is event:
+                del self.events[index]
+                del self.timestamps[index]
+                return True
+            index += 1
+        return False
+    
+    def bounds(self,
+               start_time: Optional[datetime] = None,
+               end_time: Optional[datetime] = None) -> Tuple[int, int]:
+        """
+        Find the index range of events inside an inclusive time window.
+        
+        Args:
+            start_time: Start of the window (None = unbounded)
+            end_time: End of the window (None = unbounded)
+            
+        Returns:
+            (low, high) slice bounds
+        """
+        low = 0 if start_time is None else bisect.bisect_left(self.timestamps, start_time)
+        high = len(self.events) if end_time is None else bisect.bisect_right(self.timestamps, end_time)
+        return low, max(low, high)
+    
+    def iter_range(self,
+                   start_time: Optional[datetime] = None,
+                   end_time: Optional[datetime] = None) -> Iterator[Event]:
+        """
+        Lazily iterate the events inside an inclusive time window.
+        
+        Args:
+            start_time: Start of the window (None = unbounded)
+            end_time: End of the window (None = unbounded)
+            
+        Returns:
+            Iterator over the events in chronological order
+        """
+        low, high = self.bounds(start_time, end_time)
+        events = self.events
+        return (events[i] for i in range(low, high))
+    
+    def __len__(self) -> int:
+        return len(self.events)
 
 
 class InMemoryEventStore(EventStoreBase):
     """
     In-memory implementation of the EventStore interface.
     
-    This implementation stores events in memory using a list for chronological
-    ordering and a dictionary for fast ID-based lookups. It's suitable for
-    development, testing, and scenarios where persistence is not required.
+    Events are kept in a time-ordered append log with a dictionary for
+    ID lookups and secondary indexes on type, source, correlation_id and
+    causation_id. Every index bucket is itself time-ordered, so filtered
+    time-range queries are resolved with dictionary lookups and binary
+    search instead of scans. It's suitable for development, testing, and
+    scenarios where persistence is not required.
     """
     
-    def __init__(self):
-        """Initialize the in-memory event store."""
-        self._events: List[Event] = []
+    INDEXED_FIELDS = ("type", "source", "correlation_id", "causation_id")
+    
+    def __init__(self,
+                 retention_policy: Optional[RetentionPolicy] = None,
+                 retention_slice_size: int = 64,
+                 enable_search_index: bool = False):
+        """
+        Initialize the in-memory event store.
+        
+        Args:
+            retention_policy: Policy enforced incrementally on every store()
+            retention_slice_size: Maximum evictions per incremental retention step
+            enable_search_index: Maintain an inverted index for search_events()
+        """
+        self._log = _TimeOrderedEvents()
+        self._events: List[Event] = self._log.events
         self._events_by_id: Dict[str, Event] = {}
+        self._indexes: Dict[str, Dict[Any, _TimeOrderedEvents]] = {
+            field_name: {} for field_name in self.INDEXED_FIELDS
+        }
         self._lock = threading.RLock()
+        self._search_index = EventSearchIndex() if enable_search_index else None
+        self._retention = None
+        if retention_policy is not None:
+            self.set_retention_policy(retention_policy, retention_slice_size)
+    
+    def set_retention_policy(self,
+                             retention_policy: Optional[RetentionPolicy],
+                             slice_size: int = 64) -> None:
+        """
+        Enforce a retention policy incrementally.
+        
+        Each store() then evicts at most ``slice_size`` expired events, and
+        run_retention() can be called from a timer to catch up while idle.
+        
+        Args:
+            retention_policy: The policy to enforce (None disables it)
+            slice_size: Maximum evictions per incremental step
+        """
+        from .retention import RetentionEngine
+        
+        with self._lock:
+            if retention_policy is None:
+                self._retention = None
+                return
+            
+            self._retention = RetentionEngine(retention_policy, self._remove_event, slice_size)
+            for event in self._events:
+                self._retention.track(event)
+    
+    def run_retention(self, max_items: Optional[int] = None) -> int:
+        """
+        Run one incremental retention step.
+        
+        Args:
+            max_items: Maximum evictions (None = the configured slice size)
+            
+        Returns:
+            Number of events removed
+        """
+        with self._lock:
+            if self._retention is None:
+                return 0
+            return self._retention.evict(max_items or self._retention.slice_size)
+    
+    def _remove_event(self, event: Event) -> None:
+        """Remove a single stored event (used by the retention engine)."""
+        self._unindex_event(event)
+        if self._events_by_id.get(event.id) is event:
+            del self._events_by_id[event.id]
+    
+    def _index_event(self, event: Event) -> None:
+        """Add an event to the log and every secondary index."""
+        self._log.add(event)
+        if self._search_index is not None:
+            self._search_index.add(event)
+        for field_name, index in self._indexes.items():
+            key = getattr(event, field_name)
+            bucket = index.get(key)
+            if bucket is None:
+                bucket = index[key] = _TimeOrderedEvents()
+            bucket.add(event)
+    
+    def _unindex_event(self, event: Event) -> None:
+        """Remove an event from the log and every secondary index."""
+        self._log.remove(event)
+        if self._search_index is not None:
+            self._search_index.remove(event.id)
+        for field_name, index in self._indexes.items():
+            key = getattr(event, field_name)
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.remove(event)
+                if not bucket:
+                    del index[key]
+    
+    def _replace_events(self, events: List[Event]) -> None:
+        """
+        Rebuild the log and indexes from a list of surviving events.
+        
+        Args:
+            events: The events to keep
+        """
+        self._log = _TimeOrderedEvents(events)
+        self._events = self._log.events
+        self._events_by_id = {event.id: event for event in self._events}
+        
+        self._indexes = {field_name: {} for field_name in self.INDEXED_FIELDS}
+        for field_name, index in self._indexes.items():
+            for event in self._events:
+                key = getattr(event, field_name)
+                bucket = index.get(key)
+                if bucket is None:
+                    bucket = index[key] = _TimeOrderedEvents()
+                # Already in timestamp order, so append directly
+                bucket.events.append(event)
+                bucket.timestamps.append(event.timestamp)
+        
+        if self._search_index is not None:
+            self._search_index.clear()
+            for event in self._events:
+                self._search_index.add(event)
+        
+        if self._retention is not None:
+            self._retention.reset()
+            for event in self._events:
+                self._retention.track(event)
     
     def store(self, event: Event) -> None:
         """
@@ -173,20 +544,17 @@ class InMemoryEventStore(EventStoreBase):
             event: The event to store
         """
         with self._lock:
-            # Check if event already exists
-            if event.id in self._events_by_id:
-                # Update existing event
-                existing_event = self._events_by_id[event.id]
-                index = self._events.index(existing_event)
-                self._events[index] = event
-            else:
-                # Add new event in chronological order
-                self._events.append(event)
-                # Sort to maintain chronological order
-                self._events.sort(key=lambda e: e.timestamp)
+            # Replace an existing event with the same ID
+            existing_event = self._events_by_id.get(event.id)
+            if existing_event is not None:
+                self._unindex_event(existing_event)
             
-            # Update ID lookup
+            self._index_event(event)
             self._events_by_id[event.id] = event
+            
+            if self._retention is not None:
+                self._retention.track(event)
+                self._retention.evict(self._retention.slice_size)
     
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
         """
@@ -221,117 +589,86 @@ class InMemoryEventStore(EventStoreBase):
             List of events matching the criteria, ordered chronologically
         """
         with self._lock:
-            # Start with all events (already chronologically ordered)
-            filtered_events = self._events.copy()
-            
-            # Apply time-based filtering
-            if start_time is not None:
-                filtered_events = [e for e in filtered_events if e.timestamp >= start_time]
-            
-            if end_time is not None:
-                filtered_events = [e for e in filtered_events if e.timestamp <= end_time]
-            
-            # Apply filter criteria
-            if filter_criteria:
-                filtered_events = self._apply_filter_criteria(filtered_events, filter_criteria)
-            
-            # Apply offset and limit
-            if offset > 0:
-                filtered_events = filtered_events[offset:]
-            
-            if limit is not None:
-                filtered_events = filtered_events[:limit]
+            events = self._iter_events(filter_criteria, start_time, end_time)
             
-            return filtered_events
+            stop = None if limit is None else offset + limit
+            return list(itertools.islice(events, offset, stop))
     
-    def _apply_filter_criteria(self, events: List[Event], criteria: Dict[str, Any]) -> List[Event]:
+    def _select_source(self,
+                       filter_criteria: Optional[Dict[str, Any]]) -> Tuple[_TimeOrderedEvents, Dict[str, Any]]:
         """
-        Apply filter criteria to a list of events.
+        Pick the smallest time-ordered list that can satisfy the criteria.
         
         Args:
-            events: List of events to filter
-            criteria: Filter criteria dictionary
+            filter_criteria: Dictionary of filter criteria
             
         Returns:
-            Filtered list of events
+            The list to scan and the criteria still left to check on it
         """
-        filtered_events = []
+        if not filter_criteria:
+            return self._log, {}
         
-        for event in events:
-            if self._event_matches_criteria(event, criteria):
-                filtered_events.append(event)
+        best: Optional[_TimeOrderedEvents] = None
+        best_key: Optional[str] = None
+        for key in self.INDEXED_FIELDS:
+            if key not in filter_criteria:
+                continue
+            try:
+                bucket = self._indexes[key].get(filter_criteria[key])
+            except TypeError:
+                continue  # Unhashable filter value; check it by scanning
+            if bucket is None:
+                return _TimeOrderedEvents(), {}
+            if best is None or len(bucket) < len(best):
+                best, best_key = bucket, key
         
-        return filtered_events
+        if best is None:
+            return self._log, filter_criteria
+        
+        remaining = {k: v for k, v in filter_criteria.items() if k != best_key}
+        return best, remaining
     
-    def _event_matches_criteria(self, event: Event, criteria: Dict[str, Any]) -> bool:
+    def _iter_events(self,
+                     filter_criteria: Optional[Dict[str, Any]] = None,
+                     start_time: Optional[datetime] = None,
+                     end_time: Optional[datetime] = None) -> Iterator[Event]:
         """
-        Check if an event matches the given criteria.
+        Lazily iterate the events matching criteria, in chronological order.
+        
+        Callers must hold the store lock while consuming the iterator.
         
         Args:
-            event: The event to check
-            criteria: The criteria to match against
+            filter_criteria: Dictionary of filter criteria
+            start_time: Start time for time-based filtering
+            end_time: End time for time-based filtering
             
         Returns:
-            True if the event matches all criteria, False otherwise
+            Iterator over matching events
         """
-        for key, value in criteria.items():
-            if key == "type":
-                if event.type != value:
-                    return False
-            elif key == "source":
-                if event.source != value:
-                    return False
-            elif key == "correlation_id":
-                if event.correlation_id != value:
-                    return False
-            elif key == "causation_id":
-                if event.causation_id != value:
-                    return False
-            elif key == "is_replay":
-                if event.is_replay != value:
-                    return False
-            elif key.startswith("payload."):
-                # Handle nested payload filtering
-                payload_key = key[8:]  # Remove "payload." prefix
-                if not self._check_nested_value(event.payload, payload_key, value):
-                    return False
-            elif key.startswith("metadata."):
-                # Handle nested metadata filtering
-                metadata_key = key[9:]  # Remove "metadata." prefix
-                if not self._check_nested_value(event.metadata, metadata_key, value):
-                    return False
-            else:
-                # Direct attribute check
-                if not hasattr(event, key) or getattr(event, key) != value:
-                    return False
-        
-        return True
+        source, remaining = self._select_source(filter_criteria)
+        events = source.iter_range(start_time, end_time)
+        if remaining:
+            events = (e for e in events if self._event_matches_criteria(e, remaining))
+        return events
     
-    def _check_nested_value(self, data: Dict[str, Any], key_path: str, expected_value: Any) -> bool:
+    def _apply_filter_criteria(self, events: List[Event], criteria: Dict[str, Any]) -> List[Event]:
         """
-        Check a nested value using dot notation.
+        Apply filter criteria to a list of events.
         
         Args:
-            data: The data dictionary to check
-            key_path: The key path (e.g., "user.id")
-            expected_value: The expected value
+            events: List of events to filter
+            criteria: Filter criteria dictionary
             
         Returns:
-            True if the nested value matches, False otherwise
+            Filtered list of events
         """
-        keys = key_path.split(".")
-        current = data
-        
-        for key in keys[:-1]:
-            if not isinstance(current, dict) or key not in current:
-                return False
-            current = current[key]
+        filtered_events = []
         
-        final_key = keys[-1]
-        if not isinstance(current, dict) or final_key not in current:
-            return False
+        for event in events:
+            if self._event_matches_criteria(event, criteria):
+                filtered_events.append(event)
         
-        return current[final_key] == expected_value
+        return filtered_events
     
     def cleanup_expired_events(self, retention_policy: RetentionPolicy) -> int:
         """
@@ -344,6 +681,10 @@ class InMemoryEventStore(EventStoreBase):
             Number of events removed
         """
         with self._lock:
+            # The incrementally enforced policy only needs its heaps drained
+            if self._retention is not None and retention_policy is self._retention.policy:
+                return self._retention.evict()
+            
             initial_count = len(self._events)
             current_time = time.time()
             
@@ -388,7 +729,7 @@ class InMemoryEventStore(EventStoreBase):
                 # Re-sort by timestamp for chronological order
                 non_expired_events.sort(key=lambda e: e.timestamp)
             
-            self._events = non_expired_events
+            self._replace_events(non_expired_events)
             return len(removed_events)
     
     def _cleanup_with_correlation_preservation(self, 
@@ -460,9 +801,8 @@ class InMemoryEventStore(EventStoreBase):
             
             kept_events = kept_events[events_to_remove:]
         
-        # Sort final events by timestamp
-        kept_events.sort(key=lambda e: e.timestamp)
-        self._events = kept_events
+        # Rebuild the ordered log and indexes from the survivors
+        self._replace_events(kept_events)
         
         return initial_count - len(self._events)
     
@@ -477,11 +817,13 @@ class InMemoryEventStore(EventStoreBase):
             Number of events matching the criteria
         """
         with self._lock:
-            if filter_criteria is None:
-                return len(self._events)
+            if not filter_criteria:
+                return len(self._log)
             
-            filtered_events = self._apply_filter_criteria(self._events, filter_criteria)
-            return len(filtered_events)
+            source, remaining = self._select_source(filter_criteria)
+            if not remaining:
+                return len(source)
+            return sum(1 for e in source.events if self._event_matches_criteria(e, remaining))
     
     def clear(self) -> int:
         """
@@ -492,8 +834,7 @@ class InMemoryEventStore(EventStoreBase):
         """
         with self._lock:
             count = len(self._events)
-            self._events.clear()
-            self._events_by_id.clear()
+            self._replace_events([])
             return count
     
     def get_stats(self) -> Dict[str, Any]:
@@ -513,22 +854,24 @@ class InMemoryEventStore(EventStoreBase):
                     "sources": {}
                 }
             
-            # Count events by type and source
-            event_types = {}
-            sources = {}
-            
-            for event in self._events:
-                event_types[event.type] = event_types.get(event.type, 0) + 1
-                sources[event.source] = sources.get(event.source, 0) + 1
+            # Count events by type and source from the index sizes
+            event_types = {key: len(bucket) for key, bucket in self._indexes["type"].items()}
+            sources = {key: len(bucket) for key, bucket in self._indexes["source"].items()}
             
-            return {
+            stats = {
                 "total_events": len(self._events),
                 "oldest_event": self._events[0].timestamp.isoformat(),
                 "newest_event": self._events[-1].timestamp.isoformat(),
                 "event_types": event_types,
                 "sources": sources
-            } 
-   def get_events_by_correlation_id(self, correlation_id: str) -> List[Event]:
+            }
+            if self._retention is not None:
+                stats["retention"] = self._retention.get_stats()
+            if self._search_index is not None:
+                stats["search_index"] = self._search_index.get_stats()
+            return stats
+    
+    def get_events_by_correlation_id(self, correlation_id: str) -> List[Event]:
         """
         Get all events with the same correlation ID.
         
@@ -550,16 +893,7 @@ class InMemoryEventStore(EventStoreBase):
         Returns:
             List of matching events
         """
-        with self._lock:
-            from .event_routing import WildcardPatternMatcher
-            matcher = WildcardPatternMatcher()
-            
-            matching_events = []
-            for event in self._events:
-                if matcher.matches_event_type(event.type, type_pattern):
-                    matching_events.append(event)
-            
-            return matching_events
+        return self._get_events_by_indexed_pattern("type", type_pattern)
     
     def get_events_by_source_pattern(self, source_pattern: str) -> List[Event]:
         """
@@ -571,16 +905,33 @@ class InMemoryEventStore(EventStoreBase):
         Returns:
             List of matching events
         """
+        return self._get_events_by_indexed_pattern("source", source_pattern)
+    
+    def _get_events_by_indexed_pattern(self, field_name: str, pattern: str) -> List[Event]:
+        """
+        Match a wildcard pattern against the distinct values of an indexed field.
+        
+        The pattern is evaluated once per distinct value rather than once per
+        event, and the matching buckets are merged in timestamp order.
+        
+        Args:
+            field_name: "type" or "source"
+            pattern: Wildcard pattern
+            
+        Returns:
+            List of matching events in chronological order
+        """
         with self._lock:
             from .event_routing import WildcardPatternMatcher
             matcher = WildcardPatternMatcher()
             
-            matching_events = []
-            for event in self._events:
-                if matcher.matches_event_type(event.source, source_pattern):
-                    matching_events.append(event)
-            
-            return matching_events
+            buckets = [
+                bucket.events for value, bucket in self._indexes[field_name].items()
+                if isinstance(value, str) and matcher.matches_event_type(value, pattern)
+            ]
+            if len(buckets) == 1:
+                return list(buckets[0])
+            return list(heapq.merge(*buckets, key=lambda e: e.timestamp))
     
     def search_events(self, 
                      query: str, 
@@ -588,6 +939,13 @@ class InMemoryEventStore(EventStoreBase):
         """
         Search events using text search across specified fields.
         
+        Plain queries match events containing the query as a substring.
+        Upper-case ``AND``/``OR`` combine terms, and ``field:text`` scopes a
+        term to one field or payload/metadata path (e.g.
+        ``payload.status:error``). With the search index enabled, results
+        come from posting-list intersection; queries the index cannot answer
+        fall back to scanning.
+        
         Args:
             query: Search query string
             search_fields: Fields to search in (defaults to payload and metadata)
@@ -598,59 +956,19 @@ class InMemoryEventStore(EventStoreBase):
         if search_fields is None:
             search_fields = ["payload", "metadata"]
         
-        with self._lock:
-            matching_events = []
-            query_lower = query.lower()
-            
-            for event in self._events:
-                found = False
-                
-                for field in search_fields:
-                    if field == "payload":
-                        if self._search_in_dict(event.payload, query_lower):
-                            found = True
-                            break
-                    elif field == "metadata":
-                        if self._search_in_dict(event.metadata, query_lower):
-                            found = True
-                            break
-                    elif hasattr(event, field):
-                        field_value = str(getattr(event, field)).lower()
-                        if query_lower in field_value:
-                            found = True
-                            break
-                
-                if found:
-                    matching_events.append(event)
-            
-            return matching_events
-    
-    def _search_in_dict(self, data: Dict[str, Any], query: str) -> bool:
-        """
-        Search for a query string within a dictionary recursively.
+        parsed = SearchQuery.parse(query)
         
-        Args:
-            data: Dictionary to search in
-            query: Query string (already lowercased)
+        with self._lock:
+            if self._search_index is not None:
+                event_ids = self._search_index.search(parsed, search_fields)
+                if event_ids is not None:
+                    events = [self._events_by_id[event_id] for event_id in event_ids]
+                    if not all(term.is_single_word for term in parsed.terms):
+                        events = [e for e in events if parsed.matches(e, search_fields)]
+                    events.sort(key=lambda e: (e.timestamp, self._search_index.sequence(e.id)))
+                    return events
             
-        Returns:
-            True if query found, False otherwise
-        """
-        for key, value in data.items():
-            if isinstance(value, dict):
-                if self._search_in_dict(value, query):
-                    return True
-            elif isinstance(value, (list, tuple)):
-                for item in value:
-                    if isinstance(item, dict):
-                        if self._search_in_dict(item, query):
-                            return True
-                    elif query in str(item).lower():
-                        return True
-            elif query in str(value).lower():
-                return True
-        
-        return False
+            return [event for event in self._events if parsed.matches(event, search_fields)]
     
     def get_event_timeline(self, 
                           correlation_id: str, 
@@ -666,30 +984,61 @@ class InMemoryEventStore(EventStoreBase):
             List of events in chronological order showing the event timeline
         """
         with self._lock:
-            timeline_events = []
+            bucket = self._indexes["correlation_id"].get(correlation_id)
+            chain = bucket.events if bucket is not None else []
+            if not include_causation:
+                return list(chain)
             
-            # Get all events with the same correlation ID
-            correlated_events = self.get_events_by_correlation_id(correlation_id)
-            timeline_events.extend(correlated_events)
+            # The correlation and causation indexes form the correlation graph
+            return merge_timeline(chain, self._events_by_id.get, self._caused_by)
+    
+    def _caused_by(self, event_id: str) -> List[Event]:
+        """Events whose causation_id is the given event, in chronological order."""
+        bucket = self._indexes["causation_id"].get(event_id)
+        return bucket.events if bucket is not None else []
+    
+    def get_caused_events(self, event_id: str) -> List[Event]:
+        """
+        Get the events directly caused by an event.
+        
+        Args:
+            event_id: The ID of the parent event
             
-            if include_causation:
-                # Find events that caused or were caused by these events
-                event_ids = {event.id for event in correlated_events}
-                
-                for event in self._events:
-                    # Include events that caused any of our correlated events
-                    if event.id in {e.causation_id for e in correlated_events if e.causation_id}:
-                        if event not in timeline_events:
-                            timeline_events.append(event)
-                    
-                    # Include events that were caused by any of our correlated events
-                    if event.causation_id in event_ids:
-                        if event not in timeline_events:
-                            timeline_events.append(event)
-            
-            # Sort by timestamp
-            timeline_events.sort(key=lambda e: e.timestamp)
-            return timeline_events
+        Returns:
+            List of child events in chronological order
+        """
+        with self._lock:
+            return list(self._caused_by(event_id))
+    
+    def get_causation_chain(self, event_id: str) -> List[Event]:
+        """
+        Get the events that led to an event, following causation links.
+        
+        Args:
+            event_id: The ID of the event
+            
+        Returns:
+            List of events from the root cause to the event (empty if unknown)
+        """
+        with self._lock:
+            event = self._events_by_id.get(event_id)
+            if event is None:
+                return []
+            return walk_ancestors(event, self._events_by_id.get)
+    
+    def get_descendant_events(self, event_id: str, max_depth: Optional[int] = None) -> List[Event]:
+        """
+        Get every event caused, directly or transitively, by an event.
+        
+        Args:
+            event_id: The ID of the event
+            max_depth: Maximum number of causation hops (None = unlimited)
+            
+        Returns:
+            List of descendant events in breadth-first order
+        """
+        with self._lock:
+            return walk_descendants(event_id, self._caused_by, max_depth)
     
     def aggregate_events(self, 
                         group_by: str, 
@@ -758,80 +1107,8 @@ class InMemoryEventStore(EventStoreBase):
                 current = current[key]
             return current
         except (KeyError, TypeError):
-            return default    
-   
- @classmethod
-    def create_age_based_policy(cls, max_age_hours: float) -> 'RetentionPolicy':
-        """
-        Create an age-based retention policy.
-        
-        Args:
-            max_age_hours: Maximum age in hours
-            
-        Returns:
-            RetentionPolicy configured for age-based retention
-        """
-        return cls(max_age_seconds=max_age_hours * 3600)
+            return default
     
-    @classmethod
-    def create_count_based_policy(cls, max_count: int) -> 'RetentionPolicy':
-        """
-        Create a count-based retention policy.
-        
-        Args:
-            max_count: Maximum number of events to retain
-            
-        Returns:
-            RetentionPolicy configured for count-based retention
-        """
-        return cls(max_count=max_count)
-    
-    @classmethod
-    def create_combined_policy(cls, 
-                              max_age_hours: float, 
-                              max_count: int,
-                              preserve_correlations: bool = True) -> 'RetentionPolicy':
-        """
-        Create a combined age and count-based retention policy.
-        
-        Args:
-            max_age_hours: Maximum age in hours
-            max_count: Maximum number of events to retain
-            preserve_correlations: Whether to preserve correlation chains
-            
-        Returns:
-            RetentionPolicy configured for combined retention
-        """
-        return cls(
-            max_age_seconds=max_age_hours * 3600,
-            max_count=max_count,
-            preserve_correlations=preserve_correlations
-        )
-    
-    def add_event_type_policy(self, event_type: str, policy: 'RetentionPolicy') -> None:
-        """
-        Add a specific retention policy for an event type.
-        
-        Args:
-            event_type: The event type to apply the policy to
-            policy: The retention policy for this event type
-        """
-        self.event_type_policies[event_type] = policy
-    
-    def get_effective_policy(self, event: Event) -> 'RetentionPolicy':
-        """
-        Get the effective retention policy for a specific event.
-        
-        Args:
-            event: The event to get the policy for
-            
-        Returns:
-            The effective retention policy
-        """
-        if event.type in self.event_type_policies:
-            return self.event_type_policies[event.type]
-        return self    
-
     def get_retention_stats(self, retention_policy: RetentionPolicy) -> Dict[str, Any]:
         """
         Get statistics about what would be affected by a retention policy.
@@ -863,9 +1140,9 @@ class InMemoryEventStore(EventStoreBase):
                 else:
                     events_to_keep += 1
             
-            # Calculate age statistics
-            oldest_event = min(self._events, key=lambda e: e.timestamp)
-            newest_event = max(self._events, key=lambda e: e.timestamp)
+            # Calculate age statistics (the log is time-ordered)
+            oldest_event = self._events[0]
+            newest_event = self._events[-1]
             
             oldest_age_hours = (current_time - oldest_event.timestamp.timestamp()) / 3600
             newest_age_hours = (current_time - newest_event.timestamp.timestamp()) / 3600
@@ -0,0 +1,203 @@
+"""
+Pattern compilation for the Phoenix Hydra Event Routing System.
+
+Turns an event pattern (type pattern plus attribute filters) into a
+reusable predicate once, so matching an event no longer re-parses the
+pattern: the type check is an exact/prefix/suffix comparison or a
+precompiled regex, attribute paths are pre-split, and each operator is a
+closure with its operand prepared (``$in``/``$nin`` use frozen sets).
+The semantics are those of ``WildcardPatternMatcher.matches_event_type``
+and ``EventPattern.matches_attributes``.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+TypePredicate = Callable[[str], bool]
+ValuePredicate = Callable[[Any], bool]
+
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def compile_type_matcher(pattern_str: str) -> TypePredicate:
+    """
+    Compile an event type pattern into a predicate.
+
+    Args:
+        pattern_str: Exact type, wildcard (``*``/``**``), ``regex:`` or ``!`` pattern
+
+    Returns:
+        Function returning True if an event type matches the pattern
+    """
+    if pattern_str.startswith("!"):
+        inner = compile_type_matcher(pattern_str[1:])
+        return lambda event_type: not inner(event_type)
+
+    if pattern_str.startswith("regex:"):
+        try:
+            regex = re.compile(pattern_str[6:])
+        except re.error:
+            regex = re.compile(r"^$")
+        return lambda event_type: regex.match(event_type) is not None
+
+    if pattern_str in ("*", "**"):
+        return lambda event_type: True
+
+    if "*" not in pattern_str:
+        return pattern_str.__eq__
+
+    # "prefix.**" and "**.suffix" need no regex
+    head, globstar, tail = pattern_str.partition("**")
+    if globstar and "*" not in head and "*" not in tail:
+        if not tail:
+            return lambda event_type: event_type.startswith(head)
+        if not head:
+            return lambda event_type: event_type.endswith(tail)
+
+    regex_str = re.escape(pattern_str).replace('\\*\\*', '.*').replace('\\*', '[^.]*')
+    regex = re.compile(f"^{regex_str}$")
+    return lambda event_type: regex.match(event_type) is not None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _membership(operand: Any) -> ValuePredicate:
+    """Build a membership test, using a frozen set when the operand allows it."""
+    if isinstance(operand, (list, tuple, set, frozenset)):
+        try:
+            frozen = frozenset(operand)
+        except TypeError:
+            pass
+        else:
+            def contains(value: Any) -> bool:
+                try:
+                    return value in frozen
+                except TypeError:  # Unhashable value; compare item by item
+                    return value in operand
+            return contains
+    return lambda value: value in operand
+
+
+def _compile_operator(op: str, operand: Any) -> Optional[ValuePredicate]:
+    """Build the predicate for one ``$`` operator (None for no-ops like ``$exists``)."""
+    if op == "$eq":
+        return lambda value: value == operand
+    if op == "$ne":
+        return lambda value: value != operand
+    if op == "$gt":
+        return lambda value: _is_number(value) and value > operand
+    if op == "$gte":
+        return lambda value: _is_number(value) and value >= operand
+    if op == "$lt":
+        return lambda value: _is_number(value) and value < operand
+    if op == "$lte":
+        return lambda value: _is_number(value) and value <= operand
+    if op == "$in":
+        return _membership(operand)
+    if op == "$nin":
+        contains = _membership(operand)
+        return lambda value: not contains(value)
+    # "$exists" is satisfied by the key lookup; unknown operators are ignored
+    return None
+
+
+def _compile_value(expected: Any) -> ValuePredicate:
+    """Build the predicate for an attribute filter value."""
+    if isinstance(expected, dict) and any(k.startswith("$") for k in expected.keys()):
+        checks = [
+            predicate for predicate in
+            (_compile_operator(op, operand) for op, operand in expected.items())
+            if predicate is not None
+        ]
+        if len(checks) == 1:
+            return checks[0]
+        return lambda value: all(check(value) for check in checks)
+    return lambda value: value == expected
+
+
+def _lookup(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    """Resolve a pre-split attribute path, returning _MISSING if absent."""
+    current = data
+    for part in path[:-1]:
+        current = current.get(part, _MISSING)
+        if not isinstance(current, dict):
+            return _MISSING
+    return current.get(path[-1], _MISSING)
+
+
+class CompiledPattern:
+    """
+    Reusable predicate for an event pattern.
+
+    Attributes:
+        event_type: The type pattern this was compiled from
+        attributes: The attribute filters this was compiled from
+        paths: Pre-split attribute paths referenced by the filters
+    """
+
+    __slots__ = ("event_type", "attributes", "paths", "matches_type", "_checks")
+
+    def __init__(self, event_type: str, attributes: Optional[Dict[str, Any]] = None):
+        """
+        Compile a pattern.
+
+        Args:
+            event_type: Event type pattern (can include wildcards)
+            attributes: Attribute filters for matching events
+        """
+        self.event_type = event_type
+        self.attributes = attributes if attributes is not None else {}
+        self.matches_type: TypePredicate = compile_type_matcher(event_type)
+
+        checks: List[Tuple[Tuple[str, ...], ValuePredicate]] = []
+        for key, expected in self.attributes.items():
+            checks.append((tuple(key.split(".")), _compile_value(expected)))
+        self._checks = checks
+        self.paths: Tuple[Tuple[str, ...], ...] = tuple(path for path, _ in checks)
+
+    def matches_attributes(self, event_attributes: Dict[str, Any]) -> bool:
+        """
+        Check if the attribute filters match.
+
+        Args:
+            event_attributes: The event attributes (payload) to check
+
+        Returns:
+            True if every filter matches, False otherwise
+        """
+        for path, check in self._checks:
+            value = _lookup(event_attributes, path)
+            if value is _MISSING or not check(value):
+                return False
+        return True
+
+    def matches(self, event: Any) -> bool:
+        """
+        Check if an event matches the type pattern and attribute filters.
+
+        Args:
+            event: The event to check
+
+        Returns:
+            True if the event matches, False otherwise
+        """
+        return self.matches_type(event.type) and self.matches_attributes(event.payload)
+
+    def referenced_values(self, event_attributes: Dict[str, Any]) -> Tuple[Any, ...]:
+        """
+        Extract the values of the attributes this pattern looks at.
+
+        Two payloads with the same referenced values always give the same
+        attribute match result.
+
+        Args:
+            event_attributes: The event attributes (payload)
+
+        Returns:
+            Tuple of values (a sentinel for missing ones), one per path
+        """
+        return tuple(_lookup(event_attributes, path) for path in self.paths)
@@ -0,0 +1,262 @@
+"""
+Incremental retention for Phoenix Hydra Event Routing System.
+
+Instead of sweeping the whole store, the retention engine tracks every
+stored event in an expiry heap and a count-eviction heap and removes
+expired events in small bounded slices. Correlation chains are reference
+counted so ``preserve_correlations`` never needs a global scan.
+"""
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .event_routing import Event
+from .event_store import RetentionPolicy
+
+
+@dataclass(eq=False)
+class _RetentionEntry:
+    """Retention state of one tracked event."""
+    event: Event
+    seq: int
+    expired: bool = False
+
+
+@dataclass
+class _ChainRefs:
+    """Members of a correlation chain and how many of them are still unexpired."""
+    members: Set[str] = field(default_factory=set)
+    live: int = 0
+
+
+class RetentionEngine:
+    """
+    Applies a retention policy incrementally as events are stored.
+
+    Expiry deadlines (timestamp + effective max age) sit in a min-heap, so
+    finding expired events costs O(log n) each rather than a pass over the
+    store. Count-based retention pops the oldest (or, with
+    ``priority_based``, the lowest-priority) event from a second heap.
+    Heap entries are invalidated lazily and compacted when stale entries
+    outnumber live ones.
+
+    With ``preserve_correlations`` an expired event that belongs to a
+    correlation chain is only marked expired; the chain is removed as a
+    whole once its count of unexpired members drops to zero.
+
+    The engine does no locking of its own; the owning store calls it while
+    holding its lock.
+    """
+
+    def __init__(self,
+                 policy: RetentionPolicy,
+                 remove: Callable[[Event], None],
+                 slice_size: int = 64,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize the retention engine.
+
+        Args:
+            policy: The retention policy to enforce
+            remove: Callback that removes an event from the owning store
+            slice_size: Maximum evictions per incremental step
+            clock: Source of the current time in seconds since the epoch
+        """
+        if slice_size <= 0:
+            raise ValueError("slice_size must be positive")
+
+        self.policy = policy
+        self.slice_size = slice_size
+        self._remove = remove
+        self._clock = clock
+        self._sequence = itertools.count()
+        self._entries: Dict[str, _RetentionEntry] = {}
+        self._expiry_heap: List[Tuple[float, int, str]] = []
+        self._count_heap: List[Tuple[Any, ...]] = []
+        self._chains: Dict[str, _ChainRefs] = {}
+        self._stats = {
+            "expired": 0,
+            "count_evicted": 0,
+            "chains_removed": 0,
+            "compactions": 0,
+        }
+
+    def track(self, event: Event) -> None:
+        """
+        Start tracking a newly stored event.
+
+        Args:
+            event: The stored event
+        """
+        if event.id in self._entries:
+            self.untrack(event.id)
+
+        entry = _RetentionEntry(event, next(self._sequence))
+        self._entries[event.id] = entry
+
+        max_age = self.policy.get_effective_policy(event).max_age_seconds
+        if max_age is not None:
+            deadline = event.timestamp.timestamp() + max_age
+            heapq.heappush(self._expiry_heap, (deadline, entry.seq, event.id))
+
+        if self.policy.max_count is not None:
+            heapq.heappush(self._count_heap, self._count_key(entry))
+
+        if self.policy.preserve_correlations and event.correlation_id:
+            chain = self._chains.get(event.correlation_id)
+            if chain is None:
+                chain = self._chains[event.correlation_id] = _ChainRefs()
+            chain.members.add(event.id)
+            chain.live += 1
+
+    def untrack(self, event_id: str) -> None:
+        """
+        Stop tracking an event that the store removed or replaced itself.
+
+        Args:
+            event_id: ID of the event
+        """
+        entry = self._entries.pop(event_id, None)
+        if entry is not None:
+            self._release_chain_ref(entry)
+
+    def reset(self) -> None:
+        """Forget every tracked event."""
+        self._entries.clear()
+        self._expiry_heap.clear()
+        self._count_heap.clear()
+        self._chains.clear()
+
+    def _count_key(self, entry: _RetentionEntry) -> Tuple[Any, ...]:
+        """Heap key for count-based eviction: smallest is evicted first."""
+        if self.policy.priority_based:
+            priority = entry.event.metadata.get("priority", 0)
+            return (priority, entry.event.timestamp, entry.seq, entry.event.id)
+        return (entry.event.timestamp, entry.seq, entry.event.id)
+
+    def _release_chain_ref(self, entry: _RetentionEntry) -> Optional[_ChainRefs]:
+        """Remove an entry from its correlation chain and return the chain if it survives."""
+        correlation_id = entry.event.correlation_id
+        chain = self._chains.get(correlation_id) if correlation_id else None
+        if chain is None or entry.event.id not in chain.members:
+            return None
+
+        chain.members.discard(entry.event.id)
+        if not entry.expired:
+            chain.live -= 1
+        if not chain.members:
+            del self._chains[correlation_id]
+            return None
+        return chain
+
+    def _drop(self, entry: _RetentionEntry) -> int:
+        """Remove a tracked event from the engine and the store."""
+        del self._entries[entry.event.id]
+        self._release_chain_ref(entry)
+        self._remove(entry.event)
+        return 1
+
+    def _drop_chain(self, correlation_id: str) -> int:
+        """Remove every member of a correlation chain."""
+        chain = self._chains.pop(correlation_id)
+        for event_id in chain.members:
+            entry = self._entries.pop(event_id)
+            self._remove(entry.event)
+        self._stats["chains_removed"] += 1
+        return len(chain.members)
+
+    def _expire(self, entry: _RetentionEntry) -> int:
+        """Handle an event whose deadline has passed."""
+        correlation_id = entry.event.correlation_id
+        if not (self.policy.preserve_correlations and correlation_id in self._chains):
+            self._stats["expired"] += 1
+            return self._drop(entry)
+
+        entry.expired = True
+        chain = self._chains[correlation_id]
+        chain.live -= 1
+        if chain.live > 0:
+            return 0
+
+        removed = self._drop_chain(correlation_id)
+        self._stats["expired"] += removed
+        return removed
+
+    def evict(self,
+              max_items: Optional[int] = None,
+              current_time: Optional[float] = None) -> int:
+        """
+        Remove events that the policy no longer retains.
+
+        Args:
+            max_items: Upper bound on heap entries processed (None = no bound)
+            current_time: Current time in seconds since the epoch
+
+        Returns:
+            Number of events removed from the store
+        """
+        if current_time is None:
+            current_time = self._clock()
+        budget = float("inf") if max_items is None else max_items
+        removed = 0
+
+        heap = self._expiry_heap
+        while heap and heap[0][0] < current_time and budget > 0:
+            _, seq, event_id = heapq.heappop(heap)
+            entry = self._entries.get(event_id)
+            if entry is None or entry.seq != seq or entry.expired:
+                continue
+            budget -= 1
+            removed += self._expire(entry)
+
+        max_count = self.policy.max_count
+        if max_count is not None:
+            heap = self._count_heap
+            while len(self._entries) > max_count and heap and budget > 0:
+                key = heapq.heappop(heap)
+                entry = self._entries.get(key[-1])
+                if entry is None or entry.seq != key[-2]:
+                    continue
+                budget -= 1
+                self._stats["count_evicted"] += 1
+                removed += self._drop(entry)
+
+        self._maybe_compact()
+        return removed
+
+    def _maybe_compact(self) -> None:
+        """Drop stale heap entries once they outnumber tracked events."""
+        limit = 2 * len(self._entries) + self.slice_size
+        if len(self._expiry_heap) > limit:
+            self._expiry_heap = [
+                item for item in self._expiry_heap
+                if item[2] in self._entries and self._entries[item[2]].seq == item[1]
+            ]
+            heapq.heapify(self._expiry_heap)
+            self._stats["compactions"] += 1
+        if len(self._count_heap) > limit:
+            self._count_heap = [
+                key for key in self._count_heap
+                if key[-1] in self._entries and self._entries[key[-1]].seq == key[-2]
+            ]
+            heapq.heapify(self._count_heap)
+            self._stats["compactions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get retention statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        next_deadline = self._expiry_heap[0][0] if self._expiry_heap else None
+        return {
+            "tracked_events": len(self._entries),
+            "pending_deadlines": len(self._expiry_heap),
+            "next_deadline": next_deadline,
+            "tracked_chains": len(self._chains),
+            **self._stats,
+        }
@@ -0,0 +1,374 @@
+"""
+Full-text search support for Phoenix Hydra event stores.
+
+Provides the query language used by ``InMemoryEventStore.search_events``
+(AND/OR terms and ``field:term`` scoping) and an optional inverted index
+from tokenized field values to the IDs of the events containing them.
+"""
+
+import bisect
+import itertools
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .event_routing import Event
+
+_WORD = re.compile(r"\w+")
+
+# Event attributes that can be searched and indexed besides payload/metadata
+_INDEXED_ATTRIBUTES = ("type", "source")
+# Searchable but never indexed: every event brings new IDs, and the store
+# already looks them up exactly
+_ID_ATTRIBUTES = ("id", "correlation_id", "causation_id")
+_SEARCHABLE_ATTRIBUTES = _INDEXED_ATTRIBUTES + _ID_ATTRIBUTES
+_DOCUMENT_FIELDS = ("payload", "metadata")
+
+# Tokens longer than this are matched by scanning instead of by suffix, as
+# their suffixes would take quadratic space
+_MAX_SUFFIX_TOKEN = 64
+
+
+def _iter_leaves(data: Dict[str, Any], path: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (dotted path, value) for every searchable value in a dictionary.
+
+    Lists are flattened one level, like the substring search always did.
+    """
+    for key, value in data.items():
+        value_path = f"{path}.{key}"
+        if isinstance(value, dict):
+            yield from _iter_leaves(value, value_path)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                if isinstance(item, dict):
+                    yield from _iter_leaves(item, value_path)
+                else:
+                    yield value_path, item
+        else:
+            yield value_path, value
+
+
+def _in_scope(path: str, scope: str) -> bool:
+    """Check whether a leaf path lies within a search scope."""
+    return path == scope or path.startswith(scope + ".")
+
+
+def _scope_leaves(event: Event, scope: str) -> Iterator[Tuple[str, Any]]:
+    """Yield the leaves of an event that a search scope covers."""
+    group = scope.split(".", 1)[0]
+    if group in _DOCUMENT_FIELDS:
+        for path, value in _iter_leaves(getattr(event, group), group):
+            if _in_scope(path, scope):
+                yield path, value
+    elif hasattr(event, scope):
+        yield scope, getattr(event, scope)
+
+
+def _is_indexed_scope(scope: str) -> bool:
+    """Check whether the inverted index covers a search scope."""
+    return scope.split(".", 1)[0] in _DOCUMENT_FIELDS or scope in _INDEXED_ATTRIBUTES
+
+
+@dataclass
+class SearchTerm:
+    """
+    A single search term, optionally scoped to a field.
+
+    Attributes:
+        text: Lowercased text to look for
+        field_name: Field or dotted path to search in (None = the query's fields)
+    """
+    text: str
+    field_name: Optional[str] = None
+    words: List[str] = field(init=False)
+
+    def __post_init__(self):
+        self.words = _WORD.findall(self.text)
+
+    @property
+    def is_single_word(self) -> bool:
+        """True if the text is one word, so the index answers it exactly."""
+        return len(self.words) == 1 and self.words[0] == self.text
+
+    def matches(self, event: Event, search_fields: List[str]) -> bool:
+        """
+        Check whether the term occurs in an event (substring match).
+
+        Args:
+            event: The event to check
+            search_fields: Fields searched when the term has no field
+
+        Returns:
+            True if some value in scope contains the term
+        """
+        scopes = [self.field_name] if self.field_name else search_fields
+        for scope in scopes:
+            for _, value in _scope_leaves(event, scope):
+                if self.text in str(value).lower():
+                    return True
+        return False
+
+
+@dataclass
+class SearchQuery:
+    """
+    A parsed search query: OR of groups, each an AND of terms.
+
+    Attributes:
+        groups: Alternatives; an event matches if all terms of any group match
+    """
+    groups: List[List[SearchTerm]]
+
+    @classmethod
+    def parse(cls, query: str) -> 'SearchQuery':
+        """
+        Parse a search query.
+
+        ``AND``/``OR`` (upper case) combine whitespace-separated terms, with
+        AND implied between adjacent terms and binding tighter than OR. A
+        term written ``field:text`` only searches that field, e.g.
+        ``payload.status:error``. A query without operators or scoped terms
+        is a single substring term, exactly as before.
+
+        Args:
+            query: The query string
+
+        Returns:
+            The parsed query
+        """
+        parts = query.split()
+        structured = any(part in ("AND", "OR") or cls._split_field(part) for part in parts)
+        if not structured:
+            return cls([[SearchTerm(query.lower())]])
+
+        groups: List[List[SearchTerm]] = [[]]
+        for part in parts:
+            if part == "OR":
+                groups.append([])
+            elif part != "AND":
+                scoped = cls._split_field(part)
+                if scoped:
+                    groups[-1].append(SearchTerm(scoped[1].lower(), scoped[0]))
+                else:
+                    groups[-1].append(SearchTerm(part.lower()))
+        return cls([group for group in groups if group])
+
+    @staticmethod
+    def _split_field(part: str) -> Optional[Tuple[str, str]]:
+        """Split ``field:text`` when the field names something searchable."""
+        name, separator, text = part.partition(":")
+        if not separator or not text:
+            return None
+        if name.split(".", 1)[0] in _DOCUMENT_FIELDS or name in _SEARCHABLE_ATTRIBUTES:
+            return name, text
+        return None
+
+    @property
+    def terms(self) -> List[SearchTerm]:
+        """All terms of the query."""
+        return [term for group in self.groups for term in group]
+
+    def matches(self, event: Event, search_fields: List[str]) -> bool:
+        """
+        Evaluate the query against an event by scanning its values.
+
+        Args:
+            event: The event to check
+            search_fields: Fields searched by unscoped terms
+
+        Returns:
+            True if the event matches
+        """
+        return any(
+            all(term.matches(event, search_fields) for term in group)
+            for group in self.groups
+        )
+
+
+class _TokenVocabulary:
+    """
+    The tokens of one field path, searchable by substring.
+
+    Every suffix of every token is kept in a sorted list; the tokens that
+    contain a word are the owners of the suffixes that start with it,
+    which are adjacent in the list and found by bisection.
+    """
+
+    def __init__(self):
+        """Initialize an empty vocabulary."""
+        self._suffixes: List[str] = []
+        self._owners: Dict[str, Set[str]] = {}
+        self._long_tokens: Set[str] = set()
+
+    def add(self, token: str) -> None:
+        """Add a token that is new to the path."""
+        if len(token) > _MAX_SUFFIX_TOKEN:
+            self._long_tokens.add(token)
+            return
+        for start in range(len(token)):
+            suffix = token[start:]
+            owners = self._owners.get(suffix)
+            if owners is None:
+                self._owners[suffix] = {token}
+                bisect.insort(self._suffixes, suffix)
+            else:
+                owners.add(token)
+
+    def remove(self, token: str) -> None:
+        """Remove a token no event of the path contains any more."""
+        if len(token) > _MAX_SUFFIX_TOKEN:
+            self._long_tokens.discard(token)
+            return
+        for start in range(len(token)):
+            suffix = token[start:]
+            owners = self._owners[suffix]
+            owners.discard(token)
+            if not owners:
+                del self._owners[suffix]
+                del self._suffixes[bisect.bisect_left(self._suffixes, suffix)]
+
+    def containing(self, word: str) -> Set[str]:
+        """Tokens that contain a word."""
+        tokens: Set[str] = set()
+        index = bisect.bisect_left(self._suffixes, word)
+        while index < len(self._suffixes) and self._suffixes[index].startswith(word):
+            tokens |= self._owners[self._suffixes[index]]
+            index += 1
+        tokens.update(token for token in self._long_tokens if word in token)
+        return tokens
+
+
+class EventSearchIndex:
+    """
+    Inverted index from (field path, token) to the IDs of matching events.
+
+    Tokens are the ``\\w+`` runs of each lowercased value. Because a
+    single-word search term can only occur inside one such run, the tokens
+    containing the word, found through each path's sorted suffix list,
+    give exactly the events a substring scan would find. Multi-word terms
+    use the index to narrow candidates, which the caller then verifies.
+    Event, correlation and causation IDs are not indexed.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[str, Set[str]]] = {}
+        self._vocabularies: Dict[str, _TokenVocabulary] = {}
+        self._documents: Dict[str, Tuple[int, List[Tuple[str, str]]]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, event: Event) -> None:
+        """
+        Index an event, replacing any earlier event with the same ID.
+
+        Args:
+            event: The event to index
+        """
+        self.remove(event.id)
+
+        keys = set()
+        for scope in _DOCUMENT_FIELDS + _INDEXED_ATTRIBUTES:
+            for path, value in _scope_leaves(event, scope):
+                for token in _WORD.findall(str(value).lower()):
+                    keys.add((path, token))
+
+        for path, token in keys:
+            tokens = self._postings.setdefault(path, {})
+            postings = tokens.get(token)
+            if postings is None:
+                postings = tokens[token] = set()
+                self._vocabularies.setdefault(path, _TokenVocabulary()).add(token)
+            postings.add(event.id)
+        self._documents[event.id] = (next(self._sequence), list(keys))
+
+    def remove(self, event_id: str) -> None:
+        """
+        Remove an event from the index.
+
+        Args:
+            event_id: ID of the event
+        """
+        document = self._documents.pop(event_id, None)
+        if document is None:
+            return
+
+        for path, token in document[1]:
+            tokens = self._postings[path]
+            postings = tokens[token]
+            postings.discard(event_id)
+            if not postings:
+                del tokens[token]
+                self._vocabularies[path].remove(token)
+                if not tokens:
+                    del self._postings[path]
+                    del self._vocabularies[path]
+
+    def clear(self) -> None:
+        """Remove every event from the index."""
+        self._postings.clear()
+        self._vocabularies.clear()
+        self._documents.clear()
+
+    def sequence(self, event_id: str) -> int:
+        """Insertion sequence of an indexed event, for stable ordering."""
+        return self._documents[event_id][0]
+
+    def _word_postings(self, word: str, scopes: List[str]) -> Set[str]:
+        """Union the postings of every in-scope token that contains a word."""
+        result: Set[str] = set()
+        for path, tokens in self._postings.items():
+            if not any(_in_scope(path, scope) for scope in scopes):
+                continue
+            for token in self._vocabularies[path].containing(word):
+                result |= tokens[token]
+        return result
+
+    def search(self, query: SearchQuery, search_fields: List[str]) -> Optional[Set[str]]:
+        """
+        Find candidate event IDs by intersecting posting lists.
+
+        Args:
+            query: The parsed query
+            search_fields: Fields searched by unscoped terms
+
+        Returns:
+            Candidate IDs (exact when every term is a single word), or None
+            if the query cannot be answered from the index
+        """
+        for term in query.terms:
+            scopes = [term.field_name] if term.field_name else search_fields
+            if not term.words or not all(_is_indexed_scope(scope) for scope in scopes):
+                return None
+
+        result: Set[str] = set()
+        for group in query.groups:
+            candidates: Optional[Set[str]] = None
+            # Most selective terms first, so intersections shrink quickly
+            for term in sorted(group, key=lambda t: -max(len(w) for w in t.words)):
+                scopes = [term.field_name] if term.field_name else search_fields
+                for word in term.words:
+                    postings = self._word_postings(word, scopes)
+                    candidates = postings if candidates is None else candidates & postings
+                    if not candidates:
+                        break
+                if not candidates:
+                    break
+            result |= candidates or set()
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {
+            "indexed_events": len(self._documents),
+            "indexed_paths": len(self._postings),
+            "distinct_terms": sum(len(tokens) for tokens in self._postings.values()),
+        }
@@ -0,0 +1,642 @@
+"""
+Durable segmented event store for Phoenix Hydra Event Routing System.
+
+Events are appended as length-prefixed, checksummed JSON records to
+segment files on disk. Each segment keeps a sparse timestamp index so
+range scans can seek into the memory-mapped segment, writes are fsynced
+in groups, and retention removes whole segment files.
+"""
+
+import bisect
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .event_routing import Event
+from .event_store import EventStoreBase, RetentionPolicy
+
+logger = logging.getLogger(__name__)
+
+# Record header: payload length and CRC32 of the payload, both big-endian
+_RECORD_HEADER = struct.Struct(">II")
+_SEGMENT_FILE = re.compile(r"^segment-(\d{12})\.log$")
+
+
+@dataclass(eq=False)
+class _Segment:
+    """
+    In-memory bookkeeping for one segment file.
+
+    The sparse index holds, every ``index_interval`` records, the record
+    offset together with the largest timestamp seen before it. That running
+    maximum never decreases, so it can be bisected even when events arrive
+    slightly out of order.
+    """
+    sequence: int
+    path: str
+    size: int = 0
+    record_count: int = 0
+    live_count: int = 0
+    min_timestamp: Optional[datetime] = None
+    max_timestamp: Optional[datetime] = None
+    index_timestamps: List[datetime] = field(default_factory=list)
+    index_offsets: List[int] = field(default_factory=list)
+    event_ids: List[str] = field(default_factory=list)
+    record_offsets: List[int] = field(default_factory=list)
+    view: Optional[mmap.mmap] = None
+    view_size: int = 0
+
+    @property
+    def index_path(self) -> str:
+        """Path of the sidecar index written when the segment is sealed."""
+        return self.path[:-len(".log")] + ".idx"
+
+    def note_record(self, event_id: str, timestamp: datetime, offset: int, interval: int) -> None:
+        """
+        Account for a record appended at ``offset``.
+
+        Args:
+            event_id: ID of the stored event
+            timestamp: Timestamp of the stored event
+            offset: Byte offset of the record in the segment
+            interval: Number of records between sparse index entries
+        """
+        if self.record_count and self.record_count % interval == 0:
+            self.index_timestamps.append(self.max_timestamp)
+            self.index_offsets.append(offset)
+
+        self.record_count += 1
+        self.event_ids.append(event_id)
+        self.record_offsets.append(offset)
+        if self.min_timestamp is None or timestamp < self.min_timestamp:
+            self.min_timestamp = timestamp
+        if self.max_timestamp is None or timestamp > self.max_timestamp:
+            self.max_timestamp = timestamp
+
+    def seek(self, start_time: Optional[datetime]) -> int:
+        """
+        Find the offset to start scanning from for a time range.
+
+        Args:
+            start_time: Start of the range (None = beginning of the segment)
+
+        Returns:
+            Byte offset before which every record is older than start_time
+        """
+        if start_time is None:
+            return 0
+        position = bisect.bisect_left(self.index_timestamps, start_time)
+        return self.index_offsets[position - 1] if position else 0
+
+    def close_view(self) -> None:
+        """Release the memory map, if any."""
+        if self.view is not None:
+            self.view.close()
+            self.view = None
+            self.view_size = 0
+
+
+class SegmentedEventStore(EventStoreBase):
+    """
+    Persistent event store backed by append-only segment files.
+
+    Only event locations and per-segment summaries are kept in memory;
+    event bodies are read back through memory-mapped segments. Writes are
+    buffered and fsynced once ``fsync_batch_size`` records are pending or
+    ``fsync_interval`` seconds have passed (group commit). On startup the
+    tail segment is scanned and any torn record left by a crash is
+    truncated away.
+
+    Retention works at segment granularity: ``cleanup_expired_events``
+    deletes the oldest sealed segments once all of their events are past
+    the age limit or once the remaining segments still hold ``max_count``
+    events. It may therefore keep slightly more events than the policy
+    allows, and ``priority_based``/``preserve_correlations`` are not
+    applied.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 segment_max_bytes: int = 64 * 1024 * 1024,
+                 index_interval: int = 64,
+                 fsync_batch_size: int = 100,
+                 fsync_interval: Optional[float] = 0.05):
+        """
+        Open (or create) a segmented event store.
+
+        Args:
+            directory: Directory holding the segment files
+            segment_max_bytes: Size at which the active segment is sealed
+            index_interval: Records between sparse timestamp index entries
+            fsync_batch_size: Pending records that force an fsync
+            fsync_interval: Seconds between background fsyncs (None = only
+                sync on batch size, roll and close)
+        """
+        if segment_max_bytes <= 0:
+            raise ValueError("segment_max_bytes must be positive")
+        if index_interval <= 0:
+            raise ValueError("index_interval must be positive")
+        if fsync_batch_size <= 0:
+            raise ValueError("fsync_batch_size must be positive")
+
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.index_interval = index_interval
+        self.fsync_batch_size = fsync_batch_size
+        self.fsync_interval = fsync_interval
+
+        self._lock = threading.RLock()
+        self._segments: List[_Segment] = []
+        self._locations: Dict[str, Tuple[_Segment, int]] = {}
+        self._writer = None
+        self._pending_sync = 0
+        self._closed = False
+        self._stats = {
+            "records_written": 0,
+            "fsyncs": 0,
+            "segments_deleted": 0,
+            "truncated_bytes": 0,
+        }
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+        self._stop_sync = threading.Event()
+        self._sync_thread = None
+        if fsync_interval:
+            self._sync_thread = threading.Thread(
+                target=self._sync_loop, name="event-store-sync", daemon=True)
+            self._sync_thread.start()
+
+    # Recovery
+
+    def _recover(self) -> None:
+        """Rebuild the in-memory state from the segment files on disk."""
+        sequences = sorted(
+            int(match.group(1))
+            for match in map(_SEGMENT_FILE.match, os.listdir(self.directory))
+            if match
+        )
+
+        for position, sequence in enumerate(sequences):
+            segment = _Segment(sequence, self._segment_path(sequence))
+            is_tail = position == len(sequences) - 1
+            if is_tail or not self._load_sidecar(segment):
+                self._scan_segment(segment)
+            self._segments.append(segment)
+
+        if self._segments:
+            self._writer = open(self._segments[-1].path, "ab")
+        else:
+            self._open_segment(0)
+
+    def _load_sidecar(self, segment: _Segment) -> bool:
+        """
+        Load a sealed segment's summary from its sidecar index.
+
+        Args:
+            segment: The segment to populate
+
+        Returns:
+            True if the sidecar was present and consistent with the log file
+        """
+        try:
+            with open(segment.index_path, "r", encoding="utf-8") as handle:
+                summary = json.load(handle)
+            if summary["size"] != os.path.getsize(segment.path):
+                return False
+        except (OSError, ValueError, KeyError):
+            return False
+
+        segment.size = summary["size"]
+        segment.index_timestamps = [datetime.fromisoformat(ts) for ts in summary["index_timestamps"]]
+        segment.index_offsets = summary["index_offsets"]
+        segment.record_count = len(summary["records"])
+        if summary["min_timestamp"] is not None:
+            segment.min_timestamp = datetime.fromisoformat(summary["min_timestamp"])
+            segment.max_timestamp = datetime.fromisoformat(summary["max_timestamp"])
+
+        for event_id, offset in summary["records"]:
+            segment.event_ids.append(event_id)
+            segment.record_offsets.append(offset)
+            self._set_location(event_id, segment, offset)
+        return True
+
+    def _scan_segment(self, segment: _Segment) -> None:
+        """
+        Rebuild a segment's summary by reading every record.
+
+        A record that is short, fails its checksum or cannot be decoded ends
+        the scan, and the file is truncated to the last good record.
+
+        Args:
+            segment: The segment to scan
+        """
+        file_size = os.path.getsize(segment.path)
+        offset = 0
+
+        if file_size:
+            with open(segment.path, "rb") as handle:
+                with mmap.mmap(handle.fileno(), file_size, access=mmap.ACCESS_READ) as view:
+                    while offset + _RECORD_HEADER.size <= file_size:
+                        length, checksum = _RECORD_HEADER.unpack_from(view, offset)
+                        start = offset + _RECORD_HEADER.size
+                        data = view[start:start + length]
+                        if len(data) != length or zlib.crc32(data) != checksum:
+                            break
+                        try:
+                            event = Event.from_dict(json.loads(data))
+                        except (ValueError, TypeError):
+                            break
+
+                        segment.note_record(event.id, event.timestamp, offset, self.index_interval)
+                        self._set_location(event.id, segment, offset)
+                        offset = start + length
+
+        if offset < file_size:
+            logger.warning("Truncating %d torn bytes from %s", file_size - offset, segment.path)
+            with open(segment.path, "r+b") as handle:
+                handle.truncate(offset)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self._stats["truncated_bytes"] += file_size - offset
+
+        segment.size = offset
+
+    # Writing
+
+    def _segment_path(self, sequence: int) -> str:
+        """Path of the segment file with the given sequence number."""
+        return os.path.join(self.directory, f"segment-{sequence:012d}.log")
+
+    def _open_segment(self, sequence: int) -> None:
+        """Create a new active segment and open it for appending."""
+        segment = _Segment(sequence, self._segment_path(sequence))
+        self._writer = open(segment.path, "ab")
+        self._segments.append(segment)
+
+    def _roll(self) -> None:
+        """Seal the active segment and start a new one."""
+        self._sync_locked()
+        self._writer.close()
+
+        sealed = self._segments[-1]
+        self._write_sidecar(sealed)
+        self._open_segment(sealed.sequence + 1)
+
+    def _write_sidecar(self, segment: _Segment) -> None:
+        """Persist a sealed segment's summary so restarts can skip scanning it."""
+        summary = {
+            "size": segment.size,
+            "min_timestamp": segment.min_timestamp.isoformat() if segment.min_timestamp else None,
+            "max_timestamp": segment.max_timestamp.isoformat() if segment.max_timestamp else None,
+            "index_timestamps": [ts.isoformat() for ts in segment.index_timestamps],
+            "index_offsets": segment.index_offsets,
+            "records": list(zip(segment.event_ids, segment.record_offsets)),
+        }
+        temp_path = segment.index_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle)
+        os.replace(temp_path, segment.index_path)
+
+    def _set_location(self, event_id: str, segment: _Segment, offset: int) -> None:
+        """Point an event ID at its newest record, retiring any older one."""
+        previous = self._locations.get(event_id)
+        if previous is not None:
+            previous[0].live_count -= 1
+        self._locations[event_id] = (segment, offset)
+        segment.live_count += 1
+
+    def _sync_locked(self) -> None:
+        """Flush and fsync the active segment. Caller must hold the lock."""
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._pending_sync = 0
+        self._stats["fsyncs"] += 1
+
+    def _sync_loop(self) -> None:
+        """Background group commit for writes that did not fill a batch."""
+        while not self._stop_sync.wait(self.fsync_interval):
+            with self._lock:
+                if self._pending_sync and not self._closed:
+                    self._sync_locked()
+
+    def store(self, event: Event) -> None:
+        """
+        Store a single event.
+
+        Storing an event whose ID already exists replaces it.
+
+        Args:
+            event: The event to store
+        """
+        data = json.dumps(event.to_dict(), separators=(",", ":"), default=str).encode("utf-8")
+        record = _RECORD_HEADER.pack(len(data), zlib.crc32(data)) + data
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SegmentedEventStore is closed")
+
+            segment = self._segments[-1]
+            if segment.size and segment.size + len(record) > self.segment_max_bytes:
+                self._roll()
+                segment = self._segments[-1]
+
+            offset = segment.size
+            self._writer.write(record)
+            segment.size += len(record)
+            segment.note_record(event.id, event.timestamp, offset, self.index_interval)
+            self._set_location(event.id, segment, offset)
+
+            self._stats["records_written"] += 1
+            self._pending_sync += 1
+            if self._pending_sync >= self.fsync_batch_size:
+                self._sync_locked()
+
+    def sync(self) -> None:
+        """Force pending writes to disk."""
+        with self._lock:
+            if not self._closed and self._pending_sync:
+                self._sync_locked()
+
+    # Reading
+
+    def _view(self, segment: _Segment) -> mmap.mmap:
+        """
+        Get a read-only memory map covering the segment's records.
+
+        The active segment is remapped when it has grown since the last read.
+        Caller must hold the lock.
+        """
+        if segment.view is None or segment.view_size != segment.size:
+            if segment is self._segments[-1]:
+                self._writer.flush()
+            segment.close_view()
+            with open(segment.path, "rb") as handle:
+                segment.view = mmap.mmap(handle.fileno(), segment.size, access=mmap.ACCESS_READ)
+            segment.view_size = segment.size
+        return segment.view
+
+    def _read_record(self, view: mmap.mmap, offset: int) -> Tuple[Event, int]:
+        """
+        Decode the record at an offset.
+
+        Returns:
+            The event and the offset of the next record
+        """
+        length, _ = _RECORD_HEADER.unpack_from(view, offset)
+        start = offset + _RECORD_HEADER.size
+        return Event.from_dict(json.loads(view[start:start + length])), start + length
+
+    def _scan_segment_range(self,
+                            segment: _Segment,
+                            start_time: Optional[datetime],
+                            end_time: Optional[datetime]) -> List[Event]:
+        """
+        Read the live events of one segment inside a time range.
+
+        Caller must hold the lock.
+        """
+        if not segment.live_count:
+            return []
+        if start_time is not None and segment.max_timestamp < start_time:
+            return []
+        if end_time is not None and segment.min_timestamp > end_time:
+            return []
+
+        view = self._view(segment)
+        offset = segment.seek(start_time)
+        events = []
+        while offset < segment.size:
+            record_offset = offset
+            event, offset = self._read_record(view, record_offset)
+            if start_time is not None and event.timestamp < start_time:
+                continue
+            if end_time is not None and event.timestamp > end_time:
+                continue
+            if self._locations.get(event.id) == (segment, record_offset):
+                events.append(event)
+        return events
+
+    def iter_events(self,
+                    start_time: Optional[datetime] = None,
+                    end_time: Optional[datetime] = None) -> Iterator[Event]:
+        """
+        Replay stored events in append order, one segment at a time.
+
+        The store lock is only held while a segment is being read, so
+        writers are not blocked for the whole replay.
+
+        Args:
+            start_time: Start time for time-based filtering
+            end_time: End time for time-based filtering
+
+        Returns:
+            Iterator over the stored events
+        """
+        with self._lock:
+            segments = list(self._segments)
+
+        for segment in segments:
+            with self._lock:
+                if segment not in self._segments:
+                    continue
+                events = self._scan_segment_range(segment, start_time, end_time)
+            yield from events
+
+    def get_event_by_id(self, event_id: str) -> Optional[Event]:
+        """
+        Retrieve an event by its ID.
+
+        Args:
+            event_id: The ID of the event to retrieve
+
+        Returns:
+            The event if found, None otherwise
+        """
+        with self._lock:
+            location = self._locations.get(event_id)
+            if location is None:
+                return None
+            segment, offset = location
+            return self._read_record(self._view(segment), offset)[0]
+
+    def get_events(self,
+                   filter_criteria: Optional[Dict[str, Any]] = None,
+                   start_time: Optional[datetime] = None,
+                   end_time: Optional[datetime] = None,
+                   limit: Optional[int] = None,
+                   offset: int = 0) -> List[Event]:
+        """
+        Retrieve events based on filter criteria.
+
+        Args:
+            filter_criteria: Dictionary of filter criteria
+            start_time: Start time for time-based filtering
+            end_time: End time for time-based filtering
+            limit: Maximum number of events to return
+            offset: Number of events to skip
+
+        Returns:
+            List of events matching the criteria, ordered chronologically
+        """
+        with self._lock:
+            events = []
+            for segment in self._segments:
+                for event in self._scan_segment_range(segment, start_time, end_time):
+                    if not filter_criteria or self._event_matches_criteria(event, filter_criteria):
+                        events.append(event)
+
+        # Segments are in append order; sort for events that arrived late
+        events.sort(key=lambda e: e.timestamp)
+
+        if offset > 0:
+            events = events[offset:]
+        if limit is not None:
+            events = events[:limit]
+        return events
+
+    def get_event_count(self, filter_criteria: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Get the count of events matching filter criteria.
+
+        Args:
+            filter_criteria: Dictionary of filter criteria
+
+        Returns:
+            Number of events matching the criteria
+        """
+        with self._lock:
+            if not filter_criteria:
+                return len(self._locations)
+            return sum(
+                1
+                for segment in self._segments
+                for event in self._scan_segment_range(segment, None, None)
+                if self._event_matches_criteria(event, filter_criteria)
+            )
+
+    # Retention
+
+    def _age_limit(self, retention_policy: RetentionPolicy) -> Optional[float]:
+        """
+        Age after which every event is expired under a policy.
+
+        Returns:
+            The most lenient age limit, or None if some events never expire by age
+        """
+        limits = [retention_policy.max_age_seconds]
+        limits.extend(policy.max_age_seconds for policy in retention_policy.event_type_policies.values())
+        if any(limit is None for limit in limits):
+            return None
+        return max(limits)
+
+    def _drop_segment(self, segment: _Segment) -> None:
+        """Delete a sealed segment and forget its events. Caller must hold the lock."""
+        for event_id in segment.event_ids:
+            location = self._locations.get(event_id)
+            if location is not None and location[0] is segment:
+                del self._locations[event_id]
+
+        segment.close_view()
+        self._segments.remove(segment)
+        for path in (segment.path, segment.index_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._stats["segments_deleted"] += 1
+
+    def cleanup_expired_events(self, retention_policy: RetentionPolicy) -> int:
+        """
+        Remove expired events by deleting whole sealed segments.
+
+        Args:
+            retention_policy: The retention policy to apply
+
+        Returns:
+            Number of events removed
+        """
+        with self._lock:
+            age_limit = self._age_limit(retention_policy)
+            max_count = retention_policy.max_count
+            current_time = time.time()
+            remaining = len(self._locations)
+            removed = 0
+
+            # The active segment is never dropped; stop at the first segment to keep
+            for segment in list(self._segments[:-1]):
+                expired = (
+                    age_limit is not None
+                    and (segment.max_timestamp is None
+                         or current_time - segment.max_timestamp.timestamp() > age_limit)
+                )
+                over_count = max_count is not None and remaining - segment.live_count >= max_count
+                if not (expired or over_count):
+                    break
+
+                removed += segment.live_count
+                remaining -= segment.live_count
+                self._drop_segment(segment)
+
+            return removed
+
+    def clear(self) -> int:
+        """
+        Clear all events from the store.
+
+        Returns:
+            Number of events removed
+        """
+        with self._lock:
+            count = len(self._locations)
+            next_sequence = self._segments[-1].sequence + 1
+
+            self._writer.close()
+            for segment in list(self._segments):
+                self._drop_segment(segment)
+            self._locations.clear()
+            self._pending_sync = 0
+            self._open_segment(next_sequence)
+            return count
+
+    def close(self) -> None:
+        """Sync pending writes and release files. The store cannot be used afterwards."""
+        self._stop_sync.set()
+        if self._sync_thread is not None:
+            self._sync_thread.join()
+
+        with self._lock:
+            if self._closed:
+                return
+            if self._pending_sync:
+                self._sync_locked()
+            self._writer.close()
+            for segment in self._segments:
+                segment.close_view()
+            self._closed = True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the event store.
+
+        Returns:
+            Dictionary of statistics
+        """
+        with self._lock:
+            return {
+                "total_events": len(self._locations),
+                "segments": len(self._segments),
+                "disk_bytes": sum(segment.size for segment in self._segments),
+                "pending_sync": self._pending_sync,
+                **self._stats,
+            }
@@ -0,0 +1,608 @@
+"""
+SQLite-backed event store for Phoenix Hydra Event Routing System.
+
+Events are written in batched transactions by a background writer thread
+and queried with SQL, so filtering, counting, ordering and grouping run
+inside SQLite instead of over Python lists.
+"""
+
+import itertools
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .event_routing import Event
+from .event_store import EventStoreBase, RetentionPolicy
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    source TEXT NOT NULL,
+    ts REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    correlation_id TEXT,
+    causation_id TEXT,
+    payload TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    is_replay INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events (ts, seq);
+CREATE INDEX IF NOT EXISTS idx_events_type ON events (type, ts);
+CREATE INDEX IF NOT EXISTS idx_events_source ON events (source, ts);
+CREATE INDEX IF NOT EXISTS idx_events_correlation ON events (correlation_id, ts);
+CREATE INDEX IF NOT EXISTS idx_events_causation ON events (causation_id);
+"""
+
+_COLUMNS = "id, type, source, ts, timestamp, correlation_id, causation_id, payload, metadata, is_replay"
+
+_INSERT = f"INSERT OR REPLACE INTO events ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Filter keys that map directly onto indexed columns
+_COLUMN_FILTERS = ("id", "type", "source", "correlation_id", "causation_id", "is_replay")
+
+# Group keys computed in SQL, mirroring InMemoryEventStore.aggregate_events
+_GROUP_EXPRESSIONS = {
+    "type": "type",
+    "source": "source",
+    "correlation_id": "COALESCE(correlation_id, 'no_correlation')",
+}
+
+_STOP = object()
+
+
+def _json_path(key_path: str) -> str:
+    """Convert a dotted key path into a quoted SQLite JSON path."""
+    return "$" + "".join('."{}"'.format(key.replace('"', '\\"')) for key in key_path.split("."))
+
+
+class SQLiteEventStore(EventStoreBase):
+    """
+    Event store persisted in a SQLite database.
+
+    The database runs in WAL mode with indexed columns for timestamp, type,
+    source, correlation_id and causation_id, and JSON payload/metadata
+    columns. ``store()`` only enqueues the event; a writer thread commits
+    queued events in batches of up to ``batch_size`` per transaction. Reads
+    wait for queued writes first, so they always see earlier stores.
+    """
+
+    def __init__(self,
+                 database_path: str = ":memory:",
+                 batch_size: int = 500,
+                 synchronous: str = "NORMAL"):
+        """
+        Open (or create) a SQLite event store.
+
+        Args:
+            database_path: Path of the database file, or ":memory:"
+            batch_size: Maximum number of events committed per transaction
+            synchronous: SQLite ``synchronous`` pragma for the writer
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        self.database_path = database_path
+        self.batch_size = batch_size
+
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
+        self._write_conn.execute(f"PRAGMA synchronous = {synchronous}")
+        self._write_conn.executescript(_SCHEMA)
+
+        # An in-memory database only exists on its own connection
+        if database_path == ":memory:":
+            self._read_conn = self._write_conn
+            self._read_lock = self._write_lock
+        else:
+            self._read_conn = self._connect()
+            self._read_lock = threading.Lock()
+
+        self._stats = {
+            "batches_written": 0,
+            "events_written": 0,
+            "write_errors": 0,
+        }
+        self._closed = False
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="event-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection configured for this store."""
+        connection = sqlite3.connect(self.database_path, check_same_thread=False, isolation_level=None)
+        if self.database_path != ":memory:":
+            connection.execute("PRAGMA journal_mode = WAL")
+        return connection
+
+    # Writing
+
+    def _to_row(self, event: Event) -> Tuple[Any, ...]:
+        """Convert an event into an ``events`` row."""
+        return (
+            event.id,
+            event.type,
+            event.source,
+            event.timestamp.timestamp(),
+            event.timestamp.isoformat(),
+            event.correlation_id,
+            event.causation_id,
+            json.dumps(event.payload, default=str),
+            json.dumps(event.metadata, default=str),
+            int(event.is_replay),
+        )
+
+    def _writer_loop(self) -> None:
+        """Commit queued events in batched transactions until stopped."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            events = [item for item in batch if item is not _STOP]
+            try:
+                if events:
+                    rows = [self._to_row(event) for event in events]
+                    with self._write_lock:
+                        self._write_conn.execute("BEGIN")
+                        try:
+                            self._write_conn.executemany(_INSERT, rows)
+                            self._write_conn.execute("COMMIT")
+                        except BaseException:
+                            self._write_conn.execute("ROLLBACK")
+                            raise
+                    self._stats["batches_written"] += 1
+                    self._stats["events_written"] += len(rows)
+            except Exception:
+                self._stats["write_errors"] += 1
+                logger.exception("Failed to write %d events to %s", len(events), self.database_path)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if len(events) != len(batch):
+                return
+
+    def store(self, event: Event) -> None:
+        """
+        Store a single event.
+
+        The event is committed asynchronously by the writer thread.
+
+        Args:
+            event: The event to store
+        """
+        if self._closed:
+            raise RuntimeError("SQLiteEventStore is closed")
+        self._queue.put(event)
+
+    def flush(self) -> None:
+        """Wait until every stored event has been committed."""
+        self._queue.join()
+
+    def _execute_write(self, sql: str, params: Tuple[Any, ...] = ()) -> int:
+        """
+        Run a modifying statement after pending writes are committed.
+
+        Returns:
+            Number of rows changed
+        """
+        self.flush()
+        with self._write_lock:
+            return self._write_conn.execute(sql, params).rowcount
+
+    # Query building
+
+    def _build_where(self,
+                     filter_criteria: Optional[Dict[str, Any]],
+                     start_time: Optional[datetime] = None,
+                     end_time: Optional[datetime] = None) -> Tuple[str, List[Any], Dict[str, Any]]:
+        """
+        Translate filter criteria into a WHERE clause.
+
+        Criteria that cannot be expressed in SQL are returned to be checked
+        in Python.
+
+        Returns:
+            The WHERE clause (possibly empty), its parameters and the
+            residual criteria
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        residual: Dict[str, Any] = {}
+
+        if start_time is not None:
+            clauses.append("ts >= ?")
+            params.append(start_time.timestamp())
+        if end_time is not None:
+            clauses.append("ts <= ?")
+            params.append(end_time.timestamp())
+
+        for key, value in (filter_criteria or {}).items():
+            if key in _COLUMN_FILTERS:
+                if value is None:
+                    clauses.append(f"{key} IS NULL")
+                elif isinstance(value, (str, bool)):
+                    clauses.append(f"{key} = ?")
+                    params.append(int(value) if key == "is_replay" else value)
+                else:
+                    residual[key] = value
+            elif key.startswith(("payload.", "metadata.")):
+                column, key_path = key.split(".", 1)
+                path = _json_path(key_path)
+                if value is None:
+                    clauses.append(f"json_type({column}, ?) = 'null'")
+                    params.append(path)
+                elif isinstance(value, bool):
+                    clauses.append(f"json_type({column}, ?) = ?")
+                    params.extend([path, "true" if value else "false"])
+                elif isinstance(value, (str, int, float)):
+                    clauses.append(f"json_extract({column}, ?) = ?")
+                    params.extend([path, value])
+                else:
+                    residual[key] = value
+            else:
+                residual[key] = value
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params, residual
+
+    def _row_to_event(self, row: Tuple[Any, ...]) -> Event:
+        """Rebuild an event from a row selected with ``_COLUMNS``."""
+        (event_id, event_type, source, _, timestamp,
+         correlation_id, causation_id, payload, metadata, is_replay) = row
+        return Event(
+            id=event_id,
+            type=event_type,
+            source=source,
+            timestamp=datetime.fromisoformat(timestamp),
+            correlation_id=correlation_id,
+            causation_id=causation_id,
+            payload=json.loads(payload),
+            metadata=json.loads(metadata),
+            is_replay=bool(is_replay),
+        )
+
+    def _query(self, sql: str, params: List[Any]) -> List[Tuple[Any, ...]]:
+        """Run a read query after pending writes are committed."""
+        self.flush()
+        with self._read_lock:
+            return self._read_conn.execute(sql, params).fetchall()
+
+    # Reading
+
+    def get_event_by_id(self, event_id: str) -> Optional[Event]:
+        """
+        Retrieve an event by its ID.
+
+        Args:
+            event_id: The ID of the event to retrieve
+
+        Returns:
+            The event if found, None otherwise
+        """
+        rows = self._query(f"SELECT {_COLUMNS} FROM events WHERE id = ?", [event_id])
+        return self._row_to_event(rows[0]) if rows else None
+
+    def get_events(self,
+                   filter_criteria: Optional[Dict[str, Any]] = None,
+                   start_time: Optional[datetime] = None,
+                   end_time: Optional[datetime] = None,
+                   limit: Optional[int] = None,
+                   offset: int = 0) -> List[Event]:
+        """
+        Retrieve events based on filter criteria.
+
+        Args:
+            filter_criteria: Dictionary of filter criteria
+            start_time: Start time for time-based filtering
+            end_time: End time for time-based filtering
+            limit: Maximum number of events to return
+            offset: Number of events to skip
+
+        Returns:
+            List of events matching the criteria, ordered chronologically
+        """
+        where, params, residual = self._build_where(filter_criteria, start_time, end_time)
+        sql = f"SELECT {_COLUMNS} FROM events{where} ORDER BY ts, seq"
+
+        if not residual:
+            if limit is not None or offset:
+                sql += " LIMIT ? OFFSET ?"
+                params.extend([-1 if limit is None else limit, offset])
+            return [self._row_to_event(row) for row in self._query(sql, params)]
+
+        events = (self._row_to_event(row) for row in self._query(sql, params))
+        matching = (e for e in events if self._event_matches_criteria(e, residual))
+        stop = None if limit is None else offset + limit
+        return list(itertools.islice(matching, offset, stop))
+
+    def get_event_count(self, filter_criteria: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Get the count of events matching filter criteria.
+
+        Args:
+            filter_criteria: Dictionary of filter criteria
+
+        Returns:
+            Number of events matching the criteria
+        """
+        where, params, residual = self._build_where(filter_criteria)
+        if not residual:
+            return self._query(f"SELECT COUNT(*) FROM events{where}", params)[0][0]
+
+        rows = self._query(f"SELECT {_COLUMNS} FROM events{where}", params)
+        return sum(1 for row in rows if self._event_matches_criteria(self._row_to_event(row), residual))
+
+    def get_events_by_correlation_id(self, correlation_id: str) -> List[Event]:
+        """
+        Get all events with a specific correlation ID.
+
+        Args:
+            correlation_id: The correlation ID to search for
+
+        Returns:
+            List of events with the specified correlation ID, ordered chronologically
+        """
+        return self.get_events({"correlation_id": correlation_id})
+
+    def get_event_timeline(self,
+                           correlation_id: str,
+                           include_causation: bool = True) -> List[Event]:
+        """
+        Get a timeline of related events based on correlation and causation.
+
+        Args:
+            correlation_id: The correlation ID to build timeline for
+            include_causation: Whether to include causation relationships
+
+        Returns:
+            List of events in chronological order showing the event timeline
+        """
+        if not include_causation:
+            return self.get_events_by_correlation_id(correlation_id)
+
+        sql = f"""
+            WITH chain AS (SELECT id, causation_id FROM events WHERE correlation_id = ?)
+            SELECT {_COLUMNS} FROM events
+            WHERE correlation_id = ?
+               OR id IN (SELECT causation_id FROM chain WHERE causation_id IS NOT NULL)
+               OR causation_id IN (SELECT id FROM chain)
+            ORDER BY ts, seq
+        """
+        rows = self._query(sql, [correlation_id, correlation_id])
+        return [self._row_to_event(row) for row in rows]
+
+    def aggregate_events(self,
+                         group_by: str,
+                         filter_criteria: Optional[Dict[str, Any]] = None,
+                         start_time: Optional[datetime] = None,
+                         end_time: Optional[datetime] = None) -> Dict[str, List[Event]]:
+        """
+        Aggregate events by a specified field.
+
+        Grouping on type, source or correlation_id is done by SQLite; other
+        fields are grouped in Python after the filters run in SQL.
+
+        Args:
+            group_by: Field to group by (e.g., "type", "source", "correlation_id")
+            filter_criteria: Optional filter criteria
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+
+        Returns:
+            Dictionary mapping group values to lists of events
+        """
+        expression = _GROUP_EXPRESSIONS.get(group_by)
+        if expression is None:
+            aggregated: Dict[str, List[Event]] = {}
+            for event in self.get_events(filter_criteria, start_time, end_time):
+                if group_by.startswith(("payload.", "metadata.")):
+                    column, key_path = group_by.split(".", 1)
+                    key = str(self._get_nested_value(getattr(event, column), key_path, "unknown"))
+                else:
+                    key = str(getattr(event, group_by, "unknown"))
+                aggregated.setdefault(key, []).append(event)
+            return aggregated
+
+        where, params, residual = self._build_where(filter_criteria, start_time, end_time)
+        sql = f"SELECT {expression}, {_COLUMNS} FROM events{where} ORDER BY 1, ts, seq"
+        rows = self._query(sql, params)
+
+        aggregated = {}
+        for key, group in itertools.groupby(rows, key=lambda row: row[0]):
+            events = [self._row_to_event(row[1:]) for row in group]
+            if residual:
+                events = [e for e in events if self._event_matches_criteria(e, residual)]
+            if events:
+                aggregated[key] = events
+        return aggregated
+
+    def count_events_by(self,
+                        group_by: str,
+                        filter_criteria: Optional[Dict[str, Any]] = None,
+                        start_time: Optional[datetime] = None,
+                        end_time: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Count events per group without loading them.
+
+        Args:
+            group_by: "type", "source" or "correlation_id"
+            filter_criteria: Optional filter criteria (must be expressible in SQL)
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+
+        Returns:
+            Dictionary mapping group values to event counts
+        """
+        expression = _GROUP_EXPRESSIONS.get(group_by)
+        if expression is None:
+            raise ValueError(f"Cannot count by {group_by!r}")
+
+        where, params, residual = self._build_where(filter_criteria, start_time, end_time)
+        if residual:
+            raise ValueError(f"Filter keys not supported in SQL: {sorted(residual)}")
+
+        rows = self._query(f"SELECT {expression}, COUNT(*) FROM events{where} GROUP BY 1", params)
+        return dict(rows)
+
+    def _get_nested_value(self, data: Dict[str, Any], key_path: str, default: Any = None) -> Any:
+        """
+        Get a nested value using dot notation.
+
+        Args:
+            data: The data dictionary
+            key_path: The key path (e.g., "user.id")
+            default: Default value if not found
+
+        Returns:
+            The nested value or default
+        """
+        current = data
+        try:
+            for key in key_path.split("."):
+                current = current[key]
+            return current
+        except (KeyError, TypeError):
+            return default
+
+    # Retention
+
+    def _expired_clause(self,
+                        retention_policy: RetentionPolicy,
+                        current_time: float) -> Tuple[Optional[str], List[Any]]:
+        """
+        Build a SQL predicate matching events expired by age.
+
+        Returns:
+            The predicate (None if nothing can expire by age) and its parameters
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        type_policies = retention_policy.event_type_policies
+
+        for event_type, policy in type_policies.items():
+            if policy.max_age_seconds is not None:
+                clauses.append("(type = ? AND ts < ?)")
+                params.extend([event_type, current_time - policy.max_age_seconds])
+
+        if retention_policy.max_age_seconds is not None:
+            cutoff = current_time - retention_policy.max_age_seconds
+            if type_policies:
+                placeholders = ", ".join("?" * len(type_policies))
+                clauses.append(f"(type NOT IN ({placeholders}) AND ts < ?)")
+                params.extend(list(type_policies) + [cutoff])
+            else:
+                clauses.append("ts < ?")
+                params.append(cutoff)
+
+        if not clauses:
+            return None, []
+        return "(" + " OR ".join(clauses) + ")", params
+
+    def cleanup_expired_events(self, retention_policy: RetentionPolicy) -> int:
+        """
+        Remove expired events based on retention policy.
+
+        Args:
+            retention_policy: The retention policy to apply
+
+        Returns:
+            Number of events removed
+        """
+        self.flush()
+        expired, params = self._expired_clause(retention_policy, time.time())
+
+        with self._write_lock:
+            conn = self._write_conn
+            conn.execute("BEGIN")
+            try:
+                removed = 0
+                if expired is not None:
+                    if retention_policy.preserve_correlations:
+                        # Drop standalone events, and whole chains with nothing left alive
+                        sql = f"""
+                            DELETE FROM events
+                            WHERE (correlation_id IS NULL AND {expired})
+                               OR (correlation_id IS NOT NULL AND correlation_id NOT IN (
+                                       SELECT correlation_id FROM events
+                                       WHERE correlation_id IS NOT NULL AND NOT {expired}))
+                        """
+                        params = params + params
+                    else:
+                        sql = f"DELETE FROM events WHERE {expired}"
+                    removed += conn.execute(sql, params).rowcount
+
+                if retention_policy.max_count is not None:
+                    if retention_policy.priority_based and not retention_policy.preserve_correlations:
+                        order = "COALESCE(json_extract(metadata, '$.priority'), 0) DESC, ts DESC, seq DESC"
+                    else:
+                        order = "ts DESC, seq DESC"
+                    sql = f"""
+                        DELETE FROM events WHERE seq IN (
+                            SELECT seq FROM events ORDER BY {order} LIMIT -1 OFFSET ?)
+                    """
+                    removed += conn.execute(sql, [retention_policy.max_count]).rowcount
+
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return removed
+
+    def clear(self) -> int:
+        """
+        Clear all events from the store.
+
+        Returns:
+            Number of events removed
+        """
+        return self._execute_write("DELETE FROM events")
+
+    def close(self) -> None:
+        """Commit queued events, stop the writer and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._writer.join()
+
+        with self._write_lock:
+            self._write_conn.close()
+        if self._read_conn is not self._write_conn:
+            with self._read_lock:
+                self._read_conn.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the event store.
+
+        Returns:
+            Dictionary of statistics
+        """
+        total, oldest, newest = self._query(
+            "SELECT COUNT(*),"
+            " (SELECT timestamp FROM events ORDER BY ts, seq LIMIT 1),"
+            " (SELECT timestamp FROM events ORDER BY ts DESC, seq DESC LIMIT 1)"
+            " FROM events", [])[0]
+        return {
+            "total_events": total,
+            "event_types": self.count_events_by("type"),
+            "sources": self.count_events_by("source"),
+            "oldest_event": oldest,
+            "newest_event": newest,
+            "pending_writes": self._queue.unfinished_tasks,
+            **self._stats,
+        }
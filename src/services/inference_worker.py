@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Phoenix Hydra Inference Workers
+Per-model worker threads that micro-batch concurrent inference requests
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Batch callable: (prompts, parameters) -> one result per prompt, in order.
+# Returning a generator delivers each result as soon as it is produced.
+BatchFunction = Callable[[List[str], Dict[str, Any]], Iterable[str]]
+
+DEFAULT_MAX_BATCH_SIZE = 8
+DEFAULT_MAX_WAIT_MS = 10.0
+
+_STOP = object()
+
+
+@dataclass
+class _PendingRequest:
+    """A request waiting for its batch to run"""
+    prompt: str
+    parameters: Dict[str, Any]
+    batch_key: str
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+def _batch_key(parameters: Dict[str, Any]) -> str:
+    """Requests can share a batch only if their generation parameters match"""
+    return json.dumps(parameters, sort_keys=True, default=str)
+
+
+def _resolve(request: _PendingRequest, result: Any = None, error: Optional[BaseException] = None):
+    """Complete a request's future from the worker thread"""
+
+    def _set():
+        if request.future.done():
+            return  # Caller gave up (timeout/cancel)
+        if error is not None:
+            request.future.set_exception(error)
+        else:
+            request.future.set_result(result)
+
+    try:
+        request.loop.call_soon_threadsafe(_set)
+    except RuntimeError:
+        pass  # Event loop already closed
+
+
+class InferenceWorker:
+    """
+    Runs a model's batch function on a dedicated thread.
+
+    Concurrent ``submit`` calls are collected into micro-batches of up to
+    ``max_batch_size`` requests with identical parameters, waiting at most
+    ``max_wait_ms`` after the first request for the batch to fill.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        batch_fn: BatchFunction,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.model_name = model_name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._deferred: Deque[_PendingRequest] = deque()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"inference-{model_name}", daemon=True
+        )
+
+        # Statistics
+        self.requests_processed = 0
+        self.batches_processed = 0
+        self.max_batch_seen = 0
+        self.total_queue_wait_ms = 0.0
+
+        self._thread.start()
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is alive and accepting requests"""
+        return not self._closed and self._thread.is_alive()
+
+    async def submit(self, prompt: str, parameters: Optional[Dict[str, Any]] = None) -> str:
+        """Queue a prompt and wait for its result"""
+        if self._closed:
+            raise RuntimeError(f"Inference worker for {self.model_name} is stopped")
+
+        parameters = parameters or {}
+        loop = asyncio.get_running_loop()
+        request = _PendingRequest(
+            prompt=prompt,
+            parameters=parameters,
+            batch_key=_batch_key(parameters),
+            future=loop.create_future(),
+            loop=loop,
+        )
+        self._queue.put(request)
+        return await request.future
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop the worker; queued requests fail, the running batch completes"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        if timeout is not None and threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker batching statistics"""
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() + len(self._deferred),
+            "requests_processed": self.requests_processed,
+            "batches_processed": self.batches_processed,
+            "average_batch_size": (
+                self.requests_processed / self.batches_processed
+                if self.batches_processed else 0.0
+            ),
+            "max_batch_size_seen": self.max_batch_seen,
+            "average_queue_wait_ms": (
+                self.total_queue_wait_ms / self.requests_processed
+                if self.requests_processed else 0.0
+            ),
+        }
+
+    def _next_request(self) -> Any:
+        """Next request, preferring ones deferred from an earlier batch"""
+        if self._deferred:
+            return self._deferred.popleft()
+        return self._queue.get()
+
+    def _collect_batch(self, first: _PendingRequest) -> List[_PendingRequest]:
+        """Gather requests compatible with ``first`` until the batch is full or the wait expires"""
+        batch = [first]
+        skipped: List[_PendingRequest] = []
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+
+        # Deferred requests are already waiting: take matching ones first
+        for request in list(self._deferred):
+            if len(batch) >= self.max_batch_size:
+                break
+            if request.batch_key == first.batch_key:
+                self._deferred.remove(request)
+                batch.append(request)
+
+        while len(batch) < self.max_batch_size:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)  # Handle after this batch
+                break
+            if item.batch_key == first.batch_key:
+                batch.append(item)
+            else:
+                skipped.append(item)
+
+        self._deferred.extend(skipped)
+        return batch
+
+    def _run_batch(self, batch: List[_PendingRequest]):
+        """Run one batch and deliver each result as it is produced"""
+        started = time.perf_counter()
+        delivered = 0
+        try:
+            results = self.batch_fn([r.prompt for r in batch], batch[0].parameters)
+            for request, result in zip(batch, results):
+                _resolve(request, result)
+                delivered += 1
+            if delivered < len(batch):
+                raise RuntimeError(
+                    f"Batch function returned {delivered} results for {len(batch)} prompts"
+                )
+        except Exception as e:
+            logger.error(f"Inference batch failed for {self.model_name}: {e}")
+            for request in batch[delivered:]:
+                _resolve(request, error=e)
+
+        self.requests_processed += len(batch)
+        self.batches_processed += 1
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+        self.total_queue_wait_ms += sum(started - r.enqueued_at for r in batch) * 1000
+
+    def _run(self):
+        """Worker thread main loop"""
+        while True:
+            item = self._next_request()
+            if item is _STOP:
+                break
+            self._run_batch(self._collect_batch(item))
+
+        # Fail anything still waiting
+        stopped = RuntimeError(f"Inference worker for {self.model_name} stopped")
+        pending = list(self._deferred)
+        self._deferred.clear()
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                pending.append(item)
+        for request in pending:
+            _resolve(request, error=stopped)
+
+
+def text_generation_batch_fn(pipe: Callable[..., Any]) -> BatchFunction:
+    """Adapt a transformers text-generation pipeline into a batch function"""
+
+    def run(prompts: List[str], parameters: Dict[str, Any]) -> Iterable[str]:
+        outputs = pipe(
+            prompts,
+            batch_size=len(prompts),
+            max_length=parameters.get("max_tokens", 512),
+            temperature=parameters.get("temperature", 0.7),
+            do_sample=True,
+        )
+        for output in outputs:
+            # Batched pipelines return a list of candidates per prompt
+            candidate = output[0] if isinstance(output, list) else output
+            yield candidate["generated_text"]
+
+    return run
+
+
+def _default_pipeline_factory(model_object: Dict[str, Any]) -> Callable[..., Any]:
+    """Build a transformers text-generation pipeline around a loaded model"""
+    from transformers import pipeline
+
+    tokenizer = model_object["tokenizer"]
+    if getattr(tokenizer, "pad_token", True) is None:
+        tokenizer.pad_token = tokenizer.eos_token  # Needed to pad batches
+    return pipeline("text-generation", model=model_object["model"], tokenizer=tokenizer)
+
+
+class InferenceWorkerRegistry:
+    """Inference workers keyed by model name"""
+
+    def __init__(
+        self,
+        pipeline_factory: Callable[[Dict[str, Any]], Callable[..., Any]] = _default_pipeline_factory,
+    ):
+        self.pipeline_factory = pipeline_factory
+        self.workers: Dict[str, InferenceWorker] = {}
+
+    def get(self, model_name: str) -> Optional[InferenceWorker]:
+        """Running worker for a model, if any"""
+        worker = self.workers.get(model_name)
+        return worker if worker is not None and worker.running else None
+
+    def start(
+        self,
+        model_name: str,
+        model_object: Any,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> Optional[InferenceWorker]:
+        """
+        Build the model's batch function once and start its worker.
+
+        Returns None for model objects that are not batchable text generators.
+        """
+        self.stop(model_name)
+
+        parameters = parameters or {}
+        if isinstance(model_object, dict) and "model" in model_object and "tokenizer" in model_object:
+            batch_fn = text_generation_batch_fn(self.pipeline_factory(model_object))
+        elif callable(model_object):
+            batch_fn = model_object
+        else:
+            return None
+
+        worker = InferenceWorker(
+            model_name,
+            batch_fn,
+            max_batch_size=parameters.get("max_batch_size", DEFAULT_MAX_BATCH_SIZE),
+            max_wait_ms=parameters.get("max_batch_wait_ms", DEFAULT_MAX_WAIT_MS),
+        )
+        self.workers[model_name] = worker
+        logger.info(f"Started inference worker for {model_name}")
+        return worker
+
+    def stop(self, model_name: str, timeout: Optional[float] = None):
+        """Stop a model's worker"""
+        worker = self.workers.pop(model_name, None)
+        if worker is not None:
+            worker.close(timeout)
+
+    def stop_all(self, timeout: Optional[float] = None):
+        """Stop every worker"""
+        for model_name in list(self.workers):
+            self.stop(model_name, timeout)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Batching statistics per model"""
+        return {name: worker.get_stats() for name, worker in self.workers.items()}
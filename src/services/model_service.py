@@ -4,14 +4,14 @@ Phoenix Hydra Model Service
 FastAPI service for model management and inference
 """
 
-import asyncio
+import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 import uvicorn
-from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..core.model_manager import (
@@ -26,6 +26,8 @@ from ..core.model_manager import (
     model_manager,
 )
 from . import dynamic_ui_service
+from .inference_worker import InferenceWorkerRegistry
+from .ollama_client import OllamaAPIError, OllamaClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,6 +40,15 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Per-model inference workers (pipeline built once, requests micro-batched)
+inference_workers = InferenceWorkerRegistry()
+
+# Stop a model's worker whenever the model manager unloads or evicts it
+model_manager.unload_listeners.append(inference_workers.stop)
+
+# Shared keep-alive client for the local Ollama server
+ollama_client = OllamaClient()
+
 # Include the dynamic UI router
 app.include_router(dynamic_ui_service.router, prefix="/api", tags=["Dynamic UI"])
 
@@ -58,6 +69,17 @@ class InferenceRequest(BaseModel):
     model_type: str
     prompt: str
     parameters: Optional[Dict[str, Any]] = None
+    stream: bool = False
+
+# Model types served by text-generation pipelines
+TEXT_GENERATION_MODEL_TYPES = {
+    ModelType.REASONING,
+    ModelType.CODING,
+    ModelType.GENERAL,
+    ModelType.CREATIVE,
+    ModelType.CONTEXT_LONG,
+    ModelType.CPU_OPTIMIZED,
+}
 
 class InferenceResponse(BaseModel):
     model_name: str
@@ -83,6 +105,7 @@ async def health_endpoint():
     """Health check endpoint"""
     try:
         health_status = await health_check()
+        health_status["inference_workers"] = inference_workers.get_stats()
         return health_status
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -166,7 +189,7 @@ async def load_model_endpoint(model_name: str, background_tasks: BackgroundTasks
             raise HTTPException(status_code=404, detail=f"Model {model_name} not found")
         
         # Load model in background
-        background_tasks.add_task(load_model, model_name)
+        background_tasks.add_task(_load_model_with_worker, model_name)
         
         return {
             "model_name": model_name,
@@ -224,7 +247,7 @@ async def get_active_models():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/inference")
-async def inference_endpoint(request: InferenceRequest):
+async def inference_endpoint(request: InferenceRequest, http_request: Request):
     """Perform inference with specified model type"""
     start_time = datetime.now()
     
@@ -239,18 +262,29 @@ async def inference_endpoint(request: InferenceRequest):
                 detail=f"No active model found for type {request.model_type}"
             )
         
-        # Get model instance
+        # Get model instance, loading it on first use (may evict idle models)
         model_instance = model_manager.models.get(active_model_name)
-        if not model_instance or model_instance.status != ModelStatus.LOADED:
+        if not model_instance or not await model_manager.ensure_loaded(active_model_name):
             raise HTTPException(
                 status_code=503,
                 detail=f"Model {active_model_name} is not loaded"
             )
         
+        if request.stream:
+            # Server-sent events, one per generated token
+            return StreamingResponse(
+                _inference_event_stream(
+                    http_request, active_model_name, model_instance,
+                    request.prompt, request.parameters or {}, start_time
+                ),
+                media_type="text/event-stream"
+            )
+        
         # Perform inference based on model type
-        response_text = await _perform_inference(
-            model_instance, request.prompt, request.parameters or {}
-        )
+        with model_manager.residency.in_use(active_model_name):
+            response_text = await _perform_inference(
+                model_instance, request.prompt, request.parameters or {}
+            )
         
         # Calculate inference time
         end_time = datetime.now()
@@ -271,6 +305,69 @@ async def inference_endpoint(request: InferenceRequest):
         logger.error(f"Error during inference: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _load_model_with_worker(model_name: str) -> bool:
+    """Load a model and start its inference worker"""
+    inference_workers.stop(model_name)
+    success = await load_model(model_name)
+    if success:
+        _start_inference_worker(model_name, model_manager.models[model_name])
+    return success
+
+def _start_inference_worker(model_name: str, model_instance):
+    """Build the model's pipeline once and start batching its requests"""
+    model_object = model_instance.model_object
+    if model_instance.config.type not in TEXT_GENERATION_MODEL_TYPES:
+        return None
+    if not (isinstance(model_object, dict) and "model" in model_object):
+        return None
+    try:
+        return inference_workers.start(
+            model_name, model_object, model_instance.config.parameters
+        )
+    except Exception as e:
+        logger.error(f"Failed to start inference worker for {model_name}: {e}")
+        return None
+
+async def _generate_tokens(model_instance, prompt: str, parameters: Dict[str, Any]):
+    """Yield the response as it is generated (whole response if the backend cannot stream)"""
+    model_config = model_instance.config
+    
+    if model_config.type in TEXT_GENERATION_MODEL_TYPES and model_config.ollama_name:
+        async for token in ollama_client.stream_generate(
+            model_config.ollama_name, prompt, parameters
+        ):
+            yield token
+    else:
+        yield await _perform_inference(model_instance, prompt, parameters)
+
+async def _inference_event_stream(http_request: Request, model_name: str, model_instance,
+                                  prompt: str, parameters: Dict[str, Any], start_time: datetime):
+    """Server-sent events for a streamed inference; stops generating if the client goes away"""
+    tokens = _generate_tokens(model_instance, prompt, parameters)
+    try:
+        with model_manager.residency.in_use(model_name):
+            async for token in tokens:
+                if await http_request.is_disconnected():
+                    logger.info(f"Client disconnected, cancelling inference on {model_name}")
+                    return
+                yield f"data: {json.dumps({'token': token})}\n\n"
+        
+        end_time = datetime.now()
+        done = {
+            "done": True,
+            "model_name": model_name,
+            "inference_time_ms": (end_time - start_time).total_seconds() * 1000,
+            "timestamp": end_time.isoformat()
+        }
+        yield f"data: {json.dumps(done)}\n\n"
+        
+    except Exception as e:
+        logger.error(f"Error during streamed inference: {e}")
+        yield f"data: {json.dumps({'error': str(e)})}\n\n"
+    finally:
+        # Closing the token stream closes the Ollama connection
+        await tokens.aclose()
+
 async def _perform_inference(model_instance, prompt: str, parameters: Dict[str, Any]) -> str:
     """Perform inference with the given model instance"""
     model_config = model_instance.config
@@ -309,46 +406,25 @@ async def _perform_inference(model_instance, prompt: str, parameters: Dict[str,
             return f"Biomimetic agent processing: {prompt}"
     
     elif model_config.ollama_name:
-        # Ollama model inference
+        # Ollama model inference over the pooled REST client
         try:
-            process = await asyncio.create_subprocess_exec(
-                "ollama", "run", model_config.ollama_name, prompt,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            return await ollama_client.generate(
+                model_config.ollama_name, prompt, parameters
             )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
-                return stdout.decode().strip()
-            else:
-                logger.error(f"Ollama inference failed: {stderr.decode()}")
-                return f"Error: {stderr.decode()}"
-                
-        except Exception as e:
-            logger.error(f"Ollama inference error: {e}")
+        except OllamaAPIError as e:
+            logger.error(f"Ollama inference failed: {e}")
             return f"Error: {str(e)}"
     
     elif isinstance(model_object, dict) and "model" in model_object:
-        # Hugging Face transformers model
+        # Hugging Face transformers model, batched on the model's worker thread
         try:
-            from transformers import pipeline
+            worker = inference_workers.get(model_config.name)
+            if worker is None:
+                worker = _start_inference_worker(model_config.name, model_instance)
+            if worker is None:
+                return f"Inference not implemented for model type: {model_config.type.value}"
             
-            # Create appropriate pipeline based on model type
-            if model_config.type == ModelType.CODING:
-                pipe = pipeline("text-generation", 
-                              model=model_object["model"], 
-                              tokenizer=model_object["tokenizer"])
-            else:
-                pipe = pipeline("text-generation", 
-                              model=model_object["model"], 
-                              tokenizer=model_object["tokenizer"])
-            
-            result = pipe(prompt, 
-                         max_length=parameters.get("max_tokens", 512),
-                         temperature=parameters.get("temperature", 0.7),
-                         do_sample=True)
-            
-            return result[0]["generated_text"]
+            return await worker.submit(prompt, parameters)
             
         except Exception as e:
             logger.error(f"Transformers inference error: {e}")
@@ -381,10 +457,8 @@ async def optimize_system():
             if (instance.status == ModelStatus.LOADED and 
                 name not in model_manager.active_models.values()):
                 # Unload non-active models to free memory
-                instance.status = ModelStatus.DOWNLOADED
-                instance.model_object = None
-                instance.loaded_at = None
-                unloaded_models.append(name)
+                if model_manager.unload_model(name):
+                    unloaded_models.append(name)
         
         model_manager._save_config()
         
@@ -419,6 +493,10 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down Phoenix Hydra Model Service")
     
+    # Stop inference workers and close the Ollama connection pool
+    inference_workers.stop_all(timeout=5.0)
+    await ollama_client.close()
+    
     # Save current configuration
     model_manager._save_config()
     
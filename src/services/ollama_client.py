@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Phoenix Hydra Ollama Client
+Pooled, streaming client for the local Ollama REST API
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+import aiohttp
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OllamaConfig:
+    """Configuration for the Ollama client"""
+    base_url: str = "http://localhost:11434"
+
+    # Connection pool
+    max_connections: int = 16
+    keepalive_timeout: float = 60.0
+
+    # Timeouts (no total timeout: streamed generations can run for minutes)
+    connect_timeout: float = 5.0
+    read_timeout: Optional[float] = 300.0
+
+    # Concurrent generations allowed per model
+    max_concurrent_per_model: int = 2
+
+    # How long Ollama keeps a model resident after a request
+    keep_alive: Optional[str] = "5m"
+
+
+class OllamaAPIError(Exception):
+    """Exception raised for Ollama API errors"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _generation_options(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Map /inference parameters onto Ollama generation options"""
+    options = dict(parameters.get("options", {}))
+    if "max_tokens" in parameters:
+        options["num_predict"] = parameters["max_tokens"]
+    for key in ("temperature", "top_p", "top_k", "seed", "stop"):
+        if key in parameters:
+            options[key] = parameters[key]
+    return options
+
+
+class OllamaClient:
+    """
+    Ollama REST API client sharing one keep-alive connection pool.
+
+    Streams are plain async iterators: closing or cancelling the consumer
+    closes the HTTP connection, which makes Ollama stop generating.
+    """
+
+    def __init__(self, config: Optional[OllamaConfig] = None):
+        self.config = config or OllamaConfig()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._model_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Shared session, created on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                keepalive_timeout=self.config.keepalive_timeout,
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=None,
+                connect=self.config.connect_timeout,
+                sock_read=self.config.read_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                base_url=self.config.base_url, connector=connector, timeout=timeout
+            )
+        return self._session
+
+    def _model_semaphore(self, model: str) -> asyncio.Semaphore:
+        """Concurrency limit for one model"""
+        semaphore = self._model_semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_per_model)
+            self._model_semaphores[model] = semaphore
+        return semaphore
+
+    async def close(self) -> None:
+        """Close the connection pool"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _payload(
+        self, model: str, prompt: str, parameters: Dict[str, Any], stream: bool
+    ) -> Dict[str, Any]:
+        """Request body for /api/generate"""
+        payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": stream}
+        options = _generation_options(parameters)
+        if options:
+            payload["options"] = options
+        if self.config.keep_alive is not None:
+            payload["keep_alive"] = self.config.keep_alive
+        return payload
+
+    @staticmethod
+    async def _raise_for_status(response: aiohttp.ClientResponse) -> None:
+        """Raise OllamaAPIError for error responses"""
+        if response.status < 400:
+            return
+        error_text = await response.text()
+        try:
+            message = json.loads(error_text).get("error", error_text)
+        except (json.JSONDecodeError, AttributeError):
+            message = error_text
+        raise OllamaAPIError(
+            f"Ollama request failed: {message}", status_code=response.status
+        )
+
+    async def generate(
+        self, model: str, prompt: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Generate a complete response"""
+        payload = self._payload(model, prompt, parameters or {}, stream=False)
+        async with self._model_semaphore(model):
+            try:
+                async with self._get_session().post("/api/generate", json=payload) as response:
+                    await self._raise_for_status(response)
+                    data = await response.json(content_type=None)
+            except aiohttp.ClientError as e:
+                raise OllamaAPIError(f"Connection error: {str(e)}")
+        return data.get("response", "")
+
+    async def stream_generate(
+        self, model: str, prompt: str, parameters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Yield response tokens as Ollama produces them"""
+        payload = self._payload(model, prompt, parameters or {}, stream=True)
+        async with self._model_semaphore(model):
+            try:
+                async with self._get_session().post("/api/generate", json=payload) as response:
+                    await self._raise_for_status(response)
+                    # Ollama streams one JSON object per line
+                    async for line in response.content:
+                        if not line.strip():
+                            continue
+                        chunk = json.loads(line)
+                        if "error" in chunk:
+                            raise OllamaAPIError(f"Ollama generation failed: {chunk['error']}")
+                        if chunk.get("response"):
+                            yield chunk["response"]
+                        if chunk.get("done"):
+                            break
+            except aiohttp.ClientError as e:
+                raise OllamaAPIError(f"Connection error: {str(e)}")
+
+    async def list_models(self) -> Dict[str, Any]:
+        """List models available to the Ollama server"""
+        try:
+            async with self._get_session().get("/api/tags") as response:
+                await self._raise_for_status(response)
+                return await response.json(content_type=None)
+        except aiohttp.ClientError as e:
+            raise OllamaAPIError(f"Connection error: {str(e)}")
@@ -0,0 +1,119 @@
+"""
+Micro-benchmarks for event pattern matching
+"""
+
+import time
+from typing import Callable, List
+
+import pytest
+
+from src.event_routing.event_routing import (
+    CachedPatternMatcher,
+    DefaultPatternMatcher,
+    Event,
+    EventPattern,
+    IndexedPatternMatcher,
+    Subscription,
+    WildcardPatternMatcher,
+)
+
+
+def _build_subscriptions(count: int) -> List[Subscription]:
+    """Mix of exact, wildcard, negated and attribute-filtered subscriptions."""
+    patterns = []
+    for i in range(count):
+        service = f"svc{i % 20}"
+        kind = i % 5
+        if kind == 0:
+            patterns.append(EventPattern(f"{service}.created"))
+        elif kind == 1:
+            patterns.append(EventPattern(f"{service}.*", {"level": {"$in": ["warn", "error"]}}))
+        elif kind == 2:
+            patterns.append(EventPattern(f"{service}.**", {"meta.size": {"$gt": 100}}))
+        elif kind == 3:
+            patterns.append(EventPattern(f"!{service}.debug"))
+        else:
+            patterns.append(EventPattern(f"{service}.job*", {"status": "done"}))
+    return [Subscription(pattern=pattern, handler=lambda e: None) for pattern in patterns]
+
+
+def _build_events(count: int) -> List[Event]:
+    return [
+        Event.create(
+            f"svc{i % 20}." + ("created", "jobs", "debug", "task.run")[i % 4],
+            "benchmark",
+            {"level": ("info", "warn", "error")[i % 3],
+             "meta": {"size": i % 200},
+             "status": "done" if i % 2 else "running",
+             "seq": i})
+        for i in range(count)
+    ]
+
+
+def _time_matcher(find: Callable, events: List[Event], subscriptions: List[Subscription]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        find(event, subscriptions)
+    return time.perf_counter() - start
+
+
+@pytest.mark.performance
+class TestPatternMatchingBenchmarks:
+    """Compare the pattern matchers on the same workload"""
+
+    def test_matchers_agree_and_report_timings(self):
+        subscriptions = _build_subscriptions(200)
+        events = _build_events(2000)
+
+        indexed = IndexedPatternMatcher()
+        for subscription in subscriptions:
+            indexed.add_subscription(subscription)
+
+        matchers = {
+            "default": DefaultPatternMatcher(),
+            "wildcard": WildcardPatternMatcher(),
+            "cached": CachedPatternMatcher(cache_size=10000),
+            "indexed": indexed,
+        }
+
+        expected = [
+            [s.id for s in matchers["wildcard"].find_matching_subscriptions(event, subscriptions)]
+            for event in events[:200]
+        ]
+        for name, matcher in matchers.items():
+            actual = [
+                [s.id for s in matcher.find_matching_subscriptions(event, subscriptions)]
+                for event in events[:200]
+            ]
+            assert actual == expected, name
+
+        timings = {
+            name: _time_matcher(matcher.find_matching_subscriptions, events, subscriptions)
+            for name, matcher in matchers.items()
+        }
+        for name, elapsed in timings.items():
+            print(f"{name:>10}: {elapsed * 1e6 / len(events):8.1f} us/event")
+
+        # The index only evaluates candidate subscriptions
+        assert timings["indexed"] < timings["wildcard"]
+
+    def test_compiled_predicate_beats_reparsing(self):
+        patterns = [s.pattern for s in _build_subscriptions(200)]
+        events = _build_events(500)
+        reference = WildcardPatternMatcher()
+
+        start = time.perf_counter()
+        for event in events:
+            for pattern in patterns:
+                reference.matches(event, pattern)
+        wildcard_time = time.perf_counter() - start
+
+        compiled = [pattern.compile() for pattern in patterns]
+        start = time.perf_counter()
+        for event in events:
+            for predicate in compiled:
+                predicate.matches(event)
+        compiled_time = time.perf_counter() - start
+
+        print(f"wildcard: {wildcard_time:.4f}s  compiled: {compiled_time:.4f}s")
+        assert compiled_time < wildcard_time
@@ -0,0 +1,38 @@
+"""
+Shared fixtures for the agent hooks engine tests.
+
+The engine lives in ``.kiro/engine`` but its modules import each other both
+relatively and as ``src.agent_hooks``. The engine is made importable as
+``engine`` and ``src.agent_hooks.*`` is aliased to the same module objects,
+so both spellings share classes such as ``EventType``.
+"""
+
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+from pathlib import Path
+
+ENGINE_PARENT = Path(__file__).resolve().parents[3] / ".kiro"
+ALIAS = "src.agent_hooks"
+
+
+class _EngineAliasFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Resolves ``src.agent_hooks[.x]`` to the already importable ``engine[.x]``."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname == ALIAS or fullname.startswith(ALIAS + "."):
+            return importlib.util.spec_from_loader(fullname, self)
+        return None
+
+    def create_module(self, spec):
+        return importlib.import_module("engine" + spec.name[len(ALIAS) :])
+
+    def exec_module(self, module):
+        pass
+
+
+if str(ENGINE_PARENT) not in sys.path:
+    sys.path.insert(0, str(ENGINE_PARENT))
+if not any(isinstance(finder, _EngineAliasFinder) for finder in sys.meta_path):
+    sys.meta_path.insert(0, _EngineAliasFinder())
@@ -0,0 +1,160 @@
+"""
+Unit tests for log pattern scanning in the container log analysis hook
+"""
+
+from engine.hooks.container_log_analysis_hook import (
+    ContainerLogAnalysisHook,
+    LogPattern,
+    LogPatternScanner,
+)
+
+LINES = [
+    "2024-01-01 INFO server started on :8080",
+    "ERROR: Out of memory while loading model",
+    "psycopg2: Connection refused (is the database up?)",
+    "write failed: No space left on device",
+    "the the request was retried",
+    "user admin admin logged in",
+    "GET /health 200",
+    "code=E42 retry code=E42",
+    "FATAL: panic in worker; Connection reset by peer",
+    "",
+]
+
+
+def _pattern(name, regex):
+    return LogPattern(name=name, pattern=regex, severity="medium", description="")
+
+
+def _per_pattern(patterns, line):
+    return [p for p in patterns if p.matches(line)]
+
+
+def _hook(**config):
+    return ContainerLogAnalysisHook({"id": "log-analysis", **config})
+
+
+class TestLogPatternScanner:
+    """Test cases for LogPatternScanner"""
+
+    def test_default_patterns_match_like_individual_patterns(self):
+        patterns = _hook().log_patterns
+        scanner = LogPatternScanner(patterns)
+
+        assert scanner.prefilter is not None
+        assert scanner.always_check == []
+        for line in LINES:
+            assert scanner.scan(line) == _per_pattern(patterns, line), line
+
+    def test_backreference_patterns_are_checked_individually(self):
+        patterns = [
+            _pattern("repeated_word", r"\b(\w+) \1\b"),
+            _pattern("named_repeat", r"code=(?P<code>\w+) retry code=(?P=code)"),
+            _pattern("oom", r"(Out of memory|OOMKilled)"),
+        ]
+        scanner = LogPatternScanner(patterns)
+
+        assert scanner.always_check == patterns[:2]
+        for line in LINES:
+            assert scanner.scan(line) == _per_pattern(patterns, line), line
+        assert scanner.scan("the the request was retried") == [patterns[0]]
+        assert scanner.scan("user admin admin OOMKilled") == [patterns[0], patterns[2]]
+
+    def test_patterns_that_cannot_be_combined_fall_back(self):
+        # Each compiles alone, but the alternation redefines group "code"
+        patterns = [
+            _pattern("error_code", r"error (?P<code>E\d+)"),
+            _pattern("warning_code", r"warning (?P<code>W\d+)"),
+        ]
+        scanner = LogPatternScanner(patterns)
+
+        assert scanner.prefilter is None
+        assert scanner.always_check == patterns
+        assert scanner.scan("disk warning W7") == [patterns[1]]
+        assert scanner.scan("all good") == []
+
+    def test_matching_is_case_insensitive(self):
+        patterns = [_pattern("denied", r"permission denied")]
+
+        assert LogPatternScanner(patterns).scan("PERMISSION DENIED") == patterns
+
+    def test_no_patterns(self):
+        assert LogPatternScanner([]).scan("Out of memory") == []
+
+
+class TestLogBuffering:
+    """Test cases for the per-container log ring buffer and match cursor"""
+
+    def test_ring_buffer_is_bounded(self):
+        hook = _hook(max_log_lines=5)
+
+        for i in range(12):
+            hook._store_log_line("web", f"line {i}: Out of memory")
+
+        logs = hook.container_logs["web"]
+        assert [line for _, line in logs] == [
+            f"line {i}: Out of memory" for i in range(7, 12)
+        ]
+        assert len(hook.pending_matches["web"]) == 5
+        assert hook.get_container_log_summary("web")["total_log_lines"] == 5
+
+    def test_lines_are_scanned_once(self, monkeypatch):
+        hook = _hook()
+        scanned = []
+        scan = hook.scanner.scan
+
+        def counting_scan(line):
+            scanned.append(line)
+            return scan(line)
+
+        monkeypatch.setattr(hook.scanner, "scan", counting_scan)
+
+        for line in LINES:
+            hook._store_log_line("web", line)
+        first = hook._take_new_matches("web")
+        hook._store_log_line("web", "Killed process 42")
+        second = hook._take_new_matches("web")
+        third = hook._take_new_matches("web")
+
+        assert scanned == LINES + ["Killed process 42"]
+        assert first[0] == len(LINES)
+        assert [(p.name, line) for p, line, _ in second[1]] == [
+            ("out_of_memory", "Killed process 42")
+        ]
+        assert second[0] == 1
+        assert third == (0, [])
+
+    def test_matches_are_queued_in_arrival_order(self):
+        hook = _hook()
+
+        for line in LINES:
+            hook._store_log_line("web", line)
+        _, matches = hook._take_new_matches("web")
+
+        expected = [
+            (p.name, line)
+            for line in LINES
+            for p in _per_pattern(hook.log_patterns, line)
+        ]
+        assert [(p.name, line) for p, line, _ in matches] == expected
+
+    def test_containers_have_separate_cursors(self):
+        hook = _hook()
+        hook._store_log_line("web", "Out of memory")
+        hook._store_log_line("db", "Connection refused")
+
+        assert [p.name for p, _, _ in hook._take_new_matches("web")[1]] == [
+            "out_of_memory"
+        ]
+        assert hook._take_new_matches("web") == (0, [])
+        assert [p.name for p, _, _ in hook._take_new_matches("db")[1]] == [
+            "database_connection_failure"
+        ]
+
+    def test_cleared_containers_have_nothing_pending(self):
+        hook = _hook()
+        hook._store_log_line("web", "Out of memory")
+
+        assert hook.clear_container_logs("web")
+        assert not hook.clear_container_logs("web")
+        assert hook._take_new_matches("web") == (0, [])
@@ -0,0 +1,264 @@
+"""
+Unit tests for the shared container runtime client, against the fake
+runtime API server
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from engine.utils.container_runtime import (
+    ContainerRuntimeClient,
+    ContainerRuntimeError,
+    detect_container_runtime,
+    get_container_runtime,
+    reset_container_runtime,
+)
+from engine.utils.fake_container_runtime import FakeContainerRuntimeServer
+from engine.utils.logging import ExecutionError
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_client():
+    reset_container_runtime()
+    yield
+    reset_container_runtime()
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    """A ``podman`` executable on PATH answering version and inspect."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    inspect = json.dumps([{"Name": "web", "State": {"Status": "running"}}])
+    script = bin_dir / "podman"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'echo "$@" >> "{tmp_path / "cli.log"}"\n'
+        'case "$1" in\n'
+        "  version) echo fake ;;\n"
+        f"  inspect) echo '{inspect}' ;;\n"
+        "  *) echo unsupported >&2; exit 1 ;;\n"
+        "esac\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    return tmp_path / "cli.log"
+
+
+def _serve(scenario, socket_path=None):
+    """Run ``scenario(server)`` against a fake runtime with one container."""
+
+    async def main():
+        async with FakeContainerRuntimeServer(socket_path) as server:
+            server.add_container("web", status="running", health="unhealthy")
+            return await scenario(server)
+
+    return asyncio.run(main())
+
+
+class TestContainerRuntimeClient:
+    """Test cases for ContainerRuntimeClient over the REST API"""
+
+    def test_inspect_and_restart(self):
+        async def scenario(server):
+            client = ContainerRuntimeClient("podman", server.socket_path)
+            restarted = await client.restart("web")
+            info = await client.inspect("web")
+            client.close()
+            return restarted, info
+
+        restarted, info = _serve(scenario)
+
+        assert restarted == (True, "web")
+        assert info["State"]["Health"]["Status"] == "healthy"
+        assert info["RestartCount"] == 1
+
+    def test_missing_container_reports_404(self):
+        async def scenario(server):
+            client = ContainerRuntimeClient("docker", server.socket_path)
+            with pytest.raises(ContainerRuntimeError) as excinfo:
+                await client.inspect("db")
+            restarted = await client.restart("db")
+            client.close()
+            return excinfo.value, restarted
+
+        error, restarted = _serve(scenario)
+
+        assert error.status_code == 404
+        assert "no such container: db" in str(error)
+        assert restarted == (False, "no such container: db")
+
+    def test_podman_update_uses_libpod_resources_body(self):
+        async def scenario(server):
+            client = ContainerRuntimeClient("podman", server.socket_path)
+            result = await client.update_resources("web", 1.5, 512 * 1024 * 1024)
+            client.close()
+            return result, server
+
+        (ok, _), server = _serve(scenario)
+
+        assert ok
+        method, path, body = server.requests[-1]
+        assert (method, path) == ("POST", "/v4.0.0/libpod/containers/web/update")
+        assert body == {
+            "cpu": {"quota": 150_000, "period": 100_000},
+            "memory": {"limit": 512 * 1024 * 1024},
+        }
+        host_config = server.containers["web"]["HostConfig"]
+        assert (host_config["CpuQuota"], host_config["Memory"]) == (
+            150_000,
+            512 * 1024 * 1024,
+        )
+
+    def test_docker_update_uses_compat_body(self):
+        async def scenario(server):
+            client = ContainerRuntimeClient("docker", server.socket_path)
+            result = await client.update_resources("web", 0.5, 256)
+            client.close()
+            return result, server
+
+        (ok, _), server = _serve(scenario)
+
+        assert ok
+        assert server.requests[-1] == (
+            "POST",
+            "/containers/web/update",
+            {"NanoCpus": 500_000_000, "Memory": 256},
+        )
+        assert server.containers["web"]["HostConfig"]["NanoCpus"] == 500_000_000
+
+    def test_prune_removes_exited_containers(self):
+        async def scenario(server):
+            server.add_container("old", status="exited")
+            client = ContainerRuntimeClient("podman", server.socket_path)
+            containers = await client.prune("container")
+            images = await client.prune("image")
+            with pytest.raises(ValueError):
+                await client.prune("volume")
+            client.close()
+            return containers, images, set(server.containers)
+
+        containers, images, remaining = _serve(scenario)
+
+        assert containers == (True, "Pruned unused containers")
+        assert images == (True, "Pruned unused images")
+        assert remaining == {"web"}
+
+    def test_sequential_requests_reuse_one_connection(self):
+        async def scenario(server):
+            client = ContainerRuntimeClient("podman", server.socket_path)
+            for _ in range(5):
+                await client.inspect("web")
+            stats = client.get_stats()
+            client.close()
+            return stats, server.connections
+
+        stats, connections = _serve(scenario)
+
+        assert connections == 1
+        assert stats["connections_opened"] == 1
+        assert stats["api_requests"] == 5
+
+    def test_concurrent_requests_are_bounded_by_pool_size(self):
+        async def scenario(server):
+            client = ContainerRuntimeClient(
+                "podman", server.socket_path, max_connections=2
+            )
+            await asyncio.gather(*(client.inspect("web") for _ in range(10)))
+            client.close()
+            return server.connections
+
+        assert _serve(scenario) <= 2
+
+    def test_reconnects_when_pooled_connection_was_closed(self, tmp_path):
+        socket_path = str(tmp_path / "runtime.sock")
+
+        async def scenario(server):
+            client = ContainerRuntimeClient("podman", socket_path)
+            await client.inspect("web")
+            await server.stop()
+            await server.start()
+            server.add_container("web")
+            info = await client.inspect("web")
+            stats = client.get_stats()
+            client.close()
+            return info, stats
+
+        info, stats = _serve(scenario, socket_path)
+
+        assert info["Name"] == "web"
+        assert stats["uses_api"] and stats["api_fallbacks"] == 0
+        assert stats["connections_opened"] == 2
+
+    def test_falls_back_to_cli_when_socket_dies(self, fake_cli):
+        async def scenario(server):
+            client = ContainerRuntimeClient("podman", server.socket_path)
+            await client.inspect("web")
+            await server.stop()
+            info = await client.inspect("web")
+            return info, client.get_stats()
+
+        info, stats = _serve(scenario)
+
+        assert info["Name"] == "web"
+        assert not stats["uses_api"]
+        assert stats["api_fallbacks"] == 1 and stats["cli_calls"] == 1
+        assert fake_cli.read_text().split("\n")[0] == "inspect web"
+
+
+class TestRuntimeDetection:
+    """Test cases for runtime detection and the shared client"""
+
+    def test_detection_prefers_a_reachable_socket(self, tmp_path):
+        async def scenario(server):
+            candidates = [
+                ("docker", str(tmp_path / "missing.sock")),
+                ("podman", server.socket_path),
+            ]
+            client = await detect_container_runtime(candidates)
+            client.close()
+            return client
+
+        client = _serve(scenario)
+
+        assert (client.runtime, client.uses_api) == ("podman", True)
+
+    def test_detection_falls_back_to_cli(self, tmp_path, fake_cli):
+        async def scenario():
+            return await detect_container_runtime([])
+
+        client = asyncio.run(scenario())
+
+        assert (client.runtime, client.uses_api) == ("podman", False)
+
+    def test_detection_fails_without_any_runtime(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        with pytest.raises(ExecutionError):
+            asyncio.run(detect_container_runtime([]))
+
+    def test_shared_client_is_cached_until_ttl_expires(self):
+        async def scenario(server):
+            candidates = [("podman", server.socket_path)]
+            expired = await get_container_runtime(0, candidates)
+            first = await get_container_runtime(60, candidates)
+            second = await get_container_runtime(60, candidates)
+            pings = sum(1 for _, path, _ in server.requests if path == "/version")
+            return expired, first, second, pings
+
+        expired, first, second, pings = _serve(scenario)
+
+        assert first is not expired
+        assert first is second
+        assert pings == 2
+
+    def test_shared_client_is_redetected_on_a_new_event_loop(self):
+        async def scenario(server):
+            return await get_container_runtime(60, [("podman", server.socket_path)])
+
+        first = _serve(scenario)
+        second = _serve(scenario)
+
+        assert first is not second
@@ -0,0 +1,313 @@
+"""
+Unit tests for file event coalescing in the file system watcher
+"""
+
+import asyncio
+import fnmatch
+import os
+import sys
+import types
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# event_bus.py does not import in this tree (it expects EventFilter in
+# events.router); the watcher only uses EventBus for annotations
+sys.modules.setdefault(
+    "engine.core.event_bus", types.ModuleType("engine.core.event_bus")
+)
+sys.modules["engine.core.event_bus"].EventBus = object
+
+from engine.events.components.file_system_watcher import (  # noqa: E402
+    FileSystemWatcherConfig,
+    FileSystemWatcherEventHandler,
+    compile_glob_patterns,
+)
+
+DEBOUNCE = 0.02
+
+
+def _describe(event):
+    if event.operation == "rename":
+        return f"rename:{event.old_path.name}->{event.file_path.name}"
+    return f"{event.operation}:{event.file_path.name}"
+
+
+async def _handler(tmp_path, **config):
+    events = []
+
+    async def callback(event):
+        events.append(event)
+
+    config.setdefault("debounce_seconds", DEBOUNCE)
+    handler = FileSystemWatcherEventHandler(
+        FileSystemWatcherConfig([str(tmp_path)], **config), callback
+    )
+    return handler, events
+
+
+async def _settle(handler):
+    """Wait out the debounce window and the resulting emissions."""
+    await asyncio.sleep(DEBOUNCE * 4)
+    if handler.emit_tasks:
+        await asyncio.gather(*list(handler.emit_tasks))
+    assert handler.pending == {}
+
+
+def _run(tmp_path, steps, **config):
+    """Feed (operation, path[, dest]) steps to a handler and describe the output."""
+
+    async def scenario():
+        handler, events = await _handler(tmp_path, **config)
+        for step in steps:
+            if step[0] == "move":
+                handler._record_move(tmp_path / step[1], tmp_path / step[2])
+            else:
+                handler._record_change(tmp_path / step[1], step[0])
+        await _settle(handler)
+        handler.close()
+        return [_describe(event) for event in events]
+
+    return asyncio.run(scenario())
+
+
+class TestCoalescing:
+    """Test cases for per-path change coalescing"""
+
+    def test_create_then_modify_is_a_create(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1")
+
+        assert _run(tmp_path, [("create", "a.py"), ("modify", "a.py")]) == [
+            "create:a.py"
+        ]
+
+    def test_create_then_delete_emits_nothing(self, tmp_path):
+        assert _run(tmp_path, [("create", "a.py"), ("delete", "a.py")]) == []
+
+    def test_delete_then_create_is_a_modify(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1")
+
+        assert _run(tmp_path, [("delete", "a.py"), ("create", "a.py")]) == [
+            "modify:a.py"
+        ]
+
+    def test_move_chain_collapses_into_one_rename(self, tmp_path):
+        (tmp_path / "c.py").write_text("x = 1")
+
+        steps = [("move", "a.py", "b.py"), ("move", "b.py", "c.py")]
+        assert _run(tmp_path, steps) == ["rename:a.py->c.py"]
+
+    def test_move_back_emits_nothing(self, tmp_path):
+        steps = [("move", "a.py", "b.py"), ("move", "b.py", "a.py")]
+        assert _run(tmp_path, steps) == []
+
+    def test_modified_then_moved_is_rename_and_modify(self, tmp_path):
+        (tmp_path / "b.py").write_text("x = 1")
+
+        steps = [("modify", "a.py"), ("move", "a.py", "b.py")]
+        assert _run(tmp_path, steps) == ["rename:a.py->b.py", "modify:b.py"]
+
+    def test_delete_after_move_deletes_original_path(self, tmp_path):
+        steps = [("move", "a.py", "b.py"), ("delete", "b.py")]
+        assert _run(tmp_path, steps) == ["delete:a.py"]
+
+    def test_delete_after_move_merges_with_new_file_at_original_path(self, tmp_path):
+        (tmp_path / "h.py").write_text("new")
+        steps = [
+            ("modify", "h.py"),
+            ("move", "h.py", "n.py"),
+            ("create", "h.py"),
+            ("delete", "n.py"),
+        ]
+
+        assert _run(tmp_path, steps) == ["modify:h.py"]
+
+    def test_temp_file_saved_over_known_file_is_a_modify(self, tmp_path):
+        target = tmp_path / "foo.py"
+        target.write_text("old")
+
+        async def scenario():
+            handler, events = await _handler(tmp_path)
+            handler._record_change(target, "create")
+            await _settle(handler)
+
+            temp = tmp_path / ".foo.tmp"
+            temp.write_text("new content")
+            handler._record_change(temp, "create")
+            handler._record_change(temp, "modify")
+            os.replace(temp, target)
+            handler._record_move(temp, target)
+            await _settle(handler)
+            handler.close()
+            return events
+
+        events = asyncio.run(scenario())
+
+        assert [_describe(e) for e in events] == ["create:foo.py", "modify:foo.py"]
+        assert events[0].content_hash != events[1].content_hash
+
+    def test_temp_file_moved_to_new_path_is_a_create(self, tmp_path):
+        (tmp_path / "foo.py").write_text("new")
+        steps = [("create", ".foo.tmp"), ("move", ".foo.tmp", "foo.py")]
+
+        assert _run(tmp_path, steps) == ["create:foo.py"]
+
+    def test_changes_wait_for_quiet_period(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1")
+
+        async def scenario():
+            handler, events = await _handler(tmp_path, debounce_seconds=0.1)
+            handler._record_change(tmp_path / "a.py", "create")
+            await asyncio.sleep(0.06)
+            handler._record_change(tmp_path / "a.py", "modify")
+            await asyncio.sleep(0.06)
+            waiting = list(events)
+            await handler.flush()
+            handler.close()
+            return waiting, events, handler.get_stats()
+
+        waiting, events, stats = asyncio.run(scenario())
+
+        assert waiting == []
+        assert [_describe(e) for e in events] == ["create:a.py"]
+        assert stats["raw_events"] == 2 and stats["coalesced_events"] == 1
+
+
+class TestHashing:
+    """Test cases for the (mtime, size) hash skip"""
+
+    def test_unchanged_file_modify_is_dropped(self, tmp_path):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1")
+
+        async def scenario():
+            handler, events = await _handler(tmp_path)
+            handler._record_change(path, "create")
+            await _settle(handler)
+            handler._record_change(path, "modify")
+            await _settle(handler)
+
+            path.write_text("x = 22")
+            handler._record_change(path, "modify")
+            await _settle(handler)
+            handler.close()
+            return events, handler.get_stats()
+
+        events, stats = asyncio.run(scenario())
+
+        assert [_describe(e) for e in events] == ["create:a.py", "modify:a.py"]
+        assert stats["hash_skips"] == 1
+        assert events[0].content_hash != events[1].content_hash
+
+    def test_large_files_are_not_hashed(self, tmp_path):
+        path = tmp_path / "big.bin"
+        path.write_bytes(b"x" * 2048)
+
+        async def scenario():
+            handler, events = await _handler(tmp_path, max_file_size_mb=0)
+            handler._record_change(path, "create")
+            await _settle(handler)
+            handler.close()
+            return events
+
+        (event,) = asyncio.run(scenario())
+
+        assert event.content_hash is None
+        assert event.data["size_bytes"] == 2048
+
+
+class TestPatterns:
+    """Test cases for compiled include/exclude globs"""
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [["*.py"], ["*.py", "*.md"], ["test_?.py", "[ab]*.txt"], ["*"]],
+    )
+    def test_compiled_patterns_match_like_fnmatch(self, patterns):
+        matcher = compile_glob_patterns(patterns)
+        names = ["a.py", "b.txt", "c.md", "test_1.py", "test_10.py", "x.pyc", ""]
+
+        for name in names:
+            name = os.path.normcase(name)
+            expected = any(fnmatch.fnmatch(name, p) for p in patterns)
+            assert bool(matcher.match(name)) is expected, (patterns, name)
+
+    def test_no_patterns_compile_to_none(self):
+        assert compile_glob_patterns([]) is None
+
+    def test_include_and_exclude_patterns(self, tmp_path):
+        async def scenario():
+            handler, _ = await _handler(
+                tmp_path, include_patterns=["*.py"], exclude_patterns=["test_*"]
+            )
+            return handler
+
+        handler = asyncio.run(scenario())
+
+        def event(name, is_directory=False):
+            return SimpleNamespace(
+                src_path=str(Path("/repo/src") / name), is_directory=is_directory
+            )
+
+        assert handler._should_process_event(event("app.py"))
+        assert not handler._should_process_event(event("test_app.py"))
+        assert not handler._should_process_event(event("notes.md"))
+        assert not handler._should_process_event(event("pkg.py", is_directory=True))
+
+
+class TestMoves:
+    """Test cases for moves between watched and unwatched paths"""
+
+    def _moves(self, tmp_path, moves, known=()):
+        """Feed moves through on_moved with only ``*.py`` watched."""
+
+        async def scenario():
+            handler, events = await _handler(tmp_path, include_patterns=["*.py"])
+            for name in known:
+                handler._record_change(tmp_path / name, "create")
+            await _settle(handler)
+            del events[:]
+
+            for src, dest in moves:
+                os.replace(tmp_path / src, tmp_path / dest)
+                handler.on_moved(
+                    SimpleNamespace(
+                        src_path=str(tmp_path / src),
+                        dest_path=str(tmp_path / dest),
+                        is_directory=False,
+                    )
+                )
+            await asyncio.sleep(0)
+            await _settle(handler)
+            handler.close()
+            return [_describe(event) for event in events]
+
+        return asyncio.run(scenario())
+
+    def test_temp_file_renamed_over_watched_file_is_a_modify(self, tmp_path):
+        (tmp_path / "foo.py").write_text("old")
+        (tmp_path / "foo.py.tmp").write_text("new content")
+
+        events = self._moves(tmp_path, [("foo.py.tmp", "foo.py")], known=["foo.py"])
+
+        assert events == ["modify:foo.py"]
+
+    def test_temp_file_renamed_to_new_watched_file_is_a_create(self, tmp_path):
+        (tmp_path / "foo.py.tmp").write_text("new")
+
+        assert self._moves(tmp_path, [("foo.py.tmp", "foo.py")]) == ["create:foo.py"]
+
+    def test_watched_file_moved_to_unwatched_name_is_a_delete(self, tmp_path):
+        (tmp_path / "foo.py").write_text("x = 1")
+
+        events = self._moves(tmp_path, [("foo.py", "foo.py.bak")], known=["foo.py"])
+
+        assert events == ["delete:foo.py"]
+
+    def test_rename_between_watched_names(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1")
+
+        events = self._moves(tmp_path, [("a.py", "b.py")], known=["a.py"])
+
+        assert events == ["rename:a.py->b.py"]
@@ -0,0 +1,177 @@
+"""
+Unit tests for wave-based hook dispatching
+"""
+
+import asyncio
+
+from engine.core.hook_dispatcher import HookDispatcher
+from engine.core.hook_registry import HookRegistry
+from engine.core.models import AgentHook, HookResult
+from engine.events.models import BaseEvent, EventType
+from engine.utils.logging import ConfigurationError, TimeoutError
+
+
+class RecordingHook(AgentHook):
+    """Hook that sleeps for ``delay`` seconds and records when it ran."""
+
+    def __init__(self, hook_id, log, delay=0.0, **config):
+        super().__init__({"id": hook_id, "name": hook_id, **config})
+        self.triggers = [EventType.FILE_SAVE]
+        self.log = log
+        self.delay = delay
+        self.contexts = []
+
+    async def should_execute(self, context):
+        return True
+
+    async def execute(self, context):
+        self.contexts.append(context)
+        self.log.append(("start", self.id))
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.id))
+        return HookResult.success_result(self.id)
+
+    def get_resource_requirements(self):
+        return {}
+
+
+def _registry(log, hooks, dependencies=()):
+    """Registry of RecordingHooks given as {id: config}."""
+    registry = HookRegistry()
+    for hook_id, config in hooks.items():
+        registry.register_hook(RecordingHook(hook_id, log, **config))
+    for hook_id, dependency_id in dependencies:
+        registry.add_hook_dependency(hook_id, dependency_id)
+    return registry
+
+
+def _dispatch(registry, **kwargs):
+    async def scenario():
+        dispatcher = HookDispatcher(registry, **kwargs)
+        event = BaseEvent(source="test", type=EventType.FILE_SAVE)
+        return await dispatcher.dispatch_event(event)
+
+    return asyncio.run(scenario())
+
+
+def _peak_concurrency(log):
+    running = peak = 0
+    for step, _ in log:
+        running += 1 if step == "start" else -1
+        peak = max(peak, running)
+    return peak
+
+
+class TestHookExecutionWaves:
+    """Test cases for HookRegistry.get_hook_execution_waves"""
+
+    def test_hooks_are_grouped_by_dependency_depth(self):
+        registry = _registry(
+            [],
+            dict.fromkeys("abcde", {}),
+            [("b", "a"), ("c", "a"), ("d", "b"), ("d", "c")],
+        )
+
+        waves = registry.get_hook_execution_waves(list("abcde"))
+
+        assert waves == [["a", "e"], ["b", "c"], ["d"]]
+
+    def test_dependencies_outside_the_selection_are_ignored(self):
+        registry = _registry([], dict.fromkeys("abc", {}), [("b", "a"), ("c", "b")])
+
+        assert registry.get_hook_execution_waves(["b", "c"]) == [["b"], ["c"]]
+        assert registry.get_hook_execution_waves(["a", "c"]) == [["a", "c"]]
+
+
+class TestHookDispatcher:
+    """Test cases for HookDispatcher.dispatch_event"""
+
+    def test_independent_hooks_overlap(self):
+        log = []
+        registry = _registry(log, {"a": {"delay": 0.05}, "b": {"delay": 0.05}})
+
+        results = _dispatch(registry)
+
+        assert [r.success for r in results] == [True, True]
+        assert _peak_concurrency(log) == 2
+
+    def test_concurrency_is_bounded(self):
+        log = []
+        registry = _registry(log, {hook_id: {"delay": 0.02} for hook_id in "abcd"})
+
+        _dispatch(registry, max_concurrent_hooks=2)
+
+        assert _peak_concurrency(log) == 2
+
+    def test_dependents_wait_for_their_wave(self):
+        log = []
+        registry = _registry(
+            log,
+            {"a": {"delay": 0.05}, "b": {"delay": 0.01}, "c": {}},
+            [("c", "a"), ("c", "b")],
+        )
+
+        _dispatch(registry)
+
+        assert log.index(("start", "c")) > log.index(("end", "a"))
+        assert log.index(("start", "c")) > log.index(("end", "b"))
+        hook_c = registry.get_hook("c")
+        history = hook_c.contexts[0].execution_history
+        assert [record["hook_id"] for record in history] == ["a", "b"]
+
+    def test_results_follow_wave_order_not_completion_order(self):
+        log = []
+        registry = _registry(
+            log,
+            {"slow": {"delay": 0.05}, "fast": {}, "last": {}},
+            [("last", "slow")],
+        )
+
+        results = _dispatch(registry)
+
+        assert log.index(("end", "fast")) < log.index(("end", "slow"))
+        assert [r.message for r in results] == ["slow", "fast", "last"]
+
+    def test_per_hook_timeout(self):
+        log = []
+        registry = _registry(
+            log,
+            {"stuck": {"delay": 10, "timeout_seconds": 0.05}, "quick": {}},
+        )
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            event = BaseEvent(source="test", type=EventType.FILE_SAVE)
+            results = await HookDispatcher(registry).dispatch_event(event)
+            return results, loop.time() - started
+
+        (stuck, quick), elapsed = asyncio.run(scenario())
+
+        assert elapsed < 1
+        assert not stuck.success and isinstance(stuck.error, TimeoutError)
+        assert quick.success
+
+    def test_falls_back_to_sequential_priority_order(self):
+        log = []
+        registry = _registry(
+            log,
+            {
+                "low": {"priority": 4, "delay": 0.01},
+                "critical": {"priority": 1, "delay": 0.01},
+                "high": {"priority": 2, "delay": 0.01},
+            },
+        )
+
+        def broken_plan(event_type):
+            raise ConfigurationError("Dependency cycle detected")
+
+        registry.get_execution_plan = broken_plan
+
+        results = _dispatch(registry)
+
+        assert [r.message for r in results] == ["critical", "high", "low"]
+        assert _peak_concurrency(log) == 1
+
+    def test_no_hooks_for_event(self):
+        assert _dispatch(HookRegistry()) == []
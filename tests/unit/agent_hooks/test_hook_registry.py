@@ -0,0 +1,157 @@
+"""
+Unit tests for cached hook execution plans
+"""
+
+import pytest
+
+from engine.core.hook_registry import HookRegistry
+from engine.core.models import AgentHook, HookResult
+from engine.events.models import EventType
+from engine.utils.logging import ConfigurationError
+
+
+class StubHook(AgentHook):
+    """Hook triggered by the given event types."""
+
+    def __init__(self, hook_id, *event_types):
+        super().__init__({"id": hook_id, "name": hook_id})
+        self.triggers = list(event_types) or [EventType.FILE_SAVE]
+
+    async def should_execute(self, context):
+        return True
+
+    async def execute(self, context):
+        return HookResult.success_result(self.id)
+
+    def get_resource_requirements(self):
+        return {}
+
+
+def _ids(plan):
+    return [hook.id for hook in plan.hooks]
+
+
+def _wave_ids(plan):
+    return [[hook.id for hook in wave] for wave in plan.waves]
+
+
+@pytest.fixture
+def registry():
+    registry = HookRegistry()
+    for hook_id in ("lint", "test", "deploy"):
+        registry.register_hook(StubHook(hook_id))
+    registry.register_hook(StubHook("audit", EventType.GIT_COMMIT))
+    return registry
+
+
+class TestExecutionPlanCache:
+    """Test cases for HookRegistry.get_execution_plan caching"""
+
+    def test_plan_is_built_once_per_event_type(self, registry, monkeypatch):
+        calls = []
+        original = registry.get_hook_execution_order
+
+        def counting_order(hook_ids):
+            calls.append(list(hook_ids))
+            return original(hook_ids)
+
+        monkeypatch.setattr(registry, "get_hook_execution_order", counting_order)
+
+        saves = registry.get_execution_plan(EventType.FILE_SAVE)
+        commits = registry.get_execution_plan(EventType.GIT_COMMIT)
+        built = len(calls)
+
+        assert registry.get_execution_plan(EventType.FILE_SAVE) is saves
+        assert registry.get_execution_plan(EventType.GIT_COMMIT) is commits
+        assert len(calls) == built
+        assert _ids(saves) == ["lint", "test", "deploy"]
+        assert _ids(commits) == ["audit"]
+
+    def test_event_type_without_hooks_has_empty_plan(self, registry):
+        plan = registry.get_execution_plan(EventType.BUILD_FAILURE)
+
+        assert plan.hooks == () and plan.waves == ()
+
+    def test_register_invalidates(self, registry):
+        before = registry.get_execution_plan(EventType.FILE_SAVE)
+
+        registry.register_hook(StubHook("docs"))
+
+        after = registry.get_execution_plan(EventType.FILE_SAVE)
+        assert after is not before
+        assert _ids(after) == ["lint", "test", "deploy", "docs"]
+
+    def test_unregister_invalidates(self, registry):
+        registry.add_hook_dependency("deploy", "test")
+        before = registry.get_execution_plan(EventType.FILE_SAVE)
+
+        assert registry.unregister_hook("test")
+
+        after = registry.get_execution_plan(EventType.FILE_SAVE)
+        assert after is not before
+        assert _wave_ids(after) == [["lint", "deploy"]]
+
+    def test_dependency_changes_invalidate(self, registry):
+        independent = registry.get_execution_plan(EventType.FILE_SAVE)
+
+        registry.add_hook_dependency("lint", "deploy")
+        dependent = registry.get_execution_plan(EventType.FILE_SAVE)
+
+        assert dependent is not independent
+        assert _wave_ids(dependent) == [["deploy", "test"], ["lint"]]
+
+        assert registry.remove_hook_dependency("lint", "deploy")
+        restored = registry.get_execution_plan(EventType.FILE_SAVE)
+
+        assert restored is not dependent
+        assert _wave_ids(restored) == [["lint", "test", "deploy"]]
+
+    def test_failed_changes_keep_the_cache(self, registry):
+        registry.add_hook_dependency("test", "lint")
+        plan = registry.get_execution_plan(EventType.FILE_SAVE)
+
+        assert not registry.unregister_hook("missing")
+        assert not registry.remove_hook_dependency("deploy", "lint")
+        with pytest.raises(ConfigurationError):
+            registry.add_hook_dependency("lint", "test")
+        with pytest.raises(ConfigurationError):
+            registry.register_hook(StubHook("lint"))
+
+        assert registry.get_execution_plan(EventType.FILE_SAVE) is plan
+
+
+class TestExecutionPlanOrder:
+    """Test cases for dependency ordering in execution plans"""
+
+    def test_dependencies_run_before_dependents(self):
+        registry = HookRegistry()
+        for hook_id in ("package", "deploy", "build", "notify", "lint"):
+            registry.register_hook(StubHook(hook_id))
+        for hook_id, dependency_id in [
+            ("package", "build"),
+            ("deploy", "package"),
+            ("deploy", "lint"),
+            ("notify", "deploy"),
+        ]:
+            registry.add_hook_dependency(hook_id, dependency_id)
+
+        plan = registry.get_execution_plan(EventType.FILE_SAVE)
+        order = _ids(plan)
+
+        assert sorted(order) == sorted(registry.hooks)
+        for hook_id, dependencies in registry.hook_dependencies.items():
+            for dependency_id in dependencies:
+                assert order.index(dependency_id) < order.index(hook_id)
+        assert _wave_ids(plan) == [
+            ["build", "lint"],
+            ["package"],
+            ["deploy"],
+            ["notify"],
+        ]
+
+    def test_dependencies_on_other_event_types_are_ignored(self, registry):
+        registry.add_hook_dependency("deploy", "audit")
+
+        plan = registry.get_execution_plan(EventType.FILE_SAVE)
+
+        assert _wave_ids(plan) == [["lint", "test", "deploy"]]
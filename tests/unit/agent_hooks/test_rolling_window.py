@@ -0,0 +1,159 @@
+"""
+Unit tests for the rolling time-window aggregator
+"""
+
+import random
+
+import pytest
+
+from engine.utils.rolling_window import RollingWindowAggregator
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _window(clock, **kwargs):
+    kwargs.setdefault("num_buckets", 10)
+    return RollingWindowAggregator(10.0, clock=clock, **kwargs)
+
+
+class TestRollingWindowAggregator:
+    """Test cases for RollingWindowAggregator"""
+
+    def test_statistics_over_the_window(self):
+        clock = FakeClock(100.0)
+        window = _window(clock)
+        for value in (4.0, 1.0, 7.0):
+            window.add(value)
+            clock.now += 1
+
+        assert window.count() == 3
+        assert window.sum() == 12.0
+        assert window.mean() == 4.0
+        assert (window.min(), window.max(), window.last) == (1.0, 7.0, 7.0)
+
+    def test_buckets_expire_as_time_moves_on(self):
+        clock = FakeClock(100.0)
+        window = _window(clock)
+        window.add(1.0)
+        clock.now = 105.0
+        window.add(10.0)
+
+        clock.now = 109.9
+        assert window.count() == 2
+        clock.now = 110.0
+        assert (window.count(), window.min(), window.mean()) == (1, 10.0, 10.0)
+        clock.now = 115.0
+        assert (window.count(), window.mean(), window.min()) == (0, None, None)
+
+    def test_long_gap_resets_the_whole_window(self):
+        clock = FakeClock(0.0)
+        window = _window(clock)
+        for second in range(10):
+            clock.now = float(second)
+            window.add(second)
+
+        clock.now = 1000.0
+        assert window.count() == 0
+        assert window.sum() == 0.0
+        assert window.max() is None
+
+        window.add(3.0)
+        assert (window.count(), window.mean(), window.max()) == (1, 3.0, 3.0)
+
+    def test_samples_older_than_the_window_are_ignored(self):
+        clock = FakeClock(100.0)
+        window = _window(clock)
+        window.add(5.0)
+
+        window.add(50.0, timestamp=80.0)
+        window.add(7.0, timestamp=99.5)
+
+        assert window.count() == 2
+        assert window.max() == 7.0
+        assert window.last == 5.0
+
+    def test_matches_a_brute_force_window(self):
+        rng = random.Random(7)
+        clock = FakeClock(0.0)
+        window = _window(clock)
+        samples = []
+
+        for _ in range(2000):
+            clock.now += rng.uniform(0, 0.3)
+            value = rng.uniform(-50, 50)
+            window.add(value)
+            samples.append((clock.now, value))
+
+            # The window holds whole buckets: the current one and the 9 before it
+            first_epoch = int(clock.now // 1.0) - 9
+            live = [v for t, v in samples if int(t // 1.0) >= first_epoch]
+            assert window.count() == len(live)
+            assert window.mean() == pytest.approx(sum(live) / len(live))
+            assert (window.min(), window.max()) == (min(live), max(live))
+
+    def test_ewma(self):
+        window = _window(FakeClock(), ewma_alpha=0.5)
+        assert window.ewma is None
+
+        for value in (10.0, 20.0, 30.0):
+            window.add(value)
+
+        assert window.ewma == pytest.approx(22.5)
+        assert _window(FakeClock()).ewma is None
+
+    def test_histogram_percentiles(self):
+        clock = FakeClock(100.0)
+        window = _window(clock, histogram_range=(0.0, 100.0), histogram_bins=100)
+        for value in range(1, 101):
+            window.add(float(value))
+
+        assert window.percentile(50) == pytest.approx(50.5)
+        assert window.percentile(95) == pytest.approx(95.5)
+        assert window.percentile(100) == pytest.approx(99.5)
+
+        clock.now = 200.0
+        assert window.percentile(50) is None
+
+    def test_histogram_clamps_out_of_range_values(self):
+        window = _window(FakeClock(), histogram_range=(0.0, 10.0), histogram_bins=10)
+        window.add(-5.0)
+        window.add(50.0)
+
+        assert window.percentile(1) == pytest.approx(0.5)
+        assert window.percentile(100) == pytest.approx(9.5)
+
+    def test_percentile_requires_a_histogram(self):
+        with pytest.raises(ValueError):
+            _window(FakeClock()).percentile(50)
+
+    def test_snapshot(self):
+        window = _window(
+            FakeClock(), ewma_alpha=1.0, histogram_range=(0.0, 10.0), histogram_bins=10
+        )
+        window.add(2.0)
+        window.add(4.0)
+
+        snapshot = window.snapshot()
+
+        assert snapshot["count"] == 2 and snapshot["mean"] == 3.0
+        assert snapshot["ewma"] == 4.0
+        assert snapshot["p50"] == pytest.approx(2.5)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"window_seconds": 0},
+            {"window_seconds": 10, "num_buckets": 0},
+            {"window_seconds": 10, "ewma_alpha": 0},
+            {"window_seconds": 10, "histogram_range": (5.0, 5.0)},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            RollingWindowAggregator(**kwargs)
@@ -0,0 +1,40 @@
+"""
+Shared setup for the unit tests.
+
+``src.biomimetic_agents`` imports ``src.local_processing``, which is not
+part of this tree. When it is missing, a stand-in providing the names the
+agent modules import is registered so their tests can be collected; the
+tests pass their own doubles wherever a pipeline is used.
+"""
+
+import importlib.util
+import sys
+import types
+from enum import Enum
+
+
+def _install_local_processing_stub():
+    if importlib.util.find_spec("src.local_processing") is not None:
+        return
+
+    class ProcessingMode(Enum):
+        FULL_CAPABILITY = "full_capability"
+        ENERGY_EFFICIENT = "energy_efficient"
+        MINIMAL_RESOURCES = "minimal_resources"
+        OFFLINE_ONLY = "offline_only"
+
+    class ProcessingRequest:
+        def __init__(self, **fields):
+            self.__dict__.update(fields)
+
+    class LocalAIPipeline:
+        pass
+
+    module = types.ModuleType("src.local_processing")
+    module.ProcessingMode = ProcessingMode
+    module.ProcessingRequest = ProcessingRequest
+    module.LocalAIPipeline = LocalAIPipeline
+    sys.modules[module.__name__] = module
+
+
+_install_local_processing_stub()
@@ -0,0 +1,131 @@
+import threading
+import time
+import unittest
+
+from src.event_routing.delivery import AsyncDeliveryEngine, DeliveryStats, OverflowPolicy
+from src.event_routing.event_routing import (
+    DeliveryMode,
+    Event,
+    EventPattern,
+    EventRouter,
+)
+
+
+class _Sub:
+    def __init__(self, sub_id):
+        self.id = sub_id
+
+
+class TestAsyncDeliveryEngine(unittest.TestCase):
+    def test_per_subscription_order_is_preserved(self):
+        received = {"a": [], "b": []}
+
+        def deliver(subscription, event):
+            received[subscription.id].append(event)
+
+        engine = AsyncDeliveryEngine(deliver, max_workers=4, drain_batch_size=3)
+        subs = [_Sub("a"), _Sub("b")]
+        for i in range(200):
+            for sub in subs:
+                engine.submit(sub, i)
+
+        self.assertTrue(engine.wait_until_idle(timeout=5))
+        engine.shutdown()
+        self.assertEqual(received["a"], list(range(200)))
+        self.assertEqual(received["b"], list(range(200)))
+
+    def test_thread_count_is_bounded(self):
+        engine = AsyncDeliveryEngine(lambda s, e: time.sleep(0.001), max_workers=2)
+        for i in range(50):
+            engine.submit(_Sub(f"s{i}"), i)
+
+        workers = [t for t in threading.enumerate() if t.name.startswith("event-delivery")]
+        self.assertLessEqual(len(workers), 2)
+        self.assertTrue(engine.wait_until_idle(timeout=5))
+        engine.shutdown()
+
+    def _blocked_engine(self, policy, **kwargs):
+        gate = threading.Event()
+        delivered = []
+
+        def deliver(subscription, event):
+            gate.wait(5)
+            delivered.append(event)
+
+        engine = AsyncDeliveryEngine(deliver, max_workers=1, mailbox_capacity=2,
+                                     overflow_policy=policy, **kwargs)
+        sub = _Sub("slow")
+        engine.submit(sub, 0)
+        time.sleep(0.05)  # let the worker take event 0 and block on the gate
+        return engine, sub, gate, delivered
+
+    def test_reject_policy(self):
+        engine, sub, gate, delivered = self._blocked_engine(OverflowPolicy.REJECT)
+        self.assertTrue(engine.submit(sub, 1))
+        self.assertTrue(engine.submit(sub, 2))
+        self.assertFalse(engine.submit(sub, 3))
+
+        gate.set()
+        engine.shutdown()
+        self.assertEqual(delivered, [0, 1, 2])
+        self.assertEqual(engine.stats["rejected"], 1)
+
+    def test_drop_oldest_policy(self):
+        engine, sub, gate, delivered = self._blocked_engine(OverflowPolicy.DROP_OLDEST)
+        for i in (1, 2, 3):
+            self.assertTrue(engine.submit(sub, i))
+
+        gate.set()
+        engine.shutdown()
+        self.assertEqual(delivered, [0, 2, 3])
+        self.assertEqual(engine.stats["dropped"], 1)
+
+    def test_block_policy_times_out(self):
+        engine, sub, gate, delivered = self._blocked_engine(OverflowPolicy.BLOCK,
+                                                            block_timeout=0.05)
+        engine.submit(sub, 1)
+        engine.submit(sub, 2)
+        self.assertFalse(engine.submit(sub, 3))
+
+        gate.set()
+        engine.shutdown()
+        self.assertEqual(delivered, [0, 1, 2])
+
+
+class TestDeliveryStats(unittest.TestCase):
+    def test_concurrent_increments(self):
+        stats = DeliveryStats(["hits"])
+
+        def bump():
+            for _ in range(1000):
+                stats.increment("hits")
+
+        threads = [threading.Thread(target=bump) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(stats["hits"], 8000)
+
+
+class TestRouterAsyncMode(unittest.TestCase):
+    def test_async_publish_uses_worker_pool(self):
+        router = EventRouter(max_concurrent_deliveries=3)
+        received = []
+        router.subscribe(EventPattern("job.*"), received.append)
+
+        for i in range(100):
+            router.publish(Event.create("job.done", "test", payload={"n": i}),
+                           DeliveryMode.ASYNC)
+
+        self.assertTrue(router.wait_for_async_deliveries(timeout=5))
+        router.shutdown()
+        self.assertEqual([e.payload["n"] for e in received], list(range(100)))
+        stats = router.get_stats()
+        self.assertEqual(stats["successful_deliveries"], 100)
+        self.assertEqual(stats["async_engine"]["workers"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
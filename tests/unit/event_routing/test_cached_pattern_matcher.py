@@ -0,0 +1,117 @@
+import threading
+import unittest
+
+from src.event_routing.event_routing import (
+    CachedPatternMatcher,
+    Event,
+    EventPattern,
+    EventRouter,
+    Subscription,
+)
+
+
+def _event(event_type, payload=None):
+    return Event.create(event_type, "test", payload or {})
+
+
+class TestCachedPatternMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = CachedPatternMatcher(cache_size=3)
+
+    def test_key_only_uses_referenced_fields(self):
+        pattern = EventPattern("user.*", {"level": "error"})
+        self.assertTrue(self.matcher.matches(_event("user.login", {"level": "error", "n": 1}), pattern))
+        self.assertTrue(self.matcher.matches(_event("user.login", {"n": 2, "level": "error"}), pattern))
+        self.assertFalse(self.matcher.matches(_event("user.login", {"level": "info"}), pattern))
+        self.assertFalse(self.matcher.matches(_event("order.login", {"level": "error"}), pattern))
+
+        stats = self.matcher.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 3))
+        self.assertEqual(stats["cache_size"], 3)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        pattern = EventPattern("*", {"n": {"$gt": 0}})
+        for n in (1, 2, 3):
+            self.matcher.matches(_event("t", {"n": n}), pattern)
+        self.matcher.matches(_event("t", {"n": 1}), pattern)  # refresh n=1
+        self.matcher.matches(_event("t", {"n": 4}), pattern)  # evicts n=2
+
+        self.matcher.matches(_event("t", {"n": 1}), pattern)
+        self.matcher.matches(_event("t", {"n": 2}), pattern)
+        stats = self.matcher.get_cache_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["cache_size"], 3)
+
+    def test_unhashable_values_are_matched_without_caching(self):
+        pattern = EventPattern("*", {"tags": ["a"]})
+        self.assertTrue(self.matcher.matches(_event("t", {"tags": ["a"]}), pattern))
+        self.assertEqual(self.matcher.get_cache_stats()["cache_size"], 0)
+
+    def test_recompiled_pattern_does_not_reuse_results(self):
+        pattern = EventPattern("*", {"n": 1})
+        event = _event("t", {"n": 1})
+        self.assertTrue(self.matcher.matches(event, pattern))
+        pattern.attributes = {"n": 2}
+        self.assertFalse(self.matcher.matches(event, pattern))
+
+    def test_attributes_edited_in_place_do_not_reuse_results(self):
+        pattern = EventPattern("*", {"n": 1})
+        event = _event("t", {"n": 1})
+        self.assertTrue(self.matcher.matches(event, pattern))
+        pattern.attributes["n"] = 2
+        self.assertFalse(self.matcher.matches(event, pattern))
+        self.assertTrue(self.matcher.matches(_event("t", {"n": 2}), pattern))
+
+    def test_remove_subscription_invalidates_entries(self):
+        subscription = Subscription(pattern=EventPattern("user.*"), handler=lambda e: None)
+        other = EventPattern("order.*")
+        self.matcher.matches(_event("user.login"), subscription.pattern)
+        self.matcher.matches(_event("user.login"), other)
+
+        self.matcher.remove_subscription(subscription)
+        self.assertEqual(self.matcher.get_cache_stats()["cache_size"], 1)
+        self.matcher.clear_cache()
+        self.assertEqual(self.matcher.get_cache_stats()["cache_size"], 0)
+
+    def test_concurrent_lookups(self):
+        matcher = CachedPatternMatcher(cache_size=50)
+        patterns = [EventPattern(f"svc{i}.*", {"n": {"$lt": 50}}) for i in range(10)]
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(500):
+                    n = (i + offset) % 100
+                    for index, pattern in enumerate(patterns):
+                        expected = i % 10 == index and n < 50
+                        if matcher.matches(_event(f"svc{i % 10}.x", {"n": n}), pattern) != expected:
+                            errors.append((i, index))
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        stats = matcher.get_cache_stats()
+        self.assertLessEqual(stats["cache_size"], 50)
+        self.assertEqual(stats["hits"] + stats["misses"], 4 * 500 * 10)
+
+    def test_router_unsubscribe_drops_cached_results(self):
+        router = EventRouter(pattern_matcher=CachedPatternMatcher())
+        received = []
+        subscription = router.subscribe(EventPattern("user.*"), received.append)
+        router.publish(_event("user.login"))
+        self.assertEqual(router.pattern_matcher.get_cache_stats()["cache_size"], 1)
+
+        router.unsubscribe(subscription)
+        self.assertEqual(router.pattern_matcher.get_cache_stats()["cache_size"], 0)
+        self.assertEqual(len(received), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
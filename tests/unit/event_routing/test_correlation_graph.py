@@ -0,0 +1,134 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.event_routing.correlation_graph import CorrelationGraph
+from src.event_routing.event_correlator import EventCorrelator
+from src.event_routing.event_routing import Event
+from src.event_routing.event_store import InMemoryEventStore
+
+
+def _event(event_type, seconds, correlation_id=None, causation_id=None):
+    event = Event.create(event_type, "svc", correlation_id=correlation_id,
+                         causation_id=causation_id)
+    event.timestamp = datetime(2024, 1, 1) + timedelta(seconds=seconds)
+    return event
+
+
+class TestCorrelationGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = CorrelationGraph()
+        self.root = _event("root", 1, "c1")
+        self.child = _event("child", 3, "c1", self.root.id)
+        self.late = _event("late", 2, "c1", self.root.id)
+        self.grandchild = _event("grand", 4, "c2", self.child.id)
+        for event in (self.root, self.child, self.late, self.grandchild):
+            self.graph.add(event)
+
+    def test_chain_is_time_ordered_on_insert(self):
+        self.assertEqual(self.graph.get_chain("c1"), [self.root, self.late, self.child])
+
+    def test_children_ancestors_and_descendants(self):
+        self.assertEqual(self.graph.get_children(self.root.id), [self.child, self.late])
+        self.assertEqual(self.graph.get_ancestors(self.grandchild.id),
+                         [self.root, self.child, self.grandchild])
+        self.assertEqual(self.graph.get_descendants(self.root.id),
+                         [self.child, self.late, self.grandchild])
+        self.assertEqual(self.graph.get_descendants(self.root.id, max_depth=1),
+                         [self.child, self.late])
+
+    def test_timeline_includes_causation_neighbours(self):
+        self.assertEqual(self.graph.get_timeline("c1"),
+                         [self.root, self.late, self.child, self.grandchild])
+        self.assertEqual(self.graph.get_timeline("c2", include_causation=False),
+                         [self.grandchild])
+
+    def test_remove_updates_indexes(self):
+        self.graph.remove(self.late.id)
+        self.assertEqual(self.graph.get_chain("c1"), [self.root, self.child])
+        self.assertEqual(self.graph.get_children(self.root.id), [self.child])
+
+    def test_lru_evicts_least_recently_used_chain(self):
+        evicted = []
+        graph = CorrelationGraph(max_chains=2, on_evict=lambda cid, events: evicted.append(cid))
+        graph.add(_event("a", 1, "a"))
+        graph.add(_event("b", 1, "b"))
+        graph.get_chain("a")
+        graph.add(_event("c", 1, "c"))
+
+        self.assertEqual(evicted, ["b"])
+        self.assertTrue(graph.has_chain("a"))
+        self.assertEqual(len(graph), 2)
+
+
+class TestCorrelatorUsesGraph(unittest.TestCase):
+    def test_chain_causation_and_children(self):
+        correlator = EventCorrelator()
+        root = correlator.correlate(_event("root", 5))
+        second = correlator.correlate(_event("second", 7), parent_event=root)
+        first = correlator.correlate(_event("first", 6), parent_event=root)
+
+        self.assertEqual(correlator.get_correlation_chain(root.correlation_id),
+                         [root, first, second])
+        self.assertEqual(correlator.get_causation_chain(second.id), [root, second])
+        self.assertEqual(correlator.get_caused_events(root.id), [second, first])
+
+    def test_bounded_chains(self):
+        correlator = EventCorrelator(max_chains=1)
+        old = correlator.correlate(_event("old", 1))
+        new = correlator.correlate(_event("new", 2))
+
+        self.assertIsNone(correlator.get_correlation_id_for_event(old.id))
+        self.assertEqual(correlator.get_correlation_chain(new.correlation_id), [new])
+        with self.assertRaises(ValueError):
+            correlator.get_correlation_chain(old.correlation_id)
+
+    def test_child_of_evicted_parent_starts_fresh_chain(self):
+        correlator = EventCorrelator(max_chains=1)
+        parent = correlator.correlate(_event("parent", 1))
+        correlator.correlate(_event("other", 2))
+
+        child = correlator.correlate(_event("child", 3), parent_event=parent)
+
+        self.assertEqual(child.correlation_id, parent.correlation_id)
+        self.assertEqual(child.causation_id, parent.id)
+        self.assertEqual(correlator.get_correlation_chain(child.correlation_id), [child])
+        self.assertEqual(correlator.get_correlation_id_for_event(child.id),
+                         parent.correlation_id)
+
+    def test_associate_skips_events_evicted_meanwhile(self):
+        correlator = EventCorrelator(max_chains=1)
+        first = correlator.correlate(_event("first", 1))
+        second = correlator.correlate(_event("second", 2), parent_event=first)
+
+        # Moving the first event opens a new chain, evicting the old one
+        correlation_id = correlator.associate_events([first.id, second.id])
+
+        self.assertEqual(correlator.get_correlation_chain(correlation_id), [first])
+        self.assertIsNone(correlator.get_correlation_id_for_event(second.id))
+
+
+class TestStoreTimeline(unittest.TestCase):
+    def test_timeline_and_traversal_from_indexes(self):
+        store = InMemoryEventStore()
+        root = _event("root", 1, "c1")
+        child = _event("child", 2, "c1", root.id)
+        outside = _event("outside", 3, None, child.id)
+        cause = _event("cause", 0)
+        root.causation_id = cause.id
+        unrelated = _event("unrelated", 4, "c2")
+        for event in (root, child, outside, cause, unrelated):
+            store.store(event)
+
+        self.assertEqual([e.type for e in store.get_event_timeline("c1")],
+                         ["cause", "root", "child", "outside"])
+        self.assertEqual([e.type for e in store.get_event_timeline("c1", include_causation=False)],
+                         ["root", "child"])
+        self.assertEqual(store.get_caused_events(root.id), [child])
+        self.assertEqual([e.type for e in store.get_causation_chain(outside.id)],
+                         ["cause", "root", "child", "outside"])
+        self.assertEqual([e.type for e in store.get_descendant_events(cause.id)],
+                         ["root", "child", "outside"])
+
+
+if __name__ == '__main__':
+    unittest.main()
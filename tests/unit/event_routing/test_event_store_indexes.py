@@ -0,0 +1,77 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.event_routing.event_routing import Event
+from src.event_routing.event_store import InMemoryEventStore
+
+
+def _event(event_type, seconds, source="svc", correlation_id=None, causation_id=None):
+    event = Event.create(event_type, source, correlation_id=correlation_id,
+                         causation_id=causation_id)
+    event.timestamp = datetime(2024, 1, 1) + timedelta(seconds=seconds)
+    return event
+
+
+class TestInMemoryEventStoreIndexes(unittest.TestCase):
+    def setUp(self):
+        self.store = InMemoryEventStore()
+
+    def test_out_of_order_inserts_are_time_ordered(self):
+        for seconds in [5, 1, 3, 4, 2]:
+            self.store.store(_event("t", seconds))
+
+        stamps = [e.timestamp.second for e in self.store.get_events()]
+        self.assertEqual(stamps, [1, 2, 3, 4, 5])
+
+    def test_time_range_is_inclusive(self):
+        for seconds in range(10):
+            self.store.store(_event("t", seconds))
+
+        start = datetime(2024, 1, 1, 0, 0, 3)
+        end = datetime(2024, 1, 1, 0, 0, 6)
+        events = self.store.get_events(start_time=start, end_time=end)
+        self.assertEqual([e.timestamp.second for e in events], [3, 4, 5, 6])
+
+        page = self.store.get_events(start_time=start, limit=2, offset=1)
+        self.assertEqual([e.timestamp.second for e in page], [4, 5])
+
+    def test_secondary_index_queries(self):
+        self.store.store(_event("a", 1, source="x", correlation_id="c1"))
+        self.store.store(_event("b", 2, source="y", correlation_id="c1"))
+        self.store.store(_event("a", 3, source="y", correlation_id="c2"))
+
+        self.assertEqual(len(self.store.get_events({"type": "a"})), 2)
+        self.assertEqual(len(self.store.get_events({"type": "a", "source": "y"})), 1)
+        self.assertEqual(self.store.get_event_count({"correlation_id": "c1"}), 2)
+        self.assertEqual(self.store.get_event_count({"type": "missing"}), 0)
+        self.assertEqual(self.store.get_stats()["event_types"], {"a": 2, "b": 1})
+
+    def test_replacing_event_updates_indexes(self):
+        event = _event("a", 1)
+        self.store.store(event)
+
+        replacement = _event("b", 2)
+        replacement.id = event.id
+        self.store.store(replacement)
+
+        self.assertEqual(self.store.get_event_count(), 1)
+        self.assertEqual(self.store.get_event_count({"type": "a"}), 0)
+        self.assertEqual(self.store.get_event_count({"type": "b"}), 1)
+
+    def test_type_pattern_merges_buckets_in_time_order(self):
+        self.store.store(_event("user.created", 2))
+        self.store.store(_event("user.deleted", 1))
+        self.store.store(_event("order.created", 3))
+
+        events = self.store.get_events_by_type_pattern("user.*")
+        self.assertEqual([e.type for e in events], ["user.deleted", "user.created"])
+
+    def test_clear_resets_indexes(self):
+        self.store.store(_event("a", 1))
+        self.assertEqual(self.store.clear(), 1)
+        self.assertEqual(self.store.get_events({"type": "a"}), [])
+        self.assertEqual(self.store.get_stats()["event_types"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+
+from src.event_routing.event_routing import (
+    DefaultPatternMatcher,
+    Event,
+    EventPattern,
+    EventRouter,
+    IndexedPatternMatcher,
+    Subscription,
+)
+
+
+def _noop(event):
+    pass
+
+
+class TestIndexedPatternMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = IndexedPatternMatcher()
+        self.reference = DefaultPatternMatcher()
+        self.subscriptions = []
+
+    def _subscribe(self, event_type, priority=0, attributes=None):
+        subscription = Subscription(
+            pattern=EventPattern(event_type, attributes or {}),
+            handler=_noop,
+            priority=priority)
+        self.subscriptions.append(subscription)
+        self.matcher.add_subscription(subscription)
+        return subscription
+
+    def _assert_same_as_reference(self, event_type, payload=None):
+        event = Event.create(event_type, "test", payload=payload)
+        expected = self.reference.find_matching_subscriptions(event, self.subscriptions)
+        actual = self.matcher.find_matching_subscriptions(event, [])
+        self.assertEqual([s.id for s in actual], [s.id for s in expected], event_type)
+
+    def test_matches_like_default_matcher(self):
+        for pattern in ["user.created", "user.*", "user.**", "*.created", "**.created",
+                        "**", "*", "user.*.done", "user.**.done", "user.log*",
+                        "regex:^sys\\.", "!user.created", "system.alert"]:
+            self._subscribe(pattern)
+
+        for event_type in ["user.created", "user.deleted", "user.a.done", "user.a.b.done",
+                           "user.login", "sys.boot", "system.alert", "user", "other"]:
+            self._assert_same_as_reference(event_type)
+
+    def test_priority_order_across_buckets(self):
+        low = self._subscribe("user.created", priority=1)
+        high = self._subscribe("user.*", priority=10)
+        mid = self._subscribe("*", priority=5)
+
+        event = Event.create("user.created", "test")
+        matches = self.matcher.find_matching_subscriptions(event, [])
+        self.assertEqual(matches, [high, mid, low])
+
+    def test_attribute_filters_applied(self):
+        error_sub = self._subscribe("job.*", attributes={"status": "error"})
+        self._subscribe("job.*", attributes={"status": "ok"})
+
+        event = Event.create("job.finished", "test", payload={"status": "error"})
+        self.assertEqual(self.matcher.find_matching_subscriptions(event, []), [error_sub])
+
+    def test_remove_subscription_prunes_index(self):
+        subscription = self._subscribe("a.*.c")
+        self.matcher.remove_subscription(subscription)
+
+        event = Event.create("a.b.c", "test")
+        self.assertEqual(self.matcher.find_matching_subscriptions(event, []), [])
+        self.assertTrue(self.matcher._trie.is_empty())
+        self.assertEqual(self.matcher.get_index_stats()["indexed_subscriptions"], 0)
+
+    def test_add_is_idempotent(self):
+        subscription = self._subscribe("x.y")
+        self.matcher.add_subscription(subscription)
+
+        event = Event.create("x.y", "test")
+        self.assertEqual(self.matcher.find_matching_subscriptions(event, []), [subscription])
+
+
+class TestEventRouterIndexMaintenance(unittest.TestCase):
+    def setUp(self):
+        self.router = EventRouter()
+        self.received = []
+
+    def test_default_matcher_is_indexed(self):
+        self.assertIsInstance(self.router.pattern_matcher, IndexedPatternMatcher)
+
+    def test_pause_resume_and_unsubscribe(self):
+        subscription = self.router.subscribe(EventPattern("svc.*"), self.received.append)
+
+        self.router.pause_subscription(subscription.id)
+        self.router.publish(Event.create("svc.up", "test"))
+        self.assertEqual(self.received, [])
+
+        self.router.resume_subscription(subscription.id)
+        self.router.publish(Event.create("svc.up", "test"))
+        self.assertEqual(len(self.received), 1)
+
+        self.assertTrue(self.router.unsubscribe_by_id(subscription.id))
+        self.router.publish(Event.create("svc.up", "test"))
+        self.assertEqual(len(self.received), 1)
+        self.assertIsNone(self.router.get_subscription_by_id(subscription.id))
+
+    def test_cleanup_expired_removes_from_index(self):
+        self.router.subscribe(EventPattern("svc.*"), self.received.append, max_events=1)
+        self.router.publish(Event.create("svc.up", "test"))
+
+        self.assertEqual(self.router.cleanup_expired_subscriptions(), 1)
+        stats = self.router.pattern_matcher.get_index_stats()
+        self.assertEqual(stats["indexed_subscriptions"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+
+from src.event_routing.event_routing import (
+    Event,
+    EventPattern,
+    Subscription,
+    WildcardPatternMatcher,
+)
+from src.event_routing.pattern_compiler import CompiledPattern, compile_type_matcher
+
+TYPE_PATTERNS = [
+    "*", "**", "user.created", "user.*", "user.**", "**.created", "user.*.done",
+    "user.log*", "*.created", "a.**.z", "!user.*", "!!user.*", "regex:^user\\.",
+    "regex:ord(er)?", "regex:[unclosed", "", "user.created.",
+]
+EVENT_TYPES = [
+    "user", "user.created", "user.deleted", "user.profile.created", "user.x.done",
+    "user.login", "order.created", "a.z", "a.b.c.z", "az", "", "user.created.",
+]
+
+
+class TestCompileTypeMatcher(unittest.TestCase):
+    def test_agrees_with_wildcard_matcher(self):
+        reference = WildcardPatternMatcher()
+        for pattern_str in TYPE_PATTERNS:
+            predicate = compile_type_matcher(pattern_str)
+            for event_type in EVENT_TYPES:
+                with self.subTest(pattern=pattern_str, event_type=event_type):
+                    self.assertEqual(
+                        predicate(event_type),
+                        reference.matches_event_type(event_type, pattern_str))
+
+    def test_compiled_predicates_are_shared(self):
+        self.assertIs(compile_type_matcher("user.*"), compile_type_matcher("user.*"))
+
+
+class TestCompiledPatternAttributes(unittest.TestCase):
+    def _matches(self, attributes, payload):
+        return CompiledPattern("*", attributes).matches_attributes(payload)
+
+    def test_direct_and_nested_values(self):
+        payload = {"status": "ok", "user": {"id": 7, "tags": ["a"]}}
+        self.assertTrue(self._matches({"status": "ok", "user.id": 7}, payload))
+        self.assertFalse(self._matches({"status": "fail"}, payload))
+        self.assertFalse(self._matches({"missing": None}, payload))
+        self.assertFalse(self._matches({"user.id.deeper": 7}, payload))
+        self.assertFalse(self._matches({"status.value": "ok"}, payload))
+        self.assertTrue(self._matches({"user.tags": ["a"]}, payload))
+
+    def test_comparison_operators(self):
+        payload = {"n": 5, "s": "5"}
+        self.assertTrue(self._matches({"n": {"$gt": 4, "$lte": 5}}, payload))
+        self.assertFalse(self._matches({"n": {"$gt": 5}}, payload))
+        self.assertFalse(self._matches({"s": {"$gte": "0"}}, payload))
+        self.assertTrue(self._matches({"n": {"$ne": 4, "$eq": 5}}, payload))
+        self.assertTrue(self._matches({"n": {"$exists": True}}, payload))
+        self.assertTrue(self._matches({"n": {"$unknown": 1}}, payload))
+
+    def test_membership_operators(self):
+        self.assertTrue(self._matches({"r": {"$in": ["a", "b"]}}, {"r": "b"}))
+        self.assertFalse(self._matches({"r": {"$nin": ("a", "b")}}, {"r": "a"}))
+        self.assertTrue(self._matches({"r": {"$in": "abc"}}, {"r": "bc"}))
+        # Unhashable values and operands fall back to list membership
+        self.assertTrue(self._matches({"r": {"$in": [[1], [2]]}}, {"r": [2]}))
+        self.assertTrue(self._matches({"r": {"$nin": [1, 2]}}, {"r": [1]}))
+
+    def test_referenced_values(self):
+        compiled = CompiledPattern("*", {"a": 1, "b.c": 2})
+        self.assertEqual(compiled.paths, (("a",), ("b", "c")))
+        self.assertEqual(compiled.referenced_values({"a": 1, "b": {"c": 2}, "x": 3}), (1, 2))
+        self.assertEqual(
+            compiled.referenced_values({"a": 1, "b": {"c": 2}}),
+            compiled.referenced_values({"a": 1, "b": {"c": 2, "d": 0}}))
+
+
+class TestEventPatternCompilation(unittest.TestCase):
+    def test_pattern_is_compiled_once(self):
+        pattern = EventPattern("user.*", {"n": {"$gt": 1}})
+        compiled = pattern.compile()
+        self.assertIs(pattern.compile(), compiled)
+        self.assertTrue(pattern.matches(Event.create("user.created", "test", {"n": 2})))
+        self.assertFalse(pattern.matches(Event.create("user.created", "test", {"n": 1})))
+
+    def test_reassigning_fields_recompiles(self):
+        pattern = EventPattern("user.*")
+        self.assertTrue(pattern.matches_event_type("user.created"))
+        pattern.event_type = "order.*"
+        self.assertFalse(pattern.matches_event_type("user.created"))
+        pattern.attributes = {"n": 1}
+        self.assertFalse(pattern.matches_attributes({"n": 2}))
+
+    def test_editing_attributes_in_place_recompiles(self):
+        pattern = EventPattern("user.*", {"n": 1, "tags": {"$in": ["a"]}})
+        compiled = pattern.compile()
+        self.assertFalse(pattern.matches_attributes({"n": 2, "tags": "a"}))
+
+        pattern.attributes["n"] = 2
+        self.assertTrue(pattern.matches_attributes({"n": 2, "tags": "a"}))
+        pattern.attributes["tags"]["$in"].append("b")
+        self.assertTrue(pattern.matches_attributes({"n": 2, "tags": "b"}))
+        self.assertIsNot(pattern.compile(), compiled)
+        self.assertIs(pattern.compile(), pattern.compile())
+
+    def test_compiled_state_is_not_part_of_equality_or_repr(self):
+        pattern = EventPattern("user.*")
+        pattern.compile()
+        self.assertEqual(pattern, EventPattern("user.*"))
+        self.assertNotIn("_compiled", repr(pattern))
+
+    def test_subscription_uses_compiled_pattern(self):
+        subscription = Subscription(pattern=EventPattern("!user.*"), handler=lambda e: None)
+        self.assertTrue(subscription.matches(Event.create("order.created", "test")))
+        self.assertFalse(subscription.matches(Event.create("user.created", "test")))
+
+
+if __name__ == "__main__":
+    unittest.main()
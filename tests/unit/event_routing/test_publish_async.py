@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from src.event_routing.event_routing import Event, EventPattern, EventRouter
+
+
+class TestPublishAsync(unittest.TestCase):
+    def setUp(self):
+        self.router = EventRouter(asyncio_max_concurrency=4)
+
+    def tearDown(self):
+        self.router.shutdown()
+
+    def test_coroutine_handlers_run_on_loop(self):
+        seen = []
+
+        async def handler(event):
+            await asyncio.sleep(0)
+            seen.append((event.type, threading.current_thread().name))
+
+        self.router.subscribe(EventPattern("chat.*"), handler)
+
+        async def main():
+            await self.router.publish_async(Event.create("chat.message", "test"))
+            return threading.current_thread().name
+
+        loop_thread = asyncio.run(main())
+        self.assertEqual(seen, [("chat.message", loop_thread)])
+
+    def test_sync_handlers_run_in_thread_pool(self):
+        threads = []
+        self.router.subscribe(EventPattern("cpu.*"),
+                              lambda e: threads.append(threading.current_thread().name))
+
+        asyncio.run(self.router.publish_async(Event.create("cpu.work", "test")))
+        self.assertTrue(threads[0].startswith("event-asyncio-sync"))
+
+    def test_handlers_fan_out_concurrently(self):
+        async def slow(event):
+            await asyncio.sleep(0.1)
+
+        for _ in range(4):
+            self.router.subscribe(EventPattern("fan.out"), slow)
+
+        start = time.monotonic()
+        asyncio.run(self.router.publish_async(Event.create("fan.out", "test")))
+        self.assertLess(time.monotonic() - start, 0.3)
+        self.assertEqual(self.router.get_stats()["successful_deliveries"], 4)
+
+    def test_timeout_reports_failure(self):
+        errors = []
+
+        async def hang(event):
+            await asyncio.sleep(5)
+
+        async def fast(event):
+            pass
+
+        self.router.add_error_handler(lambda event, sub, exc: errors.append(exc))
+        self.router.subscribe(EventPattern("slow.*"), hang)
+        self.router.subscribe(EventPattern("slow.*"), fast)
+
+        asyncio.run(self.router.publish_async(Event.create("slow.op", "test"), timeout=0.05))
+
+        stats = self.router.get_stats()
+        self.assertEqual(stats["failed_deliveries"], 1)
+        self.assertEqual(stats["successful_deliveries"], 1)
+        self.assertIsInstance(errors[0], asyncio.TimeoutError)
+        self.assertEqual(stats["asyncio_engine"]["timeouts"], 1)
+
+    def test_concurrency_is_bounded(self):
+        active = 0
+        peak = 0
+
+        async def handler(event):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        for _ in range(10):
+            self.router.subscribe(EventPattern("bounded"), handler)
+
+        asyncio.run(self.router.publish_async(Event.create("bounded", "test")))
+        self.assertEqual(peak, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
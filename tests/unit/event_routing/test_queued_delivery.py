@@ -0,0 +1,219 @@
+import time
+import unittest
+
+from src.event_routing.delivery import QueuedDelivery
+from src.event_routing.event_routing import (
+    DeliveryMode,
+    Event,
+    EventPattern,
+    EventRouter,
+    InMemoryEventQueue,
+)
+
+
+class TestInMemoryEventQueue(unittest.TestCase):
+    def test_fifo_and_batch_dequeue(self):
+        queue = InMemoryEventQueue()
+        for i in range(5):
+            queue.enqueue(i)
+
+        self.assertEqual(queue.dequeue(), 0)
+        self.assertEqual(queue.dequeue_batch(3), [1, 2, 3])
+        self.assertEqual(queue.size(), 1)
+        # Plain dequeues are not tracked, so nothing waits for an ack
+        self.assertEqual(queue.in_flight_count(), 0)
+
+    def test_dequeue_empty_returns_none(self):
+        self.assertIsNone(InMemoryEventQueue().dequeue())
+
+    def test_ack_and_nack(self):
+        queue = InMemoryEventQueue()
+        first, second = object(), object()
+        queue.enqueue(first)
+        queue.enqueue(second)
+
+        taken = queue.dequeue_for_ack(1)
+        self.assertEqual(queue.in_flight_count(), 1)
+        queue.nack(taken[0])
+        self.assertEqual(queue.dequeue_for_ack(10), [first, second])
+
+        queue.ack(first)
+        queue.ack(second)
+        self.assertEqual(queue.in_flight_count(), 0)
+
+    def test_nack_batch_keeps_queue_order(self):
+        queue = InMemoryEventQueue()
+        for i in range(5):
+            queue.enqueue(i)
+
+        taken = queue.dequeue_for_ack(3)
+        queue.nack_batch([taken[0], taken[2]])
+
+        self.assertEqual(queue.dequeue_batch(10), [0, 2, 3, 4])
+        self.assertEqual(queue.in_flight_count(), 1)
+
+    def test_in_flight_is_keyed_by_delivery(self):
+        queue = InMemoryEventQueue()
+        event = Event.create("q.a", "test")
+        first = QueuedDelivery(event, "sub")
+        second = QueuedDelivery(event, "sub")
+        shared = object()
+        for item in (first, second, shared, shared):
+            queue.enqueue(item)
+
+        queue.dequeue_for_ack(4)
+        self.assertEqual(queue.in_flight_count(), 4)
+
+        queue.ack(first)
+        queue.ack(shared)
+        self.assertEqual(queue.in_flight_count(), 2)
+        queue.ack(second)
+        queue.ack(shared)
+        self.assertEqual(queue.in_flight_count(), 0)
+
+
+class BatchHandler:
+    def __init__(self):
+        self.single = []
+        self.batches = []
+
+    def __call__(self, event):
+        self.single.append(event)
+
+    def handle_batch(self, events):
+        self.batches.append(list(events))
+
+
+class TestQueuedDelivery(unittest.TestCase):
+    def setUp(self):
+        self.router = EventRouter(queue_batch_size=10, queue_max_attempts=2)
+
+    def tearDown(self):
+        self.router.shutdown()
+
+    def test_events_are_shared_not_copied(self):
+        self.router.subscribe(EventPattern("q.*"), lambda e: None)
+        self.router.subscribe(EventPattern("q.*"), lambda e: None)
+        event = Event.create("q.item", "test", payload={"big": list(range(10))})
+
+        self.router.publish(event, DeliveryMode.QUEUED)
+
+        items = self.router.event_queue.dequeue_batch(10)
+        self.assertEqual(len(items), 2)
+        self.assertTrue(all(isinstance(item, QueuedDelivery) for item in items))
+        self.assertTrue(all(item.event is event for item in items))
+
+    def test_batch_handler_receives_grouped_events(self):
+        handler = BatchHandler()
+        plain = []
+        self.router.subscribe(EventPattern("q.*"), handler)
+        self.router.subscribe(EventPattern("q.*"), plain.append)
+
+        for i in range(25):
+            self.router.publish(Event.create("q.item", "test", payload={"n": i}),
+                                DeliveryMode.QUEUED)
+
+        self.assertEqual(self.router.process_queued_events(), 50)
+        self.assertEqual(handler.single, [])
+        self.assertEqual([e.payload["n"] for batch in handler.batches for e in batch],
+                         list(range(25)))
+        self.assertEqual([e.payload["n"] for e in plain], list(range(25)))
+        self.assertEqual(self.router.get_stats()["successful_deliveries"], 50)
+        self.assertEqual(self.router.event_queue.in_flight_count(), 0)
+
+    def test_failed_delivery_is_redelivered_then_dead_lettered(self):
+        attempts = []
+
+        def flaky(event):
+            attempts.append(event)
+            if event.payload["fail"]:
+                raise RuntimeError("boom")
+
+        self.router.subscribe(EventPattern("q.*"), flaky)
+        self.router.publish(Event.create("q.a", "test", payload={"fail": True}),
+                            DeliveryMode.QUEUED)
+        self.router.publish(Event.create("q.b", "test", payload={"fail": False}),
+                            DeliveryMode.QUEUED)
+
+        self.router.process_queued_events()
+
+        self.assertEqual(len([e for e in attempts if e.type == "q.a"]), 2)
+        dead = self.router.get_dead_letters()
+        self.assertEqual([d.event.type for d in dead], ["q.a"])
+        self.assertEqual(dead[0].attempts, 2)
+        stats = self.router.get_stats()["queue_consumer"]
+        self.assertEqual(stats["redelivered"], 1)
+        self.assertEqual(stats["dead_lettered"], 1)
+
+    def test_failed_batch_is_redelivered_in_order(self):
+        failures = []
+
+        class Flaky(BatchHandler):
+            def handle_batch(self, events):
+                if not failures:
+                    failures.append(events)
+                    raise RuntimeError("boom")
+                super().handle_batch(events)
+
+        handler = Flaky()
+        self.router.subscribe(EventPattern("q.*"), handler)
+        for i in range(4):
+            self.router.publish(Event.create("q.item", "test", payload={"n": i}),
+                                DeliveryMode.QUEUED)
+
+        self.router.process_queued_events(max_batches=1)
+        queued = self.router.event_queue.dequeue_batch(10)
+
+        self.assertEqual([d.event.payload["n"] for d in queued], [0, 1, 2, 3])
+
+    def test_paused_subscription_deliveries_wait_for_resume(self):
+        received = []
+        subscription = self.router.subscribe(EventPattern("q.*"), received.append)
+        for i in range(3):
+            self.router.publish(Event.create("q.a", "test", payload={"n": i}),
+                                DeliveryMode.QUEUED)
+        self.router.pause_subscription(subscription.id)
+
+        self.router.process_queued_events()
+
+        self.assertEqual(received, [])
+        self.assertEqual(self.router.get_stats()["successful_deliveries"], 0)
+        self.assertEqual(self.router.event_queue.in_flight_count(), 3)
+
+        self.router.resume_subscription(subscription.id)
+        self.router.process_queued_events()
+
+        self.assertEqual([e.payload["n"] for e in received], [0, 1, 2])
+        self.assertEqual(self.router.event_queue.in_flight_count(), 0)
+        stats = self.router.get_stats()["queue_consumer"]
+        self.assertEqual((stats["parked"], stats["parked_deliveries"]), (3, 0))
+
+    def test_unsubscribed_deliveries_are_dropped(self):
+        received = []
+        subscription = self.router.subscribe(EventPattern("q.*"), received.append)
+        self.router.publish(Event.create("q.a", "test"), DeliveryMode.QUEUED)
+        self.router.unsubscribe(subscription)
+
+        self.router.process_queued_events()
+        self.assertEqual(received, [])
+        self.assertEqual(self.router.get_stats()["queue_consumer"]["orphaned"], 1)
+
+    def test_background_drainer(self):
+        received = []
+        self.router.subscribe(EventPattern("q.*"), received.append)
+        self.router.start_queue_consumers()
+
+        for i in range(20):
+            self.router.publish(Event.create("q.a", "test", payload={"n": i}),
+                                DeliveryMode.QUEUED)
+
+        deadline = time.monotonic() + 5
+        while len(received) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.router.stop_queue_consumers()
+        self.assertEqual([e.payload["n"] for e in received], list(range(20)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from datetime import datetime, timedelta
+
+from src.event_routing.event_routing import Event
+from src.event_routing.event_store import InMemoryEventStore, RetentionPolicy
+from src.event_routing.retention import RetentionEngine
+
+
+def _event(event_type="t", age_seconds=0, **kwargs):
+    event = Event.create(event_type, "svc", **kwargs)
+    event.timestamp = datetime.now() - timedelta(seconds=age_seconds)
+    return event
+
+
+class TestRetentionEngine(unittest.TestCase):
+    def setUp(self):
+        self.removed = []
+
+    def _engine(self, policy, slice_size=64):
+        return RetentionEngine(policy, self.removed.append, slice_size=slice_size)
+
+    def test_expires_in_bounded_slices(self):
+        engine = self._engine(RetentionPolicy(max_age_seconds=60), slice_size=3)
+        for _ in range(10):
+            engine.track(_event(age_seconds=120))
+        engine.track(_event(age_seconds=0))
+
+        self.assertEqual(engine.evict(engine.slice_size), 3)
+        self.assertEqual(engine.evict(), 7)
+        self.assertEqual(len(self.removed), 10)
+        self.assertEqual(engine.get_stats()["tracked_events"], 1)
+
+    def test_event_type_policies(self):
+        policy = RetentionPolicy(max_age_seconds=3600)
+        policy.add_event_type_policy("debug", RetentionPolicy(max_age_seconds=10))
+        engine = self._engine(policy)
+        debug = _event("debug", age_seconds=60)
+        info = _event("info", age_seconds=60)
+        engine.track(debug)
+        engine.track(info)
+
+        engine.evict()
+        self.assertEqual(self.removed, [debug])
+
+    def test_count_eviction_prefers_low_priority(self):
+        engine = self._engine(RetentionPolicy(max_count=2, priority_based=True))
+        low = _event(metadata={"priority": 0})
+        high = _event(metadata={"priority": 9})
+        mid = _event(metadata={"priority": 5})
+        for event in (low, high, mid):
+            engine.track(event)
+
+        self.assertEqual(engine.evict(), 1)
+        self.assertEqual(self.removed, [low])
+
+    def test_correlation_chain_kept_until_all_members_expire(self):
+        engine = self._engine(RetentionPolicy(max_age_seconds=60, preserve_correlations=True))
+        old = _event(age_seconds=120, correlation_id="c")
+        fresh = _event(age_seconds=0, correlation_id="c")
+        engine.track(old)
+        engine.track(fresh)
+
+        self.assertEqual(engine.evict(), 0)
+        self.assertEqual(engine.evict(current_time=fresh.timestamp.timestamp() + 61), 2)
+        self.assertCountEqual(self.removed, [old, fresh])
+        self.assertEqual(engine.get_stats()["chains_removed"], 1)
+
+
+class TestInMemoryStoreIncrementalRetention(unittest.TestCase):
+    def test_store_evicts_incrementally(self):
+        store = InMemoryEventStore(RetentionPolicy(max_count=5), retention_slice_size=2)
+        events = [_event(age_seconds=100 - i) for i in range(8)]
+        for event in events:
+            store.store(event)
+
+        self.assertEqual(store.get_event_count(), 5)
+        self.assertEqual([e.id for e in store.get_events()], [e.id for e in events[3:]])
+        self.assertIsNone(store.get_event_by_id(events[0].id))
+        self.assertEqual(store.get_stats()["retention"]["count_evicted"], 3)
+
+    def test_cleanup_with_engine_policy_drains_heaps(self):
+        policy = RetentionPolicy(max_age_seconds=60)
+        store = InMemoryEventStore()
+        for _ in range(5):
+            store.store(_event(age_seconds=120))
+        store.set_retention_policy(policy, slice_size=1)
+        store.store(_event(age_seconds=0))
+
+        self.assertEqual(store.get_event_count(), 5)
+        self.assertEqual(store.cleanup_expired_events(policy), 4)
+        self.assertEqual(store.get_event_count(), 1)
+        self.assertEqual(store.get_event_count({"type": "t"}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import random
+import unittest
+
+from src.event_routing.event_routing import Event
+from src.event_routing.event_store import InMemoryEventStore, RetentionPolicy
+from src.event_routing.search_index import SearchQuery
+
+
+class TestSearchQueryParsing(unittest.TestCase):
+    def test_plain_query_is_single_substring_term(self):
+        query = SearchQuery.parse("Disk Full: /var")
+        self.assertEqual(len(query.terms), 1)
+        self.assertEqual(query.terms[0].text, "disk full: /var")
+
+    def test_operators_and_scopes(self):
+        query = SearchQuery.parse("payload.status:error AND db OR timeout")
+        self.assertEqual([[(t.field_name, t.text) for t in g] for g in query.groups],
+                         [[("payload.status", "error"), (None, "db")], [(None, "timeout")]])
+
+
+class TestIndexedSearch(unittest.TestCase):
+    def setUp(self):
+        self.indexed = InMemoryEventStore(enable_search_index=True)
+        self.scanned = InMemoryEventStore()
+        rng = random.Random(7)
+        words = ["error", "warning", "database", "timeout", "user-42", "disk full", "ok"]
+        for i in range(200):
+            event = Event.create(
+                rng.choice(["job.done", "job.failed"]), rng.choice(["api", "worker"]),
+                payload={"status": rng.choice(words), "detail": {"msg": rng.choice(words)},
+                         "tags": [rng.choice(words), i]},
+                metadata={"host": rng.choice(["alpha", "beta"])})
+            self.indexed.store(event)
+            self.scanned.store(event)
+
+    def _assert_same(self, query, search_fields=None):
+        expected = self.scanned.search_events(query, search_fields)
+        actual = self.indexed.search_events(query, search_fields)
+        self.assertEqual([e.id for e in actual], [e.id for e in expected], query)
+        return actual
+
+    def test_index_matches_substring_scan(self):
+        for query in ["error", "rror", "ERROR", "42", "user-42", "disk full", "alpha",
+                      "database OR timeout", "error AND beta", "payload.status:error",
+                      "payload.detail:time OR metadata.host:beta", "type:failed", "!!"]:
+            self._assert_same(query)
+        self._assert_same("job", ["type", "source"])
+        self._assert_same("true", ["is_replay"])
+
+    def test_event_ids_are_searched_but_not_indexed(self):
+        stats = self.indexed.get_stats()["search_index"]
+        event = Event.create("job.done", "api", payload={"status": "ok"},
+                             correlation_id="corr-1234", causation_id="cause-5678")
+        self.indexed.store(event)
+        self.scanned.store(event)
+        for query in ["correlation_id:1234", "causation_id:cause", "id:" + event.id]:
+            self.assertEqual([e.id for e in self._assert_same(query)], [event.id], query)
+        self.assertEqual([e.id for e in self._assert_same(event.id[4:12], ["id", "payload"])],
+                         [event.id])
+
+        self.assertEqual(self.indexed.get_stats()["search_index"]["distinct_terms"],
+                         stats["distinct_terms"])
+
+    def test_long_tokens(self):
+        token = "x" * 100 + "needle" + "y" * 100
+        event = Event.create("job.done", "api", payload={"blob": token})
+        self.indexed.store(event)
+        self.scanned.store(event)
+        for query in ["needle", "xneedley", token, "payload.blob:" + token[50:]]:
+            self.assertEqual([e.id for e in self._assert_same(query)], [event.id])
+
+        self.indexed.clear()
+        self.assertEqual(self.indexed.search_events("needle"), [])
+
+    def test_field_scoped_search(self):
+        events = self._assert_same("payload.status:timeout")
+        self.assertTrue(events)
+        self.assertTrue(all(e.payload["status"] == "timeout" for e in events))
+
+    def test_index_pruned_on_retention_and_clear(self):
+        self.indexed.set_retention_policy(RetentionPolicy(max_count=10))
+        self.indexed.run_retention(max_items=1000)
+
+        self.assertEqual(self.indexed.get_stats()["search_index"]["indexed_events"], 10)
+        self.assertTrue(all(self.indexed.get_event_by_id(e.id)
+                            for e in self.indexed.search_events("o")))
+        self.indexed.clear()
+        self.assertEqual(self.indexed.search_events("error"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
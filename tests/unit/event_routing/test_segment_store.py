@@ -0,0 +1,134 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.event_routing.event_routing import Event
+from src.event_routing.event_store import RetentionPolicy
+from src.event_routing.segment_store import SegmentedEventStore
+
+
+def _event(event_type, seconds, **kwargs):
+    event = Event.create(event_type, "svc", **kwargs)
+    event.timestamp = datetime(2024, 1, 1) + timedelta(seconds=seconds)
+    return event
+
+
+class TestSegmentedEventStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        shutil.rmtree(self.directory)
+
+    def _open(self, **kwargs):
+        kwargs.setdefault("segment_max_bytes", 1024)
+        kwargs.setdefault("index_interval", 4)
+        kwargs.setdefault("fsync_interval", None)
+        store = SegmentedEventStore(self.directory, **kwargs)
+        self.stores.append(store)
+        return store
+
+    def _segment_files(self):
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".log"))
+
+    def test_roundtrip_and_range_scan_across_segments(self):
+        store = self._open()
+        for seconds in range(50):
+            store.store(_event("tick", seconds, payload={"n": seconds}))
+
+        self.assertGreater(len(self._segment_files()), 1)
+        start = datetime(2024, 1, 1, 0, 0, 10)
+        end = datetime(2024, 1, 1, 0, 0, 19)
+        events = store.get_events(start_time=start, end_time=end)
+        self.assertEqual([e.payload["n"] for e in events], list(range(10, 20)))
+        self.assertEqual(store.get_event_count(), 50)
+        self.assertEqual(store.get_event_count({"payload.n": 7}), 1)
+
+    def test_reopen_uses_persisted_state(self):
+        store = self._open()
+        events = [_event("tick", seconds) for seconds in range(30)]
+        for event in events:
+            store.store(event)
+        store.close()
+
+        reopened = self._open()
+        self.assertEqual(reopened.get_event_count(), 30)
+        self.assertEqual(reopened.get_event_by_id(events[3].id).timestamp, events[3].timestamp)
+        self.assertEqual(len(reopened.get_events()), 30)
+
+    def test_torn_tail_record_is_truncated(self):
+        store = self._open(segment_max_bytes=1 << 20)
+        for seconds in range(5):
+            store.store(_event("tick", seconds))
+        store.close()
+
+        tail = os.path.join(self.directory, self._segment_files()[-1])
+        with open(tail, "ab") as handle:
+            handle.write(b"\x00\x00\x01\x00partial")
+
+        reopened = self._open(segment_max_bytes=1 << 20)
+        self.assertEqual(reopened.get_event_count(), 5)
+        self.assertEqual(reopened.get_stats()["truncated_bytes"], 11)
+        reopened.store(_event("tick", 6))
+        self.assertEqual(len(reopened.get_events()), 6)
+
+    def test_replacing_event_keeps_latest(self):
+        store = self._open()
+        event = _event("a", 1)
+        store.store(event)
+        replacement = _event("b", 2)
+        replacement.id = event.id
+        store.store(replacement)
+
+        self.assertEqual(store.get_event_count(), 1)
+        self.assertEqual(store.get_event_by_id(event.id).type, "b")
+        self.assertEqual([e.type for e in store.get_events()], ["b"])
+
+    def test_retention_drops_whole_segments(self):
+        store = self._open()
+        for seconds in range(60):
+            store.store(_event("tick", seconds))
+        segments_before = len(self._segment_files())
+
+        removed = store.cleanup_expired_events(RetentionPolicy(max_count=20))
+
+        self.assertGreater(removed, 0)
+        self.assertGreaterEqual(store.get_event_count(), 20)
+        self.assertEqual(store.get_event_count(), 60 - removed)
+        self.assertLess(len(self._segment_files()), segments_before)
+        remaining = store.get_events()
+        self.assertEqual(remaining[-1].timestamp.second, 59)
+
+    def test_age_retention_and_clear(self):
+        store = self._open()
+        for seconds in range(40):
+            store.store(_event("old", seconds))
+
+        removed = store.cleanup_expired_events(RetentionPolicy(max_age_seconds=60))
+        self.assertEqual(store.get_event_count(), 40 - removed)
+        self.assertEqual(len(self._segment_files()), 1)
+
+        self.assertEqual(store.clear(), 40 - removed)
+        self.assertEqual(store.get_events(), [])
+        store.store(_event("new", 1))
+        self.assertEqual(store.get_event_count(), 1)
+
+    def test_group_commit_batches_fsyncs(self):
+        store = self._open(segment_max_bytes=1 << 20, fsync_batch_size=10)
+        for seconds in range(25):
+            store.store(_event("tick", seconds))
+
+        stats = store.get_stats()
+        self.assertEqual(stats["fsyncs"], 2)
+        self.assertEqual(stats["pending_sync"], 5)
+        store.sync()
+        self.assertEqual(store.get_stats()["pending_sync"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
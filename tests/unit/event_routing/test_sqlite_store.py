@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from src.event_routing.event_routing import Event
+from src.event_routing.event_store import RetentionPolicy
+from src.event_routing.sqlite_store import SQLiteEventStore
+
+
+def _event(event_type, seconds, source="svc", **kwargs):
+    event = Event.create(event_type, source, **kwargs)
+    event.timestamp = datetime(2024, 1, 1) + timedelta(seconds=seconds)
+    return event
+
+
+class TestSQLiteEventStore(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLiteEventStore(batch_size=16)
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_store_and_filtered_queries(self):
+        for seconds in range(40):
+            self.store.store(_event("even" if seconds % 2 == 0 else "odd", seconds,
+                                    payload={"n": seconds, "user": {"id": seconds % 3}}))
+
+        events = self.store.get_events({"type": "odd"}, limit=3, offset=1)
+        self.assertEqual([e.payload["n"] for e in events], [3, 5, 7])
+        self.assertEqual(self.store.get_event_count({"payload.user.id": 0}), 14)
+        self.assertEqual(self.store.get_event_count(), 40)
+        self.assertGreater(self.store.get_stats()["batches_written"], 0)
+
+        start = datetime(2024, 1, 1, 0, 0, 10)
+        end = datetime(2024, 1, 1, 0, 0, 12)
+        self.assertEqual([e.payload["n"] for e in self.store.get_events(start_time=start, end_time=end)],
+                         [10, 11, 12])
+
+    def test_roundtrip_preserves_event(self):
+        event = _event("a", 1, payload={"nested": {"x": [1, 2]}}, metadata={"m": True},
+                       correlation_id="c", causation_id="p")
+        self.store.store(event)
+
+        loaded = self.store.get_event_by_id(event.id)
+        self.assertEqual(loaded.to_dict(), event.to_dict())
+
+    def test_residual_criteria_fall_back_to_python(self):
+        self.store.store(_event("a", 1, payload={"tags": ["x"]}))
+        self.store.store(_event("a", 2, payload={"tags": ["y"]}))
+
+        events = self.store.get_events({"payload.tags": ["y"]})
+        self.assertEqual([e.timestamp.second for e in events], [2])
+
+    def test_aggregate_and_timeline(self):
+        root = _event("order.created", 1, correlation_id="c1")
+        child = _event("order.paid", 2, correlation_id="c1", causation_id=root.id)
+        follow_up = _event("mail.sent", 3, causation_id=child.id)
+        other = _event("order.created", 4, source="other")
+        for event in (root, child, follow_up, other):
+            self.store.store(event)
+
+        groups = self.store.aggregate_events("type")
+        self.assertEqual({k: len(v) for k, v in groups.items()},
+                         {"order.created": 2, "order.paid": 1, "mail.sent": 1})
+        self.assertEqual(self.store.count_events_by("correlation_id"),
+                         {"c1": 2, "no_correlation": 2})
+        self.assertEqual(list(self.store.aggregate_events("source", {"type": "order.created"})),
+                         ["other", "svc"])
+
+        timeline = self.store.get_event_timeline("c1")
+        self.assertEqual([e.id for e in timeline], [root.id, child.id, follow_up.id])
+
+    def test_retention(self):
+        now = datetime.now()
+        old = Event.create("old", "svc")
+        old.timestamp = now - timedelta(hours=2)
+        self.store.store(old)
+        for _ in range(5):
+            self.store.store(Event.create("new", "svc"))
+
+        policy = RetentionPolicy(max_age_seconds=3600, max_count=3)
+        self.assertEqual(self.store.cleanup_expired_events(policy), 3)
+        self.assertEqual(self.store.get_event_count(), 3)
+        self.assertEqual(self.store.clear(), 3)
+
+
+class TestSQLiteEventStoreFile(unittest.TestCase):
+    def test_persists_across_reopen_in_wal_mode(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "events.db")
+        try:
+            store = SQLiteEventStore(path)
+            event = _event("a", 1)
+            store.store(event)
+            journal = store._read_conn.execute("PRAGMA journal_mode").fetchone()[0]
+            store.close()
+
+            reopened = SQLiteEventStore(path)
+            self.assertEqual(reopened.get_event_by_id(event.id).type, "a")
+            reopened.close()
+            self.assertEqual(journal, "wal")
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
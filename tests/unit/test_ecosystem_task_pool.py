@@ -0,0 +1,147 @@
+"""
+Unit tests for the RUBIK ecosystem task worker pool
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from src.biomimetic_agents.agent_system import AgentStatus
+from src.biomimetic_agents.ecosystem import (
+    EcosystemConfig,
+    FairTaskQueue,
+    RUBIKEcosystem,
+)
+from src.biomimetic_agents.rubik_genome import Archetype
+
+
+class FakeAgent:
+    """Agent stand-in whose tasks wait instead of calling a model."""
+
+    def __init__(self, index: int, duration: float = 0.05):
+        self.agent_id = f"agent_{index}"
+        self.status = AgentStatus.ACTIVE
+        self.archetype = Archetype.EXPLORER
+        self.genome = SimpleNamespace(generation=0)
+        self.current_mood = SimpleNamespace(value="calm")
+        self.active_tasks = {}
+        self.completed_tasks = []
+        self.duration = duration
+        self.peak_tasks = 0
+
+    def calculate_fitness(self) -> float:
+        return 0.5
+
+    async def process_task(self, task):
+        self.active_tasks[task["id"]] = task
+        self.peak_tasks = max(self.peak_tasks, len(self.active_tasks))
+        await asyncio.sleep(self.duration)
+        del self.active_tasks[task["id"]]
+        return {"success": True, "processing_time": self.duration}
+
+
+async def _run_tasks(num_agents: int, num_tasks: int, **config):
+    ecosystem = RUBIKEcosystem(
+        EcosystemConfig(max_population=num_agents, learning_enabled=False, **config)
+    )
+    agents = [FakeAgent(i) for i in range(num_agents)]
+    ecosystem.thanatos_controller.active_agents = {a.agent_id: a for a in agents}
+    ecosystem.running = True
+    ecosystem._start_task_workers()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[
+            ecosystem.process_task({"task_type": ("analysis", "coding")[i % 2]})
+            for i in range(num_tasks)
+        ]
+    )
+    elapsed = time.perf_counter() - start
+
+    ecosystem.running = False
+    await asyncio.gather(*ecosystem._task_workers)
+    return ecosystem, agents, results, elapsed
+
+
+class TestFairTaskQueue:
+    """Test cases for FairTaskQueue"""
+
+    def test_round_robins_across_task_types(self):
+        async def scenario():
+            queue = FairTaskQueue()
+            for i in range(3):
+                await queue.put(("analysis", i), "analysis")
+            await queue.put(("coding", 0), "coding")
+            return [await queue.get() for _ in range(4)]
+
+        assert asyncio.run(scenario()) == [
+            ("analysis", 0),
+            ("coding", 0),
+            ("analysis", 1),
+            ("analysis", 2),
+        ]
+
+    def test_put_waits_while_full(self):
+        async def scenario():
+            queue = FairTaskQueue(maxsize=1)
+            await queue.put("first")
+            blocked = asyncio.create_task(queue.put("second"))
+            await asyncio.sleep(0.01)
+            was_blocked = not blocked.done()
+            await queue.get()
+            await blocked
+            return was_blocked, queue.qsize()
+
+        assert asyncio.run(scenario()) == (True, 1)
+
+
+class TestTaskWorkerPool:
+    """Test cases for concurrent task processing"""
+
+    def test_tasks_run_concurrently_across_agents(self):
+        ecosystem, agents, results, elapsed = asyncio.run(_run_tasks(10, 40))
+
+        assert all(result["success"] for result in results)
+        # 40 tasks of 50ms on 10 agents x 2 slots: about 0.1s, not 2s
+        assert elapsed < 1.0
+        assert len(ecosystem.completed_tasks) == 40
+        assert ecosystem._agent_task_counts == {}
+
+    def test_per_agent_concurrency_limit(self):
+        _, agents, results, _ = asyncio.run(_run_tasks(2, 20, max_tasks_per_agent=1))
+
+        assert all(result["success"] for result in results)
+        assert max(agent.peak_tasks for agent in agents) == 1
+
+    def test_no_agents_fails_fast(self):
+        async def scenario():
+            ecosystem = RUBIKEcosystem(EcosystemConfig(learning_enabled=False))
+            ecosystem.thanatos_controller.active_agents = {}
+            ecosystem.running = True
+            ecosystem._start_task_workers()
+            result = await ecosystem.process_task({"task_type": "analysis"})
+            ecosystem.running = False
+            await asyncio.gather(*ecosystem._task_workers)
+            return result
+
+        result = asyncio.run(scenario())
+        assert result["success"] is False
+        assert result["error"] == "No suitable agent available"
+
+    def test_timeout_covers_waiting_for_queue_space(self):
+        async def scenario():
+            ecosystem = RUBIKEcosystem(
+                EcosystemConfig(learning_enabled=False, max_queued_tasks=1)
+            )
+            await ecosystem.task_queue.put("queued", "analysis")
+            start = time.perf_counter()
+            result = await ecosystem.process_task(
+                {"task_type": "analysis", "timeout": 0.05}
+            )
+            return result, time.perf_counter() - start, ecosystem.task_queue.qsize()
+
+        result, elapsed, queued = asyncio.run(scenario())
+
+        assert result["error"] == "Task timeout"
+        assert elapsed < 0.5
+        assert queued == 1
@@ -0,0 +1,173 @@
+"""
+Unit tests for the model service inference workers
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.inference_worker import InferenceWorker, InferenceWorkerRegistry
+
+
+class RecordingBatchFn:
+    """Stub model that echoes prompts and records each batch it runs."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batches = []
+        self.threads = set()
+
+    def __call__(self, prompts, parameters):
+        self.batches.append((list(prompts), dict(parameters)))
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        return [f"{parameters.get('prefix', '')}{prompt}" for prompt in prompts]
+
+
+async def _submit_all(worker, prompts, parameters=None):
+    return await asyncio.gather(*[worker.submit(p, parameters) for p in prompts])
+
+
+class TestInferenceWorker:
+    """Test cases for InferenceWorker micro-batching"""
+
+    def test_concurrent_requests_share_batches(self):
+        batch_fn = RecordingBatchFn(delay=0.02)
+        worker = InferenceWorker("stub", batch_fn, max_batch_size=4, max_wait_ms=50)
+        try:
+            prompts = [f"p{i}" for i in range(10)]
+            results = asyncio.run(_submit_all(worker, prompts))
+        finally:
+            worker.close(timeout=1.0)
+
+        assert results == prompts
+        assert max(len(batch) for batch, _ in batch_fn.batches) == 4
+        assert len(batch_fn.batches) < 10
+        assert threading.get_ident() not in batch_fn.threads
+        assert worker.get_stats()["requests_processed"] == 10
+
+    def test_batches_group_matching_parameters(self):
+        batch_fn = RecordingBatchFn()
+        worker = InferenceWorker("stub", batch_fn, max_batch_size=8, max_wait_ms=50)
+
+        async def scenario():
+            return await asyncio.gather(
+                *[
+                    worker.submit(f"p{i}", {"prefix": ("a:", "b:")[i % 2]})
+                    for i in range(6)
+                ]
+            )
+
+        try:
+            results = asyncio.run(scenario())
+        finally:
+            worker.close(timeout=1.0)
+
+        assert results == ["a:p0", "b:p1", "a:p2", "b:p3", "a:p4", "b:p5"]
+        for prompts, parameters in batch_fn.batches:
+            parity = ("a:", "b:").index(parameters["prefix"])
+            assert all(int(prompt[1:]) % 2 == parity for prompt in prompts)
+
+    def test_event_loop_not_blocked_while_batch_runs(self):
+        worker = InferenceWorker("stub", RecordingBatchFn(delay=0.2), max_wait_ms=0)
+
+        async def scenario():
+            task = asyncio.create_task(worker.submit("slow"))
+            ticks = 0
+            while not task.done():
+                await asyncio.sleep(0.01)
+                ticks += 1
+            return await task, ticks
+
+        try:
+            result, ticks = asyncio.run(scenario())
+        finally:
+            worker.close(timeout=1.0)
+
+        assert result == "slow"
+        assert ticks >= 5
+
+    def test_generator_results_are_delivered_as_produced(self):
+        received = {}
+
+        def streaming_batch_fn(prompts, parameters):
+            for prompt in prompts:
+                yield prompt.upper()
+                time.sleep(0.1)
+
+        worker = InferenceWorker("stub", streaming_batch_fn, max_wait_ms=50)
+
+        async def timed(prompt):
+            start = time.perf_counter()
+            received[prompt] = (
+                await worker.submit(prompt),
+                time.perf_counter() - start,
+            )
+
+        async def scenario():
+            await asyncio.gather(timed("first"), timed("second"))
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            worker.close(timeout=1.0)
+
+        assert received["first"][0] == "FIRST"
+        assert received["first"][1] < received["second"][1]
+
+    def test_batch_errors_fail_each_request(self):
+        def failing_batch_fn(prompts, parameters):
+            raise ValueError("model exploded")
+
+        worker = InferenceWorker("stub", failing_batch_fn)
+        try:
+            with pytest.raises(ValueError, match="model exploded"):
+                asyncio.run(worker.submit("boom"))
+        finally:
+            worker.close(timeout=1.0)
+
+    def test_submit_after_close_is_rejected(self):
+        worker = InferenceWorker("stub", RecordingBatchFn())
+        worker.close(timeout=1.0)
+
+        assert not worker.running
+        with pytest.raises(RuntimeError):
+            asyncio.run(worker.submit("late"))
+
+
+class TestInferenceWorkerRegistry:
+    """Test cases for building workers from loaded models"""
+
+    def test_pipeline_built_once_per_load(self):
+        built = []
+
+        def pipeline_factory(model_object):
+            built.append(model_object)
+
+            def pipe(prompts, **kwargs):
+                assert kwargs["batch_size"] == len(prompts)
+                return [[{"generated_text": f"{p}!"}] for p in prompts]
+
+            return pipe
+
+        registry = InferenceWorkerRegistry(pipeline_factory=pipeline_factory)
+        worker = registry.start(
+            "tiny", {"model": object(), "tokenizer": object()}, {"max_batch_size": 2}
+        )
+        try:
+            results = asyncio.run(_submit_all(worker, ["a", "b", "c"]))
+            assert registry.get("tiny") is worker
+        finally:
+            registry.stop_all(timeout=1.0)
+
+        assert results == ["a!", "b!", "c!"]
+        assert len(built) == 1
+        assert worker.max_batch_size == 2
+        assert registry.get("tiny") is None
+
+    def test_non_batchable_models_have_no_worker(self):
+        registry = InferenceWorkerRegistry()
+        assert registry.start("ollama", {"ollama_name": "llama"}) is None
+        assert registry.get_stats() == {}
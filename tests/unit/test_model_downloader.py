@@ -0,0 +1,235 @@
+"""
+Unit tests for the model download engine, against local directories and a
+local HTTP fixture
+"""
+
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.core.model_downloader import (
+    FileEntry,
+    ModelDownloadEngine,
+    RepoManifest,
+    huggingface_headers,
+    local_manifest,
+)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+@pytest.fixture
+def repos(tmp_path):
+    """Two source repositories sharing a tokenizer file."""
+    shared = b"shared tokenizer" * 1000
+    layout = {
+        "org/model-a": {"config.json": b'{"a": 1}', "tokenizer.json": shared},
+        "org/model-b": {
+            "config.json": b'{"b": 2}',
+            "tokenizer.json": shared,
+            "weights/model.safetensors": os.urandom(200_000),
+        },
+    }
+    roots = {}
+    for repo_id, files in layout.items():
+        root = tmp_path / "source" / repo_id.replace("/", "_")
+        for rel, data in files.items():
+            (root / rel).parent.mkdir(parents=True, exist_ok=True)
+            (root / rel).write_bytes(data)
+        roots[repo_id] = root
+    return layout, roots
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves ``server.files`` with Range support and optional truncation."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        data = self.server.files.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+        self.server.requests.append((self.path, self.headers.get("Range")))
+
+        start = 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+            if start >= len(data):
+                self.send_error(416)
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+            )
+        else:
+            self.send_response(200)
+        body = data[start:]
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        # Drop the connection part-way through the first response
+        if self.server.truncate_first and not self.server.truncated:
+            self.server.truncated = True
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.connection.shutdown(2)
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    server.files, server.requests = {}, []
+    server.truncate_first, server.truncated = False, False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _http_manifest(server, repo_id, files):
+    entries = []
+    for rel, data in files.items():
+        server.files[f"/{repo_id}/{rel}"] = data
+        entries.append(
+            FileEntry(
+                path=rel,
+                url=f"http://127.0.0.1:{server.server_port}/{repo_id}/{rel}",
+                size=len(data),
+                sha256=_sha256(data),
+            )
+        )
+    return RepoManifest(repo_id=repo_id, files=entries)
+
+
+class TestModelDownloadEngine:
+    """Test cases for ModelDownloadEngine"""
+
+    def test_shared_files_are_deduplicated_with_hardlinks(self, tmp_path, repos):
+        layout, roots = repos
+        engine = ModelDownloadEngine(str(tmp_path / "store"), max_concurrent_files=4)
+        jobs = [
+            (local_manifest(repo_id, str(root)), str(tmp_path / "models" / repo_id))
+            for repo_id, root in roots.items()
+        ]
+
+        results = engine.download_repos(jobs)
+
+        assert all(result.success for result in results)
+        for repo_id, files in layout.items():
+            for rel, data in files.items():
+                assert (tmp_path / "models" / repo_id / rel).read_bytes() == data
+
+        tokenizer_a = tmp_path / "models" / "org/model-a" / "tokenizer.json"
+        tokenizer_b = tmp_path / "models" / "org/model-b" / "tokenizer.json"
+        assert os.path.samefile(tokenizer_a, tokenizer_b)
+        statuses = sorted(
+            f.status for r in results for f in r.files if f.path == "tokenizer.json"
+        )
+        assert statuses == ["deduplicated", "downloaded"]
+
+        inventory = engine.load_inventory()
+        assert set(inventory["repos"]) == set(layout)
+        shared = inventory["blobs"][_sha256(layout["org/model-a"]["tokenizer.json"])]
+        assert sorted(shared["refs"]) == [
+            "org/model-a/tokenizer.json",
+            "org/model-b/tokenizer.json",
+        ]
+
+    def test_second_run_transfers_nothing(self, tmp_path, repos):
+        _, roots = repos
+        engine = ModelDownloadEngine(str(tmp_path / "store"))
+        manifest = local_manifest("org/model-b", str(roots["org/model-b"]))
+        dest = str(tmp_path / "models" / "b")
+
+        engine.download_repo(manifest, dest)
+        again = engine.download_repo(manifest, dest)
+
+        assert {f.status for f in again.files} == {"present"}
+        assert again.bytes_transferred == 0
+
+    def test_checksum_mismatch_fails_file(self, tmp_path, repos):
+        _, roots = repos
+        manifest = local_manifest("org/model-a", str(roots["org/model-a"]))
+        manifest.files[0].sha256 = "0" * 64
+        engine = ModelDownloadEngine(str(tmp_path / "store"), retries=0)
+
+        result = engine.download_repo(manifest, str(tmp_path / "models" / "a"))
+
+        assert not result.success
+        assert "does not match" in result.failed_files[0].error
+        assert list((tmp_path / "store" / "partial").iterdir()) == []
+        assert engine.load_inventory()["repos"]["org/model-a"]["complete"] is False
+
+    def test_resumes_after_dropped_connection(self, tmp_path, http_server):
+        data = os.urandom(300_000)
+        manifest = _http_manifest(http_server, "org/model", {"model.bin": data})
+        http_server.truncate_first = True
+        engine = ModelDownloadEngine(str(tmp_path / "store"), chunk_size=16 * 1024)
+
+        result = engine.download_repo(manifest, str(tmp_path / "models"))
+
+        assert result.success
+        assert result.files[0].status == "resumed"
+        assert (tmp_path / "models" / "model.bin").read_bytes() == data
+        ranges = [r for _, r in http_server.requests]
+        assert ranges[0] is None and ranges[1].startswith("bytes=")
+
+    def test_resumes_from_existing_partial_file(self, tmp_path, http_server):
+        data = os.urandom(100_000)
+        manifest = _http_manifest(http_server, "org/model", {"model.bin": data})
+        engine = ModelDownloadEngine(str(tmp_path / "store"))
+        engine.partial_dir.mkdir(parents=True)
+        part = engine.partial_dir / f"{_sha256(data)}.part"
+        part.write_bytes(data[:40_000])
+
+        result = engine.download_repo(manifest, str(tmp_path / "models"))
+
+        assert result.success
+        assert result.files[0].bytes_transferred == 60_000
+        assert http_server.requests == [("/org/model/model.bin", "bytes=40000-")]
+
+    def test_missing_file_fails_without_retrying(self, tmp_path, http_server):
+        url = f"http://127.0.0.1:{http_server.server_port}/missing"
+        manifest = RepoManifest("org/model", [FileEntry(path="missing", url=url)])
+        engine = ModelDownloadEngine(str(tmp_path / "store"))
+
+        result = engine.download_repo(manifest, str(tmp_path / "models"))
+
+        assert not result.success
+        assert "404" in result.failed_files[0].error
+
+
+class TestHuggingfaceHeaders:
+    """Test cases for huggingface_headers token resolution"""
+
+    @pytest.fixture
+    def saved_token(self, monkeypatch):
+        huggingface_hub = pytest.importorskip("huggingface_hub")
+        monkeypatch.delenv("HF_TOKEN", raising=False)
+        monkeypatch.setattr(huggingface_hub, "get_token", lambda: "hf_saved")
+
+    def test_explicit_token_comes_first(self, saved_token, monkeypatch):
+        monkeypatch.setenv("HF_TOKEN", "hf_env")
+
+        assert huggingface_headers("hf_flag") == {"Authorization": "Bearer hf_flag"}
+        assert huggingface_headers() == {"Authorization": "Bearer hf_env"}
+
+    def test_falls_back_to_saved_login(self, saved_token):
+        assert huggingface_headers() == {"Authorization": "Bearer hf_saved"}
+
+    def test_no_token(self, saved_token, monkeypatch):
+        import huggingface_hub
+
+        monkeypatch.setattr(huggingface_hub, "get_token", lambda: None)
+
+        assert huggingface_headers() == {}
@@ -0,0 +1,151 @@
+"""
+Unit tests for the incremental model inventory scanner
+"""
+
+import os
+
+import pytest
+
+from src.core.model_inventory_scanner import IncrementalTreeScanner
+
+OLD = 1_600_000_000  # Directory mtimes well outside the racy window
+
+
+def _settle(root):
+    """Backdate every directory mtime so cached entries are trusted."""
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (OLD, OLD))
+
+
+def _rglob_totals(root):
+    files = [p for p in root.rglob("*") if p.is_file()]
+    return sum(p.stat().st_size for p in files), len(files)
+
+
+@pytest.fixture
+def models(tmp_path):
+    """Two model trees with nested shard directories."""
+    root = tmp_path / "models"
+    for model in ("org_model-a", "org_model-b"):
+        for shard in range(3):
+            path = root / model / "shards" / str(shard)
+            path.mkdir(parents=True)
+            (path / "weights.safetensors").write_bytes(b"x" * (1000 + shard))
+        (root / model / "config.json").write_text("{}")
+    _settle(root)
+    return root
+
+
+class TestIncrementalTreeScanner:
+    """Test cases for IncrementalTreeScanner"""
+
+    def test_totals_match_full_walk(self, tmp_path, models):
+        scanner = IncrementalTreeScanner(str(tmp_path / "cache.json"))
+        roots = [models / "org_model-a", models / "org_model-b"]
+
+        totals = scanner.scan(str(root) for root in roots)
+
+        for root in roots:
+            stats = totals[str(root)]
+            assert (stats.size, stats.file_count) == _rglob_totals(root)
+            assert stats.directory_count == 5
+            assert stats.modified == OLD
+
+    def test_warm_rescan_lists_no_directories(self, tmp_path, models):
+        cache = str(tmp_path / "cache.json")
+        roots = [str(models / "org_model-a"), str(models / "org_model-b")]
+        first = IncrementalTreeScanner(cache).scan(roots)
+
+        scanner = IncrementalTreeScanner(cache)
+        second = scanner.scan(roots)
+
+        assert second == first
+        assert scanner.directories_scanned == 0
+        assert scanner.directories_reused == 10
+
+    def test_only_changed_directories_are_listed(self, tmp_path, models):
+        scanner = IncrementalTreeScanner(str(tmp_path / "cache.json"))
+        root = models / "org_model-a"
+        scanner.scan([str(root)])
+
+        shard = root / "shards" / "1"
+        (shard / "extra.safetensors").write_bytes(b"y" * 500)
+        os.utime(shard, (OLD + 10, OLD + 10))
+        totals = scanner.scan([str(root)])
+
+        assert scanner.directories_scanned == 1
+        stats = totals[str(root)]
+        assert (stats.size, stats.file_count) == _rglob_totals(root)
+
+    def test_recently_modified_directories_are_rescanned(self, tmp_path, models):
+        scanner = IncrementalTreeScanner(str(tmp_path / "cache.json"))
+        root = models / "org_model-a"
+        os.utime(root / "shards", None)
+
+        scanner.scan([str(root)])
+        scanner.scan([str(root)])
+
+        assert scanner.directories_scanned == 1
+
+    def test_removed_directories_are_dropped(self, tmp_path, models):
+        scanner = IncrementalTreeScanner(str(tmp_path / "cache.json"))
+        root = models / "org_model-b"
+        scanner.scan([str(root)])
+
+        shard = root / "shards" / "2"
+        (shard / "weights.safetensors").unlink()
+        shard.rmdir()
+        os.utime(root / "shards", (OLD + 10, OLD + 10))
+        totals = scanner.scan([str(root)])
+
+        assert totals[str(root)].file_count == 3
+        assert str(shard) not in scanner.load_cache()
+
+    def test_directories_removed_mid_scan_are_skipped(
+        self, tmp_path, models, monkeypatch
+    ):
+        root = models / "org_model-b"
+        shard = root / "shards" / "2"
+        scan_directory = IncrementalTreeScanner._scan_directory
+
+        def scan_then_remove_shard(path, cached, started_ns):
+            entry = scan_directory(path, cached, started_ns)
+            if path == str(shard.parent):
+                (shard / "weights.safetensors").unlink()
+                shard.rmdir()
+            return entry
+
+        monkeypatch.setattr(
+            IncrementalTreeScanner,
+            "_scan_directory",
+            staticmethod(scan_then_remove_shard),
+        )
+        totals = IncrementalTreeScanner(str(tmp_path / "cache.json")).scan([str(root)])
+
+        stats = totals[str(root)]
+        assert (stats.file_count, stats.directory_count) == (3, 4)
+
+    def test_other_trees_stay_cached(self, tmp_path, models):
+        scanner = IncrementalTreeScanner(str(tmp_path / "cache.json"))
+        scanner.scan([str(models / "org_model-a"), str(models / "org_model-b")])
+
+        scanner.scan([str(models / "org_model-a")])
+        scanner.scan([str(models / "org_model-b")])
+
+        assert scanner.directories_scanned == 0
+
+    def test_missing_roots_are_skipped(self, tmp_path, models):
+        scanner = IncrementalTreeScanner(str(tmp_path / "cache.json"))
+
+        totals = scanner.scan([str(tmp_path / "absent"), str(models / "org_model-a")])
+
+        assert list(totals) == [str(models / "org_model-a")]
+
+    def test_full_scan_ignores_cache(self, tmp_path, models):
+        scanner = IncrementalTreeScanner(str(tmp_path / "cache.json"))
+        scanner.scan([str(models)])
+
+        scanner.scan([str(models)], full=True)
+
+        assert scanner.directories_reused == 0
+        assert scanner.directories_scanned == 11
@@ -0,0 +1,115 @@
+"""
+Unit tests for memory-budgeted model residency
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.model_residency import (
+    ModelResidencyManager,
+    ResidencyBudgetError,
+    estimate_footprint_mb,
+)
+
+MB = 1024 * 1024
+
+
+class FakeTensor:
+    def __init__(self, numel: int, element_size: int = 4):
+        self._numel = numel
+        self._element_size = element_size
+
+    def numel(self):
+        return self._numel
+
+    def element_size(self):
+        return self._element_size
+
+
+class FakeModule:
+    """Stand-in for a torch module with a given parameter size."""
+
+    def __init__(self, size_mb: int):
+        self._params = [FakeTensor(size_mb * MB // 4)]
+
+    def parameters(self):
+        return iter(self._params)
+
+    def buffers(self):
+        return iter([])
+
+
+def _config(memory_mb=1024, local_path=None):
+    return SimpleNamespace(memory_requirement_mb=memory_mb, local_path=local_path)
+
+
+class TestEstimateFootprint:
+    """Test cases for footprint estimation"""
+
+    def test_prefers_loaded_parameters(self):
+        model_object = {"model": FakeModule(300), "tokenizer": object()}
+        assert estimate_footprint_mb(_config(), model_object) == 300
+
+    def test_unwraps_model_attribute(self):
+        wrapper = SimpleNamespace(model=FakeModule(20))
+        assert estimate_footprint_mb(_config(), wrapper) == 20
+
+    def test_uses_weight_files_on_disk(self, tmp_path):
+        (tmp_path / "model.safetensors").write_bytes(b"\0" * (3 * MB))
+        (tmp_path / "README.md").write_bytes(b"\0" * (5 * MB))
+        assert estimate_footprint_mb(_config(local_path=str(tmp_path))) == 3
+
+    def test_falls_back_to_configured_requirement(self, tmp_path):
+        config = _config(memory_mb=2048, local_path=str(tmp_path / "missing"))
+        assert estimate_footprint_mb(config, {"ollama_name": "llama3:8b"}) == 2048
+
+
+class TestModelResidencyManager:
+    """Test cases for LRU eviction planning"""
+
+    @pytest.fixture
+    def residency(self):
+        residency = ModelResidencyManager(budget_mb=1000)
+        for name in ("a", "b", "c"):
+            residency.admit(name, 300)
+        return residency
+
+    def test_no_eviction_when_model_fits(self, residency):
+        assert residency.plan_eviction("d", 100) == []
+        assert residency.available_mb == 100
+
+    def test_evicts_least_recently_used_first(self, residency):
+        with residency.in_use("a"):
+            pass
+
+        assert residency.plan_eviction("d", 400) == ["b"]
+        assert residency.plan_eviction("d", 700) == ["b", "c"]
+
+    def test_pinned_and_busy_models_are_kept(self, residency):
+        with residency.in_use("b"):
+            assert residency.plan_eviction("d", 400, pinned=["a"]) == ["c"]
+            with pytest.raises(ResidencyBudgetError):
+                residency.plan_eviction("d", 700, pinned=["a"])
+        assert residency.rejected_loads == 1
+
+    def test_resident_model_counts_its_own_footprint(self, residency):
+        # "a" growing from 300 to 500 MB needs 100 MB more than is free
+        assert residency.plan_eviction("a", 500) == ["b"]
+
+    def test_metrics_track_evictions(self, residency):
+        residency.release("b", evicted=True)
+        residency.release("c")
+        residency.record_request("a", hit=True)
+        residency.record_request("d", hit=False)
+
+        metrics = residency.get_metrics(pinned=["a"])
+        assert metrics["resident_mb"] == 300
+        assert metrics["evictions"] == 1
+        assert metrics["evicted_mb"] == 300
+        assert (metrics["hits"], metrics["misses"]) == (1, 1)
+        assert metrics["resident_models"]["a"]["pinned"] is True
+
+    def test_budget_from_environment(self, monkeypatch):
+        monkeypatch.setenv("PHOENIX_MODEL_MEMORY_BUDGET_MB", "4096")
+        assert ModelResidencyManager().budget_mb == 4096
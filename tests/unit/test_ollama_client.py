@@ -0,0 +1,158 @@
+"""
+Unit tests for the pooled Ollama client, against a local fake Ollama server
+"""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+from src.services.ollama_client import OllamaAPIError, OllamaClient, OllamaConfig
+
+
+class FakeOllamaServer:
+    """Serves /api/generate, streaming one word per chunk."""
+
+    def __init__(self, chunk_delay: float = 0.0):
+        self.chunk_delay = chunk_delay
+        self.payloads = []
+        self.peers = set()
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self.aborted = 0
+        self.runner = None
+        self.base_url = None
+
+    async def handle_generate(self, request):
+        payload = await request.json()
+        self.payloads.append(payload)
+        self.peers.add(request.transport.get_extra_info("peername"))
+        model = payload["model"]
+        if model == "missing":
+            return web.json_response({"error": "model 'missing' not found"}, status=404)
+
+        self.in_flight[model] = self.in_flight.get(model, 0) + 1
+        self.max_in_flight[model] = max(
+            self.max_in_flight.get(model, 0), self.in_flight[model]
+        )
+        try:
+            words = [f"{word} " for word in payload["prompt"].split()]
+            if not payload["stream"]:
+                await asyncio.sleep(self.chunk_delay)
+                return web.json_response({"response": "".join(words), "done": True})
+
+            response = web.StreamResponse()
+            response.content_type = "application/x-ndjson"
+            await response.prepare(request)
+            try:
+                for word in words:
+                    await asyncio.sleep(self.chunk_delay)
+                    await response.write(
+                        json.dumps({"response": word, "done": False}).encode() + b"\n"
+                    )
+                await response.write(json.dumps({"done": True}).encode() + b"\n")
+            except (ConnectionResetError, asyncio.CancelledError):
+                self.aborted += 1
+                raise
+            return response
+        finally:
+            self.in_flight[model] -= 1
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/api/generate", self.handle_generate)
+        self.runner = web.AppRunner(app, handler_cancellation=True)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.runner.cleanup()
+
+
+def _client(server, **config):
+    return OllamaClient(OllamaConfig(base_url=server.base_url, **config))
+
+
+class TestOllamaClient:
+    """Test cases for OllamaClient"""
+
+    def test_generate_reuses_pooled_connection(self):
+        async def scenario():
+            async with FakeOllamaServer() as server:
+                async with _client(server) as client:
+                    results = [
+                        await client.generate("llama", f"hello {i}", {"max_tokens": 8})
+                        for i in range(3)
+                    ]
+                return server, results
+
+        server, results = asyncio.run(scenario())
+        assert results == ["hello 0 ", "hello 1 ", "hello 2 "]
+        assert len(server.peers) == 1
+        assert server.payloads[0]["options"] == {"num_predict": 8}
+        assert server.payloads[0]["stream"] is False
+
+    def test_stream_generate_yields_tokens(self):
+        async def scenario():
+            async with FakeOllamaServer() as server:
+                async with _client(server) as client:
+                    return [
+                        token
+                        async for token in client.stream_generate(
+                            "llama", "the quick brown fox"
+                        )
+                    ]
+
+        assert asyncio.run(scenario()) == ["the ", "quick ", "brown ", "fox "]
+
+    def test_closing_stream_aborts_generation(self):
+        async def scenario():
+            async with FakeOllamaServer(chunk_delay=0.02) as server:
+                async with _client(server) as client:
+                    tokens = client.stream_generate("llama", "one two three four five")
+                    first = await tokens.__anext__()
+                    await tokens.aclose()
+                    await asyncio.sleep(0.1)
+                return server, first
+
+        server, first = asyncio.run(scenario())
+        assert first == "one "
+        assert server.aborted == 1
+        assert server.in_flight["llama"] == 0
+
+    def test_concurrency_limited_per_model(self):
+        async def scenario():
+            async with FakeOllamaServer(chunk_delay=0.02) as server:
+                async with _client(server, max_concurrent_per_model=2) as client:
+                    await asyncio.gather(
+                        *[client.generate("llama", "hi") for _ in range(6)],
+                        *[client.generate("mistral", "hi") for _ in range(3)],
+                    )
+                return server
+
+        server = asyncio.run(scenario())
+        assert server.max_in_flight == {"llama": 2, "mistral": 2}
+
+    def test_error_response_raises(self):
+        async def scenario():
+            async with FakeOllamaServer() as server:
+                async with _client(server) as client:
+                    await client.generate("missing", "hi")
+
+        with pytest.raises(OllamaAPIError, match="not found") as excinfo:
+            asyncio.run(scenario())
+        assert excinfo.value.status_code == 404
+
+    def test_unreachable_server_raises(self):
+        async def scenario():
+            config = OllamaConfig(base_url="http://127.0.0.1:9", connect_timeout=1.0)
+            async with OllamaClient(config) as client:
+                await client.generate("llama", "hi")
+
+        with pytest.raises(OllamaAPIError, match="Connection error"):
+            asyncio.run(scenario())
@@ -0,0 +1,217 @@
+"""
+Unit tests for the RUBIK genome population matrix
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.biomimetic_agents.rubik_genome import (
+    Archetype,
+    GeneticBase,
+    GenomeMatrix,
+    GenomePool,
+    RUBIKGenome,
+)
+
+
+def _reference_effective_expression(genome, base):
+    """Per-gene effective expression, computed one gene at a time."""
+    genes = genome.genes
+    interaction_effect = sum(
+        gene.expression_level
+        * genome.interaction_matrix[base.value][other.value]
+        * gene.dominance
+        * 0.1
+        for other, gene in genes.items()
+        if other != base
+    )
+    total = genes[base].expression_level + math.log10(1 + abs(interaction_effect))
+    return min(max(total, 0.0), 2.0)
+
+
+class TestGenomeMatrix:
+    """Test cases for GenomeMatrix batched operations"""
+
+    @pytest.fixture
+    def population(self):
+        return GenomeMatrix.random(200, np.random.default_rng(7))
+
+    def test_effective_expressions_match_per_gene_formula(self, population):
+        effective = population.effective_expressions()
+        for row in (0, 57, 199):
+            genome = population.genome(row)
+            for base in GeneticBase:
+                assert effective[row, base.value] == pytest.approx(
+                    _reference_effective_expression(genome, base)
+                )
+
+    def test_interaction_matrix_is_symmetric_for_known_pairs(self, population):
+        matrix = population.interaction_matrix
+        reasoning, focus = GeneticBase.REASONING.value, GeneticBase.FOCUS.value
+        assert matrix[reasoning, focus] == matrix[focus, reasoning] == 1.5
+        assert np.all(np.diag(matrix) == 1.0)
+
+    def test_archetypes_follow_weighted_scores(self, population):
+        genome = population.genome(3)
+        weights = {
+            Archetype.EXPLORER: {
+                "CURIOSITY": 1.5,
+                "ADAPTABILITY": 1.2,
+                "LEARNING": 1.1,
+            },
+            Archetype.GUARDIAN: {"CAUTION": 1.5, "ROBUSTNESS": 1.3, "PERSISTENCE": 1.1},
+            Archetype.CREATOR: {"CREATIVITY": 1.5, "REASONING": 1.2, "PRECISION": 1.1},
+            Archetype.DESTROYER: {"AGGRESSION": 1.4, "EFFICIENCY": 1.3, "FOCUS": 1.2},
+        }
+        scores = {
+            archetype: sum(
+                weight * genome.get_effective_expression(GeneticBase[name])
+                for name, weight in genes.items()
+            )
+            for archetype, genes in weights.items()
+        }
+        assert genome.determine_archetype() == max(scores, key=scores.get)
+        assert sum(population.archetype_counts().values()) == 200
+
+    def test_tournament_winner_is_best_of_random_entrants(self, population):
+        population.fitness = np.arange(200, dtype=float)
+        selected = population.tournament_select(20000, 200, np.random.default_rng(1))
+        assert np.all(selected == 199)
+
+        selected = population.tournament_select(20000, 2, np.random.default_rng(1))
+        # P(best of two distinct entrants is the fittest) = 2 / n
+        assert np.mean(selected == 199) == pytest.approx(2 / 200, abs=0.005)
+        assert np.all(selected > 0)
+
+    def test_crossover_inherits_from_parents(self, population):
+        parents1, parents2 = np.array([0, 1]), np.array([2, 3])
+        offspring = population.crossover(parents1, parents2, np.random.default_rng(3))
+
+        assert len(offspring) == 2
+        assert offspring.parent_genomes[0] == [
+            population.genome_ids[0],
+            population.genome_ids[2],
+        ]
+        assert np.all(offspring.generations == 1)
+        for child, (a, b) in enumerate(zip(parents1, parents2)):
+            values = offspring.raw_values[child]
+            candidates = np.stack(
+                [
+                    population.raw_values[a],
+                    population.raw_values[b],
+                    (population.raw_values[a] + population.raw_values[b]) / 2,
+                ]
+            )
+            assert np.all(np.isclose(candidates, values).any(axis=0))
+
+    def test_mutate_only_selected_rows(self, population):
+        rows = np.zeros(len(population), dtype=bool)
+        rows[:10] = True
+        mutated = population.mutate(rows, rng=np.random.default_rng(5))
+
+        assert np.array_equal(mutated.raw_values[10:], population.raw_values[10:])
+        assert mutated.genome_ids == population.genome_ids
+        assert np.all((mutated.raw_values >= 0.0) & (mutated.raw_values <= 1.0))
+
+
+class TestRUBIKGenomeView:
+    """Test cases for RUBIKGenome as a view of a matrix row"""
+
+    def test_view_reads_and_writes_its_row(self):
+        population = GenomeMatrix.random(5)
+        genome = population.genome(2)
+        genome.fitness_score = 0.75
+        assert population.fitness[2] == 0.75
+        assert genome.genome_id == population.genome_ids[2]
+        assert (
+            genome.genes[GeneticBase.MEMORY].raw_value
+            == population.raw_values[2, GeneticBase.MEMORY.value]
+        )
+
+    def test_serialization_round_trip(self):
+        genome = RUBIKGenome()
+        genome.fitness_score = 0.5
+        restored = RUBIKGenome.from_dict(genome.to_dict())
+
+        assert restored.genome_id == genome.genome_id
+        assert restored.fitness_score == 0.5
+        for base in GeneticBase:
+            assert restored.get_effective_expression(base) == pytest.approx(
+                genome.get_effective_expression(base)
+            )
+
+    def test_crossover_and_mutate_record_lineage(self):
+        parent1, parent2 = RUBIKGenome(), RUBIKGenome()
+        offspring = parent1.crossover(parent2)
+        mutated = offspring.mutate()
+
+        assert offspring.parent_genomes == [parent1.genome_id, parent2.genome_id]
+        assert offspring.generation == 1
+        assert mutated.parent_genomes == [offspring.genome_id]
+        assert mutated.genome_id != offspring.genome_id
+
+
+class TestGenomePool:
+    """Test cases for GenomePool evolution"""
+
+    def test_evaluate_fitness(self):
+        pool = GenomePool(20, seed=1)
+        genome_id = next(iter(pool.genomes))
+        fitness = pool.evaluate_fitness(
+            genome_id, {"task_success_rate": 1.0, "error_rate": 0.0}
+        )
+        assert fitness == pytest.approx(0.45)
+        assert pool.genomes[genome_id].fitness_score == pytest.approx(0.45)
+        assert pool.evaluate_fitness("missing", {}) == 0.0
+
+    def test_evaluate_fitness_batch(self):
+        pool = GenomePool(20, seed=1)
+        genome_ids = list(pool.genomes)[:4] + ["missing"]
+        fitness = pool.evaluate_fitness_batch(
+            genome_ids, {"task_success_rate": [0.0, 0.5, 1.0, 1.0, 1.0]}
+        )
+        assert fitness == pytest.approx([0.0, 0.15, 0.3, 0.3, 0.0])
+
+    def test_evolve_generation_keeps_survivors_and_size(self):
+        pool = GenomePool(50, seed=2)
+        genome_ids = list(pool.genomes)
+        pool.evaluate_fitness_batch(
+            genome_ids, {"task_success_rate": np.linspace(0.0, 1.0, 50)}
+        )
+
+        stats = pool.evolve_generation(survival_rate=0.2)
+
+        assert stats["max_fitness"] == pytest.approx(0.3)
+        assert sum(stats["archetype_distribution"].values()) == 50
+        assert len(pool.genomes) == 50
+        assert list(pool.genomes)[:10] == genome_ids[::-1][:10]
+        assert pool.generation_count == 1
+
+    def test_best_and_diverse_genomes(self):
+        pool = GenomePool(40, seed=3)
+        pool.evaluate_fitness_batch(
+            list(pool.genomes),
+            {"task_success_rate": np.random.default_rng(0).random(40)},
+        )
+
+        best = pool.get_best_genomes(3)
+        assert [g.fitness_score for g in best] == sorted(
+            (g.fitness_score for g in pool.genomes.values()), reverse=True
+        )[:3]
+
+        diverse = pool.get_diverse_genomes(4)
+        present = sum(1 for n in pool.population.archetype_counts().values() if n)
+        assert len({g.determine_archetype() for g in diverse}) == present
+
+    def test_save_and_load_population(self, tmp_path):
+        pool = GenomePool(10, seed=4)
+        pool.evolve_generation()
+        path = tmp_path / "population.json"
+        pool.save_population(str(path))
+
+        loaded = GenomePool(1)
+        loaded.load_population(str(path))
+        assert list(loaded.genomes) == list(pool.genomes)
+        assert loaded.generation_count == 1